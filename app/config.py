@@ -22,25 +22,169 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # 정적 파일 설정
+    STATIC_DIR: str = "static"
+    STATIC_OPTIMIZED: bool = True # 불변 캐시/사전 압축/Range 지원 서빙 사용
+    STATIC_IMMUTABLE_MAX_AGE: int = 365 * 24 * 60 * 60 # 지문 포함 경로 (1년)
+    STATIC_MAX_AGE: int = 60 * 60 # 그 외 경로 (1시간)
+
     # 파일 업로드 설정
     UPLOAD_DIR: str = "static/uploads"
     MAX_FILE_SIZE: int = 10 * 1024 * 1024 # 10MB
     ALLOWED_EXTENSIONS: set = {"jpg", "jpeg", "png", "gif", "webp"}
+    UPLOAD_CHUNK_SIZE: int = 64 * 1024 # 스트리밍 저장 단위 (64KB)
+    IMAGE_WORKERS: int = 2 # 이미지 리사이즈 프로세스 풀 크기
+    IMAGE_THUMBNAIL_SIZE: int = 200 # 썸네일 최대 변 길이 (px)
+    IMAGE_MEDIUM_SIZE: int = 800 # 중간 크기 최대 변 길이 (px)
 
     # 이메일 설정
     SMTP_SERVER: Optional[str] = None
     SMTP_PORT: Optional[int] = None
     SMTP_USERNAME: Optional[str] = None
     SMTP_PASSWORD: Optional[str] = None
+    SMTP_USE_TLS: bool = True # 서버가 지원하면 STARTTLS 사용
+    EMAIL_FROM: str = "no-reply@faank.co.kr"
+    EMAIL_POOL_SIZE: int = 2 # 유지할 SMTP 연결 수 (= 발송 워커 수)
+    EMAIL_BATCH_SIZE: int = 20 # 연결 1개에서 연속 발송할 최대 건수
+    EMAIL_MAX_RETRIES: int = 5
+    EMAIL_RETRY_BASE_DELAY: float = 1.0 # 재시도 대기 기본값 (초, 지수 증가)
 
     # 외부 API 키 (나중에 연결)
     KAMIS_API_KEY: Optional[str] = None # 농산물 가격 정보
     WEATHER_API_KEY: Optional[str] = None # 기상청 API
     PAYMENT_API_KEY: Optional[str] = None # 결제 API
 
+    # 가격 예측 피처 저장소 설정
+    FEATURE_STORE_DIR: str = "data/features"
+    WEATHER_SOURCE: str = "fixture" # fixture (오프라인), kma (기상청 API)
+    WEATHER_FIXTURE_PATH: Optional[str] = "data/weather_fixture.json"
+
     # Redis 설정 (캐싱용)
     REDIS_URL: str = "redis://localhost:6379"
 
+    # 투자 시뮬레이션 설정
+    SIMULATION_MAX_WORKERS: int = 4 # 프로세스 풀 크기
+    SIMULATION_CHUNK_PATHS: int = 5000 # 청크당 경로 수 (시드 분할 단위)
+    SIMULATION_PARALLEL_THRESHOLD: int = 20000 # 이 경로 수 이상이면 프로세스 풀 사용
+    SIMULATION_CACHE_SIZE: int = 256 # 결과 메모이제이션 개수
+
+    # 실시간 시세 피드 설정 (WebSocket)
+    FEED_BUS_BACKEND: str = "memory" # memory, redis (멀티 워커는 redis)
+    FEED_MAX_RATE_HZ: float = 10.0 # 클라이언트별 최대 전송 빈도
+    FEED_SEND_TIMEOUT: float = 2.0 # 전송 지연이 이보다 길면 느린 클라이언트로 간주
+    FEED_MAX_TOPICS_PER_CLIENT: int = 50
+
+    # 토큰 소유권 원장 설정 (단일 writer: 한 프로세스에서만 활성화)
+    LEDGER_ENABLED: bool = True
+    LEDGER_STORE: str = "file" # file (WAL 파일), database (ledger_entries 테이블)
+    LEDGER_WAL_PATH: str = "data/ledger.wal"
+    LEDGER_MAX_BATCH: int = 500 # 그룹 커밋 최대 건수
+    LEDGER_MAX_WAIT_MS: float = 2.0 # 첫 요청 이후 배치를 모으는 최대 시간
+    LEDGER_VERIFY_INTERVAL: float = 30.0 # 해시 체인 재검증 주기 (초)
+
+    # 이상 거래 탐지 설정
+    RISK_ENABLED: bool = True
+    RISK_REVIEW_SCORE: int = 50 # 이 점수 이상이면 추가 확인 대상
+    RISK_BLOCK_SCORE: int = 80 # 이 점수 이상이면 차단
+    RISK_MAX_KEYS: int = 50000 # 사용자/IP별 최대 추적 개수
+    TRUSTED_PROXIES: list = [] # X-Forwarded-For를 믿을 프록시 IP/CIDR (비어 있으면 XFF 무시, 접속 IP 사용)
+
+    # 장바구니 설정
+    CART_BACKEND: str = "redis" # redis, memory (테스트/단일 워커용)
+    CART_TTL_SECONDS: int = 7 * 24 * 3600 # 마지막 변경 후 이 시간이 지나면 만료
+    CART_MAX_ITEMS: int = 50 # 담을 수 있는 상품 종류 수
+    CART_MAX_QUANTITY: int = 99 # 상품당 최대 수량
+    PRODUCT_CACHE_TTL: float = 30.0 # 장바구니 가격 표시용 상품 캐시 유지 시간 (초)
+    PRODUCT_CACHE_SIZE: int = 10000
+
+    # 한정 수량 재고 선점 설정
+    INVENTORY_BACKEND: str = "database" # database (조건부 UPDATE), redis (Lua), memory (테스트/단일 워커)
+    INVENTORY_HOLD_SECONDS: int = 600 # 선점 유지 시간 (이후 자동 반환)
+    INVENTORY_MAX_PER_RESERVATION: int = 10
+    INVENTORY_SHARDS: int = 8 # memory 저장소 재고 카운터 샤드 수
+    INVENTORY_RECONCILE_INTERVAL: float = 5.0 # 만료 선점 정리 주기 (초)
+
+    # 보안 감사 로그 설정
+    AUDIT_ENABLED: bool = True
+    AUDIT_BATCH_SIZE: int = 500 # 이만큼 쌓이면 바로 기록
+    AUDIT_FLUSH_INTERVAL: float = 1.0 # 최대 기록 지연 (초)
+    AUDIT_MAX_BUFFER: int = 100000 # 메모리 버퍼 상한 (넘으면 바로 파일로)
+    AUDIT_SPILL_PATH: str = "data/audit_spill.jsonl" # DB 장애시 임시 보관 파일
+    AUDIT_RETRY_INTERVAL: float = 10.0 # DB 장애 후 재시도 간격 (초)
+
+    # 사용자 조회 캐시 설정
+    USER_CACHE_TTL: float = 60.0 # 사용자 프로젝션 캐시 유지 시간 (초)
+    USER_CACHE_SIZE: int = 100000
+    USER_LOOKUP_MAX_KEYS: int = 5000 # 내부 일괄 조회 1회 최대 user_id + 핸드폰 번호 수
+    USER_LOOKUP_BATCH: int = 500 # 일괄 조회시 한 번에 복호화/전송하는 사용자 수
+    INTERNAL_API_KEY: Optional[str] = None # 내부 서비스 호출용 키 (X-Internal-Key 헤더, 없으면 관리자 토큰만 허용)
+
+    # KYC 검증 작업 설정
+    KYC_WORKER_ENABLED: bool = False # 켜면 KYC_VERIFIER로 대기 작업 처리
+    KYC_VERIFIER: str = "http" # http (외부 기관 API), fake (로컬 가짜 검증기, 운영 환경에서는 사용 불가)
+    KYC_PROVIDER_URL: Optional[str] = None
+    KYC_PROVIDER_API_KEY: Optional[str] = None
+    KYC_CONCURRENCY: int = 8 # 동시에 진행하는 외부 검증 요청 수
+    KYC_BATCH_SIZE: int = 100 # 상태 변경 일괄 반영 최대 건수
+    KYC_FLUSH_INTERVAL: float = 0.5 # 상태 변경 반영 주기 (초)
+    KYC_POLL_INTERVAL: float = 2.0 # 대기 작업 확인 주기 (초)
+    KYC_VERIFY_TIMEOUT: float = 30.0
+    KYC_MAX_ATTEMPTS: int = 5
+    KYC_RETRY_BASE_DELAY: float = 5.0 # 재시도 대기 기본값 (초, 지수 증가)
+    KYC_CLAIM_TIMEOUT: float = 300.0 # 이 시간 동안 끝나지 않은 작업은 다시 처리
+    KYC_FAKE_LATENCY: float = 0.2 # 가짜 검증기 응답 지연 (초)
+
+    # 상품 검색 설정
+    SEARCH_BACKEND: str = "memory" # memory (워커별 메모리 역색인), pg_trgm (PostgreSQL 트라이그램 인덱스)
+    SEARCH_MIN_MATCH: float = 0.7 # 검색어 토큰 중 이 비율 이상 포함한 상품만 결과에 포함
+    SEARCH_COMPACT_RATIO: float = 0.25 # 수정/삭제로 무효가 된 문서 비율이 이 이상이면 색인 압축
+    SEARCH_REBUILD_BATCH: int = 10000 # 색인 재구성시 한 번에 읽는 상품 수
+    SEARCH_SUGGEST_SCAN: int = 2000 # 자동완성 후보로 확인하는 최대 단어 수
+    SEARCH_REBUILD_INTERVAL: float = 1800.0 # memory 색인 전체 재구성 주기 (초, 전파 중 유실된 변경 복구용, 0이면 끄기)
+
+    # 과부하 제어 설정 (경로 클래스별 동시 처리 한도)
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_LIMITS: dict = {"auth": 4, "db_read": 10, "db_write": 5, "cheap": 100} # 동시 처리 수 초기값 (DB 클래스 합은 커넥션 풀 크기 근처로)
+    ADMISSION_TARGET_LATENCY_MS: dict = {"auth": 500, "db_read": 200, "db_write": 300, "cheap": 50} # 이보다 느리면 한도 축소
+    ADMISSION_MIN_LIMIT: int = 1
+    ADMISSION_MAX_LIMIT_FACTOR: float = 4.0 # 한도 상한 = 초기값 x 이 값
+    ADMISSION_QUEUE_FACTOR: float = 10.0 # 대기열 최대 길이 = 현재 한도 x 이 값 (넘으면 바로 503)
+    ADMISSION_QUEUE_TIMEOUT: float = 1.0 # 대기열 최대 대기 시간 (초, 넘으면 503)
+    ADMISSION_CRITICAL_PATHS: list = ["/health"] # 한도 없이 항상 처리하는 경로
+
+    # 요청 프로파일링 설정 (관리자가 세션을 열었을 때만 동작)
+    PROFILING_ENABLED: bool = True # 세션이 프로세스 메모리에 있으므로 단일 워커에서만 (멀티 워커는 false)
+    PROFILING_HEADER: str = "X-Profile" # mode=header 세션에서 대상 요청임을 알리는 헤더 (값은 세션 토큰)
+    PROFILING_SAMPLE_INTERVAL_MS: float = 5.0 # 스택 샘플링 간격
+    PROFILING_KEEP_REQUESTS: int = 50 # 세션별로 보관하는 요청별 프로파일 수
+    PROFILING_KEEP_SESSIONS: int = 5 # 결과 조회용으로 보관하는 지난 세션 수
+
+    # 개인정보 암호화 설정 (봉투 암호화)
+    PII_KEY_PROVIDER: str = "local" # local (마스터 키 파일)
+    PII_MASTER_KEY_PATH: str = "data/pii_master.key" # 개발 환경에서는 없으면 자동 생성
+    PII_KEY_CACHE_TTL: float = 3600.0 # 풀린 데이터 키 메모리 보관 시간 (초)
+    PII_KEY_ROTATION_DAYS: int = 90 # 이 기간이 지나면 새 데이터 키로 암호화 (이전 키는 복호화에만 사용)
+    PII_REENCRYPT_BATCH: int = 1000 # 재암호화/내보내기시 한 번에 읽는 사용자 수
+
+    # 토큰 분배(배당) 지급 설정
+    PAYOUT_ENABLED: bool = True # 서버 시작시 중단된 분배 이어서 실행
+    PAYOUT_CHUNK_SIZE: int = 10000 # 한 트랜잭션에 기록하는 보유자 수 (체크포인트 단위)
+    PAYOUT_SNAPSHOT_DIR: str = "data/distributions" # 기준일 보유자 명부 저장 위치
+    PAYOUT_LEASE_SECONDS: float = 120.0 # 실행 중인 워커가 응답 없으면 이 시간 후 다른 워커가 이어받음
+    PAYOUT_AMOUNT_DECIMALS: int = 0 # 지급 통화 소수 자릿수 (원화 0)
+    PAYOUT_CURRENCY_UNIT: str = "원" # 알림에 표시하는 지급 통화 단위 (원, USD 등)
+
+    # 운영 서버 설정 (python -m app.core.server, 멀티 워커)
+    SERVER_WORKERS: int = 0 # 워커 수 (0이면 사용 가능한 CPU 수)
+    SERVER_PRELOAD: bool = True # 마스터에서 앱을 미리 import 후 fork (메모리 공유, 코드 변경은 재시작 필요)
+    SERVER_MAX_REQUESTS: int = 10000 # 워커가 이만큼 처리하면 교체 (메모리 증가 방지, 0이면 교체 안 함)
+    SERVER_MAX_REQUESTS_JITTER: int = 1000 # 워커들이 동시에 교체되지 않도록 더하는 임의 값 상한
+    SERVER_GRACEFUL_TIMEOUT: float = 30.0 # 종료/교체시 진행 중인 요청을 기다리는 시간 (초, 넘으면 강제 종료)
+    SERVER_WORKER_TIMEOUT: float = 60.0 # 워커 이벤트 루프가 이 시간 이상 멈추면 강제 종료 후 재시작
+    SERVER_BACKLOG: int = 2048 # 연결 대기열 길이
+    SERVER_METRICS_DIR: str = "data/metrics" # 워커별 지표 파일 위치 (/health/workers에서 합산)
+    SERVER_METRICS_INTERVAL: float = 5.0 # 워커 지표 기록 간격 (초)
+
     # 개발/운영 환경 구분
     ENVIRONMENT: str = "development" # development, production
 
@@ -48,6 +192,18 @@ class Settings(BaseSettings):
         env_file = ".env"
         case_sensitive = True
 
+# 멀티 워커에서 안전한 기본값 (워커별 메모리 상태를 쓰는 기능은 끄고 메시지 버스는 redis)
+# 원장/프로파일링은 SERVER_WORKERS=1 프로세스에서 환경변수로 켜서 따로 실행
+MULTI_WORKER_DEFAULTS = {"LEDGER_ENABLED": False, "PROFILING_ENABLED": False, "FEED_BUS_BACKEND": "redis"}
+
+
+def apply_multi_worker_defaults(config: Settings) -> Settings:
+    """환경변수/.env로 직접 지정하지 않은 설정만 멀티 워커 기본값으로"""
+    for name, value in MULTI_WORKER_DEFAULTS.items():
+        if name not in config.model_fields_set:
+            setattr(config, name, value)
+    return config
+
 # 설정 인스턴스 생성
 settings = Settings()
 
@@ -61,4 +217,8 @@ if settings.ENVIRONMENT == "production":
 elif settings.ENVIRONMENT == "development":
     settings.DEBUG = True
     # 개발 환경에서는 더 긴 토큰 만료 시간
-    settings.ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24
\ No newline at end of file
+    settings.ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24
+
+# 운영 실행(DEBUG=False)은 멀티 워커 서버(app.core.server)로 시작하므로 기본값도 멀티 워커 기준
+if not settings.DEBUG:
+    apply_multi_worker_defaults(settings)
@@ -0,0 +1,8 @@
+# app/core/__init__.py
+from .static_files import OptimizedStaticFiles, asset_url, precompress
+from .admission import AdmissionControlMiddleware, get_admission_controller
+from .profiling import ProfilingMiddleware, get_profiler, span
+
+__all__ = ["OptimizedStaticFiles", "asset_url", "precompress",
+           "AdmissionControlMiddleware", "get_admission_controller",
+           "ProfilingMiddleware", "get_profiler", "span"]
\ No newline at end of file
@@ -0,0 +1,227 @@
+# app/core/admission.py
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.core.profiling import span
+
+# 경로 분류 (클래스별로 따로 한도를 둬서 느린 DB가 bcrypt/정적 요청까지 막지 않도록)
+AUTH = "auth" # bcrypt 해시 (CPU)
+DB_READ = "db_read"
+DB_WRITE = "db_write"
+CHEAP = "cheap" # 문서, 정적 파일, CORS preflight
+
+ROUTE_CLASSES = (AUTH, DB_READ, DB_WRITE, CHEAP)
+
+# bcrypt를 쓰는 경로
+AUTH_ROUTES = {("POST", "/api/auth/login"), ("POST", "/api/auth/register")}
+
+# POST지만 조회만 하는 경로 (요청 본문이 길어 GET 대신 POST)
+READ_ROUTES = {("POST", "/api/internal/users/lookup")}
+
+READ_METHODS = {"GET", "HEAD"}
+
+
+def classify(method: str, path: str) -> Optional[str]:
+    """요청 경로 분류 (None이면 한도 없이 항상 처리)"""
+    for critical in settings.ADMISSION_CRITICAL_PATHS:
+        if path == critical or path.startswith(critical.rstrip("/") + "/"):
+            return None
+    if method == "OPTIONS" or not path.startswith("/api/"):
+        return CHEAP
+    route = (method, path.rstrip("/"))
+    if route in AUTH_ROUTES:
+        return AUTH
+    return DB_READ if method in READ_METHODS or route in READ_ROUTES else DB_WRITE
+
+
+class AdaptiveLimiter:
+    """동시 처리 한도 + 기한 있는 대기열 (AIMD: 목표 지연 이내면 한도 증가, 넘으면 x0.9)"""
+
+    def __init__(self, name: str, initial: int, target_latency: float,
+                 min_limit: Optional[int] = None, max_limit: Optional[int] = None,
+                 queue_factor: Optional[float] = None, queue_timeout: Optional[float] = None):
+        self.name = name
+        self.limit = float(initial)
+        self.target_latency = target_latency
+        self.min_limit = min_limit or settings.ADMISSION_MIN_LIMIT
+        self.max_limit = max_limit or max(self.min_limit, int(initial * settings.ADMISSION_MAX_LIMIT_FACTOR))
+        self.queue_factor = queue_factor or settings.ADMISSION_QUEUE_FACTOR
+        self.queue_timeout = queue_timeout or settings.ADMISSION_QUEUE_TIMEOUT
+
+        self.inflight = 0
+        self.latency: Optional[float] = None # 처리 시간 이동 평균 (초)
+        self.stats = {"admitted": 0, "waited": 0, "rejected": 0, "timed_out": 0, "increased": 0, "decreased": 0}
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+
+    @property
+    def capacity(self) -> int:
+        return max(self.min_limit, int(self.limit))
+
+    @property
+    def max_queue(self) -> int:
+        return int(self.capacity * self.queue_factor)
+
+    async def acquire(self) -> bool:
+        """처리 자리 확보 (대기열이 가득 찼거나 기한 안에 자리가 안 나면 False)"""
+        if self.inflight < self.capacity and not self._waiters:
+            self.inflight += 1
+            self.stats["admitted"] += 1
+            return True
+        # 기한 안에 차례가 오지 않을 요청은 기다리게 하지 않고 바로 거절
+        if len(self._waiters) >= self.max_queue or self.expected_wait() > self.queue_timeout:
+            self.stats["rejected"] += 1
+            return False
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._waiters.append(future)
+        self.stats["waited"] += 1
+        timer = loop.call_later(self.queue_timeout, self._expire, future)
+        try:
+            admitted = await future
+        except asyncio.CancelledError:
+            # 자리를 넘겨받은 직후 클라이언트가 끊긴 경우 다시 반환
+            if future.done() and not future.cancelled() and future.result():
+                self.release()
+            elif future in self._waiters:
+                self._waiters.remove(future)
+            raise
+        finally:
+            timer.cancel()
+
+        if admitted:
+            self.stats["admitted"] += 1
+        else:
+            self.stats["timed_out"] += 1
+        return admitted
+
+    def _expire(self, future: asyncio.Future):
+        if not future.done():
+            future.set_result(False)
+            self._waiters.remove(future)
+
+    def release(self, latency: Optional[float] = None, overloaded: bool = False):
+        """처리 완료 (대기 중인 요청이 있으면 자리를 그대로 넘김)"""
+        if latency is not None:
+            self._adjust(latency, overloaded)
+        while self._waiters and self.inflight <= self.capacity:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(True)
+                return
+        self.inflight -= 1
+
+    def _adjust(self, latency: float, overloaded: bool):
+        self.latency = latency if self.latency is None else self.latency * 0.9 + latency * 0.1
+        now = time.monotonic()
+        if overloaded or latency > self.target_latency:
+            # 같은 혼잡 구간의 느린 응답들로 연달아 줄이지 않도록 목표 지연 간격으로 한 번만
+            if now - self._last_decrease >= self.target_latency and self.limit > self.min_limit:
+                self.limit = max(float(self.min_limit), self.limit * 0.9)
+                self._last_decrease = now
+                self.stats["decreased"] += 1
+        elif self.inflight * 2 >= self.capacity and self.limit < self.max_limit:
+            # 한도가 실제로 병목일 때만 증가 (한도 1번 채울 때마다 +1)
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            self.stats["increased"] += 1
+
+    def expected_wait(self) -> float:
+        """지금 대기열 맨 뒤에 서면 기다릴 예상 시간 (초)"""
+        latency = self.latency or self.target_latency
+        return latency * (len(self._waiters) + 1) / self.capacity
+
+    def retry_after(self) -> int:
+        """대기열이 빠지는 데 걸릴 예상 시간 (초, Retry-After 헤더)"""
+        return min(30, max(1, math.ceil(self.expected_wait())))
+
+    def status(self) -> dict:
+        return {
+            "limit": round(self.limit, 2),
+            "inflight": self.inflight,
+            "queued": len(self._waiters),
+            "max_queue": self.max_queue,
+            "latency_ms": round(self.latency * 1000, 1) if self.latency is not None else None,
+            "target_latency_ms": round(self.target_latency * 1000, 1),
+            **self.stats,
+        }
+
+
+class AdmissionController:
+    """경로 클래스별 AdaptiveLimiter 모음"""
+
+    def __init__(self):
+        self.limiters: Dict[str, AdaptiveLimiter] = {
+            name: AdaptiveLimiter(
+                name,
+                settings.ADMISSION_LIMITS[name],
+                settings.ADMISSION_TARGET_LATENCY_MS[name] / 1000,
+            )
+            for name in ROUTE_CLASSES
+        }
+
+    def status(self) -> dict:
+        return {name: limiter.status() for name, limiter in self.limiters.items()}
+
+
+class AdmissionControlMiddleware:
+    """과부하시 대기열이 차면 바로 503 + Retry-After (스레드풀/DB 풀에 요청이 쌓이지 않도록)"""
+
+    def __init__(self, app: ASGIApp, controller: Optional[AdmissionController] = None):
+        self.app = app
+        self.controller = controller or get_admission_controller()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            # WebSocket은 연결이 길어서 동시 처리 한도 대상에서 제외
+            await self.app(scope, receive, send)
+            return
+        route_class = classify(scope["method"], scope["path"])
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        limiter = self.controller.limiters[route_class]
+        with span("queue"):
+            admitted = await limiter.acquire()
+        if not admitted:
+            response = JSONResponse(
+                status_code=503,
+                content={"message": "요청이 많아 잠시 후 다시 시도해주세요", "stauts_code": 503},
+                headers={"Retry-After": str(limiter.retry_after())},
+            )
+            await response(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.monotonic()
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            limiter.release(time.monotonic() - started, overloaded=status_code in (503, 504))
+
+
+# 프로세스별 컨트롤러 (처음 사용할 때 생성)
+_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """AdmissionController 인스턴스 반환"""
+    global _controller
+    if _controller is None:
+        _controller = AdmissionController()
+    return _controller
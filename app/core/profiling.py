@@ -0,0 +1,410 @@
+# app/core/profiling.py
+import os
+import secrets
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, model_validator
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+# 현재 요청의 프로파일 (스레드풀로 넘어간 코드에도 contextvars로 전달됨)
+_current: ContextVar[Optional["RequestProfile"]] = ContextVar("request_profile", default=None)
+
+# 이 파일들의 함수가 맨 위에 있는 스레드는 대기 중 (샘플에서 제외)
+_IDLE_FILES = ("threading.py", "queue.py", "selectors.py")
+
+# 프레임 이름 캐시 {코드 객체: "함수 (파일:줄)"}
+_frame_names: Dict[object, str] = {}
+
+_ROOT = os.getcwd() + os.sep
+
+
+def _frame_name(code) -> str:
+    name = _frame_names.get(code)
+    if name is None:
+        filename = code.co_filename
+        if filename.startswith(_ROOT):
+            filename = filename[len(_ROOT):]
+        elif "site-packages" + os.sep in filename:
+            filename = filename.split("site-packages" + os.sep, 1)[1]
+        name = _frame_names[code] = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+    return name
+
+
+def _collapse(frame) -> Optional[str]:
+    """스택을 collapsed 형식 한 줄로 (바깥 -> 안쪽, ';' 구분), 대기 중이면 None"""
+    if frame.f_code.co_filename.endswith(_IDLE_FILES):
+        return None
+    names = []
+    while frame is not None:
+        names.append(_frame_name(frame.f_code))
+        frame = frame.f_back
+    names.reverse()
+    return ";".join(names)
+
+
+class RequestProfile:
+    """요청 1건의 구간별 시간 + 스택 샘플"""
+
+    def __init__(self, request_id: int, method: str, path: str):
+        self.request_id = request_id
+        self.method = method
+        self.path = path
+        self.status_code: Optional[int] = None
+        self.started = time.perf_counter()
+        self.duration: Optional[float] = None
+        self.spans: Dict[str, List[float]] = {} # 구간 -> [누적 시간, 횟수]
+        self.samples: Counter = Counter()
+        # 샘플을 이 요청에 귀속할 스레드 -> 진행 중인 구간 수 (이벤트 루프는 요청 내내, 스레드풀 스레드는 구간 동안만)
+        self.threads: Counter = Counter({threading.get_ident(): 1})
+        self._lock = threading.Lock()
+
+    def enter_thread(self):
+        with self._lock:
+            self.threads[threading.get_ident()] += 1
+
+    def leave_thread(self):
+        """구간이 끝난 스레드는 다른 요청을 처리할 수 있으므로 귀속 해제"""
+        ident = threading.get_ident()
+        with self._lock:
+            self.threads[ident] -= 1
+            if self.threads[ident] <= 0:
+                del self.threads[ident]
+
+    def add_span(self, name: str, seconds: float):
+        with self._lock:
+            entry = self.spans.get(name)
+            if entry is None:
+                self.spans[name] = [seconds, 1]
+            else:
+                entry[0] += seconds
+                entry[1] += 1
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (hash;dur=245.1, db;dur=3.2;desc="2 calls", total;dur=260.0)"""
+        with self._lock:
+            spans = list(self.spans.items())
+        parts = []
+        for name, (seconds, count) in spans:
+            part = f"{name};dur={seconds * 1000:.1f}"
+            if count > 1:
+                part += f';desc="{count} calls"'
+            parts.append(part)
+        parts.append(f"total;dur={(time.perf_counter() - self.started) * 1000:.1f}")
+        return ", ".join(parts)
+
+    def summary(self) -> dict:
+        return {
+            "request_id": self.request_id,
+            "method": self.method,
+            "path": self.path,
+            "status_code": self.status_code,
+            "duration_ms": round(self.duration * 1000, 2) if self.duration is not None else None,
+            "spans_ms": {name: round(seconds * 1000, 2) for name, (seconds, _) in self.spans.items()},
+            "samples": sum(self.samples.values()),
+        }
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """현재 요청이 프로파일 대상이면 구간 시간 기록 (아니면 contextvar 조회만)"""
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    profile.enter_thread()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add_span(name, time.perf_counter() - started)
+        profile.leave_thread()
+
+
+class ProfilingSession:
+    """관리자가 연 프로파일링 세션 (N건 또는 시간 제한, 헤더 opt-in 또는 전체 요청)"""
+
+    def __init__(self, max_requests: int, duration_seconds: float, mode: str = "header",
+                 path_prefix: Optional[str] = None, sample_interval_ms: Optional[float] = None):
+        self.session_id = secrets.token_hex(8)
+        self.token = secrets.token_urlsafe(16) # mode=header일 때 요청 헤더로 보내는 값
+        self.max_requests = max_requests
+        self.mode = mode
+        self.path_prefix = path_prefix
+        self.interval = (sample_interval_ms or settings.PROFILING_SAMPLE_INTERVAL_MS) / 1000
+        self.created_at = time.time()
+        self.expires_at = time.monotonic() + duration_seconds
+
+        self.started_requests = 0
+        self.samples: Counter = Counter() # 세션 전체 (프로세스의 모든 실행 중 스레드)
+        self.sample_ticks = 0
+        self.requests: "OrderedDict[int, RequestProfile]" = OrderedDict()
+        self._active: Dict[int, RequestProfile] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_open(self) -> bool:
+        return (not self._stopped.is_set() and self.started_requests < self.max_requests
+                and time.monotonic() < self.expires_at)
+
+    def stop(self):
+        self._stopped.set()
+
+    def wants(self, method: str, path: str, headers: Headers) -> bool:
+        if self.path_prefix and not path.startswith(self.path_prefix):
+            return False
+        if self.mode == "header":
+            return secrets.compare_digest(headers.get(settings.PROFILING_HEADER, ""), self.token)
+        return True
+
+    def begin(self, method: str, path: str) -> Optional[RequestProfile]:
+        with self._lock:
+            if not self.is_open:
+                return None
+            self.started_requests += 1
+            profile = RequestProfile(self.started_requests, method, path)
+            self._active[profile.request_id] = profile
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="profiling-sampler", daemon=True)
+                self._thread.start()
+        return profile
+
+    def finish(self, profile: RequestProfile):
+        profile.duration = time.perf_counter() - profile.started
+        with self._lock:
+            self._active.pop(profile.request_id, None)
+            self.requests[profile.request_id] = profile
+            while len(self.requests) > settings.PROFILING_KEEP_REQUESTS:
+                self.requests.popitem(last=False)
+            if not self._active and not self.is_open:
+                self._stopped.set()
+
+    def _run(self):
+        """샘플러 스레드 (프로파일 대상 요청이 실행 중일 때만 스택 수집)"""
+        me = threading.get_ident()
+        while not self._stopped.wait(self.interval):
+            with self._lock:
+                active = list(self._active.values())
+            if not active:
+                if not self.is_open:
+                    break
+                continue
+            frames = sys._current_frames()
+            stacks = [(thread_id, _collapse(frame)) for thread_id, frame in frames.items() if thread_id != me]
+            del frames
+            with self._lock:
+                self.sample_ticks += 1
+                for thread_id, stack in stacks:
+                    if stack is None:
+                        continue
+                    self.samples[stack] += 1
+                    for profile in active:
+                        if profile.threads.get(thread_id):
+                            profile.samples[stack] += 1
+
+    def profile_samples(self, request_id: Optional[int] = None) -> Tuple[str, Counter]:
+        with self._lock:
+            if request_id is None:
+                return f"session {self.session_id}", Counter(self.samples)
+            profile = self.requests.get(request_id) or self._active.get(request_id)
+            if profile is None:
+                raise KeyError(request_id)
+            return f"{profile.method} {profile.path} #{request_id}", Counter(profile.samples)
+
+    def collapsed(self, request_id: Optional[int] = None) -> str:
+        """collapsed stack 형식 (flamegraph.pl, speedscope, inferno 입력)"""
+        _, samples = self.profile_samples(request_id)
+        return "".join(f"{stack} {count}\n" for stack, count in samples.most_common())
+
+    def speedscope(self, request_id: Optional[int] = None) -> dict:
+        """speedscope 파일 형식 (https://www.speedscope.app)"""
+        name, samples = self.profile_samples(request_id)
+        frames: List[dict] = []
+        frame_index: Dict[str, int] = {}
+        stacks, weights = [], []
+        for stack, count in samples.items():
+            indexes = []
+            for frame_name in stack.split(";"):
+                index = frame_index.get(frame_name)
+                if index is None:
+                    index = frame_index[frame_name] = len(frames)
+                    function, _, location = frame_name.partition(" (")
+                    file, _, line = location.rstrip(")").rpartition(":")
+                    frames.append({"name": function, "file": file, "line": int(line) if line.isdigit() else None})
+                indexes.append(index)
+            stacks.append(indexes)
+            weights.append(round(count * self.interval, 6))
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "faank-profiler",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": round(sum(weights), 6),
+                "samples": stacks,
+                "weights": weights,
+            }],
+        }
+
+    def status(self, include_token: bool = False) -> dict:
+        with self._lock:
+            requests = [profile.summary() for profile in self.requests.values()]
+            active = len(self._active)
+        status = {
+            "session_id": self.session_id,
+            "mode": self.mode,
+            "path_prefix": self.path_prefix,
+            "open": self.is_open,
+            "max_requests": self.max_requests,
+            "started_requests": self.started_requests,
+            "active_requests": active,
+            "expires_in": max(0.0, round(self.expires_at - time.monotonic(), 1)),
+            "sample_interval_ms": self.interval * 1000,
+            "sample_ticks": self.sample_ticks,
+            "requests": requests,
+        }
+        if include_token:
+            status["header"] = settings.PROFILING_HEADER
+            status["token"] = self.token
+        return status
+
+
+class Profiler:
+    """프로파일링 세션 관리 (동시에 열린 세션은 1개, 지난 세션은 결과 조회용으로 보관)
+
+    세션은 프로세스 메모리에 있으므로 단일 워커 프로세스에서만 사용 (멀티 워커 실행시 PROFILING_ENABLED=false)
+    """
+
+    def __init__(self):
+        self.sessions: "OrderedDict[str, ProfilingSession]" = OrderedDict()
+        self.current: Optional[ProfilingSession] = None
+        self._lock = threading.Lock()
+
+    def start_session(self, **kwargs) -> ProfilingSession:
+        session = ProfilingSession(**kwargs)
+        with self._lock:
+            if self.current is not None:
+                self.current.stop()
+            self.current = session
+            self.sessions[session.session_id] = session
+            while len(self.sessions) > settings.PROFILING_KEEP_SESSIONS:
+                self.sessions.popitem(last=False)
+        return session
+
+    def get_session(self, session_id: str) -> Optional[ProfilingSession]:
+        return self.sessions.get(session_id)
+
+    def match(self, method: str, path: str, headers: Headers) -> Optional[ProfilingSession]:
+        session = self.current
+        if session is None or not session.is_open or not session.wants(method, path, headers):
+            return None
+        return session
+
+
+class ProfilingMiddleware:
+    """열린 세션 대상 요청에 RequestProfile 연결, 응답에 Server-Timing/X-Profile-Id 헤더 추가"""
+
+    def __init__(self, app: ASGIApp, profiler: Optional[Profiler] = None):
+        self.app = app
+        self.profiler = profiler or get_profiler()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        # 세션이 없으면 바로 통과 (평소 비용은 속성 조회 1번)
+        if scope["type"] != "http" or self.profiler.current is None:
+            await self.app(scope, receive, send)
+            return
+        session = self.profiler.match(scope["method"], scope["path"], Headers(scope=scope))
+        profile = session.begin(scope["method"], scope["path"]) if session is not None else None
+        if profile is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_timing(message: Message):
+            if message["type"] == "http.response.start":
+                profile.status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", profile.server_timing())
+                headers.append("X-Profile-Id", f"{session.session_id}/{profile.request_id}")
+            await send(message)
+
+        token = _current.set(profile)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            session.finish(profile)
+
+
+class ProfiledModel(BaseModel):
+    """요청 스키마 검증 시간을 validate 구간으로 기록하는 기반 클래스"""
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _profile_validation(cls, data, handler):
+        with span("validate"):
+            return handler(data)
+
+
+class ProfiledJSONResponse(JSONResponse):
+    """JSON 직렬화 시간을 serialize 구간으로 기록"""
+
+    def render(self, content) -> bytes:
+        with span("serialize"):
+            return super().render(content)
+
+
+# DB 구간 (커서 실행 시간, 모든 엔진)
+@event.listens_for(Engine, "before_cursor_execute")
+def _db_started(conn, cursor, statement, parameters, context, executemany):
+    profile = _current.get()
+    if profile is not None:
+        profile.enter_thread()
+        conn.info.setdefault("profile_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _db_finished(conn, cursor, statement, parameters, context, executemany):
+    profile = _current.get()
+    started = conn.info.get("profile_started")
+    if profile is not None and started:
+        profile.add_span("db", time.perf_counter() - started.pop())
+        profile.leave_thread()
+
+
+@event.listens_for(Engine, "handle_error")
+def _db_failed(context):
+    # 실행 오류면 after_cursor_execute가 호출되지 않음
+    profile = _current.get()
+    started = context.connection.info.get("profile_started") if context.connection is not None else None
+    if profile is not None and started:
+        profile.add_span("db", time.perf_counter() - started.pop())
+        profile.leave_thread()
+
+
+# 프로세스별 프로파일러 (처음 사용할 때 생성)
+_profiler: Optional[Profiler] = None
+
+
+def get_profiler() -> Profiler:
+    """Profiler 인스턴스 반환"""
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler()
+    return _profiler
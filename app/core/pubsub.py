@@ -0,0 +1,156 @@
+# app/core/pubsub.py
+import asyncio
+import json
+import os
+from typing import Callable, Optional, Set
+
+from app.config import settings
+
+# 메시지 핸들러: (topic, payload bytes)
+MessageHandler = Callable[[str, bytes], None]
+
+
+class InMemoryBus:
+    """프로세스 내부 메시지 버스 (테스트/단일 워커용)"""
+
+    def __init__(self):
+        self._handler: Optional[MessageHandler] = None
+
+    async def start(self, handler: MessageHandler):
+        self._handler = handler
+
+    async def stop(self):
+        self._handler = None
+
+    async def publish(self, topic: str, payload: bytes):
+        if self._handler is not None:
+            self._handler(topic, payload)
+
+
+class RedisBus:
+    """Redis pub/sub 메시지 버스 (워커 간 전파용)"""
+
+    def __init__(self, url: Optional[str] = None, prefix: str = "feed:"):
+        self.url = url or settings.REDIS_URL
+        self.prefix = prefix
+        self._redis = None
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+
+    async def start(self, handler: MessageHandler):
+        import redis.asyncio as aioredis
+
+        self._redis = aioredis.Redis.from_url(self.url)
+        self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.psubscribe(f"{self.prefix}*")
+        self._listener = asyncio.create_task(self._listen(handler))
+
+    async def _listen(self, handler: MessageHandler):
+        """구독 메시지 수신 루프 (연결이 끊기면 재시도)"""
+        prefix_length = len(self.prefix)
+        while True:
+            try:
+                async for message in self._pubsub.listen():
+                    if message.get("type") != "pmessage":
+                        continue
+                    channel = message["channel"]
+                    if isinstance(channel, bytes):
+                        channel = channel.decode("utf-8")
+                    handler(channel[prefix_length:], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"❌ Redis pub/sub listener error: {e}")
+                await asyncio.sleep(1.0)
+
+    async def stop(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.close()
+            self._pubsub = None
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+    async def publish(self, topic: str, payload: bytes):
+        await self._redis.publish(f"{self.prefix}{topic}", payload)
+
+
+def create_bus(backend: Optional[str] = None, prefix: str = "feed:"):
+    """설정에 맞는 메시지 버스 생성 (memory, redis, prefix는 Redis 채널 구분용)"""
+    backend = backend or settings.FEED_BUS_BACKEND
+    if backend == "redis":
+        return RedisBus(prefix=prefix)
+    if backend == "memory":
+        return InMemoryBus()
+    raise ValueError(f"지원하지 않는 메시지 버스입니다: {backend}")
+
+
+class Broadcaster:
+    """워커 간 JSON 메시지 전파 (자기가 보낸 메시지는 무시, 시작 전 publish는 무시)
+
+    publish는 요청 처리 스레드에서도 호출 가능 (이벤트 루프로 넘겨서 전송)
+    """
+
+    def __init__(self, topic: str, handler: Callable[[dict], None], bus=None):
+        self.topic = topic
+        self.handler = handler
+        self.bus = bus or create_bus(prefix=f"sync:{topic}:")
+        self.origin = f"{os.getpid()}:{id(self)}"
+        self.stats = {"published": 0, "received": 0}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def started(self) -> bool:
+        return self._loop is not None
+
+    async def start(self):
+        if self._loop is not None:
+            return
+        await self.bus.start(self._receive)
+        self._loop = asyncio.get_running_loop()
+
+    async def stop(self):
+        if self._loop is None:
+            return
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._loop = None
+        await self.bus.stop()
+
+    def publish(self, message: dict):
+        loop = self._loop
+        if loop is None:
+            return
+        payload = json.dumps({"origin": self.origin, **message}, ensure_ascii=False).encode("utf-8")
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            task = loop.create_task(self._publish(payload))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        else:
+            asyncio.run_coroutine_threadsafe(self._publish(payload), loop)
+
+    async def _publish(self, payload: bytes):
+        try:
+            await self.bus.publish(self.topic, payload)
+            self.stats["published"] += 1
+        except Exception as e:
+            print(f"❌ Broadcast to other workers failed ({self.topic}): {e}")
+
+    def _receive(self, topic: str, payload: bytes):
+        message = json.loads(payload)
+        if topic != self.topic or message.get("origin") == self.origin:
+            return
+        self.handler(message)
+        self.stats["received"] += 1
@@ -0,0 +1,414 @@
+# app/core/server.py
+# 운영 서버 실행기 (멀티 워커)
+# 사용법: python -m app.core.server
+# - 마스터가 소켓을 열고 앱을 미리 import한 뒤 CPU 수만큼 워커를 fork (워커는 uvicorn)
+# - SIGHUP: 새 워커를 띄운 뒤 기존 워커를 정상 종료 (무중단 교체)
+# - SIGTERM/SIGINT: 진행 중인 요청을 마치고 종료
+# - SIGTTIN/SIGTTOU: 워커 1개 추가/감소
+
+import json
+import os
+import random
+import resource
+import signal
+import socket
+import sys
+import time
+from typing import Dict, List, Optional
+
+import uvicorn
+
+from app.config import apply_multi_worker_defaults, settings
+
+# fork 전에 만들어졌다면 워커에서 새로 만들어야 하는 프로세스별 객체 (스레드/락/연결을 가진 싱글톤)
+PER_PROCESS_SINGLETONS = [
+    ("app.services.audit_service", "_audit_log"),
+    ("app.services.feed_service", "_hub"),
+    ("app.services.ledger_service", "_ledger"),
+    ("app.services.ledger_service", "_verifier"),
+    ("app.services.risk_service", "_engine"),
+    ("app.services.cart_service", "_backend"),
+    ("app.services.cart_service", "_product_cache"),
+    ("app.services.inventory_service", "_backend"),
+    ("app.services.inventory_service", "_reconciler"),
+    ("app.services.search_service", "_backend"),
+    ("app.services.search_service", "_sync"),
+    ("app.services.simulation_service", "_executor"),
+    ("app.services.user_cache", "_user_cache"),
+    ("app.services.kyc_service", "_pool"),
+    ("app.services.feature_store", "_store"),
+    ("app.services.encryption_service", "_encryptor"),
+    ("app.services.payout_service", "_engine"),
+    ("app.core.admission", "_controller"),
+    ("app.core.profiling", "_profiler"),
+    ("app.utils.email", "_sender"),
+    ("app.utils.file_handler", "_executor"),
+]
+
+
+WORKER_BOOT_ERROR = 3 # 워커가 시작하지 못하고 종료한 경우의 종료 코드
+
+
+def cpu_count() -> int:
+    """이 프로세스가 쓸 수 있는 CPU 수 (컨테이너 CPU 제한 반영)"""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def check_multi_worker_settings() -> List[str]:
+    """워커 여러 개로 실행하면 결과가 틀어지는 설정 (워커별 메모리 상태) 목록"""
+    problems = []
+    if settings.LEDGER_ENABLED:
+        problems.append("LEDGER_ENABLED: 원장은 단일 writer입니다 (API 워커는 false, 원장은 SERVER_WORKERS=1 프로세스로 따로 실행)")
+    if settings.CART_BACKEND == "memory":
+        problems.append("CART_BACKEND=memory: 워커마다 장바구니가 달라집니다 (redis 사용)")
+    if settings.INVENTORY_BACKEND == "memory":
+        problems.append("INVENTORY_BACKEND=memory: 워커마다 재고가 따로 차감됩니다 (database 또는 redis 사용)")
+    if settings.FEED_BUS_BACKEND == "memory":
+        # 시세 외에 검색 색인(SEARCH_BACKEND=memory), 위험 이벤트, 사용자/상품 캐시 무효화도 이 버스로 전파
+        problems.append("FEED_BUS_BACKEND=memory: 다른 워커에 시세, 검색 색인 변경, 위험 이벤트, 캐시 무효화가 "
+                        "전달되지 않습니다 (redis 사용)")
+    if settings.PROFILING_ENABLED:
+        problems.append("PROFILING_ENABLED: 프로파일링 세션은 연 워커에만 있습니다 (false, 프로파일링은 SERVER_WORKERS=1 프로세스에서)")
+    return problems
+
+
+# 워커별 지표 (워커가 파일로 기록, /health/workers에서 합산)
+def _metrics_path(pid: int) -> str:
+    return os.path.join(settings.SERVER_METRICS_DIR, f"worker-{pid}.json")
+
+
+def _rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            return round(int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 1)
+    except (OSError, ValueError):
+        return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def read_worker_metrics() -> dict:
+    """워커별 지표 합산 (응답이 없는 워커의 오래된 파일은 제외)"""
+    directory = settings.SERVER_METRICS_DIR
+    stale_before = time.time() - settings.SERVER_METRICS_INTERVAL * 3
+    workers = []
+    if os.path.isdir(directory):
+        for name in os.listdir(directory):
+            if not (name.startswith("worker-") and name.endswith(".json")):
+                continue
+            try:
+                with open(os.path.join(directory, name)) as f:
+                    metrics = json.load(f)
+            except (OSError, ValueError):
+                continue # 교체 중인 파일
+            if metrics.get("updated_at", 0) >= stale_before:
+                workers.append(metrics)
+    workers.sort(key=lambda metrics: metrics["index"])
+
+    admission: Dict[str, dict] = {}
+    for metrics in workers:
+        for route_class, stats in metrics.get("admission", {}).items():
+            total = admission.setdefault(route_class, {})
+            for key, value in stats.items():
+                if isinstance(value, (int, float)) and not key.endswith("_ms"):
+                    total[key] = round(total.get(key, 0) + value, 2)
+    return {
+        "workers": len(workers),
+        "requests": sum(metrics["requests"] for metrics in workers),
+        "connections": sum(metrics["connections"] for metrics in workers),
+        "rss_mb": round(sum(metrics["rss_mb"] for metrics in workers), 1),
+        "admission": admission,
+        "per_worker": workers,
+    }
+
+
+class WorkerServer(uvicorn.Server):
+    """워커용 uvicorn 서버 (이벤트 루프에서 주기적으로 지표 기록 -> 마스터가 응답 여부 확인)"""
+
+    def __init__(self, config: uvicorn.Config, index: int, generation: int):
+        config.callback_notify = self.write_metrics
+        config.timeout_notify = max(1, int(settings.SERVER_METRICS_INTERVAL))
+        super().__init__(config)
+        self.index = index
+        self.generation = generation
+        self.started_at = time.time()
+
+    async def startup(self, sockets: Optional[List[socket.socket]] = None) -> None:
+        await super().startup(sockets=sockets)
+        # 첫 기록이 준비 완료 신호 (SIGHUP 교체시 마스터가 이후에 기존 워커 종료)
+        await self.write_metrics()
+
+    async def write_metrics(self):
+        from app.core.admission import get_admission_controller
+
+        metrics = {
+            "pid": os.getpid(),
+            "index": self.index,
+            "generation": self.generation,
+            "started_at": self.started_at,
+            "updated_at": time.time(),
+            "requests": self.server_state.total_requests,
+            "connections": len(self.server_state.connections),
+            "max_requests": self.config.limit_max_requests,
+            "rss_mb": _rss_mb(),
+            "admission": get_admission_controller().status() if settings.ADMISSION_ENABLED else {},
+        }
+        path = _metrics_path(os.getpid())
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, "w") as f:
+                json.dump(metrics, f)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"❌ Worker metrics write failed: {e}", flush=True)
+
+
+def init_worker_process():
+    """fork 직후 워커 초기화 (마스터에서 상속한 연결/난수 상태/싱글톤 정리)"""
+    # 마스터의 시그널 처리를 없애고 uvicorn이 다시 설정하도록
+    for signum in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT, signal.SIGCHLD, signal.SIGTTIN, signal.SIGTTOU):
+        signal.signal(signum, signal.SIG_DFL)
+    random.seed()
+
+    # 마스터가 만든 DB 연결은 워커끼리 공유하면 안 되므로 닫지 않고 버림
+    database = sys.modules.get("app.database")
+    if database is not None:
+        database.engine.dispose(close=False)
+
+    for module_name, attribute in PER_PROCESS_SINGLETONS:
+        module = sys.modules.get(module_name)
+        if module is not None and getattr(module, attribute, None) is not None:
+            setattr(module, attribute, None)
+
+
+def _load_app():
+    from app.main import app
+    return app
+
+
+class WorkerProcess:
+    __slots__ = ("pid", "index", "generation", "started_at", "terminating_at")
+
+    def __init__(self, pid: int, index: int, generation: int):
+        self.pid = pid
+        self.index = index
+        self.generation = generation
+        self.started_at = time.monotonic()
+        self.terminating_at: Optional[float] = None
+
+
+class Arbiter:
+    """워커 프로세스 관리 (fork, 비정상 종료/요청 수 교체시 재시작, 무중단 교체, 정상 종료)"""
+
+    def __init__(self,
+                 host: Optional[str] = None,
+                 port: Optional[int] = None,
+                 workers: Optional[int] = None,
+                 preload: Optional[bool] = None):
+        self.host = host or settings.HOST
+        self.port = port or settings.PORT
+        self.num_workers = workers or settings.SERVER_WORKERS or cpu_count()
+        self.preload = settings.SERVER_PRELOAD if preload is None else preload
+        self.app = None
+        self.sock: Optional[socket.socket] = None
+        self.workers: Dict[int, WorkerProcess] = {}
+        self.generation = 0
+        self._signals: List[int] = []
+        self._boot_failures = 0
+
+    def run(self):
+        if self.num_workers > 1:
+            # 직접 지정하지 않은 원장/프로파일링/메시지 버스 설정은 멀티 워커 기본값으로 (fork 전이라 모든 워커에 적용)
+            apply_multi_worker_defaults(settings)
+            problems = check_multi_worker_settings()
+            if problems:
+                print("❌ Multi-worker mode is unsafe with these settings:", flush=True)
+                for problem in problems:
+                    print(f"   - {problem}", flush=True)
+                sys.exit(1)
+
+        self.sock = self._bind()
+        os.makedirs(settings.SERVER_METRICS_DIR, exist_ok=True)
+        for name in os.listdir(settings.SERVER_METRICS_DIR):
+            if name.startswith("worker-"):
+                os.unlink(os.path.join(settings.SERVER_METRICS_DIR, name))
+        if self.preload:
+            # 워커가 코드/상수 메모리를 공유 (copy-on-write), 코드 변경 반영은 재시작 필요
+            self.app = _load_app()
+
+        for signum in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT, signal.SIGCHLD, signal.SIGTTIN, signal.SIGTTOU):
+            signal.signal(signum, self._on_signal)
+        print(f"✅ Server listening on {self.host}:{self.port} with {self.num_workers} workers "
+              f"(pid {os.getpid()}, preload={self.preload})", flush=True)
+
+        try:
+            self._spawn_missing()
+            while True:
+                if self._handle_signals():
+                    break
+                self._reap()
+                self._spawn_missing()
+                self._check_workers()
+                time.sleep(0.2)
+        finally:
+            self._shutdown()
+
+    def _bind(self) -> socket.socket:
+        sock = socket.socket(socket.AF_INET6 if ":" in self.host else socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(settings.SERVER_BACKLOG)
+        sock.set_inheritable(True)
+        return sock
+
+    # 시그널 (핸들러는 기록만, 처리는 메인 루프에서)
+    def _on_signal(self, signum, frame):
+        self._signals.append(signum)
+
+    def _handle_signals(self) -> bool:
+        """True면 종료"""
+        while self._signals:
+            signum = self._signals.pop(0)
+            if signum in (signal.SIGTERM, signal.SIGINT):
+                return True
+            if signum == signal.SIGHUP:
+                print(f"🔄 Reloading workers (generation {self.generation + 1})", flush=True)
+                self.generation += 1
+            elif signum == signal.SIGTTIN:
+                self.num_workers += 1
+            elif signum == signal.SIGTTOU and self.num_workers > 1:
+                self.num_workers -= 1
+        return False
+
+    # 워커 관리
+    def _spawn_missing(self):
+        current = {worker.index for worker in self.workers.values()
+                   if worker.generation == self.generation and worker.terminating_at is None}
+        for index in range(self.num_workers):
+            if index not in current:
+                self._spawn(index)
+
+    def _spawn(self, index: int):
+        pid = os.fork()
+        if pid != 0:
+            self.workers[pid] = WorkerProcess(pid, index, self.generation)
+            return
+        # 워커 프로세스
+        exit_code = 0
+        try:
+            init_worker_process()
+            self._serve(index)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else 1
+        except KeyboardInterrupt:
+            pass
+        except BaseException as e:
+            print(f"❌ Worker {index} crashed: {e}", flush=True)
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _serve(self, index: int):
+        app = self.app if self.app is not None else _load_app()
+        max_requests = settings.SERVER_MAX_REQUESTS
+        if max_requests:
+            # 워커들이 한꺼번에 교체되지 않도록
+            max_requests += random.randint(0, settings.SERVER_MAX_REQUESTS_JITTER)
+        config = uvicorn.Config(
+            app,
+            log_level="debug" if settings.DEBUG else "info",
+            limit_max_requests=max_requests or None,
+            timeout_graceful_shutdown=int(settings.SERVER_GRACEFUL_TIMEOUT),
+            backlog=settings.SERVER_BACKLOG,
+        )
+        server = WorkerServer(config, index, self.generation)
+        server.run(sockets=[self.sock])
+        if not server.started:
+            # startup 이벤트 실패 (DB/Redis 연결 등)
+            sys.exit(WORKER_BOOT_ERROR)
+
+    def _reap(self):
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            worker = self.workers.pop(pid, None)
+            try:
+                os.unlink(_metrics_path(pid))
+            except FileNotFoundError:
+                pass
+            if worker is None or worker.terminating_at is not None:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            if code == 0:
+                # 최대 요청 수 도달로 교체 (빈자리는 _spawn_missing이 채움)
+                self._boot_failures = 0
+                continue
+            print(f"❌ Worker {worker.index} (pid {pid}) exited with code {code}, restarting", flush=True)
+            if code == WORKER_BOOT_ERROR or time.monotonic() - worker.started_at < 5:
+                # 시작하자마자 죽는 워커 (import 오류, DB 연결 실패 등)는 계속 다시 띄우지 않음
+                self._boot_failures += 1
+                if self._boot_failures >= 5:
+                    raise RuntimeError("워커가 시작 직후 계속 종료됩니다")
+            else:
+                self._boot_failures = 0
+
+    def _check_workers(self):
+        now = time.monotonic()
+        ready = {worker.index for worker in self.workers.values()
+                 if worker.generation == self.generation and os.path.exists(_metrics_path(worker.pid))}
+        for worker in list(self.workers.values()):
+            if worker.terminating_at is not None:
+                # 정상 종료 대기 시간이 지나면 강제 종료
+                if now - worker.terminating_at > settings.SERVER_GRACEFUL_TIMEOUT + 5:
+                    self._kill(worker.pid, signal.SIGKILL)
+                continue
+            if worker.generation != self.generation:
+                # 무중단 교체: 같은 자리의 새 워커가 준비된 뒤 (또는 대기 시간 초과시) 종료
+                if worker.index in ready or worker.index >= self.num_workers or now - worker.started_at > settings.SERVER_GRACEFUL_TIMEOUT:
+                    self._terminate(worker)
+                continue
+            if worker.index >= self.num_workers:
+                self._terminate(worker)
+                continue
+            # 이벤트 루프가 멈춘 워커 (지표 기록이 끊김)
+            path = _metrics_path(worker.pid)
+            if os.path.exists(path) and time.time() - os.path.getmtime(path) > settings.SERVER_WORKER_TIMEOUT:
+                print(f"❌ Worker {worker.index} (pid {worker.pid}) not responding, killing", flush=True)
+                self._kill(worker.pid, signal.SIGKILL)
+
+    def _terminate(self, worker: WorkerProcess):
+        worker.terminating_at = time.monotonic()
+        self._kill(worker.pid, signal.SIGTERM)
+
+    def _kill(self, pid: int, signum: int):
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+    def _shutdown(self):
+        print("🛑 Stopping workers", flush=True)
+        for worker in self.workers.values():
+            if worker.terminating_at is None:
+                self._terminate(worker)
+        deadline = time.monotonic() + settings.SERVER_GRACEFUL_TIMEOUT + 5
+        while self.workers and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.1)
+        for pid in list(self.workers):
+            self._kill(pid, signal.SIGKILL)
+        self._reap()
+        if self.sock is not None:
+            self.sock.close()
+
+
+def main():
+    Arbiter().run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+# app/core/static_files.py
+import gzip
+import hashlib
+import os
+import re
+import stat
+import sys
+import threading
+from mimetypes import guess_type
+from typing import Dict, Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+from app.config import settings
+
+try:
+    import brotli # 선택 의존성 (.br 사전 압축용)
+except ImportError:
+    brotli = None
+
+# 지문(fingerprint) 포함 경로: name.<12자리 해시>.ext
+_FINGERPRINT_PATTERN = re.compile(r"^(?P<stem>.+)\.(?P<hash>[0-9a-f]{12})(?P<ext>\.[^./]+)$")
+
+# 내용 해시로 이름이 정해진 파일 (업로드 이미지)
+_CONTENT_ADDRESSED_PATTERN = re.compile(r"^[0-9a-f]{64}")
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# 사전 압축 대상 확장자
+COMPRESSIBLE_EXTENSIONS = {".css", ".js", ".mjs", ".json", ".svg", ".html", ".txt", ".xml", ".map"}
+
+# WebP로 대체 가능한 확장자
+WEBP_SOURCE_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+
+# 파일 지문 캐시 {경로: (mtime_ns, size, 해시)}
+_fingerprints: Dict[str, Tuple[int, int, str]] = {}
+_fingerprints_lock = threading.Lock()
+
+
+def file_fingerprint(full_path: str) -> str:
+    """파일 내용 해시 앞 12자리 (mtime/크기가 같으면 캐시 사용)"""
+    stat_result = os.stat(full_path)
+    with _fingerprints_lock:
+        cached = _fingerprints.get(full_path)
+    if cached and cached[0] == stat_result.st_mtime_ns and cached[1] == stat_result.st_size:
+        return cached[2]
+
+    hasher = hashlib.sha256()
+    with open(full_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            hasher.update(block)
+    fingerprint = hasher.hexdigest()[:12]
+
+    with _fingerprints_lock:
+        _fingerprints[full_path] = (stat_result.st_mtime_ns, stat_result.st_size, fingerprint)
+    return fingerprint
+
+
+def asset_url(relative_path: str, mount_path: str = "/static") -> str:
+    """불변(immutable) 캐시용 지문 포함 URL 생성 (static/css/app.css -> /static/css/app.<hash>.css)"""
+    relative_path = relative_path.lstrip("/")
+    name = os.path.basename(relative_path)
+    if _CONTENT_ADDRESSED_PATTERN.match(name):
+        return f"{mount_path}/{relative_path}"
+
+    fingerprint = file_fingerprint(os.path.join(settings.STATIC_DIR, relative_path))
+    stem, ext = os.path.splitext(relative_path)
+    return f"{mount_path}/{stem}.{fingerprint}{ext}"
+
+
+def _accepts(header_value: str, token: str) -> bool:
+    """Accept 계열 헤더에 token이 (q=0이 아닌 상태로) 포함되어 있는지 확인"""
+    for part in header_value.split(","):
+        fields = [field.strip() for field in part.split(";")]
+        if fields[0].lower() != token:
+            continue
+        for param in fields[1:]:
+            if param.replace(" ", "").lower() in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                return False
+        return True
+    return False
+
+
+class StaticFileResponse(FileResponse):
+    """Range 요청과 zero-copy 전송을 지원하는 파일 응답"""
+
+    def __init__(self, *args, range_header: Optional[str] = None, if_range: Optional[str] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.headers["accept-ranges"] = "bytes"
+        self.offset = 0
+        self.count = self.stat_result.st_size if self.stat_result else None
+
+        if range_header and self.stat_result is not None and self.status_code == 200:
+            # If-Range가 현재 ETag와 다르면 전체 파일 전송
+            if if_range is None or if_range == self.headers.get("etag"):
+                self._apply_range(range_header, self.stat_result.st_size)
+
+    def _apply_range(self, range_header: str, size: int):
+        """단일 바이트 범위만 지원 (다중 범위는 전체 전송)"""
+        match = _RANGE_PATTERN.match(range_header.strip())
+        if not match or (not match.group(1) and not match.group(2)):
+            return
+
+        start_text, end_text = match.groups()
+        if start_text:
+            start = int(start_text)
+            if end_text and int(end_text) < start:
+                # 끝이 시작보다 앞인 범위는 잘못된 헤더이므로 무시하고 전체 전송 (RFC 9110 14.1.1)
+                return
+            end = min(int(end_text), size - 1) if end_text else size - 1
+        else:
+            # bytes=-N : 마지막 N바이트
+            start = max(size - int(end_text), 0)
+            end = size - 1
+
+        if start >= size or start > end:
+            self.status_code = 416
+            self.offset, self.count = 0, 0
+            self.headers["content-range"] = f"bytes */{size}"
+            self.headers["content-length"] = "0"
+            return
+
+        self.status_code = 206
+        self.offset, self.count = start, end - start + 1
+        self.headers["content-range"] = f"bytes {start}-{end}/{size}"
+        self.headers["content-length"] = str(self.count)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        })
+
+        if self.send_header_only or not self.count:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        elif "http.response.zerocopysend" in scope.get("extensions", {}):
+            # 서버가 지원하면 sendfile로 커널에서 바로 전송
+            with open(self.path, "rb") as file:
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": file.fileno(),
+                    "offset": self.offset,
+                    "count": self.count,
+                    "more_body": False,
+                })
+        else:
+            async with await anyio.open_file(self.path, mode="rb") as file:
+                await file.seek(self.offset)
+                remaining = self.count
+                while remaining > 0:
+                    chunk = await file.read(min(self.chunk_size, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    await send({
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": remaining > 0,
+                    })
+                if remaining > 0:
+                    await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+        if self.background is not None:
+            await self.background()
+
+
+class OptimizedStaticFiles(StaticFiles):
+    """불변 캐시 헤더, 사전 압축/WebP 협상, Range 요청을 지원하는 정적 파일 서빙"""
+
+    def __init__(self, *args,
+                 immutable_max_age: Optional[int] = None,
+                 max_age: Optional[int] = None,
+                 **kwargs):
+        super().__init__(*args, **kwargs)
+        self.immutable_max_age = immutable_max_age if immutable_max_age is not None else settings.STATIC_IMMUTABLE_MAX_AGE
+        self.max_age = max_age if max_age is not None else settings.STATIC_MAX_AGE
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405)
+
+        request_headers = Headers(scope=scope)
+        resolved = await anyio.to_thread.run_sync(self._resolve, path, request_headers)
+        if resolved is None:
+            # 디렉터리, html 모드 등은 기본 동작 사용
+            return await super().get_response(path, scope)
+
+        full_path, stat_result, media_type, content_encoding, immutable, vary = resolved
+
+        headers = {}
+        if immutable:
+            headers["cache-control"] = f"public, max-age={self.immutable_max_age}, immutable"
+        else:
+            headers["cache-control"] = f"public, max-age={self.max_age}"
+        if content_encoding:
+            headers["content-encoding"] = content_encoding
+        if vary:
+            headers["vary"] = ", ".join(vary)
+
+        response = StaticFileResponse(
+            full_path,
+            stat_result=stat_result,
+            media_type=media_type,
+            headers=headers,
+            method=scope["method"],
+            range_header=request_headers.get("range"),
+            if_range=request_headers.get("if-range"),
+        )
+        if response.status_code == 200 and self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def _resolve(self, path: str, request_headers: Headers):
+        """요청 경로를 실제 제공할 파일로 변환 (스레드에서 실행)
+
+        반환값: (파일 경로, stat, media type, content-encoding, immutable 여부, vary 목록)
+        """
+        immutable = False
+        full_path, stat_result = self.lookup_path(path)
+
+        if stat_result is None:
+            # 지문 포함 경로 -> 원본 파일 (지문이 현재 내용과 같을 때만 불변 캐시)
+            directory, name = os.path.split(path)
+            match = _FINGERPRINT_PATTERN.match(name)
+            if not match:
+                return None
+            full_path, stat_result = self.lookup_path(os.path.join(directory, match.group("stem") + match.group("ext")))
+            if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                return None
+            immutable = file_fingerprint(full_path) == match.group("hash")
+        elif not stat.S_ISREG(stat_result.st_mode):
+            return None
+        elif _CONTENT_ADDRESSED_PATTERN.match(os.path.basename(full_path)):
+            immutable = True
+
+        media_type = guess_type(full_path)[0] or "text/plain"
+        base, ext = os.path.splitext(full_path)
+        ext = ext.lower()
+        vary = []
+
+        # 이미지: Accept에 image/webp가 있으면 WebP 변형 제공
+        if ext in WEBP_SOURCE_EXTENSIONS:
+            vary.append("Accept")
+            if _accepts(request_headers.get("accept", ""), "image/webp"):
+                webp_stat = self._stat_regular(base + ".webp")
+                if webp_stat is not None:
+                    return base + ".webp", webp_stat, "image/webp", None, immutable, vary
+
+        # 텍스트 계열: 사전 압축본 제공 (br > gzip)
+        if ext in COMPRESSIBLE_EXTENSIONS:
+            vary.append("Accept-Encoding")
+            accept_encoding = request_headers.get("accept-encoding", "")
+            for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+                if _accepts(accept_encoding, encoding):
+                    encoded_stat = self._stat_regular(full_path + suffix)
+                    if encoded_stat is not None:
+                        return full_path + suffix, encoded_stat, media_type, encoding, immutable, vary
+
+        return full_path, stat_result, media_type, None, immutable, vary
+
+    @staticmethod
+    def _stat_regular(full_path: str) -> Optional[os.stat_result]:
+        """일반 파일이면 stat 반환"""
+        try:
+            stat_result = os.stat(full_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return stat_result if stat.S_ISREG(stat_result.st_mode) else None
+
+
+def precompress(directory: str, min_size: int = 1024) -> int:
+    """압축 가능한 정적 파일의 .gz/.br 사전 압축본 생성 (변경된 파일만)"""
+    written = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if os.path.splitext(name)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+                continue
+            source = os.path.join(root, name)
+            source_stat = os.stat(source)
+            if source_stat.st_size < min_size:
+                continue
+
+            with open(source, "rb") as f:
+                data = f.read()
+
+            encoders = [(".gz", lambda d: gzip.compress(d, compresslevel=9, mtime=0))]
+            if brotli is not None:
+                encoders.append((".br", lambda d: brotli.compress(d, quality=11)))
+
+            for suffix, encode in encoders:
+                target = source + suffix
+                if os.path.exists(target) and os.stat(target).st_mtime >= source_stat.st_mtime:
+                    continue
+                encoded = encode(data)
+                if len(encoded) >= len(data):
+                    continue
+                with open(target, "wb") as f:
+                    f.write(encoded)
+                written += 1
+    return written
+
+
+if __name__ == "__main__":
+    # 사용법: python -m app.core.static_files [디렉터리]
+    target_dir = sys.argv[1] if len(sys.argv) > 1 else settings.STATIC_DIR
+    count = precompress(target_dir)
+    print(f"✅ Precompressed {count} files in {target_dir}")
@@ -5,6 +5,11 @@ from fastapi.responses import JSONResponse
 import uvicorn
 import os
 
+from app.config import settings
+from app.core.static_files import OptimizedStaticFiles
+from app.core.admission import AdmissionControlMiddleware, get_admission_controller
+from app.core.profiling import ProfiledJSONResponse, ProfilingMiddleware
+
 
 app = FastAPI(
     title="FAANK API",
@@ -12,8 +17,17 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs", # Swagger UI
     redoc_url="/redoc", # ReDoc
+    default_response_class=ProfiledJSONResponse, # 프로파일링 세션 중 직렬화 시간 기록
 )
 
+# 과부하 제어 (CORS 안쪽에 두어 503 응답에도 CORS 헤더 포함)
+if settings.ADMISSION_ENABLED:
+    app.add_middleware(AdmissionControlMiddleware)
+
+# 요청 프로파일링 (과부하 제어 바깥에 두어 대기열 시간도 queue 구간으로 기록)
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
 # CORS 설정 (프론트엔드 통신용)
 app.add_middleware(
     CORSMiddleware,
@@ -24,8 +38,11 @@ app.add_middleware(
 )
 
 # 정적 파일 서빙 (상품 이미지 등)
-if os.path.exists("static"):
-    app.mount("/static", StaticFiles(directory="static"), name="static")
+if os.path.exists(settings.STATIC_DIR):
+    if settings.STATIC_OPTIMIZED:
+        app.mount("/static", OptimizedStaticFiles(directory=settings.STATIC_DIR), name="static")
+    else:
+        app.mount("/static", StaticFiles(directory=settings.STATIC_DIR), name="static")
 
 # 라우터 import 및 등록
 try:
@@ -37,6 +54,141 @@ except ImportError as e:
 except Exception as e:
     print(f"❌ Auth router registration failed: {e}")
 
+try:
+    from app.routers import simulation
+    app.include_router(simulation.router, prefix="/api/simulation", tags=["투자 시뮬레이션"])
+    print("✅ Simulation router registered successfully")
+except ImportError as e:
+    print(f"❌ Simulation router import failed: {e}")
+except Exception as e:
+    print(f"❌ Simulation router registration failed: {e}")
+
+try:
+    from app.routers import uploads
+    app.include_router(uploads.router, prefix="/api/uploads", tags=["파일 업로드"])
+    print("✅ Uploads router registered successfully")
+except ImportError as e:
+    print(f"❌ Uploads router import failed: {e}")
+except Exception as e:
+    print(f"❌ Uploads router registration failed: {e}")
+
+try:
+    from app.routers import market
+    app.include_router(market.router, prefix="/api/market", tags=["실시간 시세"])
+    print("✅ Market router registered successfully")
+except ImportError as e:
+    print(f"❌ Market router import failed: {e}")
+except Exception as e:
+    print(f"❌ Market router registration failed: {e}")
+
+try:
+    from app.routers import ledger
+    app.include_router(ledger.router, prefix="/api/ledger", tags=["토큰 원장"])
+    print("✅ Ledger router registered successfully")
+except ImportError as e:
+    print(f"❌ Ledger router import failed: {e}")
+except Exception as e:
+    print(f"❌ Ledger router registration failed: {e}")
+
+try:
+    from app.routers import risk
+    app.include_router(risk.router, prefix="/api/risk", tags=["이상 거래 탐지"])
+    print("✅ Risk router registered successfully")
+except ImportError as e:
+    print(f"❌ Risk router import failed: {e}")
+except Exception as e:
+    print(f"❌ Risk router registration failed: {e}")
+
+try:
+    from app.routers import cart
+    app.include_router(cart.router, prefix="/api/cart", tags=["장바구니"])
+    print("✅ Cart router registered successfully")
+except ImportError as e:
+    print(f"❌ Cart router import failed: {e}")
+except Exception as e:
+    print(f"❌ Cart router registration failed: {e}")
+
+try:
+    from app.routers import inventory
+    app.include_router(inventory.router, prefix="/api/inventory", tags=["재고 선점"])
+    print("✅ Inventory router registered successfully")
+except ImportError as e:
+    print(f"❌ Inventory router import failed: {e}")
+except Exception as e:
+    print(f"❌ Inventory router registration failed: {e}")
+
+try:
+    from app.routers import audit
+    app.include_router(audit.router, prefix="/api/audit", tags=["감사 로그"])
+    print("✅ Audit router registered successfully")
+except ImportError as e:
+    print(f"❌ Audit router import failed: {e}")
+except Exception as e:
+    print(f"❌ Audit router registration failed: {e}")
+
+try:
+    from app.routers import kyc
+    app.include_router(kyc.router, prefix="/api/kyc", tags=["KYC"])
+    print("✅ KYC router registered successfully")
+except ImportError as e:
+    print(f"❌ KYC router import failed: {e}")
+except Exception as e:
+    print(f"❌ KYC router registration failed: {e}")
+
+try:
+    from app.routers import search
+    app.include_router(search.router, prefix="/api/search", tags=["상품 검색"])
+    print("✅ Search router registered successfully")
+except ImportError as e:
+    print(f"❌ Search router import failed: {e}")
+except Exception as e:
+    print(f"❌ Search router registration failed: {e}")
+
+try:
+    from app.routers import profiling
+    app.include_router(profiling.router, prefix="/api/profiling", tags=["프로파일링"])
+    print("✅ Profiling router registered successfully")
+except ImportError as e:
+    print(f"❌ Profiling router import failed: {e}")
+except Exception as e:
+    print(f"❌ Profiling router registration failed: {e}")
+
+try:
+    from app.routers import pii
+    app.include_router(pii.router, prefix="/api/pii", tags=["개인정보 암호화"])
+    print("✅ PII router registered successfully")
+except ImportError as e:
+    print(f"❌ PII router import failed: {e}")
+except Exception as e:
+    print(f"❌ PII router registration failed: {e}")
+
+try:
+    from app.routers import distribution
+    app.include_router(distribution.router, prefix="/api/distributions", tags=["토큰 분배"])
+    print("✅ Distribution router registered successfully")
+except ImportError as e:
+    print(f"❌ Distribution router import failed: {e}")
+except Exception as e:
+    print(f"❌ Distribution router registration failed: {e}")
+
+try:
+    from app.routers import notifications
+    app.include_router(notifications.router, prefix="/api/notifications", tags=["알림"])
+    print("✅ Notifications router registered successfully")
+except ImportError as e:
+    print(f"❌ Notifications router import failed: {e}")
+except Exception as e:
+    print(f"❌ Notifications router registration failed: {e}")
+
+try:
+    from app.routers import users
+    app.include_router(users.router, prefix="/api/internal/users", tags=["내부 서비스"])
+    print("✅ Users router registered successfully")
+except ImportError as e:
+    print(f"❌ Users router import failed: {e}")
+except Exception as e:
+    print(f"❌ Users router registration failed: {e}")
+
 # 헬스 체크 엔드포인트
 @app.get("/")
 async def root():
@@ -46,6 +198,116 @@ async def root():
 async def health_check():
     return {"status": "healthy", "version":"1.0.0"}
 
+@app.get("/health/admission")
+async def admission_status():
+    """경로 클래스별 동시 처리 한도/대기열 현황"""
+    return get_admission_controller().status()
+
+@app.get("/health/workers")
+async def workers_status():
+    """워커별 요청 수/연결 수/메모리 합산 (python -m app.core.server로 실행했을 때)"""
+    from app.core.server import read_worker_metrics
+    return read_worker_metrics()
+
+def _broadcasters():
+    """워커 간 전파가 필요한 프로세스별 상태"""
+    from app.services.cart_service import get_product_cache
+    from app.services.risk_service import get_risk_engine
+    from app.services.user_cache import get_user_cache
+    broadcasters = [get_product_cache().broadcaster, get_user_cache().broadcaster]
+    if settings.RISK_ENABLED:
+        broadcasters.append(get_risk_engine().broadcaster)
+    return broadcasters
+
+# 앱 시작시 초기화
+@app.on_event("startup")
+async def startup_event():
+    from app.services.feed_service import get_feed_hub
+    await get_feed_hub().start()
+
+    if settings.LEDGER_ENABLED:
+        from app.services.ledger_service import get_ledger, get_ledger_verifier
+        await get_ledger().start()
+        get_ledger_verifier().start()
+
+    if settings.SMTP_SERVER:
+        from app.utils.email import get_email_sender
+        get_email_sender().start()
+
+    from app.services.inventory_service import get_inventory_reconciler
+    get_inventory_reconciler().start()
+
+    if settings.AUDIT_ENABLED:
+        from app.services.audit_service import get_audit_log
+        get_audit_log().start()
+
+    if settings.KYC_WORKER_ENABLED:
+        from app.services.kyc_service import get_kyc_pool
+        await get_kyc_pool().start()
+
+    # 검색 색인은 백그라운드에서 구성 (완료 전에는 DB LIKE 검색)
+    from app.services.search_service import get_search_backend, get_search_sync
+    get_search_backend().start()
+    if get_search_backend().name == "memory":
+        # 다른 워커가 커밋한 상품 변경 수신
+        await get_search_sync().start()
+
+    # 다른 워커의 위험 이벤트/캐시 무효화 수신
+    for broadcaster in _broadcasters():
+        await broadcaster.start()
+
+    # 중단된 분배는 마지막 체크포인트부터 이어서 지급
+    if settings.PAYOUT_ENABLED:
+        from app.services.payout_service import get_payout_engine
+        get_payout_engine().resume_all()
+
+# 앱 종료시 정리
+@app.on_event("shutdown")
+async def shutdown_event():
+    from app.services.feed_service import get_feed_hub
+    await get_feed_hub().stop()
+
+    if settings.LEDGER_ENABLED:
+        from app.services.ledger_service import get_ledger, get_ledger_verifier
+        await get_ledger_verifier().stop()
+        await get_ledger().stop()
+
+    if settings.SMTP_SERVER:
+        from app.utils.email import get_email_sender
+        get_email_sender().stop()
+
+    from app.services.inventory_service import get_inventory_reconciler
+    await get_inventory_reconciler().stop()
+
+    from app.services.search_service import get_search_sync
+    await get_search_sync().stop()
+
+    for broadcaster in _broadcasters():
+        await broadcaster.stop()
+
+    if settings.KYC_WORKER_ENABLED:
+        from app.services.kyc_service import get_kyc_pool
+        await get_kyc_pool().stop()
+
+    if settings.PAYOUT_ENABLED:
+        from app.services.payout_service import get_payout_engine
+        get_payout_engine().stop()
+
+    if settings.AUDIT_ENABLED:
+        from app.services.audit_service import get_audit_log
+        get_audit_log().stop()
+
+    try:
+        from app.services.simulation_service import shutdown_executor
+        shutdown_executor()
+    except ImportError:
+        pass
+    try:
+        from app.utils.file_handler import shutdown_executor as shutdown_image_executor
+        shutdown_image_executor()
+    except ImportError:
+        pass
+
 # 글로벌 예외 처리
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
@@ -56,9 +318,15 @@ async def http_exception_handler(request, exc):
 
 # 서버 실행 지정
 if __name__ == "__main__":
-    uvicorn.run(
-        "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True
-    )
\ No newline at end of file
+    if settings.DEBUG:
+        # 개발: 단일 프로세스 + 코드 변경시 자동 재시작
+        uvicorn.run(
+            "app.main:app",
+            host=settings.HOST,
+            port=settings.PORT,
+            reload=True
+        )
+    else:
+        # 운영: 멀티 워커 (app.core.server)
+        from app.core.server import main
+        main()
\ No newline at end of file
@@ -1,5 +1,14 @@
 # app/models/__init__.py
 from .user import User, SMSVerification, UserSession
+from .ledger import LedgerEntry
+from .product import Product
+from .order import Order, OrderItem
+from .inventory import InventoryReservation
+from .audit import AuditEvent
+from .kyc import KycJob
+from .encryption import EncryptionKey
+from .distribution import Distribution, DistributionPayout
+from .notification import Notification
 
 # 모든 모델을 한 곳에서 import할 수 있도록
-__all__ = ["User", "SMSVerification", "UserSession"]
\ No newline at end of file
+__all__ = ["User", "SMSVerification", "UserSession", "LedgerEntry", "Product", "Order", "OrderItem", "InventoryReservation", "AuditEvent", "KycJob", "EncryptionKey", "Distribution", "DistributionPayout", "Notification"]
\ No newline at end of file
@@ -0,0 +1,40 @@
+# app/models/audit.py
+from sqlalchemy import Column, BigInteger, Integer, String, Boolean, DateTime, Text, Index
+from app.database import Base
+
+class AuditEvent(Base):
+    """보안 감사 로그 (추가 전용, PostgreSQL에서는 월별 파티션)"""
+    __tablename__ = "audit_events"
+
+    # 파티션 테이블의 기본키에는 파티션 키(occurred_at)가 포함되어야 함
+    # id는 기록 시점에 앱에서 생성 (시간순 64비트, 시퀀스 조회 없음)
+    id = Column(BigInteger, primary_key=True, autoincrement=False)
+    occurred_at = Column(DateTime(timezone=True), primary_key=True)
+    event_type = Column(String(50), nullable=False) # login_success, login_failure, register, sms_sent, ...
+    actor_id = Column(Integer, nullable=True) # 사용자 ID (로그인 전이면 None)
+    target = Column(String(200), nullable=True) # 마스킹된 전화번호, 관리자 API 경로 등
+    ip_address = Column(String(45), nullable=True)
+    success = Column(Boolean, nullable=False, default=True)
+    detail = Column(Text, nullable=True) # JSON 문자열
+
+    __table_args__ = (
+        Index("ix_audit_events_occurred_at", "occurred_at"),
+        Index("ix_audit_events_actor", "actor_id", "occurred_at"),
+        {"postgresql_partition_by": "RANGE (occurred_at)"},
+    )
+
+    def __repr__(self):
+        return f"<AuditEvent(id={self.id}, event_type={self.event_type}, actor_id={self.actor_id}, occurred_at={self.occurred_at})>"
+
+    def to_dict(self):
+        """모델을 딕셔너리로 변환 (JSON 응답용)"""
+        return {
+            "id": self.id,
+            "occurred_at": self.occurred_at.isoformat() if self.occurred_at else None,
+            "event_type": self.event_type,
+            "actor_id": self.actor_id,
+            "target": self.target,
+            "ip_address": self.ip_address,
+            "success": self.success,
+            "detail": self.detail,
+        }
@@ -0,0 +1,76 @@
+# app/models/distribution.py
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+class Distribution(Base):
+    """토큰 보유자 배당/분배 (기준일 보유량 비례, 청크 단위로 지급 진행)"""
+    __tablename__ = "distributions"
+
+    distribution_id = Column(Integer, primary_key=True, index=True)
+    token_id = Column(String(64), nullable=False, index=True)
+    total_amount = Column(BigInteger, nullable=False) # 지급 총액 (최소 단위 정수)
+    record_date = Column(DateTime(timezone=True), nullable=False) # 이 시각까지 기록된 원장 기준 보유량
+    status = Column(String(20), default="pending") # pending, running, completed, failed
+    holders = Column(Integer, nullable=True) # 기준일 보유자 수 (스냅샷 후 채움)
+    total_supply = Column(BigInteger, nullable=True) # 기준일 총 보유량
+    snapshot_sha256 = Column(String(64), nullable=True) # 스냅샷 파일 체크섬 (재개시 검증)
+    chunk_size = Column(Integer, nullable=False)
+    chunks = Column(Integer, nullable=True)
+    next_chunk = Column(Integer, default=0) # 체크포인트 (이 청크부터 이어서 지급)
+    paid_holders = Column(Integer, default=0)
+    paid_amount = Column(BigInteger, default=0)
+    lease_until = Column(DateTime(timezone=True), nullable=True) # 실행 중인 워커의 점유 만료 시각
+    error = Column(String(255), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<Distribution(distribution_id={self.distribution_id}, token_id={self.token_id}, total_amount={self.total_amount}, status={self.status})>"
+
+    def to_dict(self):
+        """모델을 딕셔너리로 변환 (JSON 응답용)"""
+        return {
+            "distribution_id": self.distribution_id,
+            "token_id": self.token_id,
+            "total_amount": self.total_amount,
+            "record_date": self.record_date.isoformat() if self.record_date else None,
+            "status": self.status,
+            "holders": self.holders,
+            "total_supply": self.total_supply,
+            "chunks": self.chunks,
+            "next_chunk": self.next_chunk,
+            "paid_holders": self.paid_holders,
+            "paid_amount": self.paid_amount,
+            "error": self.error,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+        }
+
+class DistributionPayout(Base):
+    """배당 지급 원장 (분배별 보유자당 1행, 기본키로 중복 지급 방지)"""
+    __tablename__ = "distribution_payouts"
+
+    distribution_id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, primary_key=True) # 원장 계정 (ledger_entries.to_account와 같은 값)
+    holding = Column(BigInteger, nullable=False) # 기준일 보유량
+    amount = Column(BigInteger, nullable=False) # 지급액 (최소 단위 정수)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # 사용자별 지급 내역 조회용
+        Index("ix_distribution_payouts_user", "user_id", "distribution_id"),
+    )
+
+    def __repr__(self):
+        return f"<DistributionPayout(distribution_id={self.distribution_id}, user_id={self.user_id}, amount={self.amount})>"
+
+    def to_dict(self):
+        """모델을 딕셔너리로 변환 (JSON 응답용)"""
+        return {
+            "distribution_id": self.distribution_id,
+            "user_id": self.user_id,
+            "holding": self.holding,
+            "amount": self.amount,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
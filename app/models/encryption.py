@@ -0,0 +1,28 @@
+# app/models/encryption.py
+from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy.sql import func
+from app.database import Base
+
+class EncryptionKey(Base):
+    """개인정보 암호화 데이터 키 (마스터 키로 감싼 상태로만 저장)"""
+    __tablename__ = "encryption_keys"
+
+    key_id = Column(Integer, primary_key=True, index=True)
+    wrapped_key = Column(Text, nullable=False) # 마스터 키로 암호화한 데이터 키 (base64)
+    master_key_id = Column(String(64), nullable=False) # 감쌀 때 사용한 마스터 키 식별자
+    status = Column(String(20), default="active", index=True) # active (암호화에 사용), retired (복호화만)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    retired_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<EncryptionKey(key_id={self.key_id}, status={self.status}, master_key_id={self.master_key_id})>"
+
+    def to_dict(self):
+        """모델을 딕셔너리로 변환 (JSON 응답용, 키 자료 제외)"""
+        return {
+            "key_id": self.key_id,
+            "master_key_id": self.master_key_id,
+            "status": self.status,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "retired_at": self.retired_at.isoformat() if self.retired_at else None,
+        }
@@ -0,0 +1,25 @@
+# app/models/inventory.py
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+class InventoryReservation(Base):
+    """재고 선점 (한정 판매/청약 구매 확정 전 임시 확보)"""
+    __tablename__ = "inventory_reservations"
+
+    reservation_id = Column(String(32), primary_key=True) # uuid4 hex
+    product_id = Column(Integer, ForeignKey("products.product_id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False, index=True)
+    quantity = Column(Integer, nullable=False)
+    status = Column(String(20), default="held") # held, confirmed, released, expired
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    order_id = Column(Integer, ForeignKey("orders.order_id"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # 만료 정리(reconciler) 조회용
+        Index("ix_inventory_reservations_status_expires", "status", "expires_at"),
+    )
+
+    def __repr__(self):
+        return f"<InventoryReservation(reservation_id={self.reservation_id}, product_id={self.product_id}, quantity={self.quantity}, status={self.status})>"
@@ -0,0 +1,40 @@
+# app/models/kyc.py
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+class KycJob(Base):
+    """KYC 검증 작업 (DB가 작업 큐 역할)"""
+    __tablename__ = "kyc_jobs"
+
+    job_id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False, index=True)
+    status = Column(String(20), default="queued") # queued, processing, verified, rejected, failed
+    attempts = Column(Integer, default=0)
+    payload = Column(Text, nullable=False) # 검증 요청 정보 (JSON)
+    reason = Column(String(255), nullable=True) # 거절/실패 사유
+    provider_ref = Column(String(100), nullable=True) # 외부 검증 기관 참조 번호
+    available_at = Column(DateTime(timezone=True), server_default=func.now()) # 재시도 대기 후 처리 가능 시각
+    claimed_at = Column(DateTime(timezone=True), nullable=True) # 워커가 가져간 시각
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # 대기 작업 가져오기용
+        Index("ix_kyc_jobs_status_available", "status", "available_at"),
+    )
+
+    def __repr__(self):
+        return f"<KycJob(job_id={self.job_id}, user_id={self.user_id}, status={self.status}, attempts={self.attempts})>"
+
+    def to_dict(self):
+        """모델을 딕셔너리로 변환 (JSON 응답용, payload 제외)"""
+        return {
+            "job_id": self.job_id,
+            "user_id": self.user_id,
+            "status": self.status,
+            "attempts": self.attempts,
+            "reason": self.reason,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
@@ -0,0 +1,39 @@
+# app/models/ledger.py
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+class LedgerEntry(Base):
+    """토큰 소유권 원장 (추가 전용, 해시 체인)"""
+    __tablename__ = "ledger_entries"
+
+    seq = Column(BigInteger, primary_key=True, autoincrement=False) # 원장 순번 (0부터)
+    token_id = Column(String(64), nullable=False)
+    from_account = Column(Integer, nullable=True) # 발행(issue)이면 None
+    to_account = Column(Integer, nullable=False)
+    amount = Column(BigInteger, nullable=False) # 최소 단위 정수
+    timestamp = Column(String(32), nullable=False) # 해시 계산에 쓰인 ISO 시각 그대로 보관
+    prev_hash = Column(String(64), nullable=False)
+    entry_hash = Column(String(64), nullable=False, unique=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_ledger_entries_token_to", "token_id", "to_account"),
+        Index("ix_ledger_entries_token_from", "token_id", "from_account"),
+    )
+
+    def __repr__(self):
+        return f"<LedgerEntry(seq={self.seq}, token_id={self.token_id}, from={self.from_account}, to={self.to_account}, amount={self.amount})>"
+
+    def to_dict(self):
+        """모델을 딕셔너리로 변환 (해시 검증용)"""
+        return {
+            "seq": self.seq,
+            "token_id": self.token_id,
+            "from_account": self.from_account,
+            "to_account": self.to_account,
+            "amount": self.amount,
+            "timestamp": self.timestamp,
+            "prev_hash": self.prev_hash,
+            "entry_hash": self.entry_hash,
+        }
@@ -0,0 +1,37 @@
+# app/models/notification.py
+from sqlalchemy import Column, BigInteger, Integer, String, Boolean, DateTime, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+class Notification(Base):
+    """사용자 알림 (앱 내 알림함)"""
+    __tablename__ = "notifications"
+
+    notification_id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    user_id = Column(Integer, nullable=False)
+    kind = Column(String(30), nullable=False) # distribution, ...
+    title = Column(String(100), nullable=False)
+    body = Column(String(500), nullable=False)
+    reference_id = Column(Integer, nullable=True) # 관련 항목 ID (분배 ID 등)
+    is_read = Column(Boolean, default=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # 알림함 조회용 (최신순)
+        Index("ix_notifications_user_created", "user_id", "created_at"),
+    )
+
+    def __repr__(self):
+        return f"<Notification(notification_id={self.notification_id}, user_id={self.user_id}, kind={self.kind})>"
+
+    def to_dict(self):
+        """모델을 딕셔너리로 변환 (JSON 응답용)"""
+        return {
+            "notification_id": self.notification_id,
+            "kind": self.kind,
+            "title": self.title,
+            "body": self.body,
+            "reference_id": self.reference_id,
+            "is_read": self.is_read,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
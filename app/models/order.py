@@ -0,0 +1,58 @@
+# app/models/order.py
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.database import Base
+
+class Order(Base):
+    """주문 모델"""
+    __tablename__ = "orders"
+
+    order_id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.user_id"), nullable=False, index=True)
+    status = Column(String(20), default="pending") # pending, paid, shipped, completed, cancelled
+    total_amount = Column(Integer, nullable=False) # 원 단위
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # 관계 설정
+    items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan")
+
+    def __repr__(self):
+        return f"<Order(order_id={self.order_id}, user_id={self.user_id}, status={self.status}, total_amount={self.total_amount})>"
+
+    def to_dict(self):
+        """모델을 딕셔너리로 변환 (JSON 응답용)"""
+        return {
+            "order_id": self.order_id,
+            "user_id": self.user_id,
+            "status": self.status,
+            "total_amount": self.total_amount,
+            "items": [item.to_dict() for item in self.items],
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
+
+class OrderItem(Base):
+    """주문 상품 모델 (주문 시점 가격 보관)"""
+    __tablename__ = "order_items"
+
+    id = Column(Integer, primary_key=True, index=True)
+    order_id = Column(Integer, ForeignKey("orders.order_id"), nullable=False, index=True)
+    product_id = Column(Integer, ForeignKey("products.product_id"), nullable=False)
+    quantity = Column(Integer, nullable=False)
+    unit_price = Column(Integer, nullable=False)
+
+    # 관계 설정
+    order = relationship("Order", back_populates="items")
+
+    def __repr__(self):
+        return f"<OrderItem(order_id={self.order_id}, product_id={self.product_id}, quantity={self.quantity})>"
+
+    def to_dict(self):
+        """모델을 딕셔너리로 변환 (JSON 응답용)"""
+        return {
+            "product_id": self.product_id,
+            "quantity": self.quantity,
+            "unit_price": self.unit_price,
+            "subtotal": self.quantity * self.unit_price,
+        }
@@ -0,0 +1,39 @@
+# app/models/product.py
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy.sql import func
+from app.database import Base
+
+class Product(Base):
+    """상품 모델"""
+    __tablename__ = "products"
+
+    product_id = Column(Integer, primary_key=True, index=True)
+    seller_id = Column(Integer, ForeignKey("users.user_id"), nullable=False, index=True)
+    name = Column(String(200), nullable=False)
+    description = Column(Text, nullable=True)
+    category = Column(String(50), nullable=True, index=True) # 농산물, 축산물, 수산물
+    price = Column(Integer, nullable=False) # 원 단위
+    stock = Column(Integer, nullable=False, default=0)
+    image_url = Column(String(500), nullable=True)
+    is_active = Column(Boolean, default=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<Product(product_id={self.product_id}, name={self.name}, price={self.price}, stock={self.stock})>"
+
+    def to_dict(self):
+        """모델을 딕셔너리로 변환 (JSON 응답용)"""
+        return {
+            "product_id": self.product_id,
+            "seller_id": self.seller_id,
+            "name": self.name,
+            "description": self.description,
+            "category": self.category,
+            "price": self.price,
+            "stock": self.stock,
+            "image_url": self.image_url,
+            "is_active": self.is_active,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
@@ -1,5 +1,6 @@
 # app/models/user.py
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from typing import Iterable, List, Optional
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -9,9 +10,13 @@ class User(Base):
     __tablename__ = "users"
 
     user_id = Column(Integer, primary_key=True, index=True)
-    phone_number = Column(String(11), unique=True, index=True, nullable=False)
+    # 개인정보는 암호문으로 저장 (평문은 phone_number/user_name 속성으로 접근)
+    phone_number_encrypted = Column("phone_number", String(255), nullable=False)
+    # 핸드폰 번호 blind index (조회는 이 컬럼으로, 암호화 도입 전 행은 pii_migration 실행 전까지 NULL)
+    phone_hash = Column(String(64), unique=True, index=True, nullable=True)
     password_hash = Column(String(255), nullable=False)
-    user_name = Column(String(100), nullable=True)
+    user_name_encrypted = Column("user_name", Text, nullable=True)
+    email_encrypted = Column("email", Text, nullable=True) # 주문/KYC 안내 메일 (없으면 발송 안 함)
     user_type = Column(String(20), default="customer") # customer, admin, seller
     kyc_status = Column(String(20), default="pending") # pending, verified, rejected
     is_active = Column(Boolean, default=True)
@@ -22,7 +27,65 @@ class User(Base):
     sessions = relationship("UserSession", back_populates="user", cascade="all, delete-orphan")
 
     def __repr__(self):
-        return f"<User(user_id={self.user_id}, phone_number={self.phone_number}, user_type={self.user_type})>"
+        return f"<User(user_id={self.user_id}, phone_hash={(self.phone_hash or '')[:12]}, user_type={self.user_type})>"
+
+    @property
+    def phone_number(self) -> str:
+        return self._decrypted("phone_number", self.phone_number_encrypted)
+
+    @phone_number.setter
+    def phone_number(self, value: str):
+        from app.services.encryption_service import get_encryptor
+        encryptor = get_encryptor()
+        self.phone_number_encrypted = encryptor.encrypt(value, "phone_number")
+        self.phone_hash = encryptor.blind_index(value)
+        self._remember("phone_number", self.phone_number_encrypted, value)
+
+    @property
+    def user_name(self) -> Optional[str]:
+        return self._decrypted("user_name", self.user_name_encrypted)
+
+    @user_name.setter
+    def user_name(self, value: Optional[str]):
+        from app.services.encryption_service import get_encryptor
+        self.user_name_encrypted = get_encryptor().encrypt(value, "user_name")
+        self._remember("user_name", self.user_name_encrypted, value)
+
+    @property
+    def email(self) -> Optional[str]:
+        return self._decrypted("email", self.email_encrypted)
+
+    @email.setter
+    def email(self, value: Optional[str]):
+        from app.services.encryption_service import get_encryptor
+        self.email_encrypted = get_encryptor().encrypt(value, "email")
+        self._remember("email", self.email_encrypted, value)
+
+    def _decrypted(self, field: str, token: Optional[str]) -> Optional[str]:
+        # 복호화 결과는 인스턴스에 보관 (암호문이 바뀌면 다시 복호화)
+        cached = self.__dict__.get("_plaintext", {}).get(field)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        from app.services.encryption_service import get_encryptor
+        value = get_encryptor().decrypt(token, field)
+        self._remember(field, token, value)
+        return value
+
+    def _remember(self, field: str, token: Optional[str], value: Optional[str]):
+        self.__dict__.setdefault("_plaintext", {})[field] = (token, value)
+
+    @classmethod
+    def decrypt_all(cls, users: Iterable["User"]) -> List["User"]:
+        """조회 결과의 개인정보 일괄 복호화 (필요한 데이터 키를 한 번에 로드)"""
+        from app.services.encryption_service import get_encryptor
+        encryptor = get_encryptor()
+        users = list(users)
+        for field, column in (("phone_number", "phone_number_encrypted"), ("user_name", "user_name_encrypted"),
+                              ("email", "email_encrypted")):
+            tokens = [getattr(user, column) for user in users]
+            for user, token, value in zip(users, tokens, encryptor.decrypt_many(tokens, field)):
+                user._remember(field, token, value)
+        return users
 
     def to_dict(self):
         """모델을 딕셔너리로 변환 (JSON 응답용)"""
@@ -30,6 +93,7 @@ class User(Base):
             "user_id": self.user_id,
             "phone_number": self.phone_number,
             "user_name": self.user_name,
+            "email": self.email,
             "user_type": self.user_type,
             "kyc_status": self.kyc_status,
             "is_active": self.is_active,
@@ -1,4 +1,4 @@
 # app/routers/__init__.py
-from . import auth
+from . import auth, simulation, uploads, market, ledger, risk, cart, inventory, audit, kyc, search, profiling, pii, distribution, notifications, users
 
-__all__ = ["auth"]
\ No newline at end of file
+__all__ = ["auth", "simulation", "uploads", "market", "ledger", "risk", "cart", "inventory", "audit", "kyc", "search", "profiling", "pii", "distribution", "notifications", "users"]
\ No newline at end of file
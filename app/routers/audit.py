@@ -0,0 +1,63 @@
+# app/routers/audit.py
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.database import get_db
+from app.models import User, AuditEvent
+from app.routers.auth import require_admin
+from app.routers.users import get_user_loader
+from app.schemas import ApiResponse
+from app.services.audit_service import get_audit_log
+from app.services.user_lookup_service import UserLoader
+
+router = APIRouter()
+
+@router.get("/events", response_model=ApiResponse)
+async def list_audit_events(
+    event_type: Optional[str] = None,
+    actor_id: Optional[int] = None,
+    before_id: Optional[int] = Query(None, description="이전 페이지 마지막 id (이보다 오래된 이벤트)"),
+    limit: int = Query(100, ge=1, le=500),
+    current_user: User = Depends(require_admin),
+    db: Session = Depends(get_db),
+    users: UserLoader = Depends(get_user_loader)
+):
+    """감사 이벤트 조회 (최신순, 관리자, 이벤트별 행위자 이름/유형 포함)"""
+    def query_events():
+        query = db.query(AuditEvent)
+        if event_type:
+            query = query.filter(AuditEvent.event_type == event_type)
+        if actor_id is not None:
+            query = query.filter(AuditEvent.actor_id == actor_id)
+        if before_id is not None:
+            query = query.filter(AuditEvent.id < before_id)
+        # id가 시간순이므로 id 정렬 = 시간 정렬
+        return query.order_by(AuditEvent.id.desc()).limit(limit).all()
+
+    async def with_actor(event: AuditEvent) -> dict:
+        actor = await users.load(event.actor_id) if event.actor_id is not None else None
+        return {
+            **event.to_dict(),
+            "actor": {key: actor[key] for key in ("user_id", "user_name", "user_type")} if actor else None,
+        }
+
+    events = await run_in_threadpool(query_events)
+    # 이벤트마다 load()를 호출해도 행위자 조회는 쿼리 1번
+    return ApiResponse(
+        success=True,
+        message="감사 이벤트 조회 완료",
+        data={"events": await asyncio.gather(*(with_actor(event) for event in events))}
+    )
+
+@router.get("/stats", response_model=ApiResponse)
+def get_audit_stats(current_user: User = Depends(require_admin)):
+    """감사 로그 기록/보관 현황 (관리자)"""
+    return ApiResponse(
+        success=True,
+        message="감사 로그 현황 조회 완료",
+        data=get_audit_log().status()
+    )
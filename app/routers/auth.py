@@ -1,19 +1,51 @@
 # app/routers/auth.py
-from fastapi import APIRouter, HTTPException, status, Depends
+import hmac
+import ipaddress
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, status, Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
 from app.schemas import (
     SMSRequest, SMSVerifyRequest, UserRegisterRequest, UserLoginRequest,
     SMSResponse, SMSVerifyResponse, LoginResponse, UserResponse, ApiResponse
 )
 from app.services.auth_service import AuthService
+from app.services import audit_service
+from app.services.audit_service import audit
 from app.utils.auth import verify_token
 from app.models import User
 
 router = APIRouter()
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+TRUSTED_PROXY_NETWORKS = [ipaddress.ip_network(proxy, strict=False) for proxy in settings.TRUSTED_PROXIES]
+
+def _is_trusted_proxy(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in TRUSTED_PROXY_NETWORKS)
+
+def get_client_ip(request: Request) -> str:
+    """요청 클라이언트 IP (신뢰하는 프록시를 거친 경우에만 X-Forwarded-For 사용)"""
+    peer = request.client.host if request.client else "unknown"
+    forwarded = request.headers.get("x-forwarded-for")
+    if not forwarded or not _is_trusted_proxy(peer):
+        return peer
+    # 오른쪽(가까운 프록시)부터 신뢰하는 프록시를 건너뛴 첫 주소가 클라이언트 (왼쪽 값은 클라이언트가 임의로 넣을 수 있음)
+    for hop in reversed([hop.strip() for hop in forwarded.split(",")]):
+        try:
+            ipaddress.ip_address(hop)
+        except ValueError:
+            return peer
+        if not _is_trusted_proxy(hop):
+            return hop
+    return peer
 
 # 의존성: 현재 사용자 가져오기
 def get_current_user(
@@ -50,12 +82,13 @@ def get_current_user(
 @router.post("/send-sms", response_model=SMSResponse)
 def send_sms_verification(
     request: SMSRequest,
+    http_request: Request,
     db: Session = Depends(get_db)
 ):
     """SMS 인증번호 발송"""
     auth_service = AuthService(db)
     try:
-        result = auth_service.send_sms_verification(request.phone_number)
+        result = auth_service.send_sms_verification(request.phone_number, get_client_ip(http_request))
         return SMSResponse(**result)
     except HTTPException as e:
         raise e
@@ -68,12 +101,13 @@ def send_sms_verification(
 @router.post("/verify-sms", response_model=SMSVerifyResponse)
 def verify_sms_code(
     request: SMSVerifyRequest,
+    http_request: Request,
     db: Session = Depends(get_db)
 ):
     """SMS 인증번호 확인"""
     auth_service = AuthService(db)
     try:
-        result = auth_service.verify_sms_code(request.phone_number, request.verification_code)
+        result = auth_service.verify_sms_code(request.phone_number, request.verification_code, get_client_ip(http_request))
         return SMSVerifyResponse(**result)
     except HTTPException as e:
         raise e
@@ -86,12 +120,13 @@ def verify_sms_code(
 @router.post("/register", response_model=LoginResponse)
 def register_user(
     request: UserRegisterRequest,
+    http_request: Request,
     db: Session = Depends(get_db)
 ):
     """회원가입"""
     auth_service = AuthService(db)
     try:
-        result = auth_service.register_user(request)
+        result = auth_service.register_user(request, get_client_ip(http_request))
         
         # LoginResponse 형태로 변환
         return LoginResponse(
@@ -111,12 +146,13 @@ def register_user(
 @router.post("/login", response_model=LoginResponse)
 def login_user(
     request: UserLoginRequest,
+    http_request: Request,
     db: Session = Depends(get_db)
 ):
     """로그인"""
     auth_service = AuthService(db)
     try:
-        result = auth_service.login_user(request)
+        result = auth_service.login_user(request, get_client_ip(http_request))
         
         # LoginResponse 형태로 변환
         return LoginResponse(
@@ -160,11 +196,48 @@ def test_auth():
     )
 
 # 관리자 권한 확인 의존성
-def require_admin(current_user: User = Depends(get_current_user)) -> User:
-    """관리자 권한 필요한 엔드포인트용"""
+def require_admin(request: Request, current_user: User = Depends(get_current_user)) -> User:
+    """관리자 권한 필요한 엔드포인트용 (접근 기록은 감사 로그에)"""
+    target = f"{request.method} {request.url.path}"
     if current_user.user_type != "admin":
+        audit(audit_service.ADMIN_DENIED, actor_id=current_user.user_id, target=target,
+              ip_address=get_client_ip(request), success=False)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="관리자 권한이 필요합니다"
         )
-    return current_user
\ No newline at end of file
+    audit(audit_service.ADMIN_ACCESS, actor_id=current_user.user_id, target=target, ip_address=get_client_ip(request))
+    return current_user
+
+# 판매자 권한 확인 의존성
+def require_seller(current_user: User = Depends(get_current_user)) -> User:
+    """판매자(또는 관리자) 권한 필요한 엔드포인트용"""
+    if current_user.user_type not in ("seller", "admin"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="판매자 권한이 필요합니다"
+        )
+    return current_user
+
+# 내부 서비스 권한 확인 의존성
+def require_internal_service(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    db: Session = Depends(get_db)
+) -> Optional[User]:
+    """내부 서비스(주문/알림 등) 전용 엔드포인트용 (X-Internal-Key 헤더 또는 관리자 토큰)"""
+    internal_key = request.headers.get("x-internal-key")
+    if internal_key is not None:
+        if not settings.INTERNAL_API_KEY or not hmac.compare_digest(internal_key, settings.INTERNAL_API_KEY):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="내부 서비스 키가 올바르지 않습니다"
+            )
+        return None
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증이 필요합니다",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return require_admin(request, get_current_user(credentials, db))
@@ -0,0 +1,111 @@
+# app/routers/cart.py
+from fastapi import APIRouter, HTTPException, status, Depends, Request
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models import User
+from app.routers.auth import get_client_ip, get_current_user
+from app.schemas import ApiResponse
+from app.schemas.cart import CartItemRequest, CartQuantityRequest, CartResponse, OrderResponse
+from app.services.cart_service import CartService
+
+router = APIRouter()
+
+@router.get("", response_model=CartResponse)
+def get_cart(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """내 장바구니 조회"""
+    cart_service = CartService(db)
+    try:
+        return CartResponse(**cart_service.get_cart(current_user.user_id))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.post("/items", response_model=CartResponse)
+def add_cart_item(
+    request: CartItemRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """장바구니에 상품 담기 (이미 있으면 수량 증가)"""
+    cart_service = CartService(db)
+    try:
+        return CartResponse(**cart_service.add_item(current_user.user_id, request.product_id, request.quantity))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.put("/items/{product_id}", response_model=CartResponse)
+def update_cart_item(
+    product_id: int,
+    request: CartQuantityRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """장바구니 상품 수량 변경 (0이면 삭제)"""
+    cart_service = CartService(db)
+    try:
+        return CartResponse(**cart_service.set_quantity(current_user.user_id, product_id, request.quantity))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.delete("/items/{product_id}", response_model=CartResponse)
+def remove_cart_item(
+    product_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """장바구니 상품 삭제"""
+    cart_service = CartService(db)
+    try:
+        return CartResponse(**cart_service.remove_item(current_user.user_id, product_id))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.delete("", response_model=ApiResponse)
+def clear_cart(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """장바구니 비우기"""
+    CartService(db).clear(current_user.user_id)
+    return ApiResponse(success=True, message="장바구니를 비웠습니다")
+
+@router.post("/checkout", response_model=OrderResponse)
+def checkout_cart(
+    http_request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """장바구니를 주문으로 전환"""
+    cart_service = CartService(db)
+    try:
+        return OrderResponse(**cart_service.checkout(current_user, get_client_ip(http_request)))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
@@ -0,0 +1,92 @@
+# app/routers/distribution.py
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models import User
+from app.routers.auth import get_current_user, require_admin
+from app.schemas import ApiResponse
+from app.schemas.distribution import DistributionCreateRequest, PayoutHistoryResponse
+from app.services.payout_service import DistributionService, get_payout_engine
+
+router = APIRouter()
+
+@router.post("", response_model=ApiResponse)
+def create_distribution(
+    request: DistributionCreateRequest,
+    current_user: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """분배 등록 (관리자, 기준일 보유량 비례로 백그라운드 지급)"""
+    try:
+        return ApiResponse(
+            success=True,
+            message="분배를 등록했습니다",
+            data=DistributionService(db).create(request.token_id, request.total_amount, request.record_date)
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.get("", response_model=ApiResponse)
+def list_distributions(
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """분배 목록 (관리자)"""
+    return ApiResponse(
+        success=True,
+        message="분배 목록 조회 완료",
+        data={"distributions": DistributionService(db).list_recent(limit), "engine": get_payout_engine().status()}
+    )
+
+@router.get("/payouts/me", response_model=PayoutHistoryResponse)
+def get_my_payouts(
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """내 분배금 지급 내역"""
+    return PayoutHistoryResponse(
+        user_id=current_user.user_id,
+        payouts=DistributionService(db).user_payouts(current_user.user_id, limit)
+    )
+
+@router.get("/{distribution_id}", response_model=ApiResponse)
+def get_distribution(
+    distribution_id: int,
+    current_user: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """분배 진행 현황 (관리자)"""
+    return ApiResponse(
+        success=True,
+        message="분배 조회 완료",
+        data=DistributionService(db).get(distribution_id).to_dict()
+    )
+
+@router.post("/{distribution_id}/resume", response_model=ApiResponse)
+def resume_distribution(
+    distribution_id: int,
+    current_user: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """실패/중단된 분배 재개 (관리자, 마지막 체크포인트부터)"""
+    try:
+        return ApiResponse(
+            success=True,
+            message="분배 지급을 재개했습니다",
+            data=DistributionService(db).resume(distribution_id)
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
@@ -0,0 +1,91 @@
+# app/routers/inventory.py
+from fastapi import APIRouter, HTTPException, status, Depends, Request
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models import User
+from app.routers.auth import get_client_ip, get_current_user, require_admin
+from app.schemas import ApiResponse
+from app.schemas.cart import OrderResponse
+from app.schemas.inventory import ReservationRequest, ReservationResponse, StockResponse
+from app.services.inventory_service import InventoryService, get_inventory_reconciler
+
+router = APIRouter()
+
+@router.post("/reservations", response_model=ReservationResponse)
+def reserve_stock(
+    request: ReservationRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """재고 선점 (한정 판매/청약)"""
+    inventory_service = InventoryService(db)
+    try:
+        return ReservationResponse(**inventory_service.reserve(current_user.user_id, request.product_id, request.quantity))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.post("/reservations/{reservation_id}/confirm", response_model=OrderResponse)
+def confirm_reservation(
+    reservation_id: str,
+    http_request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """선점한 재고로 주문 확정"""
+    inventory_service = InventoryService(db)
+    try:
+        return OrderResponse(**inventory_service.confirm(current_user, reservation_id, get_client_ip(http_request)))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.delete("/reservations/{reservation_id}", response_model=ReservationResponse)
+def release_reservation(
+    reservation_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """선점 취소 (재고 반환)"""
+    inventory_service = InventoryService(db)
+    try:
+        return ReservationResponse(**inventory_service.release(current_user.user_id, reservation_id))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.get("/products/{product_id}", response_model=StockResponse)
+def get_available_stock(product_id: int, db: Session = Depends(get_db)):
+    """선점 가능 수량 조회"""
+    return StockResponse(product_id=product_id, available=InventoryService(db).available(product_id))
+
+@router.post("/products/{product_id}/load", response_model=StockResponse)
+def load_product_stock(
+    product_id: int,
+    current_user: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """DB 재고로 선점 카운터 적재 (판매 시작 전, 관리자)"""
+    return StockResponse(product_id=product_id, available=InventoryService(db).load_stock(product_id))
+
+@router.get("/reconciler", response_model=ApiResponse)
+def get_reconciler_status(current_user: User = Depends(require_admin)):
+    """만료 선점 정리 현황 (관리자)"""
+    return ApiResponse(
+        success=True,
+        message="선점 정리 현황 조회 완료",
+        data=get_inventory_reconciler().status()
+    )
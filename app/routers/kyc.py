@@ -0,0 +1,49 @@
+# app/routers/kyc.py
+from fastapi import APIRouter, HTTPException, status, Depends
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models import User
+from app.routers.auth import get_current_user, require_admin
+from app.schemas import ApiResponse
+from app.schemas.kyc import KycSubmitRequest, KycJobResponse, KycStatusResponse
+from app.services.kyc_service import KycService, get_kyc_pool
+
+router = APIRouter()
+
+@router.post("/submit", response_model=KycJobResponse)
+def submit_kyc(
+    request: KycSubmitRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """KYC 신청 (결과는 /status로 확인)"""
+    kyc_service = KycService(db)
+    try:
+        return KycJobResponse(**kyc_service.submit(
+            current_user, request.real_name, request.birth_date, request.id_document_digest
+        ))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.get("/status", response_model=KycStatusResponse)
+def get_kyc_status(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """내 KYC 진행 상태"""
+    return KycStatusResponse(**KycService(db).get_status(current_user.user_id))
+
+@router.get("/stats", response_model=ApiResponse)
+def get_kyc_stats(current_user: User = Depends(require_admin)):
+    """KYC 작업 처리 현황 (관리자)"""
+    return ApiResponse(
+        success=True,
+        message="KYC 처리 현황 조회 완료",
+        data=get_kyc_pool().status()
+    )
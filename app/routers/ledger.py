@@ -0,0 +1,72 @@
+# app/routers/ledger.py
+from fastapi import APIRouter, HTTPException, status, Depends
+
+from app.models import User
+from app.routers.auth import get_current_user, require_admin
+from app.schemas import ApiResponse
+from app.schemas.ledger import TokenTransferRequest, TokenIssueRequest, LedgerEntryResponse, HoldingsResponse
+from app.services.ledger_service import LedgerError, get_ledger, get_ledger_verifier
+
+router = APIRouter()
+
+@router.post("/transfer", response_model=LedgerEntryResponse)
+async def transfer_token(
+    request: TokenTransferRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """토큰 이전 (현재 사용자 -> 대상 사용자)"""
+    try:
+        entry = await get_ledger().transfer(
+            request.token_id, current_user.user_id, request.to_user_id, request.amount
+        )
+        return LedgerEntryResponse(**entry)
+    except LedgerError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.post("/issue", response_model=LedgerEntryResponse)
+async def issue_token(
+    request: TokenIssueRequest,
+    current_user: User = Depends(require_admin)
+):
+    """토큰 발행 (관리자)"""
+    try:
+        entry = await get_ledger().issue(request.token_id, request.to_user_id, request.amount)
+        return LedgerEntryResponse(**entry)
+    except LedgerError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("/me", response_model=HoldingsResponse)
+def get_my_holdings(current_user: User = Depends(get_current_user)):
+    """내 토큰 보유 현황"""
+    return HoldingsResponse(
+        user_id=current_user.user_id,
+        holdings=get_ledger().holdings(current_user.user_id)
+    )
+
+@router.get("/balances/{token_id}/{user_id}", response_model=ApiResponse)
+def get_balance(
+    token_id: str,
+    user_id: int,
+    current_user: User = Depends(require_admin)
+):
+    """특정 사용자 토큰 잔액 조회 (관리자)"""
+    return ApiResponse(
+        success=True,
+        message="잔액 조회 완료",
+        data={"token_id": token_id, "user_id": user_id, "balance": get_ledger().balance(token_id, user_id)}
+    )
+
+@router.get("/verify", response_model=ApiResponse)
+def get_verification_status(current_user: User = Depends(require_admin)):
+    """원장 해시 체인 검증 현황 (관리자)"""
+    return ApiResponse(
+        success=True,
+        message="원장 검증 현황 조회 완료",
+        data={**get_ledger().stats(), **get_ledger_verifier().status()}
+    )
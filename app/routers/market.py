@@ -0,0 +1,88 @@
+# app/routers/market.py
+import asyncio
+import json
+
+from fastapi import APIRouter, HTTPException, status, Depends, WebSocket, WebSocketDisconnect
+
+from app.models import User
+from app.routers.auth import require_admin
+from app.schemas import ApiResponse
+from app.schemas.market import FeedPublishRequest
+from app.services.feed_service import FeedClient, SlowConsumerError, get_feed_hub
+
+router = APIRouter()
+
+async def _read_commands(websocket: WebSocket, client: FeedClient):
+    """클라이언트 구독 명령 처리 ({"action": "subscribe", "topics": [...]})"""
+    hub = get_feed_hub()
+    while True:
+        message = await websocket.receive_text()
+        try:
+            command = json.loads(message)
+            action = command.get("action")
+            topics = command.get("topics") or []
+            if not isinstance(topics, list):
+                raise ValueError()
+        except (ValueError, AttributeError):
+            client.send_control(json.dumps({"type": "error", "message": "올바르지 않은 명령입니다"}, ensure_ascii=False))
+            continue
+
+        if action == "subscribe":
+            accepted = hub.subscribe(client, [str(topic) for topic in topics])
+            client.send_control(json.dumps({"type": "subscribed", "topics": sorted(accepted)}))
+        elif action == "unsubscribe":
+            hub.unsubscribe(client, [str(topic) for topic in topics])
+            client.send_control(json.dumps({"type": "unsubscribed", "topics": sorted(topics)}))
+        else:
+            client.send_control(json.dumps({"type": "error", "message": "지원하지 않는 명령입니다"}, ensure_ascii=False))
+
+@router.websocket("/ws")
+async def market_feed(websocket: WebSocket):
+    """실시간 시세/호가 피드 (토픽 구독형 WebSocket)"""
+    hub = get_feed_hub()
+    await websocket.accept()
+    client = FeedClient(websocket)
+
+    reader = asyncio.create_task(_read_commands(websocket, client))
+    writer = asyncio.create_task(client.run_writer())
+    try:
+        done, _ = await asyncio.wait({reader, writer}, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            error = task.exception()
+            if isinstance(error, SlowConsumerError):
+                # 느린 클라이언트는 끊고 재접속 유도
+                await websocket.close(code=1013)
+            elif error is not None and not isinstance(error, WebSocketDisconnect):
+                raise error
+    finally:
+        hub.remove(client)
+        for task in (reader, writer):
+            task.cancel()
+
+@router.post("/publish", response_model=ApiResponse)
+async def publish_update(
+    request: FeedPublishRequest,
+    current_user: User = Depends(require_admin)
+):
+    """시세/호가 업데이트 발행 (관리자, 주문 체결 엔진 연동 전 테스트용)"""
+    try:
+        await get_feed_hub().publish(request.topic, request.data)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return ApiResponse(
+        success=True,
+        message="업데이트를 발행했습니다",
+        data=get_feed_hub().stats()
+    )
+
+@router.get("/stats", response_model=ApiResponse)
+def get_feed_stats(current_user: User = Depends(require_admin)):
+    """현재 워커의 피드 구독 현황 (관리자)"""
+    return ApiResponse(
+        success=True,
+        message="피드 현황 조회 완료",
+        data=get_feed_hub().stats()
+    )
@@ -0,0 +1,24 @@
+# app/routers/notifications.py
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models import User, Notification
+from app.routers.auth import get_current_user
+from app.schemas.distribution import NotificationListResponse
+
+router = APIRouter()
+
+@router.get("", response_model=NotificationListResponse)
+def get_my_notifications(
+    unread_only: bool = False,
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """내 알림 목록 (최신순)"""
+    query = db.query(Notification).filter(Notification.user_id == current_user.user_id)
+    if unread_only:
+        query = query.filter(Notification.is_read == False)
+    notifications = query.order_by(Notification.created_at.desc(), Notification.notification_id.desc()).limit(limit).all()
+    return NotificationListResponse(notifications=[notification.to_dict() for notification in notifications])
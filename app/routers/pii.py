@@ -0,0 +1,69 @@
+# app/routers/pii.py
+from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models import User, EncryptionKey
+from app.routers.auth import require_admin
+from app.schemas import ApiResponse
+from app.services.encryption_service import get_encryptor, reencrypt_users, export_users_csv
+
+router = APIRouter()
+
+@router.get("/status", response_model=ApiResponse)
+def get_encryption_status(
+    current_user: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """개인정보 암호화 키 현황 (관리자)"""
+    keys = db.query(EncryptionKey).order_by(EncryptionKey.key_id.desc()).all()
+    return ApiResponse(
+        success=True,
+        message="암호화 키 현황 조회 완료",
+        data={"encryptor": get_encryptor().status(), "keys": [key.to_dict() for key in keys]}
+    )
+
+@router.post("/rotate", response_model=ApiResponse)
+def rotate_data_key(current_user: User = Depends(require_admin)):
+    """데이터 키 교체 (관리자, 다른 워커는 키 캐시 만료 후 새 키 사용)"""
+    try:
+        key_id = get_encryptor().rotate()
+        return ApiResponse(
+            success=True,
+            message="데이터 키를 교체했습니다",
+            data={"active_key_id": key_id}
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.post("/reencrypt", response_model=ApiResponse)
+def reencrypt_user_pii(
+    current_user: User = Depends(require_admin),
+    db: Session = Depends(get_db)
+):
+    """현재 데이터 키로 사용자 개인정보 재암호화 (관리자)"""
+    try:
+        return ApiResponse(
+            success=True,
+            message="재암호화가 완료되었습니다",
+            data=reencrypt_users(db)
+        )
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.get("/users/export")
+def export_users(current_user: User = Depends(require_admin)):
+    """사용자 목록 CSV 내보내기 (관리자, 접근은 감사 로그에 기록)"""
+    return StreamingResponse(
+        export_users_csv(),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": "attachment; filename=users.csv"}
+    )
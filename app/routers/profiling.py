@@ -0,0 +1,96 @@
+# app/routers/profiling.py
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from app.core.profiling import ProfilingSession, get_profiler
+from app.models import User
+from app.routers.auth import require_admin
+from app.schemas import ApiResponse
+from app.schemas.profiling import ProfilingSessionRequest
+
+router = APIRouter()
+
+def get_session_or_404(session_id: str) -> ProfilingSession:
+    session = get_profiler().get_session(session_id)
+    if session is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로파일링 세션을 찾을 수 없습니다"
+        )
+    return session
+
+@router.post("/sessions", response_model=ApiResponse)
+def start_profiling_session(
+    request: ProfilingSessionRequest,
+    current_user: User = Depends(require_admin)
+):
+    """프로파일링 세션 시작 (기존 세션은 종료, 관리자)"""
+    session = get_profiler().start_session(
+        max_requests=request.max_requests,
+        duration_seconds=request.duration_seconds,
+        mode=request.mode,
+        path_prefix=request.path_prefix,
+        sample_interval_ms=request.sample_interval_ms,
+    )
+    return ApiResponse(
+        success=True,
+        message="프로파일링 세션을 시작했습니다",
+        data=session.status(include_token=True)
+    )
+
+@router.get("/sessions", response_model=ApiResponse)
+def list_profiling_sessions(current_user: User = Depends(require_admin)):
+    """최근 프로파일링 세션 목록 (관리자)"""
+    return ApiResponse(
+        success=True,
+        message="프로파일링 세션 조회 완료",
+        data={"sessions": [session.status() for session in get_profiler().sessions.values()]}
+    )
+
+@router.get("/sessions/{session_id}", response_model=ApiResponse)
+def get_profiling_session(session_id: str, current_user: User = Depends(require_admin)):
+    """프로파일링 세션 현황 + 요청별 구간 시간 (관리자)"""
+    return ApiResponse(
+        success=True,
+        message="프로파일링 세션 조회 완료",
+        data=get_session_or_404(session_id).status()
+    )
+
+@router.delete("/sessions/{session_id}", response_model=ApiResponse)
+def stop_profiling_session(session_id: str, current_user: User = Depends(require_admin)):
+    """프로파일링 세션 종료 (관리자)"""
+    session = get_session_or_404(session_id)
+    session.stop()
+    return ApiResponse(
+        success=True,
+        message="프로파일링 세션을 종료했습니다",
+        data=session.status()
+    )
+
+@router.get("/sessions/{session_id}/profile")
+def download_profile(
+    session_id: str,
+    format: str = Query("speedscope", pattern="^(speedscope|collapsed)$"),
+    request_id: Optional[int] = Query(None, description="요청별 프로파일 (없으면 세션 전체)"),
+    current_user: User = Depends(require_admin)
+):
+    """스택 샘플 다운로드 (speedscope JSON 또는 collapsed stack, 관리자)"""
+    session = get_session_or_404(session_id)
+    suffix = f"-{request_id}" if request_id is not None else ""
+    try:
+        if format == "collapsed":
+            return PlainTextResponse(
+                session.collapsed(request_id),
+                headers={"Content-Disposition": f'attachment; filename="profile-{session_id}{suffix}.txt"'}
+            )
+        return JSONResponse(
+            session.speedscope(request_id),
+            headers={"Content-Disposition": f'attachment; filename="profile-{session_id}{suffix}.speedscope.json"'}
+        )
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 요청의 프로파일이 없습니다 (보관 개수 초과 또는 잘못된 request_id)"
+        )
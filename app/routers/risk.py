@@ -0,0 +1,32 @@
+# app/routers/risk.py
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+
+from app.models import User
+from app.routers.auth import require_admin
+from app.schemas import ApiResponse
+from app.services.risk_service import get_risk_engine, user_risk_key
+
+router = APIRouter()
+
+@router.get("/inspect", response_model=ApiResponse)
+def inspect_risk(
+    phone_number: Optional[str] = None,
+    ip: Optional[str] = None,
+    current_user: User = Depends(require_admin)
+):
+    """사용자/IP별 이상 거래 탐지 통계 및 현재 위험도 (관리자)"""
+    engine = get_risk_engine()
+    user_key = user_risk_key(phone_number) if phone_number else None
+    return ApiResponse(
+        success=True,
+        message="이상 거래 탐지 현황 조회 완료",
+        data={
+            "stats": engine.snapshot(user_key, ip),
+            "login": engine.check("login", user_key, ip).to_dict(),
+            "sms": engine.check("sms", user_key, ip).to_dict(),
+            "sms_verify": engine.check("sms_verify", user_key, ip).to_dict(),
+            "order": engine.check("order", user_key, ip).to_dict(),
+        }
+    )
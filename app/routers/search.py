@@ -0,0 +1,71 @@
+# app/routers/search.py
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models import User
+from app.routers.auth import require_admin
+from app.schemas import ApiResponse
+from app.schemas.search import SearchResponse, SuggestResponse
+from app.services.search_service import SearchService, get_search_backend
+
+router = APIRouter()
+
+@router.get("", response_model=SearchResponse)
+def search_products(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (예: 제주 감귤)"),
+    category: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=1000),
+    db: Session = Depends(get_db)
+):
+    """상품 검색 (일치도순)"""
+    search_service = SearchService(db)
+    try:
+        return SearchResponse(**search_service.search(q, category, limit, offset))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.get("/suggest", response_model=SuggestResponse)
+def suggest_keywords(
+    q: str = Query(..., min_length=1, max_length=100, description="입력 중인 검색어 (초성 가능, 예: ㅎㅇ)"),
+    limit: int = Query(10, ge=1, le=20),
+    db: Session = Depends(get_db)
+):
+    """검색어 자동완성"""
+    search_service = SearchService(db)
+    try:
+        return SuggestResponse(**search_service.suggest(q, limit))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.post("/rebuild", response_model=ApiResponse)
+def rebuild_search_index(current_user: User = Depends(require_admin)):
+    """DB 상품 전체로 검색 색인 재구성 (백그라운드, 관리자)"""
+    started = get_search_backend().start()
+    return ApiResponse(
+        success=True,
+        message="검색 색인 재구성을 시작했습니다" if started else "이미 재구성 중입니다",
+        data=get_search_backend().status()
+    )
+
+@router.get("/status", response_model=ApiResponse)
+def get_search_status(current_user: User = Depends(require_admin)):
+    """검색 색인 현황 (관리자)"""
+    return ApiResponse(
+        success=True,
+        message="검색 색인 현황 조회 완료",
+        data=get_search_backend().status()
+    )
@@ -0,0 +1,27 @@
+# app/routers/simulation.py
+from fastapi import APIRouter, HTTPException, status
+
+from app.schemas.simulation import SimulationRequest, SimulationResponse
+from app.services.simulation_service import SimulationService
+
+router = APIRouter()
+
+@router.post("/run", response_model=SimulationResponse)
+def run_simulation(request: SimulationRequest):
+    """몬테카를로 투자 시뮬레이션 실행"""
+    simulation_service = SimulationService()
+    try:
+        result = simulation_service.run(request)
+        return SimulationResponse(**result)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
@@ -0,0 +1,72 @@
+# app/routers/uploads.py
+import re
+
+from fastapi import APIRouter, HTTPException, status, Depends, Request
+
+from app.config import settings
+from app.models import User
+from app.routers.auth import require_seller
+from app.schemas.upload import ImageUploadResponse, ImageStatusResponse
+from app.utils.file_handler import (
+    normalize_extension,
+    save_upload_stream,
+    schedule_variants,
+    variant_urls,
+    variants_ready,
+    path_to_url
+)
+
+router = APIRouter()
+
+_DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+@router.post("/images", response_model=ImageUploadResponse)
+async def upload_image(
+    request: Request,
+    filename: str,
+    current_user: User = Depends(require_seller)
+):
+    """상품 이미지 업로드 (요청 본문을 그대로 스트리밍 저장, 변형 이미지는 백그라운드 생성)"""
+    ext = normalize_extension(filename)
+
+    # Content-Length가 있으면 본문을 읽기 전에 거절
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > settings.MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"파일 크기는 {settings.MAX_FILE_SIZE // (1024 * 1024)}MB를 초과할 수 없습니다"
+        )
+
+    try:
+        result = await save_upload_stream(request.stream(), ext)
+        schedule_variants(result["digest"], result["path"])
+
+        return ImageUploadResponse(
+            digest=result["digest"],
+            url=path_to_url(result["path"]),
+            size=result["size"],
+            duplicate=result["duplicate"],
+            variants=variant_urls(result["digest"]),
+            variants_ready=variants_ready(result["digest"])
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.get("/images/{digest}", response_model=ImageStatusResponse)
+def get_image_status(digest: str):
+    """변형 이미지 생성 상태 조회"""
+    if not _DIGEST_PATTERN.match(digest):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="올바르지 않은 이미지 식별자입니다"
+        )
+    return ImageStatusResponse(
+        digest=digest,
+        variants=variant_urls(digest),
+        variants_ready=variants_ready(digest)
+    )
@@ -0,0 +1,36 @@
+# app/routers/users.py
+from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import get_db
+from app.routers.auth import require_internal_service
+from app.schemas import UserLookupRequest
+from app.services.user_lookup_service import UserLoader, stream_user_lookup
+
+router = APIRouter()
+
+# 의존성: 요청 범위 사용자 조회 배처 (같은 요청 안의 의존성/핸들러가 하나를 공유)
+def get_user_loader(db: Session = Depends(get_db)) -> UserLoader:
+    """await loader.load(user_id) 호출을 모아 쿼리 1번으로 조회"""
+    return UserLoader(db)
+
+@router.post("/lookup")
+def lookup_users(
+    request: UserLookupRequest,
+    _: None = Depends(require_internal_service)
+):
+    """사용자 일괄 조회 (내부 서비스, user_id/핸드폰 번호 최대 USER_LOOKUP_MAX_KEYS개)
+
+    응답: {"users": [...], "not_found": {"user_ids": [...], "phone_numbers": [...]}} (배치 단위로 스트리밍)
+    """
+    if len(request.user_ids) + len(request.phone_numbers) > settings.USER_LOOKUP_MAX_KEYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {settings.USER_LOOKUP_MAX_KEYS}명까지 조회할 수 있습니다"
+        )
+    return StreamingResponse(
+        stream_user_lookup(request.user_ids, request.phone_numbers),
+        media_type="application/json"
+    )
@@ -4,21 +4,105 @@ from .user import (
     SMSVerifyRequest, 
     UserRegisterRequest, 
     UserLoginRequest,
+    UserLookupRequest,
     UserResponse, 
     LoginResponse, 
     SMSResponse, 
     SMSVerifyResponse, 
     ApiResponse
 )
+from .simulation import (
+    AssetAllocation,
+    SimulationRequest,
+    DrawdownStats,
+    SimulationResponse
+)
+from .upload import (
+    ImageUploadResponse,
+    ImageStatusResponse
+)
+from .market import FeedPublishRequest
+from .ledger import (
+    TokenTransferRequest,
+    TokenIssueRequest,
+    LedgerEntryResponse,
+    HoldingsResponse
+)
+from .cart import (
+    CartItemRequest,
+    CartQuantityRequest,
+    CartItemResponse,
+    CartResponse,
+    OrderItemResponse,
+    OrderResponse
+)
+from .inventory import (
+    ReservationRequest,
+    ReservationResponse,
+    StockResponse
+)
+from .kyc import (
+    KycSubmitRequest,
+    KycJobResponse,
+    KycStatusResponse
+)
+from .search import (
+    SearchItemResponse,
+    SearchResponse,
+    SuggestionResponse,
+    SuggestResponse
+)
+from .profiling import ProfilingSessionRequest
+from .distribution import (
+    DistributionCreateRequest,
+    PayoutItemResponse,
+    PayoutHistoryResponse,
+    NotificationResponse,
+    NotificationListResponse
+)
 
 __all__ = [
     "SMSRequest", 
     "SMSVerifyRequest", 
     "UserRegisterRequest", 
     "UserLoginRequest",
+    "UserLookupRequest",
     "UserResponse", 
     "LoginResponse", 
     "SMSResponse", 
     "SMSVerifyResponse", 
-    "ApiResponse"
+    "ApiResponse",
+    "AssetAllocation",
+    "SimulationRequest",
+    "DrawdownStats",
+    "SimulationResponse",
+    "ImageUploadResponse",
+    "ImageStatusResponse",
+    "FeedPublishRequest",
+    "TokenTransferRequest",
+    "TokenIssueRequest",
+    "LedgerEntryResponse",
+    "HoldingsResponse",
+    "CartItemRequest",
+    "CartQuantityRequest",
+    "CartItemResponse",
+    "CartResponse",
+    "OrderItemResponse",
+    "OrderResponse",
+    "ReservationRequest",
+    "ReservationResponse",
+    "StockResponse",
+    "KycSubmitRequest",
+    "KycJobResponse",
+    "KycStatusResponse",
+    "SearchItemResponse",
+    "SearchResponse",
+    "SuggestionResponse",
+    "SuggestResponse",
+    "ProfilingSessionRequest",
+    "DistributionCreateRequest",
+    "PayoutItemResponse",
+    "PayoutHistoryResponse",
+    "NotificationResponse",
+    "NotificationListResponse"
 ]
\ No newline at end of file
@@ -0,0 +1,60 @@
+# app/schemas/cart.py
+from pydantic import BaseModel, validator
+from typing import Optional, List
+
+# 요청 스키마 (입력)
+class CartItemRequest(BaseModel):
+    """장바구니 담기 요청"""
+    product_id: int
+    quantity: int = 1
+
+    @validator('quantity')
+    def validate_quantity(cls, v):
+        if v <= 0:
+            raise ValueError('수량은 1개 이상이어야 합니다')
+        return v
+
+class CartQuantityRequest(BaseModel):
+    """장바구니 수량 변경 요청 (0이면 삭제)"""
+    quantity: int
+
+    @validator('quantity')
+    def validate_quantity(cls, v):
+        if v < 0:
+            raise ValueError('수량은 0 이상이어야 합니다')
+        return v
+
+# 응답 스키마 (출력)
+class CartItemResponse(BaseModel):
+    """장바구니 상품 응답"""
+    product_id: int
+    name: Optional[str] = None
+    image_url: Optional[str] = None
+    unit_price: int
+    quantity: int
+    subtotal: int
+    available: bool # 판매 중이고 재고가 충분한지 (캐시 기준)
+
+class CartResponse(BaseModel):
+    """장바구니 응답"""
+    user_id: int
+    items: List[CartItemResponse]
+    total_quantity: int
+    total_amount: int
+    expires_in: Optional[int] = None # 장바구니 만료까지 남은 시간 (초)
+
+class OrderItemResponse(BaseModel):
+    """주문 상품 응답"""
+    product_id: int
+    quantity: int
+    unit_price: int
+    subtotal: int
+
+class OrderResponse(BaseModel):
+    """주문 응답"""
+    order_id: int
+    user_id: int
+    status: str
+    total_amount: int
+    items: List[OrderItemResponse]
+    created_at: Optional[str] = None
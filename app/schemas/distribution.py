@@ -0,0 +1,54 @@
+# app/schemas/distribution.py
+from datetime import datetime
+from decimal import Decimal
+from pydantic import BaseModel, validator
+from typing import List, Optional
+
+# 요청 스키마 (입력)
+class DistributionCreateRequest(BaseModel):
+    """분배 등록 요청 (관리자)"""
+    token_id: str
+    total_amount: Decimal # 지급 총액 (원)
+    record_date: Optional[datetime] = None # 기준일 (없으면 현재 시각)
+
+    @validator('token_id')
+    def validate_token_id(cls, v):
+        v = v.strip()
+        if not 1 <= len(v) <= 64:
+            raise ValueError('토큰 ID는 1자 이상 64자 이하여야 합니다')
+        return v
+
+    @validator('total_amount')
+    def validate_total_amount(cls, v):
+        if v <= 0:
+            raise ValueError('분배 총액은 0보다 커야 합니다')
+        return v
+
+# 응답 스키마 (출력)
+class PayoutItemResponse(BaseModel):
+    """분배 지급 내역"""
+    distribution_id: int
+    token_id: str
+    record_date: Optional[str] = None
+    holding: int
+    amount: int
+    created_at: Optional[str] = None
+
+class PayoutHistoryResponse(BaseModel):
+    """내 분배 지급 내역 응답"""
+    user_id: int
+    payouts: List[PayoutItemResponse]
+
+class NotificationResponse(BaseModel):
+    """알림"""
+    notification_id: int
+    kind: str
+    title: str
+    body: str
+    reference_id: Optional[int] = None
+    is_read: bool = False
+    created_at: Optional[str] = None
+
+class NotificationListResponse(BaseModel):
+    """알림 목록 응답"""
+    notifications: List[NotificationResponse]
@@ -0,0 +1,29 @@
+# app/schemas/inventory.py
+from pydantic import BaseModel, validator
+
+# 요청 스키마 (입력)
+class ReservationRequest(BaseModel):
+    """재고 선점 요청"""
+    product_id: int
+    quantity: int = 1
+
+    @validator('quantity')
+    def validate_quantity(cls, v):
+        if v <= 0:
+            raise ValueError('수량은 1개 이상이어야 합니다')
+        return v
+
+# 응답 스키마 (출력)
+class ReservationResponse(BaseModel):
+    """재고 선점 응답"""
+    reservation_id: str
+    product_id: int
+    user_id: int
+    quantity: int
+    status: str # held, confirmed, released, expired
+    expires_at: str # 이 시각까지 확정하지 않으면 자동 반환
+
+class StockResponse(BaseModel):
+    """선점 가능 수량 응답"""
+    product_id: int
+    available: int
@@ -0,0 +1,50 @@
+# app/schemas/kyc.py
+import re
+from datetime import datetime
+from pydantic import BaseModel, validator
+from typing import Optional
+
+# 요청 스키마 (입력)
+class KycSubmitRequest(BaseModel):
+    """KYC 신청 요청"""
+    real_name: str
+    birth_date: str # YYYYMMDD
+    id_document_digest: Optional[str] = None # 업로드한 신분증 이미지 digest (/api/uploads/images)
+
+    @validator('real_name')
+    def validate_real_name(cls, v):
+        v = v.strip()
+        if not 2 <= len(v) <= 50:
+            raise ValueError('이름은 2자 이상 50자 이하여야 합니다')
+        return v
+
+    @validator('birth_date')
+    def validate_birth_date(cls, v):
+        try:
+            datetime.strptime(v, "%Y%m%d")
+        except ValueError:
+            raise ValueError('생년월일은 YYYYMMDD 형식이어야 합니다')
+        return v
+
+    @validator('id_document_digest')
+    def validate_id_document_digest(cls, v):
+        if v is not None and not re.fullmatch(r"[0-9a-f]{64}", v):
+            raise ValueError('올바른 이미지 digest가 아닙니다')
+        return v
+
+# 응답 스키마 (출력)
+class KycJobResponse(BaseModel):
+    """KYC 작업 응답"""
+    job_id: int
+    user_id: int
+    status: str # queued, processing, verified, rejected, failed
+    attempts: int
+    reason: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+class KycStatusResponse(BaseModel):
+    """KYC 상태 응답"""
+    user_id: int
+    kyc_status: str # pending, verified, rejected
+    job: Optional[KycJobResponse] = None
@@ -0,0 +1,47 @@
+# app/schemas/ledger.py
+import re
+
+from pydantic import BaseModel, validator
+from typing import Optional, Dict
+
+TOKEN_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$") # 원장 token_id 컬럼 길이 64
+
+# 요청 스키마 (입력)
+class TokenTransferRequest(BaseModel):
+    """토큰 이전 요청"""
+    token_id: str
+    to_user_id: int
+    amount: int # 최소 단위 정수
+
+    @validator('token_id')
+    def validate_token_id(cls, v):
+        if not TOKEN_ID_PATTERN.match(v):
+            raise ValueError('토큰 ID는 영문, 숫자, _, - 로 1자 이상 64자 이하여야 합니다')
+        return v
+
+    @validator('amount')
+    def validate_amount(cls, v):
+        if v <= 0:
+            raise ValueError('수량은 0보다 커야 합니다')
+        return v
+
+class TokenIssueRequest(TokenTransferRequest):
+    """토큰 발행 요청 (관리자)"""
+    pass
+
+# 응답 스키마 (출력)
+class LedgerEntryResponse(BaseModel):
+    """원장 기록 응답"""
+    seq: int
+    token_id: str
+    from_account: Optional[int] = None
+    to_account: int
+    amount: int
+    timestamp: str
+    prev_hash: str
+    entry_hash: str
+
+class HoldingsResponse(BaseModel):
+    """토큰 보유 현황 응답"""
+    user_id: int
+    holdings: Dict[str, int]
@@ -0,0 +1,8 @@
+# app/schemas/market.py
+from pydantic import BaseModel
+
+# 요청 스키마 (입력)
+class FeedPublishRequest(BaseModel):
+    """시세/호가 업데이트 발행 요청 (관리자)"""
+    topic: str # price:<토큰ID>, orderbook:<토큰ID>
+    data: dict
@@ -0,0 +1,36 @@
+# app/schemas/profiling.py
+from typing import Optional
+from pydantic import BaseModel, validator
+
+# 요청 스키마 (입력)
+class ProfilingSessionRequest(BaseModel):
+    """프로파일링 세션 시작 요청 (max_requests건 또는 duration_seconds 중 먼저 끝나는 쪽까지)"""
+    max_requests: int = 100
+    duration_seconds: int = 60
+    mode: str = "header" # header (X-Profile 헤더에 토큰을 보낸 요청만), all (모든 요청)
+    path_prefix: Optional[str] = None # 예: /api/auth/login
+    sample_interval_ms: float = 5.0
+
+    @validator('max_requests')
+    def validate_max_requests(cls, v):
+        if not 1 <= v <= 10000:
+            raise ValueError('요청 수는 1~10000 사이여야 합니다')
+        return v
+
+    @validator('duration_seconds')
+    def validate_duration(cls, v):
+        if not 1 <= v <= 3600:
+            raise ValueError('세션 시간은 1~3600초 사이여야 합니다')
+        return v
+
+    @validator('mode')
+    def validate_mode(cls, v):
+        if v not in ("header", "all"):
+            raise ValueError('mode는 header 또는 all이어야 합니다')
+        return v
+
+    @validator('sample_interval_ms')
+    def validate_sample_interval(cls, v):
+        if not 1 <= v <= 100:
+            raise ValueError('샘플링 간격은 1~100ms 사이여야 합니다')
+        return v
@@ -0,0 +1,31 @@
+# app/schemas/search.py
+from typing import List, Optional
+from pydantic import BaseModel
+
+# 응답 스키마 (출력)
+class SearchItemResponse(BaseModel):
+    """검색 결과 상품"""
+    product_id: int
+    name: str
+    price: int
+    stock: int
+    image_url: Optional[str] = None
+    score: float # 검색어 일치도 (높을수록 우선)
+
+class SearchResponse(BaseModel):
+    """상품 검색 응답"""
+    query: str
+    total: int # 조건에 맞는 전체 상품 수
+    items: List[SearchItemResponse]
+    took_ms: float
+
+class SuggestionResponse(BaseModel):
+    """자동완성 항목"""
+    text: str
+    count: int # 해당 단어를 포함한 상품 수
+
+class SuggestResponse(BaseModel):
+    """자동완성 응답"""
+    query: str
+    suggestions: List[SuggestionResponse]
+    took_ms: float
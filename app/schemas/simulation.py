@@ -0,0 +1,87 @@
+# app/schemas/simulation.py
+from pydantic import BaseModel, validator
+from typing import Optional, List, Dict
+
+# 요청 스키마 (입력)
+class AssetAllocation(BaseModel):
+    """시뮬레이션 대상 STO 상품 배분"""
+    name: str
+    weight: float
+    expected_return: float = 0.05 # 연 기대수익률
+    volatility: float = 0.2 # 연 변동성
+    historical_returns: Optional[List[float]] = None # 월별 과거 수익률 (bootstrap용)
+
+    @validator('weight')
+    def validate_weight(cls, v):
+        if v < 0:
+            raise ValueError('배분 비중은 0 이상이어야 합니다')
+        return v
+
+    @validator('volatility')
+    def validate_volatility(cls, v):
+        if v < 0:
+            raise ValueError('변동성은 0 이상이어야 합니다')
+        return v
+
+class SimulationRequest(BaseModel):
+    """투자 시뮬레이션 요청"""
+    initial_amount: float
+    horizon_months: int = 12
+    n_paths: int = 10000
+    method: str = "gbm" # gbm, bootstrap
+    seed: int = 0
+    assets: List[AssetAllocation]
+    correlation: Optional[List[List[float]]] = None # 자산 간 상관계수 행렬 (gbm용)
+
+    @validator('initial_amount')
+    def validate_initial_amount(cls, v):
+        if v <= 0:
+            raise ValueError('투자 금액은 0보다 커야 합니다')
+        return v
+
+    @validator('horizon_months')
+    def validate_horizon_months(cls, v):
+        if v < 1 or v > 360:
+            raise ValueError('투자 기간은 1~360개월이어야 합니다')
+        return v
+
+    @validator('n_paths')
+    def validate_n_paths(cls, v):
+        if v < 100 or v > 200000:
+            raise ValueError('시뮬레이션 경로 수는 100~200000 사이여야 합니다')
+        return v
+
+    @validator('method')
+    def validate_method(cls, v):
+        if v not in ("gbm", "bootstrap"):
+            raise ValueError('시뮬레이션 방식은 gbm 또는 bootstrap 이어야 합니다')
+        return v
+
+    @validator('assets')
+    def validate_assets(cls, v):
+        if not v:
+            raise ValueError('최소 1개 이상의 상품을 선택해야 합니다')
+        if sum(asset.weight for asset in v) <= 0:
+            raise ValueError('배분 비중의 합은 0보다 커야 합니다')
+        return v
+
+# 응답 스키마 (출력)
+class DrawdownStats(BaseModel):
+    """최대 낙폭(MDD) 통계"""
+    mean: float
+    median: float
+    p95: float # 하위 5% 경로의 최대 낙폭
+    worst: float
+
+class SimulationResponse(BaseModel):
+    """투자 시뮬레이션 응답"""
+    method: str
+    n_paths: int
+    horizon_months: int
+    percentiles: List[int]
+    bands: Dict[str, List[float]] # 백분위별 월별 평가금액 (p5, p50 ...)
+    final_mean: float
+    final_median: float
+    probability_of_loss: float
+    drawdown: DrawdownStats
+    cached: bool = False
@@ -0,0 +1,19 @@
+# app/schemas/upload.py
+from pydantic import BaseModel
+from typing import Dict
+
+# 응답 스키마 (출력)
+class ImageUploadResponse(BaseModel):
+    """이미지 업로드 응답"""
+    digest: str
+    url: str
+    size: int
+    duplicate: bool
+    variants: Dict[str, str]
+    variants_ready: bool
+
+class ImageStatusResponse(BaseModel):
+    """이미지 변형 처리 상태 응답"""
+    digest: str
+    variants: Dict[str, str]
+    variants_ready: bool
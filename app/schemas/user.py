@@ -1,10 +1,12 @@
 # app/schemas/user.py
 from pydantic import BaseModel, validator
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
+from app.core.profiling import ProfiledModel
+
 # 요청 스키마 (입력)
-class SMSRequest(BaseModel):
+class SMSRequest(ProfiledModel):
     """SMS 인증번호 발송 요청"""
     phone_number: str
 
@@ -22,7 +24,7 @@ class SMSRequest(BaseModel):
         
         return phone
 
-class SMSVerifyRequest(BaseModel):
+class SMSVerifyRequest(ProfiledModel):
     """SMS 인증번호 확인 요청"""
     phone_number: str
     verification_code: str
@@ -40,11 +42,12 @@ class SMSVerifyRequest(BaseModel):
             raise ValueError('인증번호는 6자리 숫자여야 합니다')
         return v
 
-class UserRegisterRequest(BaseModel):
+class UserRegisterRequest(ProfiledModel):
     """회원가입 요청"""
     phone_number: str
     password: str
     user_name: Optional[str] = None
+    email: Optional[str] = None # 주문/KYC 안내 메일 받을 주소 (선택)
 
     @validator('phone_number')
     def validate_phone_number(cls, v):
@@ -59,7 +62,17 @@ class UserRegisterRequest(BaseModel):
             raise ValueError('비밀번호는 6자리 숫자여야 합니다')
         return v
 
-class UserLoginRequest(BaseModel):
+    @validator('email')
+    def validate_email(cls, v):
+        if v is None:
+            return v
+        email = v.strip()
+        local, _, domain = email.partition('@')
+        if not local or '.' not in domain or ' ' in email or len(email) > 254:
+            raise ValueError('올바른 이메일 주소 형식이 아닙니다')
+        return email
+
+class UserLoginRequest(ProfiledModel):
     """로그인 요청"""
     phone_number: str
     password: str
@@ -77,12 +90,24 @@ class UserLoginRequest(BaseModel):
             raise ValueError('비밀번호는 6자리 숫자여야 합니다')
         return v
 
+class UserLookupRequest(BaseModel):
+    """사용자 일괄 조회 요청 (내부 서비스)"""
+    user_ids: List[int] = []
+    phone_numbers: List[str] = []
+
+    @validator('phone_numbers', always=True)
+    def validate_keys(cls, v, values):
+        if not v and not values.get('user_ids'):
+            raise ValueError('user_ids 또는 phone_numbers가 필요합니다')
+        return [phone.replace('-', '').replace(' ', '') for phone in v]
+
 # 응답 스키마 (출력)
 class UserResponse(BaseModel):
     """사용자 정보 응답"""
     user_id: int
     phone_number: str
     user_name: Optional[str] = None
+    email: Optional[str] = None
     user_type: str
     kyc_status: str
     is_active: bool
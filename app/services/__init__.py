@@ -1,4 +1,30 @@
 # app/services/__init__.py
+from .audit_service import AuditLog, get_audit_log, audit
 from .auth_service import AuthService
+from .simulation_service import SimulationService
+from .feed_service import FeedHub, FeedClient, get_feed_hub
+from .risk_service import RiskEngine, get_risk_engine
+from .feature_store import FeatureStore, get_feature_store
+from .cart_service import CartService, ProductCache, get_cart_backend, get_product_cache
+from .inventory_service import InventoryService, InventoryReconciler, get_inventory_backend, get_inventory_reconciler
+from .user_cache import UserCache, get_user_cache
+from .user_lookup_service import UserLookupService, UserLoader, stream_user_lookup
+from .kyc_service import KycService, KycWorkerPool, get_kyc_pool
+from .search_service import SearchService, InMemorySearchBackend, PgTrgmSearchBackend, get_search_backend
+from .encryption_service import PiiEncryptor, LocalFileKeyProvider, get_encryptor
+from .payout_service import PayoutEngine, DistributionService, get_payout_engine
+from .ledger_service import TokenLedger, LedgerVerifier, get_ledger, get_ledger_verifier
 
-__all__ = ["AuthService"]
\ No newline at end of file
+__all__ = ["AuthService", "SimulationService", "FeedHub", "FeedClient", "get_feed_hub",
+           "TokenLedger", "LedgerVerifier", "get_ledger", "get_ledger_verifier",
+           "RiskEngine", "get_risk_engine",
+           "FeatureStore", "get_feature_store",
+           "CartService", "ProductCache", "get_cart_backend", "get_product_cache",
+           "InventoryService", "InventoryReconciler", "get_inventory_backend", "get_inventory_reconciler",
+           "AuditLog", "get_audit_log", "audit",
+           "UserCache", "get_user_cache",
+           "UserLookupService", "UserLoader", "stream_user_lookup",
+           "KycService", "KycWorkerPool", "get_kyc_pool",
+           "SearchService", "InMemorySearchBackend", "PgTrgmSearchBackend", "get_search_backend",
+           "PiiEncryptor", "LocalFileKeyProvider", "get_encryptor",
+           "PayoutEngine", "DistributionService", "get_payout_engine"]
\ No newline at end of file
@@ -0,0 +1,309 @@
+# app/services/audit_service.py
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Callable, Deque, List, Optional, Set, Tuple
+
+from sqlalchemy import insert, text
+from sqlalchemy.exc import InterfaceError, OperationalError, TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import AuditEvent
+
+# 감사 이벤트 종류
+LOGIN_SUCCESS = "login_success"
+LOGIN_FAILURE = "login_failure"
+REGISTER = "register"
+SMS_SENT = "sms_sent"
+SMS_VERIFIED = "sms_verified"
+SMS_VERIFY_FAILURE = "sms_verify_failure"
+RISK_BLOCKED = "risk_blocked"
+ADMIN_ACCESS = "admin_access"
+ADMIN_DENIED = "admin_denied"
+
+# id = (2024-01-01 이후 ms << 22) | (pid 10비트 << 12) | 순번 12비트
+_ID_EPOCH_MS = 1704067200000
+
+# 버퍼 항목: (id, 시각, 종류, 사용자 ID, 대상, IP, 성공 여부, 상세 dict)
+AuditRow = Tuple[int, float, str, Optional[int], Optional[str], Optional[str], bool, Optional[dict]]
+
+# DB 장애로 보는 오류 (그 외 오류는 행 자체의 문제 -> 나눠서 재시도 후 격리)
+DB_OUTAGE_ERRORS = (OperationalError, InterfaceError, PoolTimeoutError)
+
+_columns = AuditEvent.__table__.c
+
+
+def _clip(value: Optional[str], column) -> Optional[str]:
+    """컬럼 길이에 맞게 자름 (외부 입력이 들어가는 값)"""
+    return None if value is None else str(value)[:column.type.length]
+
+
+class AuditLog:
+    """감사 로그 (요청 경로에서는 메모리 버퍼에 추가만, 백그라운드 스레드가 배치 INSERT)"""
+
+    def __init__(self,
+                 batch_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None,
+                 max_buffer: Optional[int] = None,
+                 spill_path: Optional[str] = None,
+                 retry_interval: Optional[float] = None,
+                 session_factory: Callable[[], Session] = SessionLocal):
+        self.batch_size = batch_size or settings.AUDIT_BATCH_SIZE
+        self.flush_interval = flush_interval or settings.AUDIT_FLUSH_INTERVAL
+        self.max_buffer = max_buffer or settings.AUDIT_MAX_BUFFER
+        self.spill_path = spill_path or settings.AUDIT_SPILL_PATH
+        self.retry_interval = retry_interval or settings.AUDIT_RETRY_INTERVAL
+        self.session_factory = session_factory
+
+        self.stats = {"written": 0, "spilled": 0, "replayed": 0, "quarantined": 0}
+        self.last_error: Optional[str] = None
+        self._buffer: Deque[AuditRow] = deque()
+        self._ids = itertools.count()
+        self._pid_bits = (os.getpid() & 0x3FF) << 12
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+        self._db_retry_at = 0.0
+        self._partitions: Set[Tuple[int, int]] = set()
+        self._thread: Optional[threading.Thread] = None
+
+    # 요청 경로 (deque.append는 스레드 안전, 락/직렬화 없음)
+    def record(self, event_type: str, actor_id: Optional[int] = None, target: Optional[str] = None,
+               ip_address: Optional[str] = None, success: bool = True, detail: Optional[dict] = None):
+        now = time.time()
+        event_id = ((int(now * 1000) - _ID_EPOCH_MS) << 22) | self._pid_bits | (next(self._ids) & 0xFFF)
+        row = (event_id, now, _clip(event_type, _columns.event_type), actor_id,
+               _clip(target, _columns.target), _clip(ip_address, _columns.ip_address), success, detail)
+        if len(self._buffer) >= self.max_buffer:
+            # 버퍼가 가득 차면 (DB 장애 + 쓰기 지연) 바로 파일로
+            self._spill([row])
+            return
+        self._buffer.append(row)
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    # 백그라운드 쓰기
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """남은 이벤트를 기록하고 종료"""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self):
+        while not self._stopping.is_set():
+            # 배치 크기가 차거나 flush_interval이 지나면 기록
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"❌ Audit writer error: {e}")
+        self.flush()
+
+    def flush(self) -> int:
+        """버퍼를 DB에 기록 (DB 장애시 파일로) -> DB에 기록한 개수"""
+        with self._flush_lock:
+            db_available = time.monotonic() >= self._db_retry_at
+            if db_available and self._has_spill():
+                db_available = self._replay_spill()
+
+            written = 0
+            while self._buffer:
+                batch = []
+                while self._buffer and len(batch) < self.batch_size:
+                    batch.append(self._buffer.popleft())
+                if db_available:
+                    count, batch = self._write(batch)
+                    written += count
+                    if not batch:
+                        continue
+                    db_available = False
+                self._spill(batch)
+            self.stats["written"] += written
+            return written
+
+    def _db_unavailable(self, error: Exception):
+        self.last_error = str(error)
+        self._db_retry_at = time.monotonic() + self.retry_interval
+        print(f"❌ Audit log DB write failed, spilling to {self.spill_path}: {error}")
+
+    def _write(self, rows: List[AuditRow]) -> Tuple[int, List[AuditRow]]:
+        """배치 기록 -> (기록한 개수, DB 장애로 기록하지 못한 행)
+
+        장애가 아닌 오류는 배치를 반으로 나눠 다시 시도하고, 한 행만 남아도 실패하면 격리 파일로
+        """
+        written = 0
+        pending = [rows]
+        while pending:
+            chunk = pending.pop()
+            try:
+                self._insert(chunk)
+                written += len(chunk)
+                self.last_error = None
+            except DB_OUTAGE_ERRORS as e:
+                self._db_unavailable(e)
+                return written, chunk + [row for part in reversed(pending) for row in part]
+            except Exception as e:
+                if len(chunk) == 1:
+                    self._quarantine(chunk, e)
+                else:
+                    middle = len(chunk) // 2
+                    pending += [chunk[middle:], chunk[:middle]]
+        return written, []
+
+    def _insert(self, rows: List[AuditRow]):
+        """여러 행을 한 트랜잭션에 multi-row INSERT"""
+        db = self.session_factory()
+        try:
+            values = [
+                {
+                    "id": event_id,
+                    "occurred_at": datetime.fromtimestamp(occurred, timezone.utc),
+                    "event_type": event_type,
+                    "actor_id": actor_id,
+                    "target": target,
+                    "ip_address": ip_address,
+                    "success": success,
+                    "detail": json.dumps(detail, ensure_ascii=False, default=str) if detail else None,
+                }
+                for event_id, occurred, event_type, actor_id, target, ip_address, success, detail in rows
+            ]
+            created = set()
+            if db.get_bind().dialect.name == "postgresql":
+                created = self._ensure_partitions(db, {(v["occurred_at"].year, v["occurred_at"].month) for v in values})
+            for start in range(0, len(values), self.batch_size):
+                db.execute(insert(AuditEvent), values[start:start + self.batch_size])
+            db.commit()
+            # 커밋된 뒤에만 생성된 파티션으로 기억 (롤백되면 다음 배치에서 다시 생성)
+            self._partitions |= created
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _ensure_partitions(self, db: Session, months: Set[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        """월별 파티션 생성 (처음 보는 달만)"""
+        created = months - self._partitions
+        for year, month in sorted(created):
+            next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+            db.execute(text(
+                f"CREATE TABLE IF NOT EXISTS audit_events_{year:04d}_{month:02d} PARTITION OF audit_events "
+                f"FOR VALUES FROM ('{year:04d}-{month:02d}-01') TO ('{next_year:04d}-{next_month:02d}-01')"
+            ))
+        return created
+
+    # 파일 보관 (DB 장애시)
+    @property
+    def _replay_path(self) -> str:
+        return self.spill_path + ".replay"
+
+    @property
+    def quarantine_path(self) -> str:
+        return self.spill_path + ".quarantine"
+
+    def _has_spill(self) -> bool:
+        return os.path.exists(self._replay_path) or os.path.exists(self.spill_path)
+
+    @staticmethod
+    def _append(path: str, rows: List[AuditRow], mode: str = "a"):
+        lines = "".join(json.dumps(list(row), ensure_ascii=False, default=str) + "\n" for row in rows)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, mode, encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _spill(self, rows: List[AuditRow]):
+        with self._spill_lock:
+            self._append(self.spill_path, rows)
+            self.stats["spilled"] += len(rows)
+
+    def _quarantine(self, rows: List[AuditRow], error: Exception):
+        """DB가 받지 않는 행 격리 (보관 파일과 같은 형식, 원인 해결 후 보관 파일로 옮기면 재기록)"""
+        with self._spill_lock:
+            self._append(self.quarantine_path, rows)
+            self.stats["quarantined"] += len(rows)
+        self.last_error = str(error)
+        print(f"❌ Audit event rejected by DB, moved to {self.quarantine_path}: {error}")
+
+    def _replay_spill(self) -> bool:
+        """보관 파일을 배치 단위로 DB에 옮김 (장애시 남은 행만 파일에 유지) -> DB 사용 가능 여부"""
+        with self._spill_lock:
+            if not os.path.exists(self._replay_path):
+                os.replace(self.spill_path, self._replay_path)
+        rows = []
+        with open(self._replay_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rows.append(tuple(json.loads(line)))
+                except ValueError:
+                    continue # 기록 중 중단된 마지막 줄
+
+        replayed = 0
+        for start in range(0, len(rows), self.batch_size):
+            count, unwritten = self._write(rows[start:start + self.batch_size])
+            replayed += count
+            if unwritten:
+                # 이미 기록한 행은 빼고 다시 저장 (다음 재시도에서 중복 기록 방지)
+                remaining = unwritten + rows[start + self.batch_size:]
+                self._append(self._replay_path + ".tmp", remaining, mode="w")
+                os.replace(self._replay_path + ".tmp", self._replay_path)
+                self._count_replayed(replayed)
+                return False
+        os.remove(self._replay_path)
+        self._count_replayed(replayed)
+        print(f"✅ Audit log replayed {replayed} spilled events")
+        return True
+
+    def _count_replayed(self, count: int):
+        self.stats["replayed"] += count
+        self.stats["written"] += count
+
+    def status(self) -> dict:
+        return {
+            **self.stats,
+            "buffered": len(self._buffer),
+            "spill_pending": self._has_spill(),
+            "quarantine_pending": os.path.exists(self.quarantine_path),
+            "last_error": self.last_error,
+        }
+
+
+# 프로세스별 감사 로그 (처음 사용할 때 생성)
+_audit_log: Optional[AuditLog] = None
+
+
+def get_audit_log() -> AuditLog:
+    """AuditLog 인스턴스 반환"""
+    global _audit_log
+    if _audit_log is None:
+        _audit_log = AuditLog()
+    return _audit_log
+
+
+def audit(event_type: str, actor_id: Optional[int] = None, target: Optional[str] = None,
+          ip_address: Optional[str] = None, success: bool = True, detail: Optional[dict] = None):
+    """감사 이벤트 기록 (AUDIT_ENABLED가 꺼져 있으면 무시)"""
+    if settings.AUDIT_ENABLED:
+        get_audit_log().record(event_type, actor_id, target, ip_address, success, detail)
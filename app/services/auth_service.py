@@ -4,8 +4,20 @@ from fastapi import HTTPException, status
 from datetime import datetime, timedelta
 from typing import Optional
 
+from app.config import settings
 from app.models import User, SMSVerification
 from app.schemas import UserRegisterRequest, UserLoginRequest
+from app.services.risk_service import (
+    get_risk_engine,
+    user_risk_key,
+    LOGIN_SUCCESS,
+    LOGIN_FAILURE,
+    SMS_SENT,
+    SMS_FAILURE
+)
+from app.services import audit_service
+from app.services.audit_service import audit
+from app.services.encryption_service import phone_number_filter
 from app.utils.auth import (
     hash_password,
     verify_password,
@@ -22,13 +34,32 @@ class AuthService:
 
     def __init__(self, db: Session):
         self.db = db
+
+    def _check_risk(self, action: str, phone_number: str, client_ip: Optional[str]):
+        """이상 거래 탐지 (메모리 조회만, DB 접근 없음)"""
+        if not settings.RISK_ENABLED:
+            return
+        assessment = get_risk_engine().check(action, user_risk_key(phone_number), client_ip)
+        if assessment.blocked:
+            audit(audit_service.RISK_BLOCKED, target=mask_phone_number(phone_number), ip_address=client_ip,
+                  success=False, detail={"action": action, **assessment.to_dict()})
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="비정상적인 요청이 감지되었습니다. 잠시 후 다시 시도해주세요"
+            )
+
+    def _record_risk_event(self, kind: str, phone_number: str, client_ip: Optional[str]):
+        """이상 거래 탐지 이벤트 기록"""
+        if settings.RISK_ENABLED:
+            get_risk_engine().record(kind, user_risk_key(phone_number), client_ip)
     
-    def send_sms_verification(self, phone_number: str) -> dict:
+    def send_sms_verification(self, phone_number: str, client_ip: Optional[str] = None) -> dict:
         """SMS 인증번호 발송"""
         phone_number = format_phone_number(phone_number)
+        self._check_risk("sms", phone_number, client_ip)
 
         # 이미 가입된 사용자인지 확인
-        existing_user = self.db.query(User).filter(User.phone_number == phone_number).first()
+        existing_user = self.db.query(User).filter(phone_number_filter(phone_number)).first()
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -56,6 +87,8 @@ class AuthService:
         # SMS 발송
         message = f"[Faank] 인증번호: {verification_code}"
         sms_success = send_sms(phone_number, message)
+        self._record_risk_event(SMS_SENT, phone_number, client_ip)
+        audit(audit_service.SMS_SENT, target=mask_phone_number(phone_number), ip_address=client_ip, success=sms_success)
 
         if not sms_success:
             raise HTTPException(
@@ -68,9 +101,10 @@ class AuthService:
             "message": f"{mask_phone_number(phone_number)}로 인증번호를 발송했습니다"
         }
 
-    def verify_sms_code(self, phone_number: str, verification_code: str) -> dict:
+    def verify_sms_code(self, phone_number: str, verification_code: str, client_ip: Optional[str] = None) -> dict:
         """SMS 인증번호 확인"""
         phone_number = format_phone_number(phone_number)
+        self._check_risk("sms_verify", phone_number, client_ip)
 
         # 저장된 인증번호 조회
         sms_verification = self.db.query(SMSVerification).filter(
@@ -106,6 +140,9 @@ class AuthService:
         if sms_verification.verification_code != verification_code:
             sms_verification.attempts += 1
             self.db.commit()
+            self._record_risk_event(SMS_FAILURE, phone_number, client_ip)
+            audit(audit_service.SMS_VERIFY_FAILURE, target=mask_phone_number(phone_number), ip_address=client_ip,
+                  success=False, detail={"attempts": sms_verification.attempts})
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="인증번호가 올바르지 않습니다"
@@ -114,6 +151,7 @@ class AuthService:
         # 인증 성공
         sms_verification = True
         self.db.commit()
+        audit(audit_service.SMS_VERIFIED, target=mask_phone_number(phone_number), ip_address=client_ip)
 
         # 임시 검증 토큰 생성 (회원가입 진행용)
         verification_token = create_verification_token(phone_number)
@@ -124,12 +162,12 @@ class AuthService:
             "verification": verification_token
         }
 
-    def register_user(self, user_data: UserRegisterRequest) -> dict:
+    def register_user(self, user_data: UserRegisterRequest, client_ip: Optional[str] = None) -> dict:
         """회원가입"""
         phone_number = format_phone_number(user_data.phone_number)
 
         # 중복 확인
-        existing_user = self.db.query(User).filter(User.phone_number == phone_number).first()
+        existing_user = self.db.query(User).filter(phone_number_filter(phone_number)).first()
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -153,12 +191,14 @@ class AuthService:
             phone_number=phone_number,
             password_hash=hashed_password,
             user_name="김팽크",
+            email=user_data.email,
             user_type="customer"
         )
 
         self.db.add(new_user)
         self.db.commit()
         self.db.refresh(new_user)
+        audit(audit_service.REGISTER, actor_id=new_user.user_id, target=mask_phone_number(phone_number), ip_address=client_ip)
 
         # 사용자 SMS 인증 데이터 삭제
         self.db.query(SMSVerification).filter(
@@ -179,22 +219,29 @@ class AuthService:
             "user": new_user.to_dict()
         }
 
-    def login_user(self, login_data: UserLoginRequest) -> dict:
+    def login_user(self, login_data: UserLoginRequest, client_ip: Optional[str] = None) -> dict:
         """로그인"""
         phone_number = format_phone_number(login_data.phone_number)
+        self._check_risk("login", phone_number, client_ip)
 
         # 사용자 조회
         user = self.db.query(User).filter(
-            User.phone_number == phone_number,
+            phone_number_filter(phone_number),
             User.is_active == True
         ).first()
 
         if not user or not verify_password(login_data.password, user.password_hash):
+            self._record_risk_event(LOGIN_FAILURE, phone_number, client_ip)
+            audit(audit_service.LOGIN_FAILURE, actor_id=user.user_id if user else None,
+                  target=mask_phone_number(phone_number), ip_address=client_ip, success=False)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="핸드폰 번호 또는 비밀번호가 올바르지 않습니다"
             )
 
+        self._record_risk_event(LOGIN_SUCCESS, phone_number, client_ip)
+        audit(audit_service.LOGIN_SUCCESS, actor_id=user.user_id, target=mask_phone_number(phone_number), ip_address=client_ip)
+
         # JWT 토큰 생성
         access_token = create_access_token(
             data={"user_id": user.user_id, "phone_number": phone_number}
@@ -0,0 +1,455 @@
+# app/services/cart_service.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.pubsub import Broadcaster
+from app.models import Product, Order, OrderItem, User
+from app.services.inventory_service import InventoryService
+from app.services.risk_service import check_order_risk, record_order
+from app.utils.email import send_template_email
+
+# 수량 변경 결과 코드 (스크립트 반환값)
+QUANTITY_LIMIT_EXCEEDED = -1
+ITEM_LIMIT_EXCEEDED = -2
+
+# 수량 변경 + 만료 갱신을 한 번에 처리 (mode: add = HINCRBY, set = 지정 수량)
+_UPDATE_ITEM_SCRIPT = """
+local current = tonumber(redis.call('HGET', KEYS[1], ARGV[2]) or '0')
+local target = tonumber(ARGV[3])
+if ARGV[1] == 'add' then target = current + target end
+if target > tonumber(ARGV[4]) then return -1 end
+if current == 0 and target > 0 and redis.call('HLEN', KEYS[1]) >= tonumber(ARGV[5]) then return -2 end
+if target <= 0 then
+    redis.call('HDEL', KEYS[1], ARGV[2])
+    target = 0
+else
+    redis.call('HINCRBY', KEYS[1], ARGV[2], target - current)
+end
+if redis.call('EXISTS', KEYS[1]) == 1 then redis.call('EXPIRE', KEYS[1], ARGV[6]) end
+return target
+"""
+
+# 주문 실패시 복구: 한도 안에서 현재 장바구니와 합침 (ARGV: 최대 수량, 최대 종류, 만료, 상품/수량 쌍...)
+_RESTORE_CART_SCRIPT = """
+local max_quantity = tonumber(ARGV[1])
+local count = redis.call('HLEN', KEYS[1])
+for i = 4, #ARGV, 2 do
+    local current = tonumber(redis.call('HGET', KEYS[1], ARGV[i]) or '0')
+    if current > 0 or count < tonumber(ARGV[2]) then
+        if current == 0 then count = count + 1 end
+        redis.call('HSET', KEYS[1], ARGV[i], math.min(current + tonumber(ARGV[i + 1]), max_quantity))
+    end
+end
+if count > 0 then redis.call('EXPIRE', KEYS[1], ARGV[3]) end
+return count
+"""
+
+# 주문 전환용: 장바구니를 읽고 바로 삭제 (중복 주문 방지)
+_TAKE_CART_SCRIPT = """
+local items = redis.call('HGETALL', KEYS[1])
+redis.call('DEL', KEYS[1])
+return items
+"""
+
+
+class InMemoryCartBackend:
+    """프로세스 메모리 장바구니 저장소 (테스트/단일 워커용)"""
+
+    def __init__(self):
+        self._carts: Dict[str, Tuple[float, Dict[int, int]]] = {}
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _get(self, key: str, now: float) -> Optional[Dict[int, int]]:
+        entry = self._carts.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= now:
+            del self._carts[key]
+            return None
+        return entry[1]
+
+    def _purge_expired(self, now: float):
+        """주기적으로 만료된 장바구니 정리"""
+        self._writes += 1
+        if self._writes % 1000:
+            return
+        for key in [key for key, (expires_at, _) in self._carts.items() if expires_at <= now]:
+            del self._carts[key]
+
+    def update_item(self, key: str, product_id: int, quantity: int, mode: str,
+                    max_quantity: int, max_items: int, ttl: int) -> int:
+        now = time.time()
+        with self._lock:
+            self._purge_expired(now)
+            items = self._get(key, now) or {}
+            current = items.get(product_id, 0)
+            target = current + quantity if mode == "add" else quantity
+            if target > max_quantity:
+                return QUANTITY_LIMIT_EXCEEDED
+            if current == 0 and target > 0 and len(items) >= max_items:
+                return ITEM_LIMIT_EXCEEDED
+            if target <= 0:
+                items.pop(product_id, None)
+                target = 0
+            else:
+                items[product_id] = target
+            if items:
+                self._carts[key] = (now + ttl, items)
+            else:
+                self._carts.pop(key, None)
+            return target
+
+    def get_items(self, key: str) -> Tuple[Dict[int, int], Optional[int]]:
+        now = time.time()
+        with self._lock:
+            items = self._get(key, now)
+            if items is None:
+                return {}, None
+            return dict(items), int(self._carts[key][0] - now)
+
+    def take(self, key: str) -> Dict[int, int]:
+        with self._lock:
+            items = self._get(key, time.time())
+            self._carts.pop(key, None)
+            return dict(items) if items else {}
+
+    def restore(self, key: str, items: Dict[int, int], max_quantity: int, max_items: int, ttl: int):
+        now = time.time()
+        with self._lock:
+            current = self._get(key, now) or {}
+            for product_id, quantity in sorted(items.items()):
+                if product_id in current or len(current) < max_items:
+                    current[product_id] = min(current.get(product_id, 0) + quantity, max_quantity)
+            if current:
+                self._carts[key] = (now + ttl, current)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._carts.pop(key, None)
+
+
+class RedisCartBackend:
+    """Redis 해시 장바구니 저장소 (cart:<user_id> -> {product_id: 수량})"""
+
+    def __init__(self, url: Optional[str] = None):
+        import redis
+
+        self._redis = redis.Redis.from_url(url or settings.REDIS_URL)
+        # EVALSHA로 실행 (스크립트 본문은 처음 한 번만 전송)
+        self._update_item = self._redis.register_script(_UPDATE_ITEM_SCRIPT)
+        self._take = self._redis.register_script(_TAKE_CART_SCRIPT)
+        self._restore = self._redis.register_script(_RESTORE_CART_SCRIPT)
+
+    @staticmethod
+    def _decode(raw) -> Dict[int, int]:
+        if isinstance(raw, dict):
+            return {int(field): int(value) for field, value in raw.items()}
+        # HGETALL 결과 평탄 리스트 [field, value, field, value, ...]
+        return {int(raw[i]): int(raw[i + 1]) for i in range(0, len(raw), 2)}
+
+    def update_item(self, key: str, product_id: int, quantity: int, mode: str,
+                    max_quantity: int, max_items: int, ttl: int) -> int:
+        return int(self._update_item(keys=[key], args=[mode, product_id, quantity, max_quantity, max_items, ttl]))
+
+    def get_items(self, key: str) -> Tuple[Dict[int, int], Optional[int]]:
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hgetall(key)
+        pipe.ttl(key)
+        raw, ttl = pipe.execute()
+        return self._decode(raw), (ttl if ttl is not None and ttl >= 0 else None)
+
+    def take(self, key: str) -> Dict[int, int]:
+        return self._decode(self._take(keys=[key]))
+
+    def restore(self, key: str, items: Dict[int, int], max_quantity: int, max_items: int, ttl: int):
+        args = [max_quantity, max_items, ttl]
+        for product_id, quantity in sorted(items.items()):
+            args += [product_id, quantity]
+        self._restore(keys=[key], args=args)
+
+    def delete(self, key: str):
+        self._redis.delete(key)
+
+
+class ProductCache:
+    """상품 가격/표시 정보 캐시 (장바구니 조회마다 DB를 읽지 않도록)"""
+
+    def __init__(self, ttl: Optional[float] = None, max_size: Optional[int] = None):
+        self.ttl = ttl if ttl is not None else settings.PRODUCT_CACHE_TTL
+        self.max_size = max_size or settings.PRODUCT_CACHE_SIZE
+        self._entries: "OrderedDict[int, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 다른 워커의 캐시에서도 제거 (시작 전이면 이 워커만)
+        self.broadcaster = Broadcaster("product_cache", lambda message: self.evict(message["product_ids"]))
+
+    def get_many(self, db: Session, product_ids: List[int]) -> Dict[int, dict]:
+        """여러 상품 정보를 한 번에 조회 (캐시에 없는 것만 IN 쿼리 1번)"""
+        now = time.monotonic()
+        found: Dict[int, dict] = {}
+        missing = []
+        with self._lock:
+            for product_id in product_ids:
+                entry = self._entries.get(product_id)
+                if entry is not None and entry[0] > now:
+                    found[product_id] = entry[1]
+                    self._entries.move_to_end(product_id)
+                else:
+                    missing.append(product_id)
+
+        if missing:
+            rows = db.query(
+                Product.product_id, Product.name, Product.price, Product.stock,
+                Product.image_url, Product.is_active
+            ).filter(Product.product_id.in_(missing)).all()
+            loaded = {
+                row.product_id: {
+                    "product_id": row.product_id,
+                    "name": row.name,
+                    "price": row.price,
+                    "stock": row.stock,
+                    "image_url": row.image_url,
+                    "is_active": row.is_active,
+                }
+                for row in rows
+            }
+            with self._lock:
+                for product_id, info in loaded.items():
+                    self._entries[product_id] = (now + self.ttl, info)
+                    self._entries.move_to_end(product_id)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+            found.update(loaded)
+        return found
+
+    def invalidate(self, product_ids: List[int]):
+        """가격/재고 변경시 캐시 제거 (모든 워커)"""
+        self.evict(product_ids)
+        self.broadcaster.publish({"product_ids": product_ids})
+
+    def evict(self, product_ids: List[int]):
+        """이 워커의 캐시에서만 제거"""
+        with self._lock:
+            for product_id in product_ids:
+                self._entries.pop(product_id, None)
+
+
+class CartService:
+    """장바구니 서비스 (담기/수정은 Redis, 주문 전환시에만 DB 사용)"""
+
+    def __init__(self, db: Session, backend=None, product_cache: Optional[ProductCache] = None,
+                 inventory: Optional[InventoryService] = None):
+        self.db = db
+        self.backend = backend or get_cart_backend()
+        self.product_cache = product_cache or get_product_cache()
+        self.inventory = inventory or InventoryService(db)
+
+    @staticmethod
+    def cart_key(user_id: int) -> str:
+        return f"cart:{user_id}"
+
+    def _update_item(self, user_id: int, product_id: int, quantity: int, mode: str) -> int:
+        result = self.backend.update_item(
+            self.cart_key(user_id), product_id, quantity, mode,
+            settings.CART_MAX_QUANTITY, settings.CART_MAX_ITEMS, settings.CART_TTL_SECONDS
+        )
+        if result == QUANTITY_LIMIT_EXCEEDED:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"상품당 최대 {settings.CART_MAX_QUANTITY}개까지 담을 수 있습니다"
+            )
+        if result == ITEM_LIMIT_EXCEEDED:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"장바구니에는 최대 {settings.CART_MAX_ITEMS}종류까지 담을 수 있습니다"
+            )
+        return result
+
+    def _require_active_product(self, product_id: int):
+        product = self.product_cache.get_many(self.db, [product_id]).get(product_id)
+        if not product or not product["is_active"]:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="판매 중인 상품이 아닙니다"
+            )
+
+    def add_item(self, user_id: int, product_id: int, quantity: int) -> dict:
+        """상품 담기 (이미 있으면 수량 증가)"""
+        self._require_active_product(product_id)
+        self._update_item(user_id, product_id, quantity, "add")
+        return self.get_cart(user_id)
+
+    def set_quantity(self, user_id: int, product_id: int, quantity: int) -> dict:
+        """수량 변경 (0이면 삭제, 판매 중지된 상품도 삭제는 가능)"""
+        if quantity > 0:
+            self._require_active_product(product_id)
+        self._update_item(user_id, product_id, quantity, "set")
+        return self.get_cart(user_id)
+
+    def remove_item(self, user_id: int, product_id: int) -> dict:
+        """상품 삭제"""
+        return self.set_quantity(user_id, product_id, 0)
+
+    def clear(self, user_id: int):
+        """장바구니 비우기"""
+        self.backend.delete(self.cart_key(user_id))
+
+    def get_cart(self, user_id: int) -> dict:
+        """장바구니 조회 (상품 정보는 캐시에서 한 번에 채움)"""
+        items, expires_in = self.backend.get_items(self.cart_key(user_id))
+        products = self.product_cache.get_many(self.db, list(items))
+
+        result = []
+        total_amount = 0
+        for product_id, quantity in items.items():
+            product = products.get(product_id)
+            if product is None:
+                # 삭제된 상품은 표시만 하고 합계에서 제외
+                result.append({
+                    "product_id": product_id, "name": None, "image_url": None,
+                    "unit_price": 0, "quantity": quantity, "subtotal": 0, "available": False,
+                })
+                continue
+            available = bool(product["is_active"]) and product["stock"] >= quantity
+            subtotal = product["price"] * quantity
+            if available:
+                total_amount += subtotal
+            result.append({
+                "product_id": product_id,
+                "name": product["name"],
+                "image_url": product["image_url"],
+                "unit_price": product["price"],
+                "quantity": quantity,
+                "subtotal": subtotal,
+                "available": available,
+            })
+
+        return {
+            "user_id": user_id,
+            "items": result,
+            "total_quantity": sum(items.values()),
+            "total_amount": total_amount,
+            "expires_in": expires_in,
+        }
+
+    def checkout(self, user: User, client_ip: Optional[str] = None) -> dict:
+        """장바구니를 주문으로 전환 (가격/재고는 DB 기준으로 다시 확인, 이상 거래 탐지 후 기록)"""
+        user_id = user.user_id
+        key = self.cart_key(user_id)
+        items = self.backend.take(key)
+        if not items:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="장바구니가 비어 있습니다"
+            )
+
+        sold: Dict[int, int] = {}
+        try:
+            products = {
+                product.product_id: product
+                for product in self.db.query(Product).filter(Product.product_id.in_(list(items))).all()
+            }
+            order = Order(user_id=user_id, status="pending", total_amount=0)
+            total_amount = 0
+            for product_id, quantity in sorted(items.items()):
+                product = products.get(product_id)
+                if product is None or not product.is_active:
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail=f"판매가 중지된 상품이 있습니다 (상품 ID: {product_id})"
+                    )
+                # 선점 판매와 같은 재고 저장소에서 차감 (redis/memory 카운터 + DB 재고)
+                if not self.inventory.sell(product_id, quantity):
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail=f"재고가 부족합니다: {product.name}"
+                    )
+                sold[product_id] = quantity
+                order.items.append(OrderItem(product_id=product_id, quantity=quantity, unit_price=product.price))
+                total_amount += product.price * quantity
+
+            order.total_amount = total_amount
+            check_order_risk(user, client_ip, total_amount)
+            self.db.add(order)
+            self.db.commit()
+            self.db.refresh(order)
+        except Exception:
+            self.db.rollback()
+            self.inventory.cancel_sales(sold)
+            # 주문 실패시 장바구니 복구 (그 사이 담은 상품과 한도 안에서 합쳐짐)
+            self.backend.restore(key, items, settings.CART_MAX_QUANTITY, settings.CART_MAX_ITEMS,
+                                 settings.CART_TTL_SECONDS)
+            raise
+        finally:
+            self.product_cache.invalidate(list(items))
+
+        record_order(user, client_ip, order.total_amount)
+        send_template_email(user.email, "order_confirmation", {
+            "user_name": user.user_name or "고객",
+            "order_id": order.order_id,
+            "amount": f"{order.total_amount:,}",
+        })
+        return order.to_dict()
+
+
+# 상품 표시 정보 변경 추적 (커밋 후 모든 워커의 캐시에서 제거, 재고 SQL 차감은 주문 처리에서 직접 제거)
+_CACHE_CHANGES_KEY = "product_cache_changes"
+_CACHED_FIELDS = ("name", "price", "stock", "image_url", "is_active")
+
+
+def _record_cache_change(target: Product):
+    session = inspect(target).session
+    if session is not None:
+        session.info.setdefault(_CACHE_CHANGES_KEY, set()).add(target.product_id)
+
+
+@event.listens_for(Product, "after_update")
+def _product_updated(mapper, connection, target):
+    attrs = inspect(target).attrs
+    if any(attrs[field].history.has_changes() for field in _CACHED_FIELDS):
+        _record_cache_change(target)
+
+
+@event.listens_for(Product, "after_delete")
+def _product_deleted(mapper, connection, target):
+    _record_cache_change(target)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_product_cache(session):
+    product_ids = session.info.pop(_CACHE_CHANGES_KEY, None)
+    if product_ids:
+        get_product_cache().invalidate(sorted(product_ids))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_cache_changes(session):
+    session.info.pop(_CACHE_CHANGES_KEY, None)
+
+
+# 프로세스별 저장소/캐시 (처음 사용할 때 생성)
+_backend = None
+_product_cache: Optional[ProductCache] = None
+
+
+def get_cart_backend():
+    """설정(CART_BACKEND)에 맞는 장바구니 저장소 반환"""
+    global _backend
+    if _backend is None:
+        _backend = RedisCartBackend() if settings.CART_BACKEND == "redis" else InMemoryCartBackend()
+    return _backend
+
+
+def get_product_cache() -> ProductCache:
+    """ProductCache 인스턴스 반환"""
+    global _product_cache
+    if _product_cache is None:
+        _product_cache = ProductCache()
+    return _product_cache
@@ -0,0 +1,350 @@
+# app/services/encryption_service.py
+import base64
+import csv
+import hashlib
+import hmac
+import io
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import EncryptionKey, User
+from app.utils.auth import format_phone_number
+
+# 암호문 형식: "v1.<데이터 키 ID>.<base64(nonce 12바이트 + 암호문 + 태그)>"
+_VERSION = "v1"
+_NONCE_SIZE = 12
+_WRAP_AAD = b"faank-pii-data-key"
+_BLIND_INDEX_INFO = b"faank-pii-blind-index"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def is_encrypted(value: Optional[str]) -> bool:
+    """암호문 여부 (암호화 도입 전 평문 데이터 구분용)"""
+    return bool(value) and value.startswith(_VERSION + ".")
+
+
+class LocalFileKeyProvider:
+    """로컬 파일 마스터 키 (개발/테스트용, 운영에서는 같은 인터페이스로 KMS 연동)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.PII_MASTER_KEY_PATH
+        master = self._load()
+        # 마스터 키 자체가 아닌 지문만 식별자로 노출
+        self.key_id = "local:" + hashlib.sha256(master).hexdigest()[:16]
+        self._aead = AESGCM(master)
+        self._master = master
+
+    def _load(self) -> bytes:
+        if not os.path.exists(self.path):
+            if settings.ENVIRONMENT == "production":
+                raise RuntimeError(f"마스터 키 파일이 없습니다: {self.path}")
+            self._create()
+        with open(self.path, "rb") as f:
+            master = base64.b64decode(f.read().strip())
+        if len(master) != 32:
+            raise ValueError(f"마스터 키는 32바이트여야 합니다: {self.path}")
+        return master
+
+    def _create(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(base64.b64encode(AESGCM.generate_key(bit_length=256)))
+        try:
+            # 워커 여러 개가 동시에 만들어도 먼저 만든 키 하나만 사용
+            os.link(temp_path, self.path)
+        except FileExistsError:
+            pass
+        finally:
+            os.unlink(temp_path)
+
+    def wrap(self, data_key: bytes) -> str:
+        nonce = os.urandom(_NONCE_SIZE)
+        return base64.b64encode(nonce + self._aead.encrypt(nonce, data_key, _WRAP_AAD)).decode("ascii")
+
+    def unwrap(self, wrapped_key: str) -> bytes:
+        raw = base64.b64decode(wrapped_key)
+        return self._aead.decrypt(raw[:_NONCE_SIZE], raw[_NONCE_SIZE:], _WRAP_AAD)
+
+    def derive(self, info: bytes) -> bytes:
+        """용도별 하위 키 (blind index용 HMAC 키 등)"""
+        return HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=info).derive(self._master)
+
+
+def get_key_provider(kind: Optional[str] = None) -> LocalFileKeyProvider:
+    """설정에 맞는 마스터 키 제공자 생성"""
+    kind = kind or settings.PII_KEY_PROVIDER
+    if kind == "local":
+        return LocalFileKeyProvider()
+    raise ValueError(f"지원하지 않는 마스터 키 제공자입니다: {kind}")
+
+
+class PiiEncryptor:
+    """개인정보 필드 암호화 (데이터 키는 마스터 키로 감싸서 DB에, 풀린 키는 메모리 캐시)"""
+
+    def __init__(self,
+                 provider: Optional[LocalFileKeyProvider] = None,
+                 key_cache_ttl: Optional[float] = None,
+                 rotation_days: Optional[int] = None,
+                 session_factory: Callable[[], Session] = SessionLocal):
+        self.provider = provider or get_key_provider()
+        self.key_cache_ttl = key_cache_ttl or settings.PII_KEY_CACHE_TTL
+        self.rotation_interval = timedelta(days=rotation_days or settings.PII_KEY_ROTATION_DAYS)
+        self.session_factory = session_factory
+
+        self.stats = {"encrypted": 0, "decrypted": 0, "key_loads": 0, "rotations": 0, "plaintext_reads": 0}
+        self._index_key = self.provider.derive(_BLIND_INDEX_INFO)
+        self._keys: Dict[int, Tuple[float, AESGCM]] = {} # key_id -> (만료 시각, 풀린 데이터 키)
+        self._active: Optional[Tuple[float, int, AESGCM]] = None # (다시 확인할 시각, key_id, 데이터 키)
+        self._lock = threading.Lock()
+
+    # 데이터 키 관리
+    def _active_key(self, rotate: bool = False) -> Tuple[int, AESGCM]:
+        now = time.monotonic()
+        active = self._active
+        if not rotate and active is not None and active[0] > now:
+            return active[1], active[2]
+        with self._lock:
+            active = self._active
+            if not rotate and active is not None and active[0] > now:
+                return active[1], active[2]
+            db = self.session_factory()
+            try:
+                row = db.query(EncryptionKey).filter(
+                    EncryptionKey.status == "active"
+                ).order_by(EncryptionKey.key_id.desc()).first()
+                if rotate or row is None or self._is_due(row):
+                    row = self._create_key(db)
+                key_id = row.key_id
+                aead = AESGCM(self.provider.unwrap(row.wrapped_key))
+            finally:
+                db.close()
+            self.stats["key_loads"] += 1
+            # 다른 워커가 교체한 키도 캐시 만료 후에는 따라감
+            self._keys[key_id] = (now + self.key_cache_ttl, aead)
+            self._active = (now + self.key_cache_ttl, key_id, aead)
+            return key_id, aead
+
+    def _is_due(self, row: EncryptionKey) -> bool:
+        created_at = row.created_at
+        if created_at is None:
+            return False
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return _utcnow() - created_at >= self.rotation_interval
+
+    def _create_key(self, db: Session) -> EncryptionKey:
+        now = _utcnow()
+        row = EncryptionKey(
+            wrapped_key=self.provider.wrap(AESGCM.generate_key(bit_length=256)),
+            master_key_id=self.provider.key_id,
+            status="active",
+            created_at=now,
+        )
+        db.add(row)
+        db.flush()
+        # 이전 키는 복호화 전용으로 (워커가 동시에 교체해도 가장 최근 키 하나만 active)
+        db.query(EncryptionKey).filter(
+            EncryptionKey.status == "active",
+            EncryptionKey.key_id < row.key_id,
+        ).update({"status": "retired", "retired_at": now}, synchronize_session=False)
+        db.commit()
+        self.stats["rotations"] += 1
+        return row
+
+    def _get_keys(self, key_ids: Set[int]) -> Dict[int, AESGCM]:
+        """데이터 키 조회 (캐시에 없는 키만 한 번의 쿼리로 로드)"""
+        now = time.monotonic()
+        keys: Dict[int, AESGCM] = {}
+        missing: List[int] = []
+        for key_id in key_ids:
+            entry = self._keys.get(key_id)
+            if entry is not None and entry[0] > now:
+                keys[key_id] = entry[1]
+            else:
+                missing.append(key_id)
+        if not missing:
+            return keys
+
+        with self._lock:
+            db = self.session_factory()
+            try:
+                rows = db.query(EncryptionKey).filter(EncryptionKey.key_id.in_(missing)).all()
+            finally:
+                db.close()
+            for row in rows:
+                aead = AESGCM(self.provider.unwrap(row.wrapped_key))
+                self._keys[row.key_id] = (now + self.key_cache_ttl, aead)
+                keys[row.key_id] = aead
+            self.stats["key_loads"] += len(rows)
+        unknown = set(missing) - keys.keys()
+        if unknown:
+            raise ValueError(f"데이터 키를 찾을 수 없습니다: {sorted(unknown)}")
+        return keys
+
+    def rotate(self) -> int:
+        """새 데이터 키로 교체 (이후 암호화는 새 키, 기존 암호문은 이전 키로 계속 복호화)"""
+        return self._active_key(rotate=True)[0]
+
+    # 암호화/복호화
+    def encrypt(self, value: Optional[str], field: str) -> Optional[str]:
+        """필드 암호화 (필드명을 AAD로 묶어 다른 컬럼에 옮겨 붙인 암호문은 복호화 실패)"""
+        if value is None:
+            return None
+        key_id, aead = self._active_key()
+        nonce = os.urandom(_NONCE_SIZE)
+        sealed = aead.encrypt(nonce, value.encode("utf-8"), field.encode("ascii"))
+        self.stats["encrypted"] += 1
+        return f"{_VERSION}.{key_id}.{base64.b64encode(nonce + sealed).decode('ascii')}"
+
+    def decrypt(self, token: Optional[str], field: str) -> Optional[str]:
+        return self.decrypt_many([token], field)[0]
+
+    def decrypt_many(self, tokens: Iterable[Optional[str]], field: str) -> List[Optional[str]]:
+        """여러 행 일괄 복호화 (데이터 키 조회는 키별로 한 번)"""
+        tokens = list(tokens)
+        parsed: List[Optional[Tuple[int, bytes]]] = []
+        for token in tokens:
+            if is_encrypted(token):
+                _, key_id, payload = token.split(".", 2)
+                parsed.append((int(key_id), base64.b64decode(payload)))
+            else:
+                parsed.append(None)
+
+        keys = self._get_keys({item[0] for item in parsed if item is not None})
+        aad = field.encode("ascii")
+        results: List[Optional[str]] = []
+        for token, item in zip(tokens, parsed):
+            if item is None:
+                # 암호화 도입 전 평문 (reencrypt_users로 전환 전까지)
+                if token is not None:
+                    self.stats["plaintext_reads"] += 1
+                results.append(token)
+                continue
+            key_id, raw = item
+            try:
+                plain = keys[key_id].decrypt(raw[:_NONCE_SIZE], raw[_NONCE_SIZE:], aad)
+            except InvalidTag:
+                raise ValueError(f"{field} 복호화에 실패했습니다 (key_id={key_id})")
+            results.append(plain.decode("utf-8"))
+        self.stats["decrypted"] += len(tokens)
+        return results
+
+    def blind_index(self, phone_number: str) -> str:
+        """핸드폰 번호 조회용 결정적 HMAC (같은 번호는 항상 같은 값이라 unique 인덱스 조회 가능)"""
+        normalized = format_phone_number(phone_number)
+        return hmac.new(self._index_key, normalized.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    def key_id_of(self, token: Optional[str]) -> Optional[int]:
+        return int(token.split(".", 2)[1]) if is_encrypted(token) else None
+
+    def status(self) -> dict:
+        now = time.monotonic()
+        active = self._active
+        return {
+            "provider": self.provider.key_id,
+            "active_key_id": active[1] if active is not None else None,
+            "cached_keys": sum(1 for expires_at, _ in self._keys.values() if expires_at > now),
+            "rotation_days": self.rotation_interval.days,
+            **self.stats,
+        }
+
+
+def phone_number_filter(phone_number: str):
+    """핸드폰 번호로 사용자를 찾는 조건 (blind index, 마이그레이션 전 phone_hash가 NULL인 행은 평문 비교)"""
+    phone_number = format_phone_number(phone_number)
+    return or_(
+        User.phone_hash == get_encryptor().blind_index(phone_number),
+        and_(User.phone_hash.is_(None), User.phone_number_encrypted == phone_number),
+    )
+
+
+def reencrypt_users(db: Session, batch_size: Optional[int] = None) -> dict:
+    """현재 데이터 키가 아닌 사용자 개인정보 재암호화 (키 교체 후, 평문 데이터 전환용)"""
+    batch_size = batch_size or settings.PII_REENCRYPT_BATCH
+    encryptor = get_encryptor()
+    active_key_id, _ = encryptor._active_key()
+    result = {"scanned": 0, "reencrypted": 0}
+    last_id = 0
+    while True:
+        users = db.query(User).filter(User.user_id > last_id).order_by(User.user_id).limit(batch_size).all()
+        if not users:
+            break
+        last_id = users[-1].user_id
+        stale = [
+            user for user in users
+            if encryptor.key_id_of(user.phone_number_encrypted) != active_key_id
+            or any(token is not None and encryptor.key_id_of(token) != active_key_id
+                   for token in (user.user_name_encrypted, user.email_encrypted))
+        ]
+        for user in User.decrypt_all(stale):
+            # setter가 현재 키로 다시 암호화 (blind index도 함께 갱신)
+            user.phone_number = user.phone_number
+            user.user_name = user.user_name
+            user.email = user.email
+        db.commit()
+        result["scanned"] += len(users)
+        result["reencrypted"] += len(stale)
+        db.expunge_all()
+    return result
+
+
+_EXPORT_COLUMNS = ["user_id", "phone_number", "user_name", "user_type", "kyc_status", "is_active", "created_at"]
+
+
+def export_users_csv(batch_size: Optional[int] = None,
+                     session_factory: Callable[[], Session] = SessionLocal) -> Iterator[str]:
+    """사용자 목록 CSV (배치 단위로 읽고 일괄 복호화해서 바로 내보냄)"""
+    batch_size = batch_size or settings.PII_REENCRYPT_BATCH
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(_EXPORT_COLUMNS)
+    db = session_factory()
+    try:
+        last_id = 0
+        while True:
+            users = db.query(User).filter(User.user_id > last_id).order_by(User.user_id).limit(batch_size).all()
+            if not users:
+                break
+            last_id = users[-1].user_id
+            for user in User.decrypt_all(users):
+                writer.writerow([
+                    user.user_id, user.phone_number, user.user_name or "", user.user_type, user.kyc_status,
+                    user.is_active, user.created_at.isoformat() if user.created_at else "",
+                ])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            db.expunge_all()
+    finally:
+        db.close()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+# 프로세스별 암호화기 (처음 사용할 때 생성)
+_encryptor: Optional[PiiEncryptor] = None
+
+
+def get_encryptor() -> PiiEncryptor:
+    """PiiEncryptor 인스턴스 반환"""
+    global _encryptor
+    if _encryptor is None:
+        _encryptor = PiiEncryptor()
+    return _encryptor
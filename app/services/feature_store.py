@@ -0,0 +1,440 @@
+# app/services/feature_store.py
+import hashlib
+import json
+import os
+import threading
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.config import settings
+
+_EPOCH = date(1970, 1, 1)
+
+# 원천 데이터 컬럼
+RAW_COLUMNS = ("price", "temp_mean", "precipitation", "humidity")
+
+# 피처 컬럼 (순서 = 저장/조회 순서)
+FEATURE_COLUMNS = (
+    "price",
+    "price_lag_1", "price_lag_7", "price_lag_14", "price_lag_28",
+    "price_ma_7", "price_ma_28", "price_std_28", "price_change_7",
+    "temp_mean_7", "temp_mean_28",
+    "precip_sum_7", "precip_sum_28",
+    "humidity_mean_7",
+    "doy_sin", "doy_cos", "dow_sin", "dow_cos",
+)
+
+# 피처 계산에 필요한 최대 과거 일수
+MAX_LOOKBACK = 28
+
+# 직전 값으로 채우는 원천 컬럼 (compute_features와 같은 목록)
+FORWARD_FILLED_COLUMNS = ("price", "temp_mean", "humidity")
+
+# 지역 -> 기상청 ASOS 관측소 번호
+KMA_STATIONS = {
+    "서울": 108, "강릉": 105, "대전": 133, "청주": 131, "전주": 146,
+    "광주": 156, "대구": 143, "안동": 136, "부산": 159, "제주": 184, "서귀포": 189,
+}
+
+
+def to_day(d: date) -> int:
+    """날짜 -> 1970-01-01 기준 일수"""
+    return (d - _EPOCH).days
+
+
+def from_day(day: int) -> date:
+    """1970-01-01 기준 일수 -> 날짜"""
+    return _EPOCH + timedelta(days=int(day))
+
+
+# 데이터 소스
+class FixtureWeatherSource:
+    """오프라인 날씨 소스 (JSON 파일, 없으면 지역별 결정적 합성 데이터)
+
+    JSON 형식: {"제주": {"2024-01-01": {"temp_mean": 6.1, "precipitation": 0.0, "humidity": 65}}}
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path if path is not None else settings.WEATHER_FIXTURE_PATH
+        self._data = {}
+        if self.path and os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._data = json.load(f)
+
+    def fetch(self, region: str, start: date, end: date) -> List[dict]:
+        rows = []
+        fixture = self._data.get(region, {})
+        seed = int(hashlib.sha256(region.encode("utf-8")).hexdigest()[:8], 16)
+        for day in range(to_day(start), to_day(end) + 1):
+            d = from_day(day)
+            row = fixture.get(d.isoformat())
+            if row is None:
+                # 계절성 + 지역별 고정 잡음
+                rng = np.random.default_rng(seed + day)
+                season = np.cos(2 * np.pi * (d.timetuple().tm_yday - 200) / 365.25)
+                row = {
+                    "temp_mean": round(13.0 + 12.0 * season + rng.normal(0, 2), 1),
+                    "precipitation": round(float(max(0.0, rng.gamma(0.6, 8.0) - 3.0)), 1),
+                    "humidity": round(float(np.clip(65 + 15 * season + rng.normal(0, 8), 20, 100)), 1),
+                }
+            rows.append({"date": d, **row})
+        return rows
+
+
+class KmaWeatherSource:
+    """기상청 ASOS 일자료 API 날씨 소스 (WEATHER_API_KEY 필요)"""
+
+    URL = "http://apis.data.go.kr/1360000/AsosDalyInfoService/getWthrDataList"
+    PAGE_SIZE = 999
+
+    def __init__(self, api_key: Optional[str] = None, transport=None):
+        self.api_key = api_key or settings.WEATHER_API_KEY
+        self.transport = transport # httpx 전송 계층 (테스트용 교체)
+        if not self.api_key:
+            raise ValueError("WEATHER_API_KEY가 설정되지 않았습니다")
+
+    def fetch(self, region: str, start: date, end: date) -> List[dict]:
+        import httpx
+
+        station = KMA_STATIONS.get(region)
+        if station is None:
+            raise ValueError(f"관측소 정보가 없는 지역입니다: {region}")
+
+        items = []
+        with httpx.Client(timeout=10.0, transport=self.transport) as client:
+            page = 1
+            while True:
+                response = client.get(self.URL, params={
+                    "serviceKey": self.api_key,
+                    "dataType": "JSON",
+                    "dataCd": "ASOS",
+                    "dateCd": "DAY",
+                    "startDt": start.strftime("%Y%m%d"),
+                    "endDt": end.strftime("%Y%m%d"),
+                    "stnIds": station,
+                    "numOfRows": self.PAGE_SIZE,
+                    "pageNo": page,
+                })
+                response.raise_for_status()
+                body = response.json()["response"]["body"]
+                # 자료가 없으면 items가 "" (API 응답 형식)
+                page_items = body.get("items")
+                page_items = (page_items.get("item") or []) if isinstance(page_items, dict) else []
+                if isinstance(page_items, dict): # 1건이면 목록이 아닌 객체
+                    page_items = [page_items]
+                items.extend(page_items)
+                if not page_items or len(items) >= int(body.get("totalCount") or 0):
+                    break
+                page += 1
+
+        def number(value):
+            return float(value) if value not in (None, "") else np.nan
+
+        return [{
+            "date": date.fromisoformat(item["tm"]),
+            "temp_mean": number(item.get("avgTa")),
+            "precipitation": number(item.get("sumRn")) if item.get("sumRn") not in (None, "") else 0.0,
+            "humidity": number(item.get("avgRhm")),
+        } for item in items]
+
+
+def create_weather_source(kind: Optional[str] = None):
+    """설정에 맞는 날씨 소스 생성 (fixture, kma)"""
+    kind = kind or settings.WEATHER_SOURCE
+    if kind == "fixture":
+        return FixtureWeatherSource()
+    if kind == "kma":
+        return KmaWeatherSource()
+    raise ValueError(f"지원하지 않는 날씨 소스입니다: {kind}")
+
+
+# 피처 계산
+def _forward_fill(values: np.ndarray) -> np.ndarray:
+    """NaN을 직전 값으로 채움"""
+    mask = np.isnan(values)
+    if not mask.any():
+        return values
+    index = np.where(~mask, np.arange(len(values)), 0)
+    np.maximum.accumulate(index, out=index)
+    return values[index] # 맨 앞의 NaN은 그대로 남음
+
+
+def _shift(values: np.ndarray, lag: int) -> np.ndarray:
+    out = np.full_like(values, np.nan)
+    if lag < len(values):
+        out[lag:] = values[:len(values) - lag]
+    return out
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """누적합 기반 이동평균 (창 안에 빈 값이 있으면 NaN)"""
+    out = np.full_like(values, np.nan)
+    if len(values) >= window:
+        valid = ~np.isnan(values)
+        csum = np.cumsum(np.insert(np.where(valid, values, 0.0), 0, 0.0))
+        count = np.cumsum(np.insert(valid, 0, False).astype(np.int64))
+        sums = csum[window:] - csum[:-window]
+        full = (count[window:] - count[:-window]) == window
+        out[window - 1:] = np.where(full, sums / window, np.nan)
+    return out
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_mean(values, window) * window
+
+
+def _rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    mean = _rolling_mean(values, window)
+    mean_sq = _rolling_mean(values * values, window)
+    return np.sqrt(np.maximum(mean_sq - mean * mean, 0.0))
+
+
+def compute_features(raw: np.ndarray, days: np.ndarray) -> np.ndarray:
+    """원천 데이터 [len(RAW_COLUMNS), n] -> 피처 [len(FEATURE_COLUMNS), n]"""
+    price = _forward_fill(raw[0].astype(np.float64))
+    temp = _forward_fill(raw[1].astype(np.float64))
+    precip = np.nan_to_num(raw[2].astype(np.float64))
+    humidity = _forward_fill(raw[3].astype(np.float64))
+
+    dates = np.array(days, dtype="datetime64[D]")
+    day_of_year = (dates - dates.astype("datetime64[Y]")).astype(np.int64) + 1
+    day_of_week = (days.astype(np.int64) + 3) % 7 # 1970-01-01은 목요일 (월=0)
+
+    lag_7 = _shift(price, 7)
+    columns = {
+        "price": price,
+        "price_lag_1": _shift(price, 1),
+        "price_lag_7": lag_7,
+        "price_lag_14": _shift(price, 14),
+        "price_lag_28": _shift(price, 28),
+        "price_ma_7": _rolling_mean(price, 7),
+        "price_ma_28": _rolling_mean(price, 28),
+        "price_std_28": _rolling_std(price, 28),
+        "price_change_7": np.divide(price - lag_7, lag_7, out=np.full_like(price, np.nan), where=lag_7 > 0),
+        "temp_mean_7": _rolling_mean(temp, 7),
+        "temp_mean_28": _rolling_mean(temp, 28),
+        "precip_sum_7": _rolling_sum(precip, 7),
+        "precip_sum_28": _rolling_sum(precip, 28),
+        "humidity_mean_7": _rolling_mean(humidity, 7),
+        "doy_sin": np.sin(2 * np.pi * day_of_year / 365.25),
+        "doy_cos": np.cos(2 * np.pi * day_of_year / 365.25),
+        "dow_sin": np.sin(2 * np.pi * day_of_week / 7),
+        "dow_cos": np.cos(2 * np.pi * day_of_week / 7),
+    }
+    return np.vstack([columns[name] for name in FEATURE_COLUMNS]).astype(np.float32)
+
+
+class ItemFeatures:
+    """품목 1개의 일별 원천 데이터 + 피처 (컬럼 단위 배열, 날짜는 연속)"""
+
+    def __init__(self, item_code: str, region: str):
+        self.item_code = item_code
+        self.region = region
+        self.start_day: Optional[int] = None
+        self.raw = np.empty((len(RAW_COLUMNS), 0), dtype=np.float32)
+        self.features = np.empty((len(FEATURE_COLUMNS), 0), dtype=np.float32)
+        self.dirty_from: Optional[int] = None # 다시 계산해야 하는 첫 인덱스
+
+    @property
+    def n_days(self) -> int:
+        return self.raw.shape[1]
+
+    def _ensure_range(self, first_day: int, last_day: int):
+        """날짜 범위 확장 (새 칸은 NaN)"""
+        if self.start_day is None:
+            self.start_day = first_day
+            self.raw = np.full((len(RAW_COLUMNS), last_day - first_day + 1), np.nan, dtype=np.float32)
+            self.dirty_from = 0
+            return
+
+        if first_day < self.start_day:
+            pad = self.start_day - first_day
+            self.raw = np.hstack([np.full((len(RAW_COLUMNS), pad), np.nan, dtype=np.float32), self.raw])
+            self.start_day = first_day
+            self.dirty_from = 0 # 앞쪽이 바뀌면 전체 재계산
+
+        end_day = self.start_day + self.n_days - 1
+        if last_day > end_day:
+            self.raw = np.hstack([self.raw, np.full((len(RAW_COLUMNS), last_day - end_day), np.nan, dtype=np.float32)])
+
+    def upsert(self, column: str, rows: Iterable[Tuple[int, float]]):
+        """원천 데이터 반영 (일수, 값)"""
+        rows = list(rows)
+        if not rows:
+            return
+        days = np.fromiter((day for day, _ in rows), dtype=np.int64, count=len(rows))
+        values = np.fromiter((value for _, value in rows), dtype=np.float64, count=len(rows))
+        self._ensure_range(int(days.min()), int(days.max()))
+
+        index = days - self.start_day
+        self.raw[RAW_COLUMNS.index(column), index] = values
+        first = int(index.min())
+        self.dirty_from = first if self.dirty_from is None else min(self.dirty_from, first)
+
+    def materialize(self) -> int:
+        """변경된 구간만 피처 재계산 -> 계산한 일수"""
+        if self.dirty_from is None:
+            return 0
+
+        # 과거 창(MAX_LOOKBACK)을 위해 조금 앞에서부터 계산
+        keep = min(self.dirty_from, self.features.shape[1])
+        begin = max(0, keep - MAX_LOOKBACK * 2)
+        # forward-fill이 전체 계산과 같도록 시작 위치 이전의 마지막 관측값부터 (긴 결측 구간 대비)
+        last_valid = [
+            np.flatnonzero(~np.isnan(self.raw[RAW_COLUMNS.index(column), :begin + 1]))
+            for column in FORWARD_FILLED_COLUMNS
+        ]
+        begin = min([begin, *(int(valid[-1]) for valid in last_valid if len(valid))])
+        days = np.arange(self.start_day + begin, self.start_day + self.n_days)
+        recomputed = compute_features(self.raw[:, begin:], days)
+
+        offset = keep - begin
+        self.features = np.hstack([self.features[:, :keep], recomputed[:, offset:]])
+
+        computed = self.n_days - keep
+        self.dirty_from = None
+        return computed
+
+    def index_of(self, d: date) -> Optional[int]:
+        if self.start_day is None:
+            return None
+        index = to_day(d) - self.start_day
+        return index if 0 <= index < self.features.shape[1] else None
+
+
+class FeatureStore:
+    """가격 예측용 피처 저장소 (품목/날짜 키, 컬럼 단위 .npz 저장)"""
+
+    def __init__(self, directory: Optional[str] = None, weather_source=None):
+        self.directory = directory or settings.FEATURE_STORE_DIR
+        self.weather_source = weather_source or create_weather_source()
+        self._items: Dict[str, ItemFeatures] = {}
+        self._lock = threading.RLock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, item_code: str) -> str:
+        return os.path.join(self.directory, f"{item_code}.npz")
+
+    def register_item(self, item_code: str, region: str) -> ItemFeatures:
+        """품목 등록 (저장된 피처가 있으면 불러옴)"""
+        with self._lock:
+            item = self._items.get(item_code)
+            if item is None:
+                item = self._load(item_code) or ItemFeatures(item_code, region)
+                self._items[item_code] = item
+            return item
+
+    def _get(self, item_code: str) -> ItemFeatures:
+        item = self._items.get(item_code)
+        if item is None:
+            item = self._load(item_code)
+            if item is None:
+                raise KeyError(f"등록되지 않은 품목입니다: {item_code}")
+            self._items[item_code] = item
+        return item
+
+    # 적재 (증분)
+    def ingest_prices(self, item_code: str, rows: Iterable[Tuple[date, float]]):
+        """KAMIS 가격 반영 [(날짜, 가격)]"""
+        with self._lock:
+            self._get(item_code).upsert("price", ((to_day(d), price) for d, price in rows))
+
+    def ingest_weather(self, item_code: str, rows: Iterable[dict]):
+        """날씨 반영 [{"date", "temp_mean", "precipitation", "humidity"}]"""
+        rows = list(rows)
+        with self._lock:
+            item = self._get(item_code)
+            for column in ("temp_mean", "precipitation", "humidity"):
+                item.upsert(column, ((to_day(row["date"]), row[column]) for row in rows))
+
+    def refresh_weather(self, item_code: str, start: date, end: date):
+        """날씨 소스에서 기간 데이터를 받아 반영"""
+        item = self._get(item_code)
+        self.ingest_weather(item_code, self.weather_source.fetch(item.region, start, end))
+
+    def materialize(self, item_code: Optional[str] = None, persist: bool = True) -> Dict[str, int]:
+        """변경된 품목/구간만 피처 계산 후 저장"""
+        result = {}
+        with self._lock:
+            codes = [item_code] if item_code else list(self._items)
+            for code in codes:
+                item = self._get(code)
+                computed = item.materialize()
+                if computed and persist:
+                    self._save(item)
+                result[code] = computed
+        return result
+
+    # 조회
+    def get_online_features(self, item_code: str, d: date) -> Optional[np.ndarray]:
+        """온라인 추론용 단건 조회 (피처 벡터, 없으면 None)"""
+        item = self._get(item_code)
+        index = item.index_of(d)
+        if index is None:
+            return None
+        return item.features[:, index]
+
+    def get_training_data(self,
+                          item_codes: List[str],
+                          start: date,
+                          end: date,
+                          columns: Optional[List[str]] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """학습용 배치 조회 -> (X [n, n_features], 날짜(datetime64[D]) [n], 품목 인덱스 [n])"""
+        rows = [FEATURE_COLUMNS.index(column) for column in columns] if columns else slice(None)
+        blocks, date_blocks, item_blocks = [], [], []
+
+        for position, code in enumerate(item_codes):
+            item = self._get(code)
+            if item.start_day is None:
+                continue
+            begin = max(to_day(start) - item.start_day, 0)
+            stop = min(to_day(end) - item.start_day + 1, item.features.shape[1])
+            if begin >= stop:
+                continue
+            blocks.append(item.features[rows, begin:stop].T)
+            date_blocks.append(np.arange(item.start_day + begin, item.start_day + stop).astype("datetime64[D]"))
+            item_blocks.append(np.full(stop - begin, position, dtype=np.int32))
+
+        n_columns = len(columns) if columns else len(FEATURE_COLUMNS)
+        if not blocks:
+            return (np.empty((0, n_columns), dtype=np.float32),
+                    np.empty(0, dtype="datetime64[D]"),
+                    np.empty(0, dtype=np.int32))
+        return np.vstack(blocks), np.concatenate(date_blocks), np.concatenate(item_blocks)
+
+    # 저장/불러오기
+    def _save(self, item: ItemFeatures):
+        """컬럼별 배열로 저장 (임시 파일 -> 교체)"""
+        arrays = {f"raw_{name}": item.raw[i] for i, name in enumerate(RAW_COLUMNS)}
+        arrays.update({f"f_{name}": item.features[i] for i, name in enumerate(FEATURE_COLUMNS)})
+        tmp_path = self._path(item.item_code) + ".tmp.npz"
+        np.savez(tmp_path, start_day=np.int64(item.start_day), region=np.array(item.region), **arrays)
+        os.replace(tmp_path, self._path(item.item_code))
+
+    def _load(self, item_code: str) -> Optional[ItemFeatures]:
+        path = self._path(item_code)
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as data:
+            item = ItemFeatures(item_code, str(data["region"]))
+            item.start_day = int(data["start_day"])
+            item.raw = np.vstack([data[f"raw_{name}"] for name in RAW_COLUMNS]).astype(np.float32)
+            if all(f"f_{name}" in data for name in FEATURE_COLUMNS):
+                item.features = np.vstack([data[f"f_{name}"] for name in FEATURE_COLUMNS]).astype(np.float32)
+            else:
+                item.dirty_from = 0 # 피처 구성이 바뀌었으면 재계산
+        return item
+
+
+# 프로세스별 저장소 (처음 사용할 때 생성)
+_store: Optional[FeatureStore] = None
+
+
+def get_feature_store() -> FeatureStore:
+    """FeatureStore 인스턴스 반환"""
+    global _store
+    if _store is None:
+        _store = FeatureStore()
+    return _store
@@ -0,0 +1,167 @@
+# app/services/feed_service.py
+import asyncio
+import json
+import re
+import time
+from collections import deque
+from typing import Dict, Iterable, Optional, Set
+
+from app.config import settings
+from app.core.pubsub import create_bus
+
+# 토픽 형식: price:<토큰ID>, orderbook:<토큰ID>
+TOPIC_PATTERN = re.compile(r"^(price|orderbook):[A-Za-z0-9_-]{1,64}$")
+
+
+class SlowConsumerError(Exception):
+    """전송이 제한 시간 안에 끝나지 않은 클라이언트"""
+
+
+class FeedClient:
+    """WebSocket 클라이언트 1개 (토픽별 최신 값만 유지해 전송 빈도 제한)"""
+
+    def __init__(self, websocket,
+                 max_rate_hz: Optional[float] = None,
+                 send_timeout: Optional[float] = None):
+        self.websocket = websocket
+        self.topics: Set[str] = set()
+        self.min_interval = 1.0 / (max_rate_hz or settings.FEED_MAX_RATE_HZ)
+        self.send_timeout = send_timeout or settings.FEED_SEND_TIMEOUT
+        self.sent = 0
+        self.coalesced = 0
+        self._pending: Dict[str, str] = {}
+        self._control = deque()
+        self._wakeup = asyncio.Event()
+        self._closed = False
+
+    def offer(self, topic: str, payload: str):
+        """업데이트 등록 (아직 보내지 않은 같은 토픽 값은 덮어씀)"""
+        if topic in self._pending:
+            self.coalesced += 1
+        self._pending[topic] = payload
+        self._wakeup.set()
+
+    def send_control(self, payload: str):
+        """구독 응답 등 제어 메시지 등록 (덮어쓰지 않음)"""
+        self._control.append(payload)
+        self._wakeup.set()
+
+    def close(self):
+        self._closed = True
+        self._wakeup.set()
+
+    async def run_writer(self):
+        """전송 루프 (최대 전송 빈도 유지, 느린 클라이언트는 SlowConsumerError)"""
+        loop = asyncio.get_running_loop()
+        last_flush = 0.0
+        while not self._closed:
+            await self._wakeup.wait()
+            if self._closed:
+                break
+
+            # 최소 간격 동안 들어온 업데이트는 합쳐서 전송
+            delay = last_flush + self.min_interval - loop.time()
+            if delay > 0 and self._pending and not self._control:
+                await asyncio.sleep(delay)
+
+            self._wakeup.clear()
+            control, self._control = self._control, deque()
+            pending, self._pending = self._pending, {}
+            if pending:
+                last_flush = loop.time()
+
+            for payload in (*control, *pending.values()):
+                try:
+                    await asyncio.wait_for(self.websocket.send_text(payload), self.send_timeout)
+                except asyncio.TimeoutError:
+                    raise SlowConsumerError()
+                self.sent += 1
+
+
+class FeedHub:
+    """토픽 구독 관리 및 팬아웃 (워커마다 1개)"""
+
+    def __init__(self, bus=None):
+        self.bus = bus or create_bus()
+        self.published = 0
+        self._subscribers: Dict[str, Set[FeedClient]] = {}
+        self._started = False
+
+    async def start(self):
+        if not self._started:
+            await self.bus.start(self._dispatch)
+            self._started = True
+
+    async def stop(self):
+        if self._started:
+            await self.bus.stop()
+            self._started = False
+
+    def _dispatch(self, topic: str, payload: bytes):
+        """버스 메시지를 구독자에게 전달 (직렬화된 payload 1개를 모두가 공유)"""
+        subscribers = self._subscribers.get(topic)
+        if not subscribers:
+            return
+        text = payload.decode("utf-8") if isinstance(payload, bytes) else payload
+        for client in subscribers:
+            client.offer(topic, text)
+
+    def subscribe(self, client: FeedClient, topics: Iterable[str]) -> Set[str]:
+        """토픽 구독 (형식 오류, 개수 초과 토픽은 제외)"""
+        accepted = set()
+        for topic in topics:
+            if not TOPIC_PATTERN.match(topic):
+                continue
+            if topic not in client.topics and len(client.topics) >= settings.FEED_MAX_TOPICS_PER_CLIENT:
+                break
+            client.topics.add(topic)
+            self._subscribers.setdefault(topic, set()).add(client)
+            accepted.add(topic)
+        return accepted
+
+    def unsubscribe(self, client: FeedClient, topics: Iterable[str]):
+        """토픽 구독 해제"""
+        for topic in topics:
+            client.topics.discard(topic)
+            subscribers = self._subscribers.get(topic)
+            if subscribers is not None:
+                subscribers.discard(client)
+                if not subscribers:
+                    del self._subscribers[topic]
+
+    def remove(self, client: FeedClient):
+        """연결 종료된 클라이언트 정리"""
+        self.unsubscribe(client, list(client.topics))
+        client.close()
+
+    async def publish(self, topic: str, data: dict):
+        """업데이트 발행 (직렬화는 발행 시 1번만)"""
+        if not TOPIC_PATTERN.match(topic):
+            raise ValueError(f"올바르지 않은 토픽입니다: {topic}")
+        payload = json.dumps(
+            {"topic": topic, "data": data, "ts": time.time()},
+            ensure_ascii=False,
+            separators=(",", ":")
+        )
+        self.published += 1
+        await self.bus.publish(topic, payload.encode("utf-8"))
+
+    def stats(self) -> dict:
+        """현재 구독 현황"""
+        return {
+            "topics": len(self._subscribers),
+            "subscriptions": sum(len(clients) for clients in self._subscribers.values()),
+            "published": self.published,
+        }
+
+
+# 워커별 허브 (처음 사용할 때 생성)
+_hub: Optional[FeedHub] = None
+
+
+def get_feed_hub() -> FeedHub:
+    """현재 워커의 FeedHub 반환"""
+    global _hub
+    if _hub is None:
+        _hub = FeedHub()
+    return _hub
@@ -0,0 +1,639 @@
+# app/services/inventory_service.py
+import asyncio
+import heapq
+import random
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Product, Order, OrderItem, InventoryReservation, User
+from app.services.risk_service import check_order_risk, record_order
+
+
+class StockNotLoaded(Exception):
+    """재고 카운터가 아직 적재되지 않음 (DB 재고로 초기화 필요)"""
+
+
+def _new_hold(product_id: int, user_id: int, quantity: int, ttl: int) -> dict:
+    return {
+        "reservation_id": uuid.uuid4().hex,
+        "product_id": product_id,
+        "user_id": user_id,
+        "quantity": quantity,
+        "status": "held",
+        "expires_at": time.time() + ttl,
+    }
+
+
+class InMemoryInventoryBackend:
+    """샤딩된 재고 카운터 (프로세스 메모리, 테스트/단일 워커용)"""
+
+    decrements_db_stock = False
+
+    def __init__(self, shards: Optional[int] = None):
+        self.n_shards = shards or settings.INVENTORY_SHARDS
+        # 상품별 샤드 재고와 샤드별 락 (구매자가 서로 다른 샤드에서 차감)
+        self._stocks: Dict[int, List[int]] = {}
+        self._locks: Dict[int, List[threading.Lock]] = {}
+        self._holds: Dict[str, dict] = {}
+        self._expiry: List[Tuple[float, str]] = []
+        self._holds_lock = threading.Lock()
+
+    def load(self, db: Session, product_id: int, stock: int):
+        """재고 카운터 초기화 (진행 중인 선점 수량 제외)"""
+        with self._holds_lock:
+            held = sum(h["quantity"] for h in self._holds.values() if h["product_id"] == product_id)
+        remaining = max(0, stock - held)
+        base, extra = divmod(remaining, self.n_shards)
+        self._locks.setdefault(product_id, [threading.Lock() for _ in range(self.n_shards)])
+        self._stocks[product_id] = [base + (1 if i < extra else 0) for i in range(self.n_shards)]
+
+    def available(self, db: Session, product_id: int) -> Optional[int]:
+        shards = self._stocks.get(product_id)
+        return sum(shards) if shards is not None else None
+
+    def _take(self, product_id: int, quantity: int) -> bool:
+        shards = self._stocks.get(product_id)
+        if shards is None:
+            raise StockNotLoaded(product_id)
+        locks = self._locks[product_id]
+        # 임의의 샤드부터 시도 -> 동시 구매자가 같은 락에 몰리지 않음
+        start = random.randrange(self.n_shards)
+        for step in range(self.n_shards):
+            index = (start + step) % self.n_shards
+            with locks[index]:
+                if shards[index] >= quantity:
+                    shards[index] -= quantity
+                    return True
+        # 한 샤드로 부족하면 전체 락을 순서대로 잡고 여러 샤드에서 모아서 차감
+        for lock in locks:
+            lock.acquire()
+        try:
+            if sum(shards) < quantity:
+                return False
+            for index in range(self.n_shards):
+                taken = min(shards[index], quantity)
+                shards[index] -= taken
+                quantity -= taken
+                if quantity == 0:
+                    break
+            return True
+        finally:
+            for lock in locks:
+                lock.release()
+
+    def restock(self, db: Session, product_id: int, quantity: int):
+        shards = self._stocks.get(product_id)
+        if shards is None:
+            return
+        index = random.randrange(self.n_shards)
+        with self._locks[product_id][index]:
+            shards[index] += quantity
+
+    def sell(self, db: Session, product_id: int, quantity: int) -> bool:
+        return self._take(product_id, quantity)
+
+    def reserve(self, db: Session, product_id: int, user_id: int, quantity: int, ttl: int) -> Optional[dict]:
+        if not self._take(product_id, quantity):
+            return None
+        hold = _new_hold(product_id, user_id, quantity, ttl)
+        with self._holds_lock:
+            self._holds[hold["reservation_id"]] = hold
+            heapq.heappush(self._expiry, (hold["expires_at"], hold["reservation_id"]))
+        return dict(hold)
+
+    def _finish(self, reservation_id: str, user_id: Optional[int], new_status: str) -> Optional[dict]:
+        now = time.time()
+        with self._holds_lock:
+            hold = self._holds.get(reservation_id)
+            if hold is None or (user_id is not None and hold["user_id"] != user_id):
+                return None
+            if new_status == "confirmed" and hold["expires_at"] <= now:
+                return None
+            del self._holds[reservation_id]
+        if new_status != "confirmed":
+            self.restock(None, hold["product_id"], hold["quantity"])
+        return {**hold, "status": new_status}
+
+    def confirm(self, db: Session, reservation_id: str, user_id: int) -> Optional[dict]:
+        return self._finish(reservation_id, user_id, "confirmed")
+
+    def release(self, db: Session, reservation_id: str, user_id: Optional[int] = None) -> Optional[dict]:
+        return self._finish(reservation_id, user_id, "released")
+
+    def expire(self, db: Session, now: float, limit: int) -> int:
+        expired_ids = []
+        with self._holds_lock:
+            while self._expiry and self._expiry[0][0] <= now and len(expired_ids) < limit:
+                _, reservation_id = heapq.heappop(self._expiry)
+                if reservation_id in self._holds:
+                    expired_ids.append(reservation_id)
+        return sum(1 for reservation_id in expired_ids if self._finish(reservation_id, None, "expired"))
+
+
+# 선점: 재고 확인 + 차감 + 선점 기록 (KEYS: 재고, 선점 해시, 만료 zset, 선점 ID -> 상품 인덱스)
+_RESERVE_SCRIPT = """
+local stock = redis.call('GET', KEYS[1])
+if not stock then return -1 end
+local quantity = tonumber(ARGV[3])
+if tonumber(stock) < quantity then return -2 end
+local left = redis.call('DECRBY', KEYS[1], quantity)
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[2] .. ':' .. ARGV[3] .. ':' .. ARGV[4])
+redis.call('ZADD', KEYS[3], ARGV[4], ARGV[1])
+redis.call('HSET', KEYS[4], ARGV[1], ARGV[5])
+return left
+"""
+
+# 장바구니 주문: 선점 없이 바로 차감
+_SELL_SCRIPT = """
+local stock = redis.call('GET', KEYS[1])
+if not stock then return -1 end
+if tonumber(stock) < tonumber(ARGV[1]) then return -2 end
+return redis.call('DECRBY', KEYS[1], ARGV[1])
+"""
+
+# 선점 종료 (mode: confirm = 판매 확정, release/expire = 재고 반환)
+_FINISH_SCRIPT = """
+local hold = redis.call('HGET', KEYS[2], ARGV[1])
+if not hold then return false end
+local user, quantity, expires = string.match(hold, '^(%d+):(%d+):([%d%.]+)$')
+if ARGV[2] ~= '' and ARGV[2] ~= user then return false end
+local now = tonumber(ARGV[4])
+if ARGV[3] == 'confirm' then
+    if tonumber(expires) <= now then return false end
+else
+    if ARGV[3] == 'expire' and tonumber(expires) > now then return false end
+    redis.call('INCRBY', KEYS[1], quantity)
+end
+redis.call('HDEL', KEYS[2], ARGV[1])
+redis.call('ZREM', KEYS[3], ARGV[1])
+return hold
+"""
+
+# 재고 적재: 진행 중인 선점 수량을 빼고 설정
+_LOAD_SCRIPT = """
+local held = 0
+for _, hold in ipairs(redis.call('HVALS', KEYS[2])) do
+    local _, quantity = string.match(hold, '^(%d+):(%d+):')
+    held = held + tonumber(quantity)
+end
+local remaining = tonumber(ARGV[1]) - held
+if remaining < 0 then remaining = 0 end
+redis.call('SET', KEYS[1], remaining)
+return remaining
+"""
+
+
+class RedisInventoryBackend:
+    """Redis Lua 스크립트 기반 재고 선점 (상품 1개 = 카운터 키 1개)"""
+
+    decrements_db_stock = False
+
+    def __init__(self, url: Optional[str] = None, prefix: str = "inv"):
+        import redis
+
+        self.prefix = prefix
+        self._redis = redis.Redis.from_url(url or settings.REDIS_URL)
+        self._reserve = self._redis.register_script(_RESERVE_SCRIPT)
+        self._finish_hold = self._redis.register_script(_FINISH_SCRIPT)
+        self._load = self._redis.register_script(_LOAD_SCRIPT)
+        self._sell = self._redis.register_script(_SELL_SCRIPT)
+
+    def _keys(self, product_id: int) -> List[str]:
+        # 해시 태그로 상품별 키를 같은 슬롯에 배치
+        tag = f"{self.prefix}:{{{product_id}}}"
+        return [f"{tag}:stock", f"{tag}:holds", f"{tag}:expiry"]
+
+    def load(self, db: Session, product_id: int, stock: int):
+        self._load(keys=self._keys(product_id), args=[stock])
+        self._redis.sadd(f"{self.prefix}:products", product_id)
+
+    def available(self, db: Session, product_id: int) -> Optional[int]:
+        value = self._redis.get(self._keys(product_id)[0])
+        return int(value) if value is not None else None
+
+    def restock(self, db: Session, product_id: int, quantity: int):
+        self._redis.incrby(self._keys(product_id)[0], quantity)
+
+    def sell(self, db: Session, product_id: int, quantity: int) -> bool:
+        result = self._sell(keys=self._keys(product_id)[:1], args=[quantity])
+        if result == -1:
+            raise StockNotLoaded(product_id)
+        return result != -2
+
+    def reserve(self, db: Session, product_id: int, user_id: int, quantity: int, ttl: int) -> Optional[dict]:
+        hold = _new_hold(product_id, user_id, quantity, ttl)
+        # 선점 인덱스도 같은 스크립트에서 기록 (중간에 죽어도 만료 정리가 찾을 수 있도록)
+        result = self._reserve(
+            keys=[*self._keys(product_id), f"{self.prefix}:reservations"],
+            args=[hold["reservation_id"], user_id, quantity, f"{hold['expires_at']:.3f}", product_id]
+        )
+        if result == -1:
+            raise StockNotLoaded(product_id)
+        if result == -2:
+            return None
+        return hold
+
+    def _finish(self, reservation_id: str, user_id: Optional[int], mode: str, now: float,
+                product_id: Optional[int] = None) -> Optional[dict]:
+        if product_id is None:
+            product_id = self._redis.hget(f"{self.prefix}:reservations", reservation_id)
+            if product_id is None:
+                return None
+        product_id = int(product_id)
+        raw = self._finish_hold(
+            keys=self._keys(product_id),
+            args=[reservation_id, "" if user_id is None else user_id, mode, now]
+        )
+        if not raw:
+            return None
+        self._redis.hdel(f"{self.prefix}:reservations", reservation_id)
+        hold_user, quantity, expires_at = raw.decode("utf-8").split(":")
+        return {
+            "reservation_id": reservation_id,
+            "product_id": product_id,
+            "user_id": int(hold_user),
+            "quantity": int(quantity),
+            "status": {"confirm": "confirmed", "release": "released", "expire": "expired"}[mode],
+            "expires_at": float(expires_at),
+        }
+
+    def confirm(self, db: Session, reservation_id: str, user_id: int) -> Optional[dict]:
+        return self._finish(reservation_id, user_id, "confirm", time.time())
+
+    def release(self, db: Session, reservation_id: str, user_id: Optional[int] = None) -> Optional[dict]:
+        return self._finish(reservation_id, user_id, "release", time.time())
+
+    def expire(self, db: Session, now: float, limit: int) -> int:
+        expired = 0
+        for raw_product_id in self._redis.smembers(f"{self.prefix}:products"):
+            expiry_key = self._keys(int(raw_product_id))[2]
+            for raw_id in self._redis.zrangebyscore(expiry_key, "-inf", now, start=0, num=limit - expired):
+                if self._finish(raw_id.decode("utf-8"), None, "expire", now, int(raw_product_id)):
+                    expired += 1
+            if expired >= limit:
+                break
+        return expired
+
+
+class DatabaseInventoryBackend:
+    """DB 조건부 UPDATE ... RETURNING 기반 재고 선점 (행 잠금은 문장 1개 동안만)
+
+    변경은 flush까지만 (커밋/롤백은 세션을 가진 InventoryService/InventoryReconciler가)
+    """
+
+    decrements_db_stock = True
+
+    def load(self, db: Session, product_id: int, stock: int):
+        # products.stock이 곧 카운터
+        pass
+
+    def available(self, db: Session, product_id: int) -> Optional[int]:
+        return db.execute(select(Product.stock).where(Product.product_id == product_id)).scalar()
+
+    def restock(self, db: Session, product_id: int, quantity: int):
+        db.execute(
+            update(Product)
+            .where(Product.product_id == product_id)
+            .values(stock=Product.stock + quantity)
+            .execution_options(synchronize_session=False)
+        )
+
+    def reserve(self, db: Session, product_id: int, user_id: int, quantity: int, ttl: int) -> Optional[dict]:
+        # SELECT ... FOR UPDATE 없이 재고 확인과 차감을 한 문장으로
+        left = db.execute(
+            update(Product)
+            .where(Product.product_id == product_id, Product.is_active == True, Product.stock >= quantity)
+            .values(stock=Product.stock - quantity)
+            .returning(Product.stock)
+            .execution_options(synchronize_session=False)
+        ).scalar()
+        if left is None:
+            # 조건에 맞는 행이 없어 바뀐 것이 없음
+            return None
+        hold = _new_hold(product_id, user_id, quantity, ttl)
+        db.add(InventoryReservation(
+            reservation_id=hold["reservation_id"],
+            product_id=product_id,
+            user_id=user_id,
+            quantity=quantity,
+            status="held",
+            expires_at=datetime.fromtimestamp(hold["expires_at"], timezone.utc),
+        ))
+        db.flush()
+        return hold
+
+    def _finish(self, db: Session, reservation_id: str, user_id: Optional[int], new_status: str) -> Optional[dict]:
+        conditions = [InventoryReservation.reservation_id == reservation_id, InventoryReservation.status == "held"]
+        if user_id is not None:
+            conditions.append(InventoryReservation.user_id == user_id)
+        if new_status == "confirmed":
+            conditions.append(InventoryReservation.expires_at > datetime.now(timezone.utc))
+        row = db.execute(
+            update(InventoryReservation)
+            .where(*conditions)
+            .values(status=new_status)
+            .returning(InventoryReservation.product_id, InventoryReservation.user_id,
+                       InventoryReservation.quantity, InventoryReservation.expires_at)
+            .execution_options(synchronize_session=False)
+        ).first()
+        if row is None:
+            return None
+        # confirm은 주문 생성과 같은 트랜잭션에서 커밋
+        if new_status != "confirmed":
+            db.execute(
+                update(Product)
+                .where(Product.product_id == row.product_id)
+                .values(stock=Product.stock + row.quantity)
+                .execution_options(synchronize_session=False)
+            )
+        expires_at = row.expires_at
+        if expires_at.tzinfo is None:
+            # SQLite는 시간대 없이 저장 (UTC로 기록했음)
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return {
+            "reservation_id": reservation_id,
+            "product_id": row.product_id,
+            "user_id": row.user_id,
+            "quantity": row.quantity,
+            "status": new_status,
+            "expires_at": expires_at.timestamp(),
+        }
+
+    def confirm(self, db: Session, reservation_id: str, user_id: int) -> Optional[dict]:
+        return self._finish(db, reservation_id, user_id, "confirmed")
+
+    def release(self, db: Session, reservation_id: str, user_id: Optional[int] = None) -> Optional[dict]:
+        return self._finish(db, reservation_id, user_id, "released")
+
+    def expire(self, db: Session, now: float, limit: int) -> int:
+        expired_ids = select(InventoryReservation.reservation_id).where(
+            InventoryReservation.status == "held",
+            InventoryReservation.expires_at <= datetime.fromtimestamp(now, timezone.utc)
+        ).limit(limit).scalar_subquery()
+        rows = db.execute(
+            update(InventoryReservation)
+            .where(InventoryReservation.reservation_id.in_(expired_ids), InventoryReservation.status == "held")
+            .values(status="expired")
+            .returning(InventoryReservation.product_id, InventoryReservation.quantity)
+            .execution_options(synchronize_session=False)
+        ).all()
+        # 상품별로 합쳐서 재고 반환 (상품당 UPDATE 1번)
+        returned: Dict[int, int] = defaultdict(int)
+        for row in rows:
+            returned[row.product_id] += row.quantity
+        for product_id in sorted(returned):
+            db.execute(
+                update(Product)
+                .where(Product.product_id == product_id)
+                .values(stock=Product.stock + returned[product_id])
+                .execution_options(synchronize_session=False)
+            )
+        return len(rows)
+
+
+def _reservation_response(hold: dict) -> dict:
+    return {
+        **hold,
+        "expires_at": datetime.fromtimestamp(hold["expires_at"], timezone.utc).isoformat(),
+    }
+
+
+class InventoryService:
+    """한정 수량 상품 재고 선점 -> 구매 확정/취소"""
+
+    def __init__(self, db: Session, backend=None):
+        self.db = db
+        self.backend = backend or get_inventory_backend()
+
+    def load_stock(self, product_id: int) -> int:
+        """DB 재고로 카운터 적재 (판매 시작 전 또는 재동기화)"""
+        stock = self.db.execute(select(Product.stock).where(Product.product_id == product_id)).scalar()
+        if stock is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="상품을 찾을 수 없습니다"
+            )
+        self.backend.load(self.db, product_id, stock)
+        return self.backend.available(self.db, product_id)
+
+    def available(self, product_id: int) -> int:
+        """선점 가능 수량"""
+        value = self.backend.available(self.db, product_id)
+        if value is None:
+            return self.load_stock(product_id)
+        return value
+
+    def reserve(self, user_id: int, product_id: int, quantity: int) -> dict:
+        """재고 선점 (INVENTORY_HOLD_SECONDS 안에 확정하지 않으면 자동 반환)"""
+        if quantity > settings.INVENTORY_MAX_PER_RESERVATION:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"1회 최대 {settings.INVENTORY_MAX_PER_RESERVATION}개까지 구매할 수 있습니다"
+            )
+        ttl = settings.INVENTORY_HOLD_SECONDS
+        try:
+            try:
+                hold = self.backend.reserve(self.db, product_id, user_id, quantity, ttl)
+            except StockNotLoaded:
+                self.load_stock(product_id)
+                hold = self.backend.reserve(self.db, product_id, user_id, quantity, ttl)
+            if hold is not None:
+                self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        if hold is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="재고가 부족합니다"
+            )
+        return _reservation_response(hold)
+
+    def sell(self, product_id: int, quantity: int) -> bool:
+        """선점 없이 바로 판매 (장바구니 주문, 커밋은 호출한 쪽 트랜잭션에서)
+
+        재고 카운터(redis/memory)와 DB 재고를 함께 차감, 부족하면 아무것도 차감하지 않고 False
+        """
+        if not self.backend.decrements_db_stock:
+            try:
+                taken = self.backend.sell(self.db, product_id, quantity)
+            except StockNotLoaded:
+                self.load_stock(product_id)
+                taken = self.backend.sell(self.db, product_id, quantity)
+            if not taken:
+                return False
+        if self._decrement_db_stock(product_id, quantity):
+            return True
+        if not self.backend.decrements_db_stock:
+            self.backend.restock(self.db, product_id, quantity)
+        return False
+
+    def cancel_sales(self, items: Dict[int, int]):
+        """주문 롤백 후 sell()로 차감한 카운터 재고 반환 (DB 재고는 롤백으로 복구됨)"""
+        if self.backend.decrements_db_stock:
+            return
+        for product_id, quantity in items.items():
+            self.backend.restock(self.db, product_id, quantity)
+
+    def _decrement_db_stock(self, product_id: int, quantity: int) -> bool:
+        """재고가 충분할 때만 DB 재고 차감 (동시 주문 대비 조건부 UPDATE)"""
+        updated = self.db.execute(
+            update(Product)
+            .where(Product.product_id == product_id, Product.stock >= quantity)
+            .values(stock=Product.stock - quantity)
+            .execution_options(synchronize_session=False)
+        )
+        return updated.rowcount == 1
+
+    def release(self, user_id: int, reservation_id: str) -> dict:
+        """선점 취소 (재고 반환)"""
+        try:
+            hold = self.backend.release(self.db, reservation_id, user_id)
+            if hold is not None:
+                self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        if hold is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="진행 중인 선점을 찾을 수 없습니다"
+            )
+        return _reservation_response(hold)
+
+    def confirm(self, user: User, reservation_id: str, client_ip: Optional[str] = None) -> dict:
+        """선점을 주문으로 확정 (이상 거래 탐지 후 기록)"""
+        user_id = user.user_id
+        hold = self.backend.confirm(self.db, reservation_id, user_id)
+        if hold is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="선점이 만료되었거나 존재하지 않습니다"
+            )
+
+        product_id, quantity = hold["product_id"], hold["quantity"]
+        try:
+            price = self.db.execute(select(Product.price).where(Product.product_id == product_id)).scalar()
+            # 차단되면 아래 except에서 선점 수량 복구 (DB 저장소는 롤백으로 선점 유지)
+            check_order_risk(user, client_ip, price * quantity)
+            # Redis/메모리 카운터는 판매 확정 시점에 DB 재고 반영 (카운터와 어긋나도 음수가 되지 않도록)
+            if not self.backend.decrements_db_stock and not self._decrement_db_stock(product_id, quantity):
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="재고가 부족합니다"
+                )
+            order = Order(user_id=user_id, status="pending", total_amount=price * quantity)
+            order.items.append(OrderItem(product_id=product_id, quantity=quantity, unit_price=price))
+            self.db.add(order)
+            self.db.flush()
+            if self.backend.decrements_db_stock:
+                self.db.execute(
+                    update(InventoryReservation)
+                    .where(InventoryReservation.reservation_id == reservation_id)
+                    .values(order_id=order.order_id)
+                    .execution_options(synchronize_session=False)
+                )
+            self.db.commit()
+            self.db.refresh(order)
+        except Exception:
+            self.db.rollback()
+            # 주문 생성 실패시 선점 수량을 다시 판매 가능 상태로
+            if not self.backend.decrements_db_stock:
+                self.backend.restock(self.db, product_id, quantity)
+            raise
+        record_order(user, client_ip, order.total_amount)
+        return order.to_dict()
+
+
+class InventoryReconciler:
+    """만료된 선점을 주기적으로 반환"""
+
+    def __init__(self, backend=None, interval: Optional[float] = None, batch_size: int = 500):
+        self.backend = backend or get_inventory_backend()
+        self.interval = interval or settings.INVENTORY_RECONCILE_INTERVAL
+        self.batch_size = batch_size
+        self.released = 0
+        self.last_run: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def run_once(self) -> int:
+        """만료된 선점 반환 -> 반환한 개수"""
+        released = 0
+        db = SessionLocal()
+        try:
+            while True:
+                count = self.backend.expire(db, time.time(), self.batch_size)
+                db.commit()
+                released += count
+                if count < self.batch_size:
+                    break
+        finally:
+            db.close()
+        self.released += released
+        self.last_run = time.time()
+        return released
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.to_thread(self.run_once)
+            except Exception as e:
+                print(f"❌ Inventory reconciler error: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def status(self) -> dict:
+        return {
+            "backend": type(self.backend).__name__,
+            "released_total": self.released,
+            "last_run": self.last_run,
+            "interval": self.interval,
+        }
+
+
+# 프로세스별 저장소/정리기 (처음 사용할 때 생성)
+_backend = None
+_reconciler: Optional[InventoryReconciler] = None
+
+
+def get_inventory_backend():
+    """설정(INVENTORY_BACKEND)에 맞는 재고 저장소 반환"""
+    global _backend
+    if _backend is None:
+        if settings.INVENTORY_BACKEND == "redis":
+            _backend = RedisInventoryBackend()
+        elif settings.INVENTORY_BACKEND == "memory":
+            _backend = InMemoryInventoryBackend()
+        else:
+            _backend = DatabaseInventoryBackend()
+    return _backend
+
+
+def get_inventory_reconciler() -> InventoryReconciler:
+    """InventoryReconciler 인스턴스 반환"""
+    global _reconciler
+    if _reconciler is None:
+        _reconciler = InventoryReconciler()
+    return _reconciler
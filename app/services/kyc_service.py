@@ -0,0 +1,439 @@
+# app/services/kyc_service.py
+import asyncio
+import hashlib
+import json
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, List, NamedTuple, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import DateTime, Integer, String, column, func, or_, select, update, values
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import User, KycJob
+from app.services.user_cache import get_user_cache
+from app.utils.email import send_template_email
+
+# 최종 결과 (verified/rejected는 users.kyc_status에 반영, failed는 pending 유지)
+VERIFIED = "verified"
+REJECTED = "rejected"
+FAILED = "failed"
+
+
+# 상태별 안내 메일 문구 (상태 표시, 본문)
+KYC_NOTICES = {
+    "pending": ("심사 중", "본인확인 신청이 접수되었습니다. 결과는 메일로 다시 안내해 드립니다."),
+    VERIFIED: ("인증 완료", "본인확인이 완료되어 모든 서비스를 이용하실 수 있습니다."),
+    REJECTED: ("인증 거절", "제출하신 정보로 본인확인을 할 수 없었습니다. 정보를 확인한 뒤 다시 신청해 주세요."),
+}
+
+
+def send_kyc_notice(user: User, kyc_status: str) -> bool:
+    """KYC 상태 안내 메일 발송 예약 (메일 주소를 등록한 사용자만)"""
+    label, message = KYC_NOTICES[kyc_status]
+    context = {"user_name": user.user_name or "고객", "kyc_status": label, "message": message}
+    return send_template_email(user.email, "kyc_notice", context)
+
+
+class KycResult(NamedTuple):
+    status: str # verified, rejected, failed
+    reason: Optional[str] = None
+    provider_ref: Optional[str] = None
+
+
+class TransientKycError(Exception):
+    """일시적인 검증 실패 (재시도 대상)"""
+
+
+class ClaimedJob(NamedTuple):
+    job_id: int
+    user_id: int
+    payload: dict
+    attempts: int
+
+
+class FakeKycVerifier:
+    """로컬 가짜 검증기 (개발/테스트용, 외부 호출 없음)"""
+
+    def __init__(self, latency: Optional[float] = None):
+        self.latency = settings.KYC_FAKE_LATENCY if latency is None else latency
+
+    async def verify(self, user_id: int, payload: dict) -> KycResult:
+        await asyncio.sleep(self.latency)
+        provider_ref = "FAKE-" + hashlib.sha256(f"{user_id}:{payload.get('real_name')}".encode("utf-8")).hexdigest()[:12]
+        birth = datetime.strptime(payload["birth_date"], "%Y%m%d").date()
+        today = date.today()
+        age = today.year - birth.year - ((today.month, today.day) < (birth.month, birth.day))
+        if age < 19:
+            return KycResult(REJECTED, "만 19세 미만은 투자 서비스를 이용할 수 없습니다", provider_ref)
+        return KycResult(VERIFIED, None, provider_ref)
+
+
+class HttpKycVerifier:
+    """외부 KYC 기관 HTTP API 검증기 (KYC_PROVIDER_URL 필요)"""
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
+        import httpx
+
+        base_url = base_url or settings.KYC_PROVIDER_URL
+        if not base_url:
+            raise ValueError("KYC_PROVIDER_URL이 설정되지 않았습니다")
+        # 연결 재사용 (워커 전체가 클라이언트 1개 공유)
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            headers={"Authorization": f"Bearer {api_key or settings.KYC_PROVIDER_API_KEY or ''}"},
+            timeout=settings.KYC_VERIFY_TIMEOUT,
+            limits=httpx.Limits(max_connections=settings.KYC_CONCURRENCY),
+        )
+
+    async def verify(self, user_id: int, payload: dict) -> KycResult:
+        import httpx
+
+        try:
+            response = await self._client.post("/verifications", json={"reference": f"user-{user_id}", **payload})
+        except httpx.TransportError as e:
+            raise TransientKycError(str(e))
+        if response.status_code >= 500 or response.status_code == 429:
+            raise TransientKycError(f"KYC 기관 응답 오류: {response.status_code}")
+        if response.status_code >= 400:
+            return KycResult(FAILED, f"검증 요청 거부: {response.status_code}")
+        body = response.json()
+        result = VERIFIED if body.get("status") == "verified" else REJECTED
+        return KycResult(result, body.get("reason"), body.get("id"))
+
+    async def close(self):
+        await self._client.aclose()
+
+
+def create_kyc_verifier(kind: Optional[str] = None):
+    """설정에 맞는 검증기 생성 (fake, http)"""
+    kind = kind or settings.KYC_VERIFIER
+    if kind == "fake":
+        # 만 19세 이상이면 모두 통과시키므로 운영에서는 시작하지 않음
+        if settings.ENVIRONMENT == "production":
+            raise ValueError("운영 환경에서는 KYC_VERIFIER=fake를 사용할 수 없습니다")
+        return FakeKycVerifier()
+    if kind == "http":
+        return HttpKycVerifier()
+    raise ValueError(f"지원하지 않는 KYC 검증기입니다: {kind}")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class KycWorkerPool:
+    """KYC 작업 처리기 (DB 큐에서 묶어서 가져오고, 결과도 묶어서 반영)"""
+
+    def __init__(self,
+                 verifier=None,
+                 concurrency: Optional[int] = None,
+                 batch_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None,
+                 max_attempts: Optional[int] = None,
+                 session_factory: Callable[[], Session] = SessionLocal):
+        self.verifier = verifier
+        self.concurrency = concurrency or settings.KYC_CONCURRENCY
+        self.batch_size = batch_size or settings.KYC_BATCH_SIZE
+        self.flush_interval = flush_interval or settings.KYC_FLUSH_INTERVAL
+        self.max_attempts = max_attempts or settings.KYC_MAX_ATTEMPTS
+        self.session_factory = session_factory
+
+        self.stats = {"claimed": 0, VERIFIED: 0, REJECTED: 0, FAILED: 0, "retried": 0, "batches": 0}
+        self._results: List[tuple] = []
+        self._inflight: set = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_event: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        if self._tasks:
+            return
+        if self.verifier is None:
+            self.verifier = create_kyc_verifier()
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._flush_event = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._dispatch_loop()),
+            asyncio.create_task(self._flush_loop()),
+        ]
+
+    async def stop(self, timeout: float = 10.0):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        # 진행 중인 검증은 기다렸다가 결과 반영 (못 끝낸 작업은 claim 만료 후 재처리)
+        if self._inflight:
+            await asyncio.wait(list(self._inflight), timeout=timeout)
+        await self.flush()
+        if hasattr(self.verifier, "close"):
+            await self.verifier.close()
+
+    def notify(self):
+        """새 작업 등록 알림 (요청 처리 스레드에서 호출 가능)"""
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    # 작업 가져오기
+    def _claim(self, limit: int) -> List[ClaimedJob]:
+        """처리 가능한 작업을 한 번에 processing으로 변경하고 가져옴"""
+        now = _utcnow()
+        stale = now - timedelta(seconds=settings.KYC_CLAIM_TIMEOUT)
+        claimable = (
+            select(KycJob.job_id)
+            .where(or_(
+                (KycJob.status == "queued") & (KycJob.available_at <= now),
+                # 워커가 죽어서 끝내지 못한 작업
+                (KycJob.status == "processing") & (KycJob.claimed_at < stale),
+            ))
+            .order_by(KycJob.job_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True) # 여러 워커 프로세스가 같은 작업을 가져가지 않도록
+        )
+        db = self.session_factory()
+        try:
+            rows = db.execute(
+                update(KycJob)
+                .where(KycJob.job_id.in_(claimable))
+                .values(status="processing", claimed_at=now, updated_at=now)
+                .returning(KycJob.job_id, KycJob.user_id, KycJob.payload, KycJob.attempts)
+                .execution_options(synchronize_session=False)
+            ).all()
+            db.commit()
+        finally:
+            db.close()
+        return [ClaimedJob(row.job_id, row.user_id, json.loads(row.payload), row.attempts or 0) for row in rows]
+
+    async def _dispatch_loop(self):
+        while True:
+            # 확인 도중 들어온 알림은 유지되도록 먼저 초기화
+            self._wakeup.clear()
+            claimed = 0
+            capacity = self.concurrency - len(self._inflight)
+            if capacity > 0:
+                try:
+                    jobs = await asyncio.to_thread(self._claim, capacity)
+                except Exception as e:
+                    print(f"❌ KYC job claim failed: {e}")
+                    jobs = []
+                claimed = len(jobs)
+                self.stats["claimed"] += claimed
+                for job in jobs:
+                    task = asyncio.create_task(self._process(job))
+                    self._inflight.add(task)
+                    task.add_done_callback(self._inflight.discard)
+            if claimed == 0 or len(self._inflight) >= self.concurrency:
+                # 새 작업 알림, 처리 완료(여유 생김), 또는 주기적으로 다시 확인
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=settings.KYC_POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _process(self, job: ClaimedJob):
+        attempts = job.attempts + 1
+        now = _utcnow()
+        try:
+            result = await asyncio.wait_for(
+                self.verifier.verify(job.user_id, job.payload), timeout=settings.KYC_VERIFY_TIMEOUT
+            )
+            outcome = (job.job_id, job.user_id, result.status, attempts, result.reason, result.provider_ref, now)
+            self.stats[result.status] += 1
+        except Exception as e:
+            reason = (str(e) or type(e).__name__)[:255]
+            if attempts >= self.max_attempts:
+                outcome = (job.job_id, job.user_id, FAILED, attempts, reason, None, now)
+                self.stats[FAILED] += 1
+            else:
+                # 지수 백오프 후 다시 queued
+                retry_at = now + timedelta(seconds=settings.KYC_RETRY_BASE_DELAY * (2 ** (attempts - 1)))
+                outcome = (job.job_id, job.user_id, "queued", attempts, reason, None, retry_at)
+                self.stats["retried"] += 1
+        self._results.append(outcome)
+        if len(self._results) >= self.batch_size:
+            self._flush_event.set()
+        self._wakeup.set()
+
+    # 결과 반영
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_event.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_event.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        if not self._results:
+            return 0
+        results, self._results = self._results, []
+        try:
+            await asyncio.to_thread(self._apply, results)
+        except Exception as e:
+            print(f"❌ KYC status update failed: {e}")
+            self._results = results + self._results
+            return 0
+        self.stats["batches"] += 1
+        return len(results)
+
+    def _apply(self, results: List[tuple]):
+        """작업/사용자 상태를 UPDATE 1번씩으로 반영"""
+        job_rows = [
+            {"job_id": job_id, "status": job_status, "attempts": attempts, "reason": reason,
+             "provider_ref": provider_ref, "available_at": available_at}
+            for job_id, _, job_status, attempts, reason, provider_ref, available_at in results
+        ]
+        user_rows = {
+            user_id: job_status
+            for _, user_id, job_status, _, _, _, _ in results
+            if job_status in (VERIFIED, REJECTED)
+        }
+        db = self.session_factory()
+        try:
+            if db.get_bind().dialect.name == "postgresql":
+                # UPDATE ... FROM (VALUES (...), (...)) AS v(...) WHERE id = v.id
+                job_values = values(
+                    column("job_id", Integer), column("status", String), column("attempts", Integer),
+                    column("reason", String), column("provider_ref", String),
+                    column("available_at", DateTime(timezone=True)),
+                    name="v",
+                ).data([tuple(row.values()) for row in job_rows])
+                db.execute(
+                    update(KycJob)
+                    .where(KycJob.job_id == job_values.c.job_id)
+                    .values(status=job_values.c.status, attempts=job_values.c.attempts,
+                            reason=job_values.c.reason, provider_ref=job_values.c.provider_ref,
+                            available_at=job_values.c.available_at, claimed_at=None, updated_at=func.now())
+                    .execution_options(synchronize_session=False)
+                )
+                if user_rows:
+                    user_values = values(
+                        column("user_id", Integer), column("kyc_status", String), name="u"
+                    ).data(list(user_rows.items()))
+                    db.execute(
+                        update(User)
+                        .where(User.user_id == user_values.c.user_id)
+                        .values(kyc_status=user_values.c.kyc_status, updated_at=func.now())
+                        .execution_options(synchronize_session=False)
+                    )
+            else:
+                # 기본키 기준 bulk UPDATE (executemany)
+                now = _utcnow()
+                db.execute(update(KycJob), [{**row, "claimed_at": None, "updated_at": now} for row in job_rows])
+                if user_rows:
+                    db.execute(update(User), [
+                        {"user_id": user_id, "kyc_status": kyc_status, "updated_at": now}
+                        for user_id, kyc_status in user_rows.items()
+                    ])
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        get_user_cache().invalidate(user_rows)
+        self._notify(user_rows)
+
+    def _notify(self, user_rows: dict):
+        """결과가 확정된 사용자에게 안내 메일 (실패해도 반영된 상태는 그대로)"""
+        if not user_rows or not settings.SMTP_SERVER:
+            return
+        db = self.session_factory()
+        try:
+            users = db.query(User).filter(User.user_id.in_(list(user_rows)), User.email_encrypted.isnot(None)).all()
+            for user in User.decrypt_all(users):
+                send_kyc_notice(user, user_rows[user.user_id])
+        except Exception as e:
+            print(f"❌ KYC notice email failed: {e}")
+        finally:
+            db.close()
+
+    def status(self) -> dict:
+        return {
+            **self.stats,
+            "inflight": len(self._inflight),
+            "pending_results": len(self._results),
+            "concurrency": self.concurrency,
+            "verifier": type(self.verifier).__name__ if self.verifier is not None else None,
+        }
+
+
+class KycService:
+    """KYC 신청/조회"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def submit(self, user: User, real_name: str, birth_date: str, id_document_digest: Optional[str] = None) -> dict:
+        """KYC 신청 (검증은 백그라운드 작업으로)"""
+        if user.kyc_status == VERIFIED:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="이미 KYC 인증이 완료되었습니다"
+            )
+        active_job = self.db.query(KycJob.job_id).filter(
+            KycJob.user_id == user.user_id,
+            KycJob.status.in_(("queued", "processing"))
+        ).first()
+        if active_job:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="이미 진행 중인 KYC 신청이 있습니다"
+            )
+
+        job = KycJob(
+            user_id=user.user_id,
+            status="queued",
+            attempts=0,
+            payload=json.dumps({
+                "real_name": real_name,
+                "birth_date": birth_date,
+                "id_document_digest": id_document_digest,
+            }, ensure_ascii=False),
+            available_at=_utcnow(),
+        )
+        self.db.add(job)
+        user.kyc_status = "pending"
+        self.db.commit()
+        self.db.refresh(job)
+
+        get_user_cache().invalidate([user.user_id])
+        get_kyc_pool().notify()
+        send_kyc_notice(user, "pending")
+        return job.to_dict()
+
+    def get_status(self, user_id: int) -> dict:
+        """KYC 상태 조회 (사용자 정보는 캐시 우선)"""
+        projection = get_user_cache().get(user_id)
+        if projection is None:
+            user = self.db.query(User).filter(User.user_id == user_id).first()
+            if user is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="사용자를 찾을 수 없습니다"
+                )
+            projection = user.to_dict()
+            get_user_cache().put_many([projection])
+
+        job = self.db.query(KycJob).filter(KycJob.user_id == user_id).order_by(KycJob.job_id.desc()).first()
+        return {
+            "user_id": user_id,
+            "kyc_status": projection["kyc_status"],
+            "job": job.to_dict() if job else None,
+        }
+
+
+# 프로세스별 작업 처리기 (처음 사용할 때 생성)
+_pool: Optional[KycWorkerPool] = None
+
+
+def get_kyc_pool() -> KycWorkerPool:
+    """KycWorkerPool 인스턴스 반환"""
+    global _pool
+    if _pool is None:
+        _pool = KycWorkerPool()
+    return _pool
@@ -0,0 +1,421 @@
+# app/services/ledger_service.py
+import asyncio
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import insert
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import LedgerEntry, User
+
+GENESIS_HASH = "0" * 64
+TOKEN_ID_MAX_LENGTH = 64 # LedgerEntry.token_id 컬럼 길이
+
+
+class LedgerError(Exception):
+    """원장 처리 오류 (잔액 부족, 잘못된 요청 등)"""
+
+
+class LedgerIntegrityError(Exception):
+    """해시 체인 불일치 (원장 변조 의심)"""
+
+
+def compute_entry_hash(entry: dict) -> str:
+    """원장 항목 해시 (이전 해시 포함 -> 체인)"""
+    payload = "|".join([
+        str(entry["seq"]),
+        entry["token_id"],
+        "" if entry["from_account"] is None else str(entry["from_account"]),
+        str(entry["to_account"]),
+        str(entry["amount"]),
+        entry["timestamp"],
+        entry["prev_hash"],
+    ])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def verify_chain(entries: List[dict], prev_hash: str, next_seq: int) -> Tuple[str, int]:
+    """항목 목록의 순번/해시 체인 검증 후 (마지막 해시, 다음 순번) 반환"""
+    for entry in entries:
+        if entry["seq"] != next_seq:
+            raise LedgerIntegrityError(f"원장 순번이 맞지 않습니다 (기대값 {next_seq}, 실제 {entry['seq']})")
+        if entry["prev_hash"] != prev_hash or compute_entry_hash(entry) != entry["entry_hash"]:
+            raise LedgerIntegrityError(f"원장 해시가 일치하지 않습니다 (seq={entry['seq']})")
+        prev_hash = entry["entry_hash"]
+        next_seq += 1
+    return prev_hash, next_seq
+
+
+class FileLedgerStore:
+    """WAL 파일 저장소 (배치당 write 1번 + fsync 1번)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.LEDGER_WAL_PATH
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "ab")
+
+    def append(self, entries: List[dict]):
+        data = "".join(json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries)
+        position = self._file.tell()
+        try:
+            self._file.write(data.encode("utf-8"))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except Exception:
+            # 일부만 기록된 배치 제거 (체인이 끊기지 않도록)
+            self._file.truncate(position)
+            raise
+
+    def read_from(self, cursor: int, limit: int = 10000) -> Tuple[List[dict], int]:
+        """cursor(바이트 위치) 이후 항목 읽기 -> (항목, 다음 cursor)"""
+        entries = []
+        with open(self.path, "rb") as f:
+            f.seek(cursor)
+            while len(entries) < limit:
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    break # 아직 기록 중인 마지막 줄은 다음에 읽음
+                entries.append(json.loads(line))
+                cursor += len(line)
+        return entries, cursor
+
+    def close(self):
+        self._file.close()
+
+
+class DatabaseLedgerStore:
+    """DB 저장소 (배치당 다중 행 INSERT + commit 1번)"""
+
+    def append(self, entries: List[dict]):
+        db = SessionLocal()
+        try:
+            db.execute(insert(LedgerEntry), entries)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def read_from(self, cursor: int, limit: int = 10000) -> Tuple[List[dict], int]:
+        """cursor(다음 seq) 이후 항목 읽기 -> (항목, 다음 cursor)"""
+        db = SessionLocal()
+        try:
+            rows = db.query(LedgerEntry).filter(
+                LedgerEntry.seq >= cursor
+            ).order_by(LedgerEntry.seq).limit(limit).all()
+            entries = [row.to_dict() for row in rows]
+        finally:
+            db.close()
+        if entries:
+            cursor = entries[-1]["seq"] + 1
+        return entries, cursor
+
+    def close(self):
+        pass
+
+
+def create_store(kind: Optional[str] = None):
+    """설정에 맞는 원장 저장소 생성 (file, database)"""
+    kind = kind or settings.LEDGER_STORE
+    if kind == "file":
+        return FileLedgerStore()
+    if kind == "database":
+        return DatabaseLedgerStore()
+    raise ValueError(f"지원하지 않는 원장 저장소입니다: {kind}")
+
+
+def user_exists(account: int) -> bool:
+    """원장 계정(user_id)이 사용자로 존재하는지 확인"""
+    db = SessionLocal()
+    try:
+        return db.query(User.user_id).filter(User.user_id == account).first() is not None
+    finally:
+        db.close()
+
+
+class TokenLedger:
+    """토큰 소유권 원장 (메모리 잔액 + 그룹 커밋 WAL)
+
+    잔액은 메모리에 있으므로 한 프로세스에서만 실행해야 합니다.
+    """
+
+    def __init__(self, store=None,
+                 max_batch: Optional[int] = None,
+                 max_wait_ms: Optional[float] = None,
+                 account_exists: Callable[[int], bool] = user_exists):
+        self.store = store or create_store()
+        self.account_exists = account_exists
+        self.max_batch = max_batch or settings.LEDGER_MAX_BATCH
+        self.max_wait = (max_wait_ms if max_wait_ms is not None else settings.LEDGER_MAX_WAIT_MS) / 1000.0
+        self.accounts: Dict[int, Dict[str, int]] = {} # 계정 -> {토큰: 잔액}
+        self.last_hash = GENESIS_HASH
+        self.next_seq = 0
+        self.batches = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._committer: Optional[asyncio.Task] = None
+        self._known_accounts: Set[int] = set() # 존재를 확인한 받는 계정
+
+    def recover(self):
+        """저장소 전체를 재생해 잔액 복구 (해시 체인 검증 포함)"""
+        cursor = 0
+        while True:
+            entries, cursor = self.store.read_from(cursor)
+            if not entries:
+                break
+            self.last_hash, self.next_seq = verify_chain(entries, self.last_hash, self.next_seq)
+            for entry in entries:
+                self._apply(entry)
+
+    async def start(self):
+        """복구 후 커밋 루프 시작"""
+        if self._committer is not None:
+            return
+        await asyncio.to_thread(self.recover)
+        self._queue = asyncio.Queue()
+        self._committer = asyncio.create_task(self._commit_loop())
+
+    async def stop(self, timeout: float = 10.0):
+        """대기 중인 요청을 기록하고 종료 (시간 안에 못 끝낸 요청은 LedgerError)
+
+        기록 중인 배치는 끝날 때까지 기다린 뒤 저장소를 닫음 (중간에 닫으면 WAL 배치가 잘림)
+        """
+        if self._committer is not None:
+            queue, self._queue = self._queue, None # 이후 요청은 바로 거절
+            queue.put_nowait(None)
+            done, _ = await asyncio.wait({self._committer}, timeout=timeout)
+            if not done:
+                error = LedgerError("원장이 종료되어 요청을 처리하지 못했습니다")
+                while not queue.empty():
+                    item = queue.get_nowait()
+                    if item is not None and not item[1].done():
+                        item[1].set_exception(error)
+                queue.put_nowait(None)
+                try:
+                    await self._committer
+                except Exception as e:
+                    print(f"❌ Ledger committer error on stop: {e}")
+            self._committer = None
+        self.store.close()
+
+    # 조회
+    def balance(self, token_id: str, account: int) -> int:
+        """잔액 조회 (메모리, O(1))"""
+        return self.accounts.get(account, {}).get(token_id, 0)
+
+    def holdings(self, account: int) -> Dict[str, int]:
+        """계정의 토큰별 보유량"""
+        return {token_id: amount for token_id, amount in self.accounts.get(account, {}).items() if amount > 0}
+
+    # 기록
+    async def issue(self, token_id: str, to_account: int, amount: int) -> dict:
+        """토큰 발행 (from_account 없음)"""
+        return await self._submit(token_id, None, to_account, amount)
+
+    async def transfer(self, token_id: str, from_account: int, to_account: int, amount: int) -> dict:
+        """토큰 이전"""
+        if from_account == to_account:
+            raise LedgerError("같은 계정으로는 이전할 수 없습니다")
+        return await self._submit(token_id, from_account, to_account, amount)
+
+    async def _submit(self, token_id: str, from_account: Optional[int], to_account: int, amount: int) -> dict:
+        if self._queue is None:
+            raise LedgerError("원장이 시작되지 않았습니다")
+        if amount <= 0:
+            raise LedgerError("수량은 0보다 커야 합니다")
+        if not token_id or len(token_id) > TOKEN_ID_MAX_LENGTH:
+            # 저장소에서 실패하면 같은 배치의 다른 요청까지 실패하므로 미리 거절
+            raise LedgerError("올바르지 않은 토큰 ID입니다")
+        if to_account not in self._known_accounts:
+            # 없는 계정으로 보낸 토큰은 아무도 옮길 수 없으므로 미리 거절
+            if not await asyncio.to_thread(self.account_exists, to_account):
+                raise LedgerError("받는 계정이 존재하지 않습니다")
+            self._known_accounts.add(to_account)
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(((token_id, from_account, to_account, amount), future))
+        return await future
+
+    async def _commit_loop(self):
+        """요청을 모아 한 번에 기록 (기록 중에 들어온 요청은 다음 배치로)"""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            item = await queue.get()
+            if item is None:
+                return # stop()
+            batch, stopping = [item], False
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._commit_batch(batch)
+            if stopping:
+                return
+
+    async def _commit_batch(self, batch: list):
+        """배치 검증 -> 해시 체인 생성 -> 저장(1번) -> 메모리 반영"""
+        overlay: Dict[Tuple[str, int], int] = {}
+        entries, accepted = [], []
+        prev_hash, seq = self.last_hash, self.next_seq
+        timestamp = datetime.now(timezone.utc).isoformat()
+
+        for (token_id, from_account, to_account, amount), future in batch:
+            if future.cancelled():
+                continue
+            if from_account is not None:
+                key = (token_id, from_account)
+                available = overlay.get(key, self.balance(token_id, from_account))
+                if available < amount:
+                    future.set_exception(LedgerError("보유 수량이 부족합니다"))
+                    continue
+                overlay[key] = available - amount
+            to_key = (token_id, to_account)
+            overlay[to_key] = overlay.get(to_key, self.balance(token_id, to_account)) + amount
+
+            entry = {
+                "seq": seq,
+                "token_id": token_id,
+                "from_account": from_account,
+                "to_account": to_account,
+                "amount": amount,
+                "timestamp": timestamp,
+                "prev_hash": prev_hash,
+            }
+            entry["entry_hash"] = compute_entry_hash(entry)
+            prev_hash, seq = entry["entry_hash"], seq + 1
+            entries.append(entry)
+            accepted.append(future)
+
+        if not entries:
+            return
+
+        try:
+            await asyncio.to_thread(self.store.append, entries)
+        except Exception as e:
+            for future in accepted:
+                if not future.done():
+                    future.set_exception(LedgerError(f"원장 기록에 실패했습니다: {e}"))
+            return
+
+        for (token_id, account), amount in overlay.items():
+            self.accounts.setdefault(account, {})[token_id] = amount
+        self.last_hash, self.next_seq = prev_hash, seq
+        self.batches += 1
+        for entry, future in zip(entries, accepted):
+            if not future.done():
+                future.set_result(entry)
+
+    def _apply(self, entry: dict):
+        """항목을 메모리 잔액에 반영 (복구용)"""
+        token_id, amount = entry["token_id"], entry["amount"]
+        if entry["from_account"] is not None:
+            holdings = self.accounts.setdefault(entry["from_account"], {})
+            holdings[token_id] = holdings.get(token_id, 0) - amount
+        holdings = self.accounts.setdefault(entry["to_account"], {})
+        holdings[token_id] = holdings.get(token_id, 0) + amount
+
+    def stats(self) -> dict:
+        return {
+            "entries": self.next_seq,
+            "batches": self.batches,
+            "last_hash": self.last_hash,
+            "accounts": len(self.accounts),
+        }
+
+
+class LedgerVerifier:
+    """해시 체인 증분 재검증 (마지막으로 검증한 위치부터 이어서)"""
+
+    def __init__(self, store, interval: Optional[float] = None):
+        self.store = store
+        self.interval = interval or settings.LEDGER_VERIFY_INTERVAL
+        self.cursor = 0
+        self.verified_seq = 0
+        self.verified_hash = GENESIS_HASH
+        self.error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def verify_once(self) -> int:
+        """새로 기록된 항목 검증 -> 검증한 개수"""
+        verified = 0
+        while True:
+            entries, cursor = self.store.read_from(self.cursor)
+            if not entries:
+                return verified
+            try:
+                self.verified_hash, self.verified_seq = verify_chain(entries, self.verified_hash, self.verified_seq)
+            except LedgerIntegrityError as e:
+                self.error = str(e)
+                raise
+            self.cursor = cursor
+            verified += len(entries)
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.to_thread(self.verify_once)
+            except LedgerIntegrityError as e:
+                print(f"❌ Ledger integrity check failed: {e}")
+            except Exception as e:
+                print(f"❌ Ledger verifier error: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def status(self) -> dict:
+        return {
+            "verified_entries": self.verified_seq,
+            "verified_hash": self.verified_hash,
+            "ok": self.error is None,
+            "error": self.error,
+        }
+
+
+# 프로세스별 원장 (처음 사용할 때 생성)
+_ledger: Optional[TokenLedger] = None
+_verifier: Optional[LedgerVerifier] = None
+
+
+def get_ledger() -> TokenLedger:
+    """원장 인스턴스 반환"""
+    global _ledger
+    if _ledger is None:
+        _ledger = TokenLedger()
+    return _ledger
+
+
+def get_ledger_verifier() -> LedgerVerifier:
+    """원장 검증기 인스턴스 반환"""
+    global _verifier
+    if _verifier is None:
+        _verifier = LedgerVerifier(get_ledger().store)
+    return _verifier
@@ -0,0 +1,508 @@
+# app/services/payout_service.py
+import hashlib
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from fastapi import HTTPException, status
+from sqlalchemy import insert, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import Distribution, DistributionPayout, Notification
+from app.services.ledger_service import GENESIS_HASH, get_ledger, verify_chain
+
+_INT64_MAX = 2 ** 63 - 1
+
+NOTIFICATION_KIND = "distribution"
+
+
+class PayoutError(Exception):
+    """분배 처리 오류 (보유자 없음, 스냅샷 불일치 등)"""
+
+
+class _LeaseLost(Exception):
+    """다른 워커가 분배를 이어받음 (조용히 중단)"""
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def to_minor_units(amount: Decimal, decimals: Optional[int] = None) -> int:
+    """금액 -> 최소 단위 정수 (자릿수를 넘는 소수는 반올림하지 않고 오류)"""
+    decimals = settings.PAYOUT_AMOUNT_DECIMALS if decimals is None else decimals
+    scaled = Decimal(amount).scaleb(decimals)
+    if scaled != scaled.to_integral_value():
+        raise ValueError(f"금액은 소수점 {decimals}자리까지 입력할 수 있습니다")
+    return int(scaled)
+
+
+def format_amount(minor: int, decimals: Optional[int] = None) -> str:
+    """최소 단위 정수 -> 표시용 금액 (1,234 / 1,234.50)"""
+    decimals = settings.PAYOUT_AMOUNT_DECIMALS if decimals is None else decimals
+    if decimals == 0:
+        return f"{minor:,}"
+    return f"{Decimal(minor).scaleb(-decimals):,.{decimals}f}"
+
+
+def total_supply(holdings: np.ndarray) -> int:
+    """총 보유량 (int64 합계가 넘치면 조용히 음수가 되므로 미리 확인)"""
+    if len(holdings) and int(holdings.max()) > _INT64_MAX // len(holdings):
+        supply = sum(holdings.tolist())
+        if supply > _INT64_MAX:
+            raise PayoutError("총 보유량이 너무 커서 분배할 수 없습니다")
+        return supply
+    return int(holdings.sum())
+
+
+def allocate_pro_rata(total_amount: int, holdings: np.ndarray) -> np.ndarray:
+    """보유량 비례 배분 (정수 내림 후 남은 금액은 나머지가 큰 보유자부터 1씩)
+
+    합계는 항상 total_amount와 같고, 나머지가 같으면 앞쪽(계정 번호가 작은) 보유자 우선
+    """
+    holdings = np.asarray(holdings, dtype=np.int64)
+    supply = total_supply(holdings)
+    if supply <= 0:
+        raise PayoutError("기준일 보유자가 없습니다")
+
+    # total * h / supply = q * h + r * h / supply (r < supply라서 int64 곱셈이 넘치지 않는 경우가 대부분)
+    quotient, rest = divmod(total_amount, supply)
+    if rest * int(holdings.max()) <= _INT64_MAX:
+        scaled = holdings * rest
+        amounts = holdings * quotient + scaled // supply
+        remainders = scaled % supply
+    else:
+        # 보유량 단위가 매우 큰 토큰은 파이썬 정수로 계산 (느리지만 정확)
+        scaled = holdings.astype(object) * rest
+        amounts = holdings * quotient + (scaled // supply).astype(np.int64)
+        remainders = (scaled % supply).astype(np.int64)
+
+    leftover = total_amount - int(amounts.sum())
+    if leftover:
+        # 전체 정렬 대신 leftover번째로 큰 나머지를 기준으로 선택
+        cutoff = np.partition(remainders, len(remainders) - leftover)[len(remainders) - leftover]
+        above = np.flatnonzero(remainders > cutoff)
+        tied = np.flatnonzero(remainders == cutoff)[:leftover - len(above)]
+        amounts[above] += 1
+        amounts[tied] += 1
+    return amounts
+
+
+def snapshot_holdings(store, token_id: str, record_date: datetime) -> Tuple[np.ndarray, np.ndarray]:
+    """원장 재생으로 기준일 보유량 계산 -> (계정, 보유량), 계정순 정렬, 보유량 0 제외"""
+    record_date = _as_utc(record_date)
+    balances: Dict[int, int] = {}
+    prev_hash, next_seq = GENESIS_HASH, 0
+    cursor = 0
+    reached = False
+    while not reached:
+        entries, cursor = store.read_from(cursor)
+        if not entries:
+            break
+        # 변조된 원장으로 지급하지 않도록 해시 체인 검증
+        prev_hash, next_seq = verify_chain(entries, prev_hash, next_seq)
+        for entry in entries:
+            # 원장은 기록 순서대로 시각이 증가하므로 기준일 이후 항목이 나오면 종료
+            if datetime.fromisoformat(entry["timestamp"]) > record_date:
+                reached = True
+                break
+            if entry["token_id"] != token_id:
+                continue
+            amount = entry["amount"]
+            if entry["from_account"] is not None:
+                balances[entry["from_account"]] = balances.get(entry["from_account"], 0) - amount
+            balances[entry["to_account"]] = balances.get(entry["to_account"], 0) + amount
+
+    accounts = np.fromiter((account for account, amount in balances.items() if amount > 0), dtype=np.int64)
+    holdings = np.fromiter((amount for amount in balances.values() if amount > 0), dtype=np.int64)
+    order = np.argsort(accounts, kind="stable")
+    return accounts[order], holdings[order]
+
+
+def _file_sha256(path: str) -> Optional[str]:
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class PayoutEngine:
+    """분배 지급 실행기 (기준일 스냅샷 -> 벡터 배분 -> 청크별 일괄 INSERT + 체크포인트)
+
+    청크 지급과 체크포인트는 같은 트랜잭션이라 중단 후 재개해도 중복/누락 없음
+    """
+
+    def __init__(self,
+                 store=None,
+                 snapshot_dir: Optional[str] = None,
+                 lease_seconds: Optional[float] = None,
+                 session_factory: Callable[[], Session] = SessionLocal):
+        self.store = store
+        self.snapshot_dir = snapshot_dir or settings.PAYOUT_SNAPSHOT_DIR
+        self.lease = timedelta(seconds=lease_seconds or settings.PAYOUT_LEASE_SECONDS)
+        self.session_factory = session_factory
+
+        self.stats = {"runs": 0, "completed": 0, "failed": 0, "chunks": 0, "payouts": 0}
+        self._threads: Dict[int, threading.Thread] = {}
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+
+    # 실행 관리
+    def start(self, distribution_id: int):
+        """백그라운드 스레드에서 분배 실행 (이미 실행 중이면 무시)"""
+        with self._lock:
+            thread = self._threads.get(distribution_id)
+            if thread is not None and thread.is_alive():
+                return
+            thread = threading.Thread(
+                target=self._run_logged, args=(distribution_id,), name=f"payout-{distribution_id}", daemon=True
+            )
+            self._threads[distribution_id] = thread
+            thread.start()
+
+    def resume_all(self) -> int:
+        """중단된 분배 이어서 실행 (서버 시작시, 다른 워커가 실행 중인 분배는 점유 만료 후)"""
+        db = self.session_factory()
+        try:
+            ids = [row.distribution_id for row in db.query(Distribution.distribution_id).filter(
+                Distribution.status.in_(("pending", "running"))
+            ).all()]
+        finally:
+            db.close()
+        for distribution_id in ids:
+            self.start(distribution_id)
+        return len(ids)
+
+    def stop(self, timeout: float = 10.0):
+        """진행 중인 청크까지만 기록하고 중단 (점유를 풀어 다른 워커가 바로 이어받도록)"""
+        self._stopping.set()
+        for thread in list(self._threads.values()):
+            thread.join(timeout)
+
+    def _run_logged(self, distribution_id: int):
+        try:
+            self.run(distribution_id)
+        except Exception as e:
+            print(f"❌ Distribution {distribution_id} payout failed: {e}")
+
+    # 실행
+    def run(self, distribution_id: int, max_chunks: Optional[int] = None) -> Optional[dict]:
+        """분배 실행 (체크포인트부터), 점유하지 못하면 None"""
+        distribution = self._claim(distribution_id)
+        if distribution is None:
+            return None
+        self.stats["runs"] += 1
+        try:
+            accounts, holdings = self._load_snapshot(distribution)
+            amounts = allocate_pro_rata(distribution.total_amount, holdings)
+            notice = self._notification_text(distribution)
+
+            written = 0
+            for chunk in range(distribution.next_chunk or 0, distribution.chunks):
+                if self._stopping.is_set() or (max_chunks is not None and written >= max_chunks):
+                    self._release(distribution_id)
+                    return None
+                start = chunk * distribution.chunk_size
+                end = start + distribution.chunk_size
+                self._write_chunk(distribution, chunk, accounts[start:end], holdings[start:end],
+                                  amounts[start:end], notice)
+                written += 1
+            return self._complete(distribution_id)
+        except _LeaseLost:
+            return None
+        except Exception as e:
+            self._fail(distribution_id, str(e) or type(e).__name__)
+            raise
+
+    def _claim(self, distribution_id: int) -> Optional[Distribution]:
+        """실행 점유 (점유 만료 전에는 다른 워커가 가져가지 않음)"""
+        now = _utcnow()
+        db = self.session_factory()
+        try:
+            result = db.execute(
+                update(Distribution)
+                .where(
+                    Distribution.distribution_id == distribution_id,
+                    Distribution.status.in_(("pending", "running")),
+                    or_(Distribution.lease_until.is_(None), Distribution.lease_until < now),
+                )
+                .values(status="running", lease_until=now + self.lease, error=None)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            if result.rowcount != 1:
+                return None
+            distribution = db.query(Distribution).filter(Distribution.distribution_id == distribution_id).one()
+            db.expunge(distribution)
+            return distribution
+        finally:
+            db.close()
+
+    def snapshot_path(self, distribution_id: int) -> str:
+        return os.path.join(self.snapshot_dir, f"distribution_{distribution_id}.npz")
+
+    def save_snapshot(self, distribution_id: int, accounts: np.ndarray, holdings: np.ndarray) -> dict:
+        """기준일 보유자 명부 저장 (원장 재생 대신 외부 명부를 쓸 때도 사용)"""
+        accounts = np.asarray(accounts, dtype=np.int64)
+        holdings = np.asarray(holdings, dtype=np.int64)
+        if len(accounts) != len(holdings) or (len(accounts) > 1 and np.any(np.diff(accounts) <= 0)):
+            raise PayoutError("보유자 명부는 계정순으로 정렬된 중복 없는 목록이어야 합니다")
+
+        path = self.snapshot_path(distribution_id)
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            np.savez(f, accounts=accounts, holdings=holdings)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+        db = self.session_factory()
+        try:
+            distribution = db.query(Distribution).filter(Distribution.distribution_id == distribution_id).one()
+            distribution.holders = len(accounts)
+            distribution.total_supply = total_supply(holdings)
+            distribution.chunks = -(-len(accounts) // distribution.chunk_size)
+            distribution.snapshot_sha256 = _file_sha256(path)
+            db.commit()
+            return distribution.to_dict()
+        finally:
+            db.close()
+
+    def _load_snapshot(self, distribution: Distribution) -> Tuple[np.ndarray, np.ndarray]:
+        path = self.snapshot_path(distribution.distribution_id)
+        if distribution.snapshot_sha256 is None:
+            # 첫 실행: 원장 재생으로 스냅샷 생성 (재개시에는 같은 명부를 그대로 사용)
+            store = self.store or get_ledger().store
+            accounts, holdings = snapshot_holdings(store, distribution.token_id, distribution.record_date)
+            snapshot = self.save_snapshot(distribution.distribution_id, accounts, holdings)
+            distribution.holders = snapshot["holders"]
+            distribution.total_supply = snapshot["total_supply"]
+            distribution.chunks = snapshot["chunks"]
+            return accounts, holdings
+
+        if _file_sha256(path) != distribution.snapshot_sha256:
+            raise PayoutError("스냅샷 파일이 없거나 변경되었습니다")
+        with np.load(path) as data:
+            return data["accounts"], data["holdings"]
+
+    def _notification_text(self, distribution: Distribution) -> Tuple[str, str, str]:
+        """(제목, 본문 앞, 본문 뒤) -> 보유자별로 금액만 사이에 채움"""
+        record_date = _as_utc(distribution.record_date).strftime("%Y-%m-%d")
+        return (
+            f"{distribution.token_id} 분배금 지급 안내",
+            f"{distribution.token_id} 분배금이 지급되었습니다: ",
+            f" {settings.PAYOUT_CURRENCY_UNIT} (기준일 {record_date})",
+        )
+
+    def _write_chunk(self, distribution: Distribution, chunk: int, accounts: np.ndarray, holdings: np.ndarray,
+                     amounts: np.ndarray, notice: Tuple[str, str, str]):
+        """청크 1개 지급 (지급 원장 + 알림 일괄 INSERT, 체크포인트 갱신을 한 트랜잭션으로)"""
+        distribution_id = distribution.distribution_id
+        title, body_head, body_tail = notice
+        paid = amounts > 0 # 보유량이 너무 적어 0원인 보유자는 기록하지 않음
+        accounts, holdings, amounts = accounts[paid].tolist(), holdings[paid].tolist(), amounts[paid].tolist()
+        payouts = [
+            {"distribution_id": distribution_id, "user_id": account, "holding": holding, "amount": amount}
+            for account, holding, amount in zip(accounts, holdings, amounts)
+        ]
+        notifications = [
+            {"user_id": account, "kind": NOTIFICATION_KIND, "title": title,
+             "body": body_head + format_amount(amount) + body_tail, "reference_id": distribution_id}
+            for account, amount in zip(accounts, amounts)
+        ]
+
+        db = self.session_factory()
+        try:
+            if payouts:
+                # ORM 일괄 INSERT 경로를 거치지 않고 테이블에 바로 (행별 처리 비용 없음)
+                db.execute(insert(DistributionPayout.__table__), payouts)
+                db.execute(insert(Notification.__table__), notifications)
+            result = db.execute(
+                update(Distribution)
+                .where(
+                    Distribution.distribution_id == distribution_id,
+                    Distribution.status == "running",
+                    Distribution.next_chunk == chunk,
+                )
+                .values(
+                    next_chunk=chunk + 1,
+                    paid_holders=Distribution.paid_holders + len(payouts),
+                    paid_amount=Distribution.paid_amount + sum(amounts),
+                    lease_until=_utcnow() + self.lease,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount != 1:
+                raise _LeaseLost()
+            db.commit()
+        except IntegrityError:
+            # 점유가 만료되어 다른 워커가 같은 청크를 먼저 기록함
+            db.rollback()
+            raise _LeaseLost()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        self.stats["chunks"] += 1
+        self.stats["payouts"] += len(payouts)
+
+    def _complete(self, distribution_id: int) -> dict:
+        db = self.session_factory()
+        try:
+            # 지급 합계가 총액과 정확히 같을 때만 완료 처리
+            result = db.execute(
+                update(Distribution)
+                .where(
+                    Distribution.distribution_id == distribution_id,
+                    Distribution.status == "running",
+                    Distribution.paid_amount == Distribution.total_amount,
+                )
+                .values(status="completed", completed_at=_utcnow(), lease_until=None)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            if result.rowcount != 1:
+                raise PayoutError("지급 합계가 분배 총액과 일치하지 않습니다")
+            self.stats["completed"] += 1
+            return db.query(Distribution).filter(Distribution.distribution_id == distribution_id).one().to_dict()
+        finally:
+            db.close()
+
+    def _fail(self, distribution_id: int, reason: str):
+        self.stats["failed"] += 1
+        db = self.session_factory()
+        try:
+            db.execute(
+                update(Distribution)
+                .where(Distribution.distribution_id == distribution_id, Distribution.status == "running")
+                .values(status="failed", error=reason[:255], lease_until=None)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def _release(self, distribution_id: int):
+        db = self.session_factory()
+        try:
+            db.execute(
+                update(Distribution)
+                .where(Distribution.distribution_id == distribution_id, Distribution.status == "running")
+                .values(lease_until=None)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def status(self) -> dict:
+        return {
+            "running": sorted(distribution_id for distribution_id, thread in self._threads.items() if thread.is_alive()),
+            **self.stats,
+        }
+
+
+class DistributionService:
+    """분배 등록/조회"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create(self, token_id: str, total_amount: Decimal, record_date: Optional[datetime] = None) -> dict:
+        """분배 등록 후 백그라운드 지급 시작"""
+        try:
+            total = to_minor_units(total_amount)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        if not 0 < total <= _INT64_MAX:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="분배 총액이 올바르지 않습니다")
+        record_date = _as_utc(record_date) if record_date is not None else _utcnow()
+        if record_date > _utcnow():
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="기준일은 현재 시각 이전이어야 합니다")
+
+        distribution = Distribution(
+            token_id=token_id,
+            total_amount=total,
+            record_date=record_date,
+            status="pending",
+            chunk_size=settings.PAYOUT_CHUNK_SIZE,
+            next_chunk=0,
+            paid_holders=0,
+            paid_amount=0,
+        )
+        self.db.add(distribution)
+        self.db.commit()
+        self.db.refresh(distribution)
+        get_payout_engine().start(distribution.distribution_id)
+        return distribution.to_dict()
+
+    def get(self, distribution_id: int) -> Distribution:
+        distribution = self.db.query(Distribution).filter(Distribution.distribution_id == distribution_id).first()
+        if distribution is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="분배를 찾을 수 없습니다"
+            )
+        return distribution
+
+    def list_recent(self, limit: int = 50) -> List[dict]:
+        distributions = self.db.query(Distribution).order_by(Distribution.distribution_id.desc()).limit(limit).all()
+        return [distribution.to_dict() for distribution in distributions]
+
+    def resume(self, distribution_id: int) -> dict:
+        """실패/중단된 분배 재개 (체크포인트부터)"""
+        distribution = self.get(distribution_id)
+        if distribution.status == "completed":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="이미 완료된 분배입니다"
+            )
+        if distribution.status == "failed":
+            distribution.status = "pending"
+            distribution.error = None
+            self.db.commit()
+        get_payout_engine().start(distribution_id)
+        return distribution.to_dict()
+
+    def user_payouts(self, user_id: int, limit: int = 50) -> List[dict]:
+        """사용자 지급 내역 (최근 분배순)"""
+        rows = self.db.query(DistributionPayout, Distribution).join(
+            Distribution, Distribution.distribution_id == DistributionPayout.distribution_id
+        ).filter(
+            DistributionPayout.user_id == user_id
+        ).order_by(DistributionPayout.distribution_id.desc()).limit(limit).all()
+        return [
+            {
+                **payout.to_dict(),
+                "token_id": distribution.token_id,
+                "record_date": distribution.record_date.isoformat() if distribution.record_date else None,
+            }
+            for payout, distribution in rows
+        ]
+
+
+# 프로세스별 실행기 (처음 사용할 때 생성)
+_engine: Optional[PayoutEngine] = None
+
+
+def get_payout_engine() -> PayoutEngine:
+    """PayoutEngine 인스턴스 반환"""
+    global _engine
+    if _engine is None:
+        _engine = PayoutEngine()
+    return _engine
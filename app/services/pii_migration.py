@@ -0,0 +1,60 @@
+# app/services/pii_migration.py
+# 개인정보 암호화 도입 전 DB 전환 (phone_hash/email 추가 -> 컬럼 확장 -> 재암호화 -> 제약 추가)
+from typing import Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import Session
+
+from app.database import Base, SessionLocal
+from app.models import EncryptionKey, User
+from app.services.encryption_service import reencrypt_users
+
+
+def migrate_user_pii(db: Session, batch_size: Optional[int] = None) -> dict:
+    """기존 users 테이블을 암호화 스키마로 전환 (여러 번 실행해도 안전)
+
+    재암호화가 끝나기 전까지 phone_hash가 NULL인 행은 로그인시 평문 번호로 조회됨
+    """
+    bind = db.get_bind()
+    is_postgresql = bind.dialect.name == "postgresql"
+    result = {"added_phone_hash": False, "added_email": False, "widened_columns": False}
+
+    # 1. phone_hash는 NULL 허용으로 먼저 추가 (기존 행은 재암호화 때 채움)
+    Base.metadata.create_all(bind, tables=[EncryptionKey.__table__])
+    columns = {column["name"] for column in inspect(bind).get_columns("users")}
+    if "phone_hash" not in columns:
+        db.execute(text("ALTER TABLE users ADD COLUMN phone_hash VARCHAR(64)"))
+        result["added_phone_hash"] = True
+    # 안내 메일 주소 (선택 입력, 암호문 저장)
+    if "email" not in columns:
+        db.execute(text("ALTER TABLE users ADD COLUMN email TEXT"))
+        result["added_email"] = True
+
+    # 2. 암호문(약 60자 이상)이 들어가도록 컬럼 확장 (SQLite는 길이 제한 없음)
+    if is_postgresql:
+        db.execute(text("ALTER TABLE users ALTER COLUMN phone_number TYPE VARCHAR(255)"))
+        db.execute(text("ALTER TABLE users ALTER COLUMN user_name TYPE TEXT"))
+        result["widened_columns"] = True
+    db.commit()
+
+    # 3. 평문/이전 키 행을 현재 키로 암호화 (phone_hash도 함께 채움)
+    result.update(reencrypt_users(db, batch_size))
+
+    # 4. 모든 행이 채워진 뒤에 제약 추가
+    missing = db.execute(text("SELECT count(*) FROM users WHERE phone_hash IS NULL")).scalar()
+    if missing:
+        raise RuntimeError(f"phone_hash가 비어 있는 사용자가 {missing}명 있습니다 (다시 실행하세요)")
+    db.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ix_users_phone_hash ON users (phone_hash)"))
+    if is_postgresql:
+        db.execute(text("ALTER TABLE users ALTER COLUMN phone_hash SET NOT NULL"))
+    db.commit()
+    return result
+
+
+if __name__ == "__main__":
+    # 사용법: python -m app.services.pii_migration (배포 직후 1번, 앱 실행 중에도 가능)
+    session = SessionLocal()
+    try:
+        print(f"✅ User PII migrated: {migrate_user_pii(session)}")
+    finally:
+        session.close()
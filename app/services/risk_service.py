@@ -0,0 +1,306 @@
+# app/services/risk_service.py
+import math
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from app.config import settings
+from app.core.pubsub import Broadcaster
+from app.services import audit_service
+from app.services.encryption_service import get_encryptor
+
+# 이벤트 종류
+LOGIN_SUCCESS = "login_success"
+LOGIN_FAILURE = "login_failure"
+SMS_SENT = "sms_sent"
+SMS_FAILURE = "sms_failure"
+ORDER = "order"
+
+EVENT_KINDS = (LOGIN_SUCCESS, LOGIN_FAILURE, SMS_SENT, SMS_FAILURE, ORDER)
+
+# 위험 등급
+ALLOW = "allow"
+REVIEW = "review"
+BLOCK = "block"
+
+
+class SlidingWindowCounter:
+    """시간 버킷 링 버퍼 기반 슬라이딩 윈도우 카운터"""
+
+    __slots__ = ("bucket_seconds", "buckets", "total", "head")
+
+    def __init__(self, window_seconds: int, n_buckets: int = 12):
+        self.bucket_seconds = max(1, window_seconds // n_buckets)
+        self.buckets = array("d", [0.0]) * n_buckets
+        self.total = 0.0
+        self.head = 0 # 마지막으로 기록한 버킷 번호 (시각 / bucket_seconds)
+
+    def _advance(self, now: float):
+        """지난 버킷 비우기 (오래된 값 제거)"""
+        current = int(now) // self.bucket_seconds
+        elapsed = current - self.head
+        if elapsed <= 0:
+            return
+        n = len(self.buckets)
+        if elapsed >= n:
+            for i in range(n):
+                self.buckets[i] = 0.0
+            self.total = 0.0
+        else:
+            for step in range(1, elapsed + 1):
+                index = (self.head + step) % n
+                self.total -= self.buckets[index]
+                self.buckets[index] = 0.0
+        self.head = current
+
+    def add(self, now: float, value: float = 1.0):
+        self._advance(now)
+        self.buckets[self.head % len(self.buckets)] += value
+        self.total += value
+
+    def value(self, now: float) -> float:
+        self._advance(now)
+        return self.total
+
+
+class KeyStats:
+    """사용자 또는 IP 1개의 이벤트 통계"""
+
+    __slots__ = ("minute", "hour", "amount_mean", "amount_var", "amount_count", "recent_keys")
+
+    def __init__(self):
+        # 이벤트 종류별 카운터는 처음 발생할 때 생성 (메모리 절약)
+        self.minute: Dict[str, SlidingWindowCounter] = {}
+        self.hour: Dict[str, SlidingWindowCounter] = {}
+        # 주문 금액 EWMA 평균/분산
+        self.amount_mean = 0.0
+        self.amount_var = 0.0
+        self.amount_count = 0
+        # IP별 최근 시도한 계정 (개수 제한)
+        self.recent_keys: "OrderedDict[str, float]" = OrderedDict()
+
+    def record(self, kind: str, now: float, amount: Optional[float] = None, related_key: Optional[str] = None):
+        if kind not in self.minute:
+            self.minute[kind] = SlidingWindowCounter(60)
+            self.hour[kind] = SlidingWindowCounter(3600)
+        self.minute[kind].add(now)
+        self.hour[kind].add(now)
+
+        if amount is not None:
+            self.amount_count += 1
+            if self.amount_count == 1:
+                self.amount_mean = amount
+            else:
+                alpha = 0.1
+                delta = amount - self.amount_mean
+                self.amount_mean += alpha * delta
+                self.amount_var = (1 - alpha) * (self.amount_var + alpha * delta * delta)
+
+        if related_key is not None:
+            self.recent_keys[related_key] = now
+            self.recent_keys.move_to_end(related_key)
+            while len(self.recent_keys) > 32:
+                self.recent_keys.popitem(last=False)
+
+    def per_minute(self, kind: str, now: float) -> float:
+        counter = self.minute.get(kind)
+        return counter.value(now) if counter is not None else 0.0
+
+    def per_hour(self, kind: str, now: float) -> float:
+        counter = self.hour.get(kind)
+        return counter.value(now) if counter is not None else 0.0
+
+    def distinct_keys(self, now: float, window: float = 600.0) -> int:
+        """window 안에 시도된 서로 다른 계정 수"""
+        return sum(1 for seen in self.recent_keys.values() if now - seen <= window)
+
+    def amount_zscore(self, amount: float) -> float:
+        """주문 금액의 평소 대비 z-score"""
+        if self.amount_count < 5 or self.amount_var <= 0:
+            return 0.0
+        return (amount - self.amount_mean) / math.sqrt(self.amount_var)
+
+
+# 규칙: (이름, 점수, 조건(action, user 통계, ip 통계, 금액, now))
+Rule = Tuple[str, int, Callable[[str, Optional[KeyStats], Optional[KeyStats], Optional[float], float], bool]]
+
+DEFAULT_RULES: List[Rule] = [
+    ("login_failures_burst", 80,
+     lambda action, user, ip, amount, now: action == "login" and user is not None and user.per_minute(LOGIN_FAILURE, now) >= 5),
+    ("login_failures_hourly", 40,
+     lambda action, user, ip, amount, now: action == "login" and user is not None and user.per_hour(LOGIN_FAILURE, now) >= 20),
+    ("ip_login_failures", 50,
+     lambda action, user, ip, amount, now: action == "login" and ip is not None and ip.per_minute(LOGIN_FAILURE, now) >= 20),
+    ("ip_credential_stuffing", 60,
+     lambda action, user, ip, amount, now: action == "login" and ip is not None and ip.distinct_keys(now) >= 10),
+    ("sms_flood", 80,
+     lambda action, user, ip, amount, now: action == "sms" and user is not None and user.per_hour(SMS_SENT, now) >= 10),
+    ("ip_sms_flood", 60,
+     lambda action, user, ip, amount, now: action == "sms" and ip is not None and ip.per_minute(SMS_SENT, now) >= 10),
+    ("sms_resend_after_failures", 50,
+     lambda action, user, ip, amount, now: action == "sms" and user is not None and user.per_hour(SMS_FAILURE, now) >= 10),
+    # 인증번호 확인은 발송 횟수가 아닌 확인 실패 횟수로만 판단 (여러 번 재발송한 사용자도 확인 가능)
+    ("sms_verify_failures", 80,
+     lambda action, user, ip, amount, now: action == "sms_verify" and user is not None and user.per_hour(SMS_FAILURE, now) >= 10),
+    ("ip_sms_verify_failures", 60,
+     lambda action, user, ip, amount, now: action == "sms_verify" and ip is not None and ip.per_minute(SMS_FAILURE, now) >= 20),
+    ("order_burst", 50,
+     lambda action, user, ip, amount, now: action == "order" and user is not None and user.per_minute(ORDER, now) >= 10),
+    ("order_amount_outlier", 40,
+     lambda action, user, ip, amount, now: action == "order" and user is not None and amount is not None and user.amount_zscore(amount) >= 4.0),
+    ("order_after_login_failures", 30,
+     lambda action, user, ip, amount, now: action == "order" and user is not None and user.per_hour(LOGIN_FAILURE, now) >= 5),
+]
+
+
+class RiskAssessment:
+    """위험도 평가 결과"""
+
+    __slots__ = ("score", "decision", "reasons")
+
+    def __init__(self, score: int, decision: str, reasons: List[str]):
+        self.score = score
+        self.decision = decision
+        self.reasons = reasons
+
+    @property
+    def blocked(self) -> bool:
+        return self.decision == BLOCK
+
+    def to_dict(self):
+        return {"score": self.score, "decision": self.decision, "reasons": self.reasons}
+
+
+class RiskEngine:
+    """인증/주문 이벤트 기반 실시간 이상 거래 탐지 (메모리, DB 조회 없음)"""
+
+    def __init__(self, rules: Optional[List[Rule]] = None,
+                 max_keys: Optional[int] = None,
+                 clock: Callable[[], float] = time.time):
+        self.rules = rules if rules is not None else DEFAULT_RULES
+        self.max_keys = max_keys or settings.RISK_MAX_KEYS
+        self.clock = clock
+        self._users: "OrderedDict[str, KeyStats]" = OrderedDict()
+        self._ips: "OrderedDict[str, KeyStats]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 다른 워커가 받은 이벤트도 반영 (워커마다 따로 세면 임계값이 워커 수만큼 느슨해짐)
+        self.broadcaster = Broadcaster("risk", lambda message: self.apply(
+            message["kind"], message["user_key"], message["ip"], message["amount"]
+        ))
+
+    def _get(self, table: "OrderedDict[str, KeyStats]", key: Optional[str], create: bool) -> Optional[KeyStats]:
+        """키 통계 조회 (오래 사용되지 않은 키부터 제거)"""
+        if key is None:
+            return None
+        stats = table.get(key)
+        if stats is None:
+            if not create:
+                return None
+            stats = table[key] = KeyStats()
+            if len(table) > self.max_keys:
+                table.popitem(last=False)
+        else:
+            table.move_to_end(key)
+        return stats
+
+    def record(self, kind: str, user_key: Optional[str] = None, ip: Optional[str] = None, amount: Optional[float] = None):
+        """이벤트 반영 (모든 워커)"""
+        if kind not in EVENT_KINDS:
+            raise ValueError(f"지원하지 않는 이벤트입니다: {kind}")
+        self.apply(kind, user_key, ip, amount)
+        self.broadcaster.publish({"kind": kind, "user_key": user_key, "ip": ip, "amount": amount})
+
+    def apply(self, kind: str, user_key: Optional[str], ip: Optional[str], amount: Optional[float]):
+        """이 워커의 통계에만 반영"""
+        now = self.clock()
+        with self._lock:
+            user = self._get(self._users, user_key, create=True)
+            if user is not None:
+                user.record(kind, now, amount=amount)
+            ip_stats = self._get(self._ips, ip, create=True)
+            if ip_stats is not None:
+                ip_stats.record(kind, now, related_key=user_key)
+
+    def check(self, action: str, user_key: Optional[str] = None, ip: Optional[str] = None, amount: Optional[float] = None) -> RiskAssessment:
+        """위험도 평가 (action: login, sms, sms_verify, order)"""
+        now = self.clock()
+        score = 0
+        reasons = []
+        with self._lock:
+            user = self._get(self._users, user_key, create=False)
+            ip_stats = self._get(self._ips, ip, create=False)
+            if user is not None or ip_stats is not None:
+                for name, points, condition in self.rules:
+                    if condition(action, user, ip_stats, amount, now):
+                        score += points
+                        reasons.append(name)
+
+        if score >= settings.RISK_BLOCK_SCORE:
+            decision = BLOCK
+        elif score >= settings.RISK_REVIEW_SCORE:
+            decision = REVIEW
+        else:
+            decision = ALLOW
+        return RiskAssessment(min(score, 100), decision, reasons)
+
+    def check_order(self, user_key: str, ip: Optional[str], amount: float) -> RiskAssessment:
+        """주문 전 위험도 평가 (주문 처리에서 호출)"""
+        return self.check("order", user_key, ip, amount)
+
+    def snapshot(self, user_key: Optional[str] = None, ip: Optional[str] = None) -> dict:
+        """키별 현재 통계 (관리자 조회용)"""
+        now = self.clock()
+        result = {}
+        with self._lock:
+            for label, table, key in (("user", self._users, user_key), ("ip", self._ips, ip)):
+                stats = table.get(key) if key is not None else None
+                if stats is None:
+                    continue
+                result[label] = {
+                    "per_minute": {kind: stats.per_minute(kind, now) for kind in EVENT_KINDS},
+                    "per_hour": {kind: stats.per_hour(kind, now) for kind in EVENT_KINDS},
+                    "distinct_accounts": stats.distinct_keys(now),
+                }
+            result["tracked"] = {"users": len(self._users), "ips": len(self._ips)}
+        return result
+
+
+def user_risk_key(phone_number: str) -> str:
+    """사용자 키 = 핸드폰 번호 blind index (로그인 전 인증 이벤트와 로그인 후 주문 이벤트가 같은 키, 평문은 메모리에 두지 않음)"""
+    return get_encryptor().blind_index(phone_number)
+
+
+def check_order_risk(user, client_ip: Optional[str], amount: float):
+    """주문 전 위험도 확인 (차단 대상이면 감사 로그 기록 후 429)"""
+    if not settings.RISK_ENABLED:
+        return
+    assessment = get_risk_engine().check_order(user_risk_key(user.phone_number), client_ip, amount)
+    if assessment.blocked:
+        audit_service.audit(audit_service.RISK_BLOCKED, actor_id=user.user_id, target="order", ip_address=client_ip,
+                            success=False, detail={"action": "order", "amount": amount, **assessment.to_dict()})
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="비정상적인 주문이 감지되었습니다. 잠시 후 다시 시도해주세요"
+        )
+
+
+def record_order(user, client_ip: Optional[str], amount: float):
+    """주문 완료 이벤트 기록"""
+    if settings.RISK_ENABLED:
+        get_risk_engine().record(ORDER, user_risk_key(user.phone_number), client_ip, amount=amount)
+
+
+# 프로세스별 엔진 (처음 사용할 때 생성)
+_engine: Optional[RiskEngine] = None
+
+
+def get_risk_engine() -> RiskEngine:
+    """RiskEngine 인스턴스 반환"""
+    global _engine
+    if _engine is None:
+        _engine = RiskEngine()
+    return _engine
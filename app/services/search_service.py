@@ -0,0 +1,593 @@
+# app/services/search_service.py
+import asyncio
+import bisect
+import math
+import threading
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from fastapi import HTTPException, status
+from sqlalchemy import event, inspect, text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.pubsub import Broadcaster, create_bus
+from app.database import SessionLocal
+from app.models import Product
+from app.services.cart_service import get_product_cache
+from app.utils.hangul import choseong, decompose, index_tokens, is_choseong_only, ngrams, normalize
+
+# 상품 변경: product_id -> (이름, 카테고리, 판매 여부), 삭제면 None
+ProductChange = Optional[Tuple[str, Optional[str], bool]]
+
+# 검색 결과: (product_id, 점수)
+SearchHit = Tuple[int, float]
+
+
+def _intersect(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """정렬된 두 문서 번호 배열의 교집합 (작은 쪽 기준 이진 탐색)"""
+    small, large = (a, b) if len(a) <= len(b) else (b, a)
+    if len(small) == 0:
+        return small.copy()
+    positions = np.minimum(np.searchsorted(large, small), len(large) - 1)
+    return small[large[positions] == small]
+
+
+class _IndexData:
+    """역색인 본체 (스레드 안전하지 않음, InMemorySearchBackend가 락으로 보호)"""
+
+    def __init__(self):
+        self.postings: Dict[str, array] = {} # 토큰 -> 문서 번호 (증가 순)
+        self.doc_product = array("i") # 문서 번호 -> product_id
+        self.doc_length = array("H") # 문서 번호 -> 정규화된 이름 길이 (짧을수록 우선)
+        self.doc_category = array("H") # 문서 번호 -> 카테고리 코드
+        self.alive = bytearray() # 문서 번호 -> 유효 여부 (수정/삭제되면 0)
+        self.docs: Dict[int, int] = {} # product_id -> 문서 번호
+        self.texts: Dict[int, str] = {} # product_id -> 정규화된 이름
+        self.categories: Dict[str, int] = {"": 0}
+        self.terms: Dict[str, int] = {} # 단어 -> 포함 상품 수 (자동완성 순위)
+        self.term_keys: List[Tuple[str, str]] = [] # (자모 분해, 단어) 정렬
+        self.choseong_keys: List[Tuple[str, str]] = [] # (초성, 단어) 정렬
+        self.dead = 0
+
+    def add(self, product_id: int, name: str, category: Optional[str]):
+        normalized = normalize(name)
+        if not normalized:
+            return
+        doc = len(self.doc_product)
+        words = normalized.split()
+        tokens: Set[str] = set()
+        for word in words:
+            tokens |= index_tokens(word)
+        for token in tokens:
+            posting = self.postings.get(token)
+            if posting is None:
+                posting = self.postings[token] = array("i")
+            posting.append(doc)
+
+        self.doc_product.append(product_id)
+        self.doc_length.append(min(len(normalized), 0xFFFF))
+        self.doc_category.append(self.categories.setdefault(category or "", len(self.categories)))
+        self.alive.append(1)
+        self.docs[product_id] = doc
+        self.texts[product_id] = normalized
+
+        for word in set(words):
+            count = self.terms.get(word, 0)
+            if count == 0:
+                bisect.insort(self.term_keys, (decompose(word), word))
+                bisect.insort(self.choseong_keys, (choseong(word), word))
+            self.terms[word] = count + 1
+
+    def remove(self, product_id: int):
+        """문서는 무효 표시만 (postings 정리는 compact에서 한 번에)"""
+        doc = self.docs.pop(product_id, None)
+        if doc is None:
+            return
+        self.alive[doc] = 0
+        self.dead += 1
+        for word in set(self.texts.pop(product_id).split()):
+            count = self.terms[word] - 1
+            if count:
+                self.terms[word] = count
+                continue
+            del self.terms[word]
+            for keys, key in ((self.term_keys, decompose(word)), (self.choseong_keys, choseong(word))):
+                index = bisect.bisect_left(keys, (key, word))
+                if index < len(keys) and keys[index] == (key, word):
+                    del keys[index]
+
+    def compact(self):
+        """무효 문서를 postings에서 제거하고 문서 번호 재배치"""
+        alive = np.frombuffer(self.alive, dtype=np.bool_).copy()
+        remap = (np.cumsum(alive, dtype=np.int64) - 1).astype(np.int32)
+        postings = {}
+        for token, posting in self.postings.items():
+            docs = np.frombuffer(posting, dtype=np.int32)
+            kept = remap[docs[alive[docs]]]
+            if len(kept):
+                postings[token] = array("i", kept.tobytes())
+        self.postings = postings
+        self.doc_product = array("i", np.frombuffer(self.doc_product, dtype=np.int32)[alive].tobytes())
+        self.doc_length = array("H", np.frombuffer(self.doc_length, dtype=np.uint16)[alive].tobytes())
+        self.doc_category = array("H", np.frombuffer(self.doc_category, dtype=np.uint16)[alive].tobytes())
+        self.alive = bytearray(b"\x01" * len(self.doc_product))
+        self.docs = {product_id: doc for doc, product_id in enumerate(self.doc_product)}
+        self.dead = 0
+
+    def search(self, grams: Set[str], category: Optional[str], min_match: float, limit: int) -> Tuple[int, List[SearchHit]]:
+        """검색어 토큰을 일정 비율 이상 포함한 문서 -> (전체 개수, 상위 limit개)"""
+        required = max(1, math.ceil(len(grams) * min_match))
+        lists = [self.postings[gram] for gram in grams if gram in self.postings]
+        if len(lists) < required:
+            return 0, []
+
+        # 문서별 일치 토큰 수 (결과가 적으면 정렬, 많으면 전체 문서 카운터)
+        merged = np.concatenate([np.frombuffer(posting, dtype=np.int32) for posting in lists])
+        n_docs = len(self.doc_product)
+        if len(merged) * 8 < n_docs:
+            docs, counts = np.unique(merged, return_counts=True)
+        else:
+            counts = np.bincount(merged, minlength=n_docs)
+            docs = np.flatnonzero(counts >= required)
+            counts = counts[docs]
+
+        keep = (counts >= required) & np.frombuffer(self.alive, dtype=np.bool_)[docs]
+        if category is not None:
+            code = self.categories.get(category)
+            if code is None:
+                return 0, []
+            keep &= np.frombuffer(self.doc_category, dtype=np.uint16)[docs] == code
+        docs = docs[keep]
+        total = len(docs)
+        if total == 0:
+            return 0, []
+
+        # 일치 토큰 비율 우선, 같으면 이름이 짧은 상품 우선
+        lengths = np.frombuffer(self.doc_length, dtype=np.uint16)[docs]
+        scores = counts[keep] / len(grams) - lengths * 0.0001
+        if total > limit:
+            top = np.argpartition(-scores, limit - 1)[:limit]
+        else:
+            top = np.arange(total)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        product_ids = np.frombuffer(self.doc_product, dtype=np.int32)[docs[top]]
+        return total, list(zip(product_ids.tolist(), scores[top].tolist()))
+
+    def complete(self, word: str, scan_limit: int) -> List[str]:
+        """접두어로 시작하는 단어 (초성만 입력하면 초성 기준, 아니면 자모 기준)"""
+        if is_choseong_only(word):
+            keys, key = self.choseong_keys, word
+        else:
+            keys, key = self.term_keys, decompose(word)
+        start = bisect.bisect_left(keys, (key,))
+        words = []
+        for index in range(start, min(start + scan_limit, len(keys))):
+            if not keys[index][0].startswith(key):
+                break
+            words.append(keys[index][1])
+        return words
+
+    def matching_docs(self, words: Iterable[str], docs: Optional[np.ndarray] = None) -> np.ndarray:
+        """모든 단어를 포함하는 유효 문서 번호 (드문 토큰부터 교집합, 정렬됨)"""
+        grams: Set[str] = set()
+        for word in words:
+            grams |= ngrams(word)
+        for gram in sorted(grams, key=lambda g: len(self.postings.get(g, ()))):
+            posting = self.postings.get(gram)
+            if posting is None:
+                return np.empty(0, dtype=np.int32)
+            current = np.frombuffer(posting, dtype=np.int32)
+            docs = current.copy() if docs is None else _intersect(docs, current)
+            if len(docs) == 0:
+                return docs
+        if docs is None:
+            return np.empty(0, dtype=np.int32)
+        return docs[np.frombuffer(self.alive, dtype=np.bool_)[docs]]
+
+
+class InMemorySearchBackend:
+    """프로세스 메모리 역색인 (상품 변경시 증분 갱신, DB에서 전체 재구성)"""
+
+    name = "memory"
+
+    def __init__(self, min_match: Optional[float] = None, compact_ratio: Optional[float] = None,
+                 session_factory=SessionLocal):
+        self.min_match = min_match or settings.SEARCH_MIN_MATCH
+        self.compact_ratio = compact_ratio or settings.SEARCH_COMPACT_RATIO
+        self.session_factory = session_factory
+        self.ready = False # 첫 재구성 전에는 DB LIKE 검색으로 대체
+        self.stats = {"rebuilds": 0, "updates": 0, "compactions": 0}
+        self.last_rebuild_seconds: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._data = _IndexData()
+        self._lock = threading.Lock()
+        self._pending: Optional[Dict[int, ProductChange]] = None # 재구성 중 들어온 변경
+        self._thread: Optional[threading.Thread] = None
+
+    # 색인 갱신
+    def start(self) -> bool:
+        """백그라운드 재구성 시작 (이미 진행 중이면 False)"""
+        if self._thread is not None and self._thread.is_alive():
+            return False
+        self._thread = threading.Thread(target=self._rebuild_in_background, name="search-rebuild", daemon=True)
+        self._thread.start()
+        return True
+
+    def _rebuild_in_background(self):
+        try:
+            self.rebuild()
+        except Exception as e:
+            self.last_error = str(e)
+            print(f"❌ Search index rebuild failed: {e}")
+
+    def rebuild(self, db: Optional[Session] = None):
+        """DB 상품 전체로 새 색인을 만든 뒤 교체 (그동안 검색은 기존 색인으로 처리)"""
+        started = time.perf_counter()
+        own_session = db is None
+        db = db or self.session_factory()
+        with self._lock:
+            self._pending = {}
+        try:
+            fresh = _IndexData()
+            rows = db.query(Product.product_id, Product.name, Product.category).filter(
+                Product.is_active == True
+            ).order_by(Product.product_id).yield_per(settings.SEARCH_REBUILD_BATCH)
+            for row in rows:
+                fresh.add(row.product_id, row.name, row.category)
+            with self._lock:
+                # 읽는 동안 커밋된 변경을 새 색인에 다시 반영
+                self._apply_changes(fresh, self._pending)
+                self._data = fresh
+                self.ready = True
+        finally:
+            with self._lock:
+                self._pending = None
+            if own_session:
+                db.close()
+        self.stats["rebuilds"] += 1
+        self.last_rebuild_seconds = round(time.perf_counter() - started, 3)
+        self.last_error = None
+        print(f"✅ Search index rebuilt: {len(fresh.docs)} products in {self.last_rebuild_seconds}s")
+
+    def apply(self, changes: Dict[int, ProductChange]):
+        """커밋된 상품 변경 반영"""
+        with self._lock:
+            if self._pending is not None:
+                self._pending.update(changes)
+            data = self._data
+            self._apply_changes(data, changes)
+            self.stats["updates"] += len(changes)
+            if data.dead > max(1000, len(data.docs) * self.compact_ratio):
+                data.compact()
+                self.stats["compactions"] += 1
+
+    @staticmethod
+    def _apply_changes(data: _IndexData, changes: Dict[int, ProductChange]):
+        for product_id, change in changes.items():
+            data.remove(product_id)
+            if change is not None:
+                name, category, is_active = change
+                if is_active:
+                    data.add(product_id, name, category)
+
+    # 조회
+    def search(self, db: Session, query: str, category: Optional[str], limit: int, offset: int) -> Tuple[int, List[SearchHit]]:
+        normalized = normalize(query)
+        grams: Set[str] = set()
+        for word in normalized.split():
+            grams |= ngrams(word)
+        if not grams:
+            return 0, []
+
+        # 붙여 쓴 검색어를 그대로 포함하면 가산점 (상위 후보만 확인)
+        phrase = normalized.replace(" ", "")
+        with self._lock:
+            data = self._data
+            total, hits = data.search(grams, category, self.min_match, max(100, (offset + limit) * 4))
+            texts = [data.texts.get(product_id, "") for product_id, _ in hits]
+        ranked = sorted(
+            ((product_id, score + (1.0 if phrase in name.replace(" ", "") else 0.0))
+             for (product_id, score), name in zip(hits, texts)),
+            key=lambda hit: -hit[1]
+        )
+        return total, ranked[offset:offset + limit]
+
+    def suggest(self, db: Session, prefix: str, limit: int) -> List[dict]:
+        """마지막 단어 자동완성 (앞 단어가 있으면 함께 등장하는 단어만, 함께 등장한 상품 수 순)"""
+        words = normalize(prefix).split()
+        if not words:
+            return []
+        last = words[-1]
+        context = [word for word in words[:-1] if not is_choseong_only(word)]
+        with self._lock:
+            data = self._data
+            candidates = data.complete(last, settings.SEARCH_SUGGEST_SCAN)
+            candidates.sort(key=lambda word: -data.terms[word])
+            if not context:
+                return [{"text": word, "count": data.terms[word]} for word in candidates[:limit]]
+
+            context_docs = data.matching_docs(context)
+            counted = []
+            for word in candidates[:limit * 3]:
+                count = len(data.matching_docs([word], context_docs)) if len(context_docs) else 0
+                if count:
+                    counted.append((count, word))
+        counted.sort(key=lambda item: -item[0])
+        context_text = " ".join(context)
+        return [{"text": f"{context_text} {word}", "count": count} for count, word in counted[:limit]]
+
+    def status(self) -> dict:
+        with self._lock:
+            data = self._data
+            return {
+                "backend": self.name,
+                "ready": self.ready,
+                "rebuilding": self._pending is not None,
+                "products": len(data.docs),
+                "terms": len(data.terms),
+                "tokens": len(data.postings),
+                "dead_docs": data.dead,
+                **self.stats,
+                "last_rebuild_seconds": self.last_rebuild_seconds,
+                "last_error": self.last_error,
+            }
+
+
+class PgTrgmSearchBackend:
+    """PostgreSQL pg_trgm 트라이그램 인덱스 검색 (색인을 워커별 메모리에 두지 않는 경우)"""
+
+    name = "pg_trgm"
+    ready = True
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+        self.last_error: Optional[str] = None
+
+    def start(self) -> bool:
+        """확장/인덱스 생성 (이미 있으면 그대로)"""
+        db = self.session_factory()
+        try:
+            self.rebuild(db)
+        except Exception as e:
+            db.rollback()
+            self.last_error = str(e)
+            print(f"❌ pg_trgm search index setup failed: {e}")
+        finally:
+            db.close()
+        return True
+
+    def rebuild(self, db: Optional[Session] = None):
+        own_session = db is None
+        db = db or self.session_factory()
+        try:
+            db.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            db.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_products_name_trgm ON products USING gin (name gin_trgm_ops)"
+            ))
+            db.execute(text("ANALYZE products"))
+            db.commit()
+            self.last_error = None
+        finally:
+            if own_session:
+                db.close()
+
+    def apply(self, changes: Dict[int, ProductChange]):
+        # DB 인덱스는 트랜잭션과 함께 갱신됨
+        pass
+
+    def search(self, db: Session, query: str, category: Optional[str], limit: int, offset: int) -> Tuple[int, List[SearchHit]]:
+        normalized = normalize(query)
+        if not normalized:
+            return 0, []
+        category_filter = "AND category = :category" if category is not None else ""
+        rows = db.execute(text(f"""
+            SELECT product_id, word_similarity(:query, name) AS score, count(*) OVER () AS total
+            FROM products
+            WHERE is_active AND :query <% name {category_filter}
+            ORDER BY score DESC, length(name)
+            LIMIT :limit OFFSET :offset
+        """), {"query": normalized, "category": category, "limit": limit, "offset": offset}).all()
+        total = rows[0].total if rows else 0
+        return total, [(row.product_id, float(row.score)) for row in rows]
+
+    def suggest(self, db: Session, prefix: str, limit: int) -> List[dict]:
+        """상품명 부분 일치 (초성 검색은 memory 백엔드만 지원)"""
+        normalized = normalize(prefix)
+        if not normalized or is_choseong_only(normalized.split()[-1]):
+            return []
+        rows = db.execute(text("""
+            SELECT name, count(*) AS count
+            FROM products
+            WHERE is_active AND name ILIKE :pattern
+            GROUP BY name
+            ORDER BY count DESC, length(name)
+            LIMIT :limit
+        """), {"pattern": f"%{normalized}%", "limit": limit}).all()
+        return [{"text": row.name, "count": row.count} for row in rows]
+
+    def status(self) -> dict:
+        return {"backend": self.name, "ready": self.ready, "last_error": self.last_error}
+
+
+class SearchService:
+    """상품 검색 서비스 (색인에서 product_id를 찾고 상품 정보는 ProductCache에서)"""
+
+    def __init__(self, db: Session, backend=None):
+        self.db = db
+        self.backend = backend or get_search_backend()
+
+    def search(self, query: str, category: Optional[str] = None, limit: int = 20, offset: int = 0) -> dict:
+        if not normalize(query):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="검색어를 입력해주세요"
+            )
+        started = time.perf_counter()
+        if self.backend.ready:
+            total, hits = self.backend.search(self.db, query, category, limit, offset)
+        else:
+            total, hits = self._search_like(query, category, limit, offset)
+
+        products = get_product_cache().get_many(self.db, [product_id for product_id, _ in hits])
+        items = [
+            {**products[product_id], "score": round(score, 4)}
+            for product_id, score in hits
+            if product_id in products and products[product_id]["is_active"]
+        ]
+        return {
+            "query": query,
+            "total": total,
+            "items": items,
+            "took_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def suggest(self, prefix: str, limit: int = 10) -> dict:
+        started = time.perf_counter()
+        suggestions = self.backend.suggest(self.db, prefix, limit) if self.backend.ready else []
+        return {
+            "query": prefix,
+            "suggestions": suggestions,
+            "took_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def _search_like(self, query: str, category: Optional[str], limit: int, offset: int) -> Tuple[int, List[SearchHit]]:
+        """색인 준비 전 대체 검색 (단어별 LIKE, 전체 스캔)"""
+        products = self.db.query(Product.product_id).filter(Product.is_active == True)
+        for word in normalize(query).split():
+            products = products.filter(Product.name.ilike(f"%{word}%"))
+        if category is not None:
+            products = products.filter(Product.category == category)
+        total = products.count()
+        rows = products.order_by(Product.product_id).offset(offset).limit(limit).all()
+        return total, [(row.product_id, 1.0) for row in rows]
+
+
+class SearchIndexSync:
+    """워커별 memory 색인 동기화 (커밋한 변경을 메시지 버스로 다른 워커에 전파 + 주기적 재구성)"""
+
+    topic = "products"
+
+    def __init__(self, bus=None, backend=None, rebuild_interval: Optional[float] = None):
+        self.broadcaster = Broadcaster(self.topic, self._receive, bus=bus or create_bus(prefix="search:"))
+        self.backend = backend
+        self.rebuild_interval = settings.SEARCH_REBUILD_INTERVAL if rebuild_interval is None else rebuild_interval
+        self._rebuild_task: Optional[asyncio.Task] = None
+
+    @property
+    def stats(self) -> dict:
+        return self.broadcaster.stats
+
+    async def start(self):
+        if self.broadcaster.started:
+            return
+        self.backend = self.backend or get_search_backend()
+        await self.broadcaster.start()
+        if self.rebuild_interval > 0:
+            self._rebuild_task = asyncio.create_task(self._rebuild_loop())
+
+    async def stop(self):
+        if self._rebuild_task is not None:
+            self._rebuild_task.cancel()
+            try:
+                await self._rebuild_task
+            except asyncio.CancelledError:
+                pass
+            self._rebuild_task = None
+        await self.broadcaster.stop()
+
+    def publish(self, changes: Dict[int, ProductChange]):
+        """커밋된 변경 전파 (요청 처리 스레드에서 호출 가능, 시작 전이면 무시)
+
+        유실된 변경은 주기적 재구성으로 복구
+        """
+        self.broadcaster.publish({"changes": changes})
+
+    def _receive(self, message: dict):
+        changes = {
+            int(product_id): tuple(change) if change is not None else None
+            for product_id, change in message["changes"].items()
+        }
+        self.backend.apply(changes)
+
+    async def _rebuild_loop(self):
+        while True:
+            await asyncio.sleep(self.rebuild_interval)
+            try:
+                await asyncio.to_thread(self.backend.rebuild)
+            except Exception as e:
+                print(f"❌ Search index periodic rebuild failed: {e}")
+
+
+# 상품 변경 추적 (커밋된 변경만 색인에 반영)
+_CHANGES_KEY = "search_index_changes"
+_INDEXED_FIELDS = ("name", "category", "is_active")
+
+
+def _record_change(target: Product, deleted: bool = False):
+    session = inspect(target).session
+    if session is None:
+        return
+    change = None if deleted else (target.name, target.category, target.is_active is not False)
+    session.info.setdefault(_CHANGES_KEY, {})[target.product_id] = change
+
+
+@event.listens_for(Product, "after_insert")
+def _product_inserted(mapper, connection, target):
+    _record_change(target)
+
+
+@event.listens_for(Product, "after_update")
+def _product_updated(mapper, connection, target):
+    # 재고/가격만 바뀐 경우는 색인 갱신 불필요
+    attrs = inspect(target).attrs
+    if any(attrs[field].history.has_changes() for field in _INDEXED_FIELDS):
+        _record_change(target)
+
+
+@event.listens_for(Product, "after_delete")
+def _product_deleted(mapper, connection, target):
+    _record_change(target, deleted=True)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_product_changes(session):
+    changes = session.info.pop(_CHANGES_KEY, None)
+    if not changes:
+        return
+    try:
+        backend = get_search_backend()
+        backend.apply(changes)
+        if backend.name == "memory":
+            get_search_sync().publish(changes)
+    except Exception as e:
+        # 커밋은 이미 끝났으므로 색인 오류는 기록만 (재구성으로 복구)
+        print(f"❌ Search index update failed: {e}")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_product_changes(session):
+    session.info.pop(_CHANGES_KEY, None)
+
+
+# 프로세스별 검색 저장소/동기화 (처음 사용할 때 생성)
+_backend = None
+_sync: Optional[SearchIndexSync] = None
+
+
+def get_search_backend():
+    """설정(SEARCH_BACKEND)에 맞는 검색 저장소 반환"""
+    global _backend
+    if _backend is None:
+        _backend = PgTrgmSearchBackend() if settings.SEARCH_BACKEND == "pg_trgm" else InMemorySearchBackend()
+    return _backend
+
+
+def get_search_sync() -> SearchIndexSync:
+    """SearchIndexSync 인스턴스 반환"""
+    global _sync
+    if _sync is None:
+        _sync = SearchIndexSync()
+    return _sync
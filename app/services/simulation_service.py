@@ -0,0 +1,202 @@
+# app/services/simulation_service.py
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, List, Tuple
+
+import numpy as np
+
+from app.config import settings
+from app.schemas.simulation import SimulationRequest
+
+PERCENTILES = [5, 25, 50, 75, 95]
+
+# 최대 경로 x 기간 원소 수 (float32 기준 약 80MB)
+MAX_PATH_ELEMENTS = 20_000_000
+
+# 프로세스 풀 (처음 사용할 때 생성)
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# 파라미터 해시 기반 결과 캐시
+_cache: "OrderedDict[str, dict]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """시뮬레이션용 프로세스 풀 반환"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=settings.SIMULATION_MAX_WORKERS)
+        return _executor
+
+
+def shutdown_executor():
+    """프로세스 풀 종료 (앱 종료시)"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def _simulate_chunk(params: dict, seed_seq: np.random.SeedSequence, n_paths: int) -> Tuple[np.ndarray, np.ndarray]:
+    """경로 청크 하나를 벡터 연산으로 시뮬레이션 (프로세스 풀에서 실행)
+
+    반환값: (월별 평가금액 [n_paths, horizon+1], 경로별 최대 낙폭 [n_paths])
+    """
+    rng = np.random.default_rng(seed_seq)
+    weights = np.asarray(params["weights"], dtype=np.float64)
+    horizon = params["horizon_months"]
+
+    if params["method"] == "gbm":
+        dt = 1.0 / 12.0
+        mu = np.asarray(params["mu"], dtype=np.float64)
+        sigma = np.asarray(params["sigma"], dtype=np.float64)
+        chol = np.asarray(params["cholesky"], dtype=np.float64)
+
+        z = rng.standard_normal((n_paths, horizon, len(weights)))
+        z = z @ chol.T # 상관관계 반영
+        log_returns = (mu - 0.5 * sigma ** 2) * dt + sigma * np.sqrt(dt) * z
+        asset_returns = np.expm1(log_returns)
+    else:
+        history = np.asarray(params["history"], dtype=np.float64) # [T, n_assets]
+        idx = rng.integers(0, history.shape[0], size=(n_paths, horizon))
+        asset_returns = history[idx] # 같은 시점을 함께 뽑아 자산 간 상관관계 유지
+
+    # 매월 리밸런싱 가정
+    portfolio_returns = asset_returns @ weights
+    growth = np.cumprod(1.0 + portfolio_returns, axis=1)
+
+    values = np.empty((n_paths, horizon + 1), dtype=np.float32)
+    values[:, 0] = params["initial_amount"]
+    values[:, 1:] = params["initial_amount"] * growth
+
+    running_max = np.maximum.accumulate(values, axis=1)
+    drawdowns = 1.0 - values / running_max
+    return values, drawdowns.max(axis=1)
+
+
+class SimulationService:
+    """투자 시뮬레이션 비즈니스 로직 (몬테카를로)"""
+
+    def __init__(self,
+                 chunk_paths: Optional[int] = None,
+                 parallel_threshold: Optional[int] = None):
+        self.chunk_paths = chunk_paths or settings.SIMULATION_CHUNK_PATHS
+        self.parallel_threshold = parallel_threshold or settings.SIMULATION_PARALLEL_THRESHOLD
+
+    def run(self, request: SimulationRequest) -> dict:
+        """시뮬레이션 실행 (동일 파라미터는 캐시된 결과 반환)"""
+        if request.n_paths * (request.horizon_months + 1) > MAX_PATH_ELEMENTS:
+            raise ValueError("시뮬레이션 규모가 너무 큽니다 (경로 수 또는 기간을 줄여주세요)")
+
+        params = self._build_params(request)
+        key = self._param_hash(params, request.n_paths, request.seed, self.chunk_paths)
+
+        with _cache_lock:
+            cached = _cache.get(key)
+            if cached is not None:
+                _cache.move_to_end(key)
+                return {**cached, "cached": True}
+
+        values, max_drawdowns = self._simulate(params, request.n_paths, request.seed)
+        result = self._summarize(request, values, max_drawdowns)
+
+        with _cache_lock:
+            _cache[key] = result
+            _cache.move_to_end(key)
+            while len(_cache) > settings.SIMULATION_CACHE_SIZE:
+                _cache.popitem(last=False)
+
+        return {**result, "cached": False}
+
+    def _build_params(self, request: SimulationRequest) -> dict:
+        """요청을 워커 프로세스로 넘길 수 있는 단순 파라미터로 변환"""
+        weights = np.array([asset.weight for asset in request.assets], dtype=np.float64)
+        weights = weights / weights.sum()
+
+        params = {
+            "method": request.method,
+            "horizon_months": request.horizon_months,
+            "initial_amount": float(request.initial_amount),
+            "weights": weights.tolist(),
+        }
+
+        if request.method == "gbm":
+            n_assets = len(request.assets)
+            correlation = np.eye(n_assets) if request.correlation is None else np.asarray(request.correlation, dtype=np.float64)
+            if correlation.shape != (n_assets, n_assets):
+                raise ValueError("상관계수 행렬의 크기가 상품 수와 일치하지 않습니다")
+            try:
+                cholesky = np.linalg.cholesky(correlation)
+            except np.linalg.LinAlgError:
+                raise ValueError("상관계수 행렬이 양의 정부호가 아닙니다")
+
+            params["mu"] = [asset.expected_return for asset in request.assets]
+            params["sigma"] = [asset.volatility for asset in request.assets]
+            params["cholesky"] = cholesky.tolist()
+        else:
+            histories = [asset.historical_returns for asset in request.assets]
+            if any(not history for history in histories):
+                raise ValueError("bootstrap 방식은 모든 상품의 과거 수익률이 필요합니다")
+            if len({len(history) for history in histories}) != 1:
+                raise ValueError("모든 상품의 과거 수익률 길이가 같아야 합니다")
+            params["history"] = np.column_stack(histories).tolist()
+
+        return params
+
+    @staticmethod
+    def _param_hash(params: dict, n_paths: int, seed: int, chunk_paths: int) -> str:
+        """파라미터 해시 (메모이제이션 키, 청크 크기가 다르면 청크별 난수열이 달라 결과도 다름)"""
+        payload = json.dumps({"params": params, "n_paths": n_paths, "seed": seed, "chunk_paths": chunk_paths},
+                             sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _chunk_sizes(self, n_paths: int) -> List[int]:
+        """경로 수를 고정 크기 청크로 분할"""
+        sizes = [self.chunk_paths] * (n_paths // self.chunk_paths)
+        if n_paths % self.chunk_paths:
+            sizes.append(n_paths % self.chunk_paths)
+        return sizes
+
+    def _simulate(self, params: dict, n_paths: int, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+        """청크별 시드로 시뮬레이션 (워커 수와 무관하게 결과 동일)"""
+        sizes = self._chunk_sizes(n_paths)
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+        if n_paths >= self.parallel_threshold and len(sizes) > 1:
+            executor = _get_executor()
+            results = list(executor.map(_simulate_chunk, [params] * len(sizes), seeds, sizes))
+        else:
+            results = [_simulate_chunk(params, s, size) for s, size in zip(seeds, sizes)]
+
+        values = np.concatenate([r[0] for r in results], axis=0)
+        max_drawdowns = np.concatenate([r[1] for r in results])
+        return values, max_drawdowns
+
+    @staticmethod
+    def _summarize(request: SimulationRequest, values: np.ndarray, max_drawdowns: np.ndarray) -> dict:
+        """백분위 밴드 및 낙폭 통계 계산"""
+        bands = np.percentile(values, PERCENTILES, axis=0)
+        final_values = values[:, -1].astype(np.float64)
+
+        return {
+            "method": request.method,
+            "n_paths": request.n_paths,
+            "horizon_months": request.horizon_months,
+            "percentiles": PERCENTILES,
+            "bands": {f"p{p}": np.round(band, 2).tolist() for p, band in zip(PERCENTILES, bands)},
+            "final_mean": round(float(final_values.mean()), 2),
+            "final_median": round(float(np.median(final_values)), 2),
+            "probability_of_loss": round(float((final_values < request.initial_amount).mean()), 4),
+            "drawdown": {
+                "mean": round(float(max_drawdowns.mean()), 4),
+                "median": round(float(np.median(max_drawdowns)), 4),
+                "p95": round(float(np.percentile(max_drawdowns, 95)), 4),
+                "worst": round(float(max_drawdowns.max()), 4),
+            },
+        }
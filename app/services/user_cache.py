@@ -0,0 +1,76 @@
+# app/services/user_cache.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.config import settings
+from app.core.pubsub import Broadcaster
+
+
+class UserCache:
+    """사용자 조회용 프로젝션 캐시 (User.to_dict() 결과, 프로세스 메모리)"""
+
+    def __init__(self, ttl: Optional[float] = None, max_size: Optional[int] = None):
+        self.ttl = ttl if ttl is not None else settings.USER_CACHE_TTL
+        self.max_size = max_size or settings.USER_CACHE_SIZE
+        self._entries: "OrderedDict[int, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 다른 워커의 캐시에서도 제거 (시작 전이면 이 워커만)
+        self.broadcaster = Broadcaster("user_cache", lambda message: self.evict(message["user_ids"]))
+
+    def get(self, user_id: int) -> Optional[dict]:
+        found, _ = self.get_many([user_id])
+        return found.get(user_id)
+
+    def get_many(self, user_ids: Iterable[int]) -> Tuple[Dict[int, dict], List[int]]:
+        """캐시 조회 -> (찾은 항목, 없는 user_id 목록)"""
+        now = time.monotonic()
+        found: Dict[int, dict] = {}
+        missing: List[int] = []
+        with self._lock:
+            for user_id in user_ids:
+                entry = self._entries.get(user_id)
+                if entry is not None and entry[0] > now:
+                    found[user_id] = entry[1]
+                    self._entries.move_to_end(user_id)
+                else:
+                    missing.append(user_id)
+        return found, missing
+
+    def put_many(self, projections: Iterable[dict]):
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            for projection in projections:
+                self._entries[projection["user_id"]] = (expires_at, projection)
+                self._entries.move_to_end(projection["user_id"])
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_ids: Iterable[int]):
+        """사용자 정보 변경시 캐시 제거 (모든 워커)"""
+        user_ids = list(user_ids)
+        self.evict(user_ids)
+        self.broadcaster.publish({"user_ids": user_ids})
+
+    def evict(self, user_ids: Iterable[int]):
+        """이 워커의 캐시에서만 제거"""
+        with self._lock:
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# 프로세스별 캐시 (처음 사용할 때 생성)
+_user_cache: Optional[UserCache] = None
+
+
+def get_user_cache() -> UserCache:
+    """UserCache 인스턴스 반환"""
+    global _user_cache
+    if _user_cache is None:
+        _user_cache = UserCache()
+    return _user_cache
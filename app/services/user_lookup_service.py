@@ -0,0 +1,164 @@
+# app/services/user_lookup_service.py
+import asyncio
+import json
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import Integer, String, and_, any_, bindparam, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models import User
+from app.services.encryption_service import get_encryptor
+from app.services.user_cache import get_user_cache
+from app.utils.auth import format_phone_number
+
+
+def _any(db: Session, column, keys: list, item_type):
+    """column = ANY(:keys) (PostgreSQL은 배열 파라미터 1개라 키 수와 무관하게 같은 쿼리, 그 외 DB는 IN)"""
+    if db.get_bind().dialect.name == "postgresql":
+        return column == any_(bindparam(None, keys, type_=ARRAY(item_type)))
+    return column.in_(keys)
+
+
+class UserLookupService:
+    """여러 사용자 일괄 조회 (캐시 우선, 없는 사용자만 쿼리 1번)"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.cache = get_user_cache()
+
+    def get_many(self, user_ids: Iterable[int]) -> Dict[int, dict]:
+        """user_id -> 사용자 정보 (없는 사용자는 결과에서 빠짐)"""
+        found, missing = self.cache.get_many(dict.fromkeys(user_ids))
+        for projections in self.load(missing):
+            found.update((projection["user_id"], projection) for projection in projections)
+        return found
+
+    def load(self, user_ids: List[int]) -> Iterator[List[dict]]:
+        """DB에서 읽어 배치 단위로 일괄 복호화 -> 캐시 저장 후 반환"""
+        if not user_ids:
+            return
+        result = self.db.execute(
+            select(User)
+            .where(_any(self.db, User.user_id, user_ids, Integer))
+            .execution_options(yield_per=settings.USER_LOOKUP_BATCH)
+        )
+        for users in result.scalars().partitions():
+            projections = [user.to_dict() for user in User.decrypt_all(users)]
+            self.cache.put_many(projections)
+            for user in users:
+                self.db.expunge(user)
+            yield projections
+
+    def resolve_phones(self, phone_numbers: Iterable[str]) -> Dict[str, int]:
+        """핸드폰 번호 -> user_id (blind index 컬럼만 읽음, 사용자 정보는 user_id로 캐시에서)
+
+        마이그레이션 전 phone_hash가 NULL인 행은 평문 번호로 비교
+        """
+        encryptor = get_encryptor()
+        phones_by_hash: Dict[str, List[str]] = {}
+        phones_by_plain: Dict[str, List[str]] = {}
+        for phone_number in phone_numbers:
+            phones_by_hash.setdefault(encryptor.blind_index(phone_number), []).append(phone_number)
+            phones_by_plain.setdefault(format_phone_number(phone_number), []).append(phone_number)
+        if not phones_by_hash:
+            return {}
+        rows = self.db.query(User.user_id, User.phone_hash, User.phone_number_encrypted).filter(or_(
+            _any(self.db, User.phone_hash, list(phones_by_hash), String),
+            and_(User.phone_hash.is_(None), _any(self.db, User.phone_number_encrypted, list(phones_by_plain), String)),
+        )).all()
+        return {
+            phone_number: row.user_id
+            for row in rows
+            for phone_number in (phones_by_hash[row.phone_hash] if row.phone_hash
+                                 else phones_by_plain[row.phone_number_encrypted])
+        }
+
+
+def stream_user_lookup(user_ids: List[int],
+                       phone_numbers: List[str],
+                       session_factory: Callable[[], Session] = SessionLocal) -> Iterator[str]:
+    """일괄 조회 JSON 응답 ({"users": [...], "not_found": {...}})을 배치 단위로 생성
+
+    캐시에 있는 사용자를 먼저 보내고, 나머지는 DB에서 읽는 대로 이어서 보냄 (순서는 요청과 다를 수 있음)
+    """
+    db = session_factory()
+    try:
+        service = UserLookupService(db)
+        phone_user_ids = service.resolve_phones(phone_numbers) if phone_numbers else {}
+        cached, missing = service.cache.get_many(dict.fromkeys([*user_ids, *phone_user_ids.values()]))
+        found = set(cached)
+
+        yield '{"users":['
+        separator = ""
+        if cached:
+            yield json.dumps(list(cached.values()), ensure_ascii=False)[1:-1]
+            separator = ","
+        for projections in service.load(missing):
+            found.update(projection["user_id"] for projection in projections)
+            yield separator + json.dumps(projections, ensure_ascii=False)[1:-1]
+            separator = ","
+        not_found = {
+            "user_ids": [user_id for user_id in dict.fromkeys(user_ids) if user_id not in found],
+            "phone_numbers": [phone_number for phone_number in phone_numbers if phone_number not in phone_user_ids],
+        }
+        yield '],"not_found":' + json.dumps(not_found, ensure_ascii=False) + "}"
+    finally:
+        db.close()
+
+
+class UserLoader:
+    """요청 범위 사용자 조회 배처 (DataLoader 방식)
+
+    같은 이벤트 루프 틱에 들어온 load() 호출을 모아 get_many 1번으로 처리하고,
+    요청 안에서 이미 조회한 사용자는 다시 조회하지 않음
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.batches = 0
+        self._results: Dict[int, Optional[dict]] = {}
+        self._pending: Dict[int, List[asyncio.Future]] = {}
+        self._lock = asyncio.Lock() # 세션은 스레드 하나에서만 사용
+        self._tasks = set()
+
+    async def load(self, user_id: int) -> Optional[dict]:
+        """사용자 정보 (없으면 None)"""
+        if user_id in self._results:
+            return self._results[user_id]
+        loop = asyncio.get_running_loop()
+        if not self._pending:
+            # 지금 실행 대기 중인 다른 태스크들의 load()까지 모인 뒤에 조회
+            loop.call_soon(self._schedule)
+        future = loop.create_future()
+        self._pending.setdefault(user_id, []).append(future)
+        return await future
+
+    async def load_many(self, user_ids: Iterable[int]) -> List[Optional[dict]]:
+        return list(await asyncio.gather(*(self.load(user_id) for user_id in user_ids)))
+
+    def _schedule(self):
+        task = asyncio.ensure_future(self._dispatch())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self):
+        pending, self._pending = self._pending, {}
+        try:
+            async with self._lock:
+                found = await run_in_threadpool(UserLookupService(self.db).get_many, list(pending))
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        self.batches += 1
+        for user_id, futures in pending.items():
+            self._results[user_id] = found.get(user_id)
+            for future in futures:
+                if not future.done():
+                    future.set_result(self._results[user_id])
@@ -9,6 +9,7 @@ from .auth import (
     format_phone_number,
     mask_phone_number
 )
+from .email import EmailSender, get_email_sender, render_email, send_template_email
 
 __all__ = [
     "hash_password",
@@ -18,5 +19,9 @@ __all__ = [
     "generate_verification_code",
     "send_sms",
     "format_phone_number",
-    "mask_phone_number"
+    "mask_phone_number",
+    "EmailSender",
+    "get_email_sender",
+    "render_email",
+    "send_template_email"
 ]
\ No newline at end of file
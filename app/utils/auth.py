@@ -8,6 +8,8 @@ from typing import Optional
 import os
 from dotenv import load_dotenv
 
+from app.core.profiling import span
+
 load_dotenv()
 
 SECRET_KEY = os.getenv("SECRET_KEY", "faank-secret-key")
@@ -17,11 +19,13 @@ ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
 # 비밀번호 관련
 def hash_password(password: str) -> str:
     """비밀번호 설정"""
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    with span("hash"):
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+    with span("hash"):
+        return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
 
 # JWT 토큰 관련
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -35,13 +39,15 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
     to_encode.update({"exp": expire})
 
-    encode_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    with span("jwt"):
+        encode_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encode_jwt
 
 def verify_token(token: str) -> Optional[dict]:
     """JWT 토큰 검증"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        with span("jwt"):
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         return payload
     except jwt.ExpiredSignatureError: # 토큰 만료
         return None
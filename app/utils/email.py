@@ -0,0 +1,371 @@
+# app/utils/email.py
+import heapq
+import html
+import queue
+import random
+import re
+import smtplib
+import socket
+import ssl
+import threading
+import time
+from email.message import EmailMessage
+from email.utils import formatdate, getaddresses, make_msgid, parseaddr
+from string import Formatter
+from typing import Dict, List, Optional, Tuple
+
+from app.config import settings
+
+_DOT_AT_LINE_START = re.compile(rb"(?m)^\.")
+_BARE_NEWLINE = re.compile(rb"(?:\r\n|\n|\r(?!\n))")
+
+
+class CompiledTemplate:
+    """미리 파싱해 둔 문자열 템플릿 ({name} 치환, 렌더링시 재파싱 없음)"""
+
+    def __init__(self, source: str, escape_html: bool = False):
+        self.escape_html = escape_html
+        # (리터럴, 필드명) 목록으로 한 번만 파싱
+        self.parts: List[Tuple[str, Optional[str]]] = [
+            (literal, field) for literal, field, _, _ in Formatter().parse(source)
+        ]
+        self.fields = {field for _, field in self.parts if field}
+
+    def render(self, context: dict) -> str:
+        missing = self.fields - context.keys()
+        if missing:
+            raise KeyError(f"템플릿 값이 없습니다: {', '.join(sorted(missing))}")
+        out = []
+        for literal, field in self.parts:
+            out.append(literal)
+            if field:
+                value = str(context[field])
+                out.append(html.escape(value) if self.escape_html else value)
+        return "".join(out)
+
+
+# 메일 템플릿 (이름 -> 제목, 본문, HTML 본문)
+EMAIL_TEMPLATES = {
+    "order_confirmation": (
+        "[Faank] 주문이 완료되었습니다 (주문번호 {order_id})",
+        "{user_name}님, 주문해주셔서 감사합니다.\n\n주문번호: {order_id}\n결제금액: {amount}원\n\nFaank 드림",
+        "<p>{user_name}님, 주문해주셔서 감사합니다.</p><p>주문번호: <b>{order_id}</b><br>결제금액: {amount}원</p><p>Faank 드림</p>",
+    ),
+    "kyc_notice": (
+        "[Faank] 본인확인(KYC) 결과 안내",
+        "{user_name}님의 본인확인 상태가 '{kyc_status}'(으)로 변경되었습니다.\n\n{message}\n\nFaank 드림",
+        "<p>{user_name}님의 본인확인 상태가 <b>{kyc_status}</b>(으)로 변경되었습니다.</p><p>{message}</p><p>Faank 드림</p>",
+    ),
+}
+
+# 앱 시작시 한 번 컴파일
+_compiled_templates: Dict[str, Tuple[CompiledTemplate, CompiledTemplate, CompiledTemplate]] = {
+    name: (CompiledTemplate(subject), CompiledTemplate(text), CompiledTemplate(body_html, escape_html=True))
+    for name, (subject, text, body_html) in EMAIL_TEMPLATES.items()
+}
+
+
+def render_email(template_name: str, to: str, context: dict, sender: Optional[str] = None) -> EmailMessage:
+    """템플릿으로 메일 메시지 생성"""
+    if template_name not in _compiled_templates:
+        raise KeyError(f"등록되지 않은 메일 템플릿입니다: {template_name}")
+    subject, text, body_html = _compiled_templates[template_name]
+
+    message = EmailMessage()
+    message["From"] = sender or settings.EMAIL_FROM
+    message["To"] = to
+    message["Subject"] = subject.render(context)
+    message["Date"] = formatdate(localtime=True)
+    message["Message-ID"] = make_msgid(domain="faank")
+    message.set_content(text.render(context))
+    message.add_alternative(body_html.render(context), subtype="html")
+    return message
+
+
+class TransientEmailError(Exception):
+    """재시도 가능한 발송 오류 (4xx, 연결 끊김 등)"""
+
+
+class PermanentEmailError(Exception):
+    """재시도해도 실패할 발송 오류 (5xx)"""
+
+
+class PooledSMTPConnection:
+    """로그인된 상태로 재사용하는 SMTP 연결 1개 (PIPELINING 지원시 명령 묶음 전송)"""
+
+    def __init__(self, host: str, port: int, username: Optional[str], password: Optional[str],
+                 use_tls: bool, timeout: float = 30.0):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.smtp: Optional[smtplib.SMTP] = None
+        self.last_used = 0.0
+        self.sent = 0
+
+    def connect(self):
+        self.close()
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        smtp.ehlo()
+        if self.use_tls and smtp.has_extn("starttls"):
+            smtp.starttls(context=ssl.create_default_context())
+            smtp.ehlo()
+        if self.username and self.password:
+            smtp.login(self.username, self.password)
+        # 명령을 직접 묶어서 보내므로 Nagle 지연 불필요
+        smtp.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.smtp = smtp
+        self.last_used = time.monotonic()
+
+    def ensure(self, idle_check_seconds: float = 60.0):
+        """연결이 없거나 오래 쉬었다면 확인 후 재연결"""
+        if self.smtp is None:
+            self.connect()
+            return
+        if time.monotonic() - self.last_used > idle_check_seconds:
+            try:
+                code, _ = self.smtp.noop()
+                if code != 250:
+                    self.connect()
+            except smtplib.SMTPException:
+                self.connect()
+            except OSError:
+                self.connect()
+
+    def close(self):
+        if self.smtp is not None:
+            try:
+                self.smtp.quit()
+            except Exception:
+                pass
+            self.smtp = None
+
+    def send(self, message: EmailMessage) -> Dict[str, Tuple[int, bytes]]:
+        """메시지 1건 발송 후 거부된 수신자 반환 (전원 거부시 TransientEmailError / PermanentEmailError)"""
+        # 봉투 주소는 표시 이름을 뺀 주소만 ("Faank <no-reply@faank.com>" -> no-reply@faank.com)
+        sender = parseaddr(str(message["From"]))[1]
+        recipients = [address for _, address in getaddresses([str(message["To"])]) if address]
+        data = message.as_bytes()
+        try:
+            if self.smtp.has_extn("pipelining"):
+                refused = self._send_pipelined(sender, recipients, data)
+            else:
+                refused = self.smtp.sendmail(sender, recipients, data)
+        except smtplib.SMTPResponseException as e:
+            self._reset()
+            if 400 <= e.smtp_code < 500:
+                raise TransientEmailError(f"{e.smtp_code} {e.smtp_error!r}")
+            raise PermanentEmailError(f"{e.smtp_code} {e.smtp_error!r}")
+        except smtplib.SMTPRecipientsRefused as e:
+            self._reset()
+            codes = [code for code, _ in e.recipients.values()]
+            if any(400 <= code < 500 for code in codes):
+                raise TransientEmailError(f"수신자 거부: {e.recipients}")
+            raise PermanentEmailError(f"수신자 거부: {e.recipients}")
+        except (smtplib.SMTPServerDisconnected, OSError) as e:
+            self.smtp = None
+            raise TransientEmailError(str(e))
+        self.last_used = time.monotonic()
+        self.sent += 1
+        return refused
+
+    def _send_pipelined(self, sender: str, recipients: List[str], data: bytes) -> Dict[str, Tuple[int, bytes]]:
+        """MAIL/RCPT/DATA를 한 번에 보내고 응답을 모아서 확인 (RFC 2920)"""
+        commands = [f"MAIL FROM:<{sender}>"] + [f"RCPT TO:<{r}>" for r in recipients] + ["DATA"]
+        self.smtp.send("".join(command + "\r\n" for command in commands))
+        replies = [self.smtp.getreply() for _ in commands]
+
+        mail_code, mail_message = replies[0]
+        if mail_code != 250:
+            raise smtplib.SMTPSenderRefused(mail_code, mail_message, sender)
+
+        refused = {
+            recipient: reply
+            for recipient, reply in zip(recipients, replies[1:-1])
+            if reply[0] not in (250, 251)
+        }
+        data_code, data_message = replies[-1]
+        if len(refused) == len(recipients):
+            if data_code == 354:
+                # 수신자가 없어도 DATA를 받아들인 서버는 빈 본문으로 끝내야 다음 명령을 받음
+                self.smtp.send(b".\r\n")
+                self.smtp.getreply()
+            raise smtplib.SMTPRecipientsRefused(refused)
+        if data_code != 354:
+            raise smtplib.SMTPDataError(data_code, data_message)
+
+        body = _DOT_AT_LINE_START.sub(b"..", _BARE_NEWLINE.sub(b"\r\n", data))
+        if not body.endswith(b"\r\n"):
+            body += b"\r\n"
+        self.smtp.send(body + b".\r\n")
+        code, response = self.smtp.getreply()
+        if code != 250:
+            raise smtplib.SMTPDataError(code, response)
+        return refused
+
+    def _reset(self):
+        """실패한 트랜잭션 정리 (연결은 유지)"""
+        try:
+            self.smtp.rset()
+        except Exception:
+            self.smtp = None
+
+
+class EmailSender:
+    """백그라운드 메일 발송기 (연결 풀 + 배치 + 재시도)"""
+
+    def __init__(self,
+                 host: Optional[str] = None,
+                 port: Optional[int] = None,
+                 username: Optional[str] = None,
+                 password: Optional[str] = None,
+                 use_tls: Optional[bool] = None,
+                 pool_size: Optional[int] = None,
+                 batch_size: Optional[int] = None,
+                 max_retries: Optional[int] = None,
+                 retry_base_delay: Optional[float] = None):
+        self.host = host or settings.SMTP_SERVER
+        self.port = port or settings.SMTP_PORT or 587
+        self.username = username if username is not None else settings.SMTP_USERNAME
+        self.password = password if password is not None else settings.SMTP_PASSWORD
+        self.use_tls = settings.SMTP_USE_TLS if use_tls is None else use_tls
+        self.pool_size = pool_size or settings.EMAIL_POOL_SIZE
+        self.batch_size = batch_size or settings.EMAIL_BATCH_SIZE
+        self.max_retries = max_retries if max_retries is not None else settings.EMAIL_MAX_RETRIES
+        self.retry_base_delay = retry_base_delay if retry_base_delay is not None else settings.EMAIL_RETRY_BASE_DELAY
+
+        self.stats = {"sent": 0, "retried": 0, "failed": 0, "refused": 0} # refused: 일부 거부된 수신자 수
+        self._queue: "queue.Queue[Tuple[EmailMessage, int]]" = queue.Queue()
+        self._retry_heap: List[Tuple[float, int, EmailMessage, int]] = []
+        self._retry_lock = threading.Lock()
+        self._retry_counter = 0
+        self._workers: List[threading.Thread] = []
+        self._stopping = threading.Event()
+        self._stats_lock = threading.Lock()
+
+    # 발송 요청 (요청 처리 경로에서 호출, 즉시 반환)
+    def enqueue(self, message: EmailMessage):
+        self._queue.put((message, 0))
+
+    def send_template(self, to: str, template_name: str, context: dict):
+        """템플릿 메일 발송 예약"""
+        self.enqueue(render_email(template_name, to, context))
+
+    # 워커 관리
+    def start(self):
+        if self._workers:
+            return
+        if not self.host:
+            raise ValueError("SMTP_SERVER가 설정되지 않았습니다")
+        self._stopping.clear()
+        for i in range(self.pool_size):
+            worker = threading.Thread(target=self._worker_loop, name=f"email-worker-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def stop(self, timeout: float = 10.0):
+        """남은 메일을 최대 timeout초 동안 보낸 뒤 종료"""
+        deadline = time.monotonic() + timeout
+        while self.pending() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self._stopping.set()
+        for worker in self._workers:
+            worker.join(max(0.0, deadline - time.monotonic()) + 1.0)
+        self._workers = []
+
+    def pending(self) -> int:
+        with self._retry_lock:
+            return self._queue.qsize() + len(self._retry_heap)
+
+    def _next_batch(self) -> List[Tuple[EmailMessage, int]]:
+        """재시도 시각이 된 메일 우선, 그다음 큐에서 최대 batch_size개"""
+        batch = []
+        now = time.monotonic()
+        with self._retry_lock:
+            while self._retry_heap and self._retry_heap[0][0] <= now and len(batch) < self.batch_size:
+                _, _, message, attempt = heapq.heappop(self._retry_heap)
+                batch.append((message, attempt))
+            next_retry = self._retry_heap[0][0] - now if self._retry_heap else 0.5
+
+        if not batch:
+            try:
+                batch.append(self._queue.get(timeout=max(0.01, min(0.5, next_retry))))
+            except queue.Empty:
+                return batch
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _schedule_retry(self, message: EmailMessage, attempt: int, error: Exception):
+        if attempt >= self.max_retries:
+            self._count("failed")
+            print(f"❌ Email delivery failed after {attempt} attempts ({message['To']}): {error}")
+            return
+        # 지수 백오프 + 지터
+        delay = self.retry_base_delay * (2 ** attempt) * (0.5 + random.random())
+        with self._retry_lock:
+            self._retry_counter += 1
+            heapq.heappush(self._retry_heap, (time.monotonic() + delay, self._retry_counter, message, attempt + 1))
+        self._count("retried")
+
+    def _count(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _worker_loop(self):
+        """워커 1개 = SMTP 연결 1개 (배치 단위로 같은 연결에서 연속 발송)"""
+        connection = PooledSMTPConnection(self.host, self.port, self.username, self.password, self.use_tls)
+        try:
+            while not self._stopping.is_set():
+                batch = self._next_batch()
+                if not batch:
+                    continue
+                try:
+                    connection.ensure()
+                except Exception as e:
+                    for message, attempt in batch:
+                        self._schedule_retry(message, attempt, e)
+                    continue
+
+                for index, (message, attempt) in enumerate(batch):
+                    try:
+                        if connection.smtp is None:
+                            connection.connect()
+                        refused = connection.send(message)
+                        self._count("sent")
+                        if refused:
+                            # 나머지 수신자에게는 전달됨 (거부된 주소는 재시도해도 같은 결과라 기록만)
+                            self._count("refused", len(refused))
+                            print(f"❌ Email recipients refused ({message['To']}): {refused}")
+                    except PermanentEmailError as e:
+                        self._count("failed")
+                        print(f"❌ Email rejected ({message['To']}): {e}")
+                    except Exception as e:
+                        self._schedule_retry(message, attempt, e)
+        finally:
+            connection.close()
+
+
+# 프로세스별 발송기 (처음 사용할 때 생성)
+_sender: Optional[EmailSender] = None
+
+
+def get_email_sender() -> EmailSender:
+    """EmailSender 인스턴스 반환"""
+    global _sender
+    if _sender is None:
+        _sender = EmailSender()
+    return _sender
+
+
+def send_template_email(to: Optional[str], template_name: str, context: dict) -> bool:
+    """템플릿 메일 발송 예약 (SMTP 미설정이거나 받는 주소가 없으면 건너뜀)"""
+    if not settings.SMTP_SERVER or not to:
+        return False
+    get_email_sender().send_template(to, template_name, context)
+    return True
@@ -0,0 +1,252 @@
+# app/utils/file_handler.py
+import hashlib
+import os
+import threading
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import AsyncIterator, Dict, Optional
+
+import aiofiles
+import aiofiles.os
+from fastapi import HTTPException, status
+
+from app.config import settings
+
+# 변형 이미지 종류 (이름 접미사, 포맷)
+VARIANTS = {
+    "thumbnail": ("_thumbnail.jpg", "JPEG"),
+    "medium": ("_medium.jpg", "JPEG"),
+    "webp": (".webp", "WEBP"),
+}
+
+# 확장자 정규화 (같은 내용은 같은 이름으로 저장)
+_EXTENSION_ALIASES = {"jpeg": "jpg"}
+
+# 이미지 리사이즈용 프로세스 풀 (처음 사용할 때 생성)
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# 처리 중인 변형 작업 (같은 파일 중복 처리 방지)
+_pending: Dict[str, Future] = {}
+_pending_lock = threading.Lock()
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """이미지 처리용 프로세스 풀 반환"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=settings.IMAGE_WORKERS)
+        return _executor
+
+
+def shutdown_executor():
+    """프로세스 풀 종료 (앱 종료시)"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def normalize_extension(filename: str) -> str:
+    """파일명에서 확장자 추출 및 검증"""
+    ext = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ""
+    if ext not in settings.ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"허용되지 않는 파일 형식입니다 ({', '.join(sorted(settings.ALLOWED_EXTENSIONS))})"
+        )
+    return _EXTENSION_ALIASES.get(ext, ext)
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    """파일 앞부분(매직 넘버)으로 이미지 형식 판별 (디코딩 없음)"""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+def _shard_dir(digest: str) -> str:
+    """해시 앞 2자리로 디렉터리 분산"""
+    return os.path.join(settings.UPLOAD_DIR, digest[:2])
+
+
+def original_path(digest: str, ext: str) -> str:
+    """원본 파일 경로"""
+    return os.path.join(_shard_dir(digest), f"{digest}.{ext}")
+
+
+def variant_path(digest: str, variant: str) -> str:
+    """변형 이미지 파일 경로"""
+    suffix, _ = VARIANTS[variant]
+    return os.path.join(_shard_dir(digest), f"{digest}{suffix}")
+
+
+def path_to_url(path: str) -> str:
+    """디스크 경로를 /static URL로 변환"""
+    return "/" + path.replace(os.sep, "/")
+
+
+def variant_urls(digest: str) -> Dict[str, str]:
+    """변형 이미지 URL 목록"""
+    return {variant: path_to_url(variant_path(digest, variant)) for variant in VARIANTS}
+
+
+def variants_ready(digest: str) -> bool:
+    """모든 변형 이미지가 생성되었는지 확인"""
+    return all(os.path.exists(variant_path(digest, variant)) for variant in VARIANTS)
+
+
+async def save_upload_stream(chunks: AsyncIterator[bytes], ext: str) -> dict:
+    """요청 본문을 청크 단위로 디스크에 저장 (내용 해시로 파일명 결정, 중복 저장 방지)"""
+    tmp_dir = os.path.join(settings.UPLOAD_DIR, "tmp")
+    await aiofiles.os.makedirs(tmp_dir, exist_ok=True)
+    tmp_path = os.path.join(tmp_dir, f"{uuid.uuid4().hex}.part")
+
+    hasher = hashlib.sha256()
+    size = 0
+    head = b""
+    buffer = bytearray()
+
+    try:
+        async with aiofiles.open(tmp_path, "wb") as f:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                size += len(chunk)
+                # 크기 제한 초과시 즉시 중단 (나머지 본문은 읽지 않음)
+                if size > settings.MAX_FILE_SIZE:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"파일 크기는 {settings.MAX_FILE_SIZE // (1024 * 1024)}MB를 초과할 수 없습니다"
+                    )
+                if len(head) < 16:
+                    head += chunk[:16 - len(head)]
+                hasher.update(chunk)
+                buffer += chunk
+                if len(buffer) >= settings.UPLOAD_CHUNK_SIZE:
+                    await f.write(bytes(buffer))
+                    buffer.clear()
+            if buffer:
+                await f.write(bytes(buffer))
+
+        if size == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="빈 파일은 업로드할 수 없습니다"
+            )
+
+        detected = sniff_image_type(head)
+        if detected is None or detected != ext:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="파일 내용이 확장자와 일치하지 않습니다"
+            )
+
+        digest = hasher.hexdigest()
+        final_path = original_path(digest, ext)
+        duplicate = await aiofiles.os.path.exists(final_path)
+
+        if duplicate:
+            await aiofiles.os.remove(tmp_path)
+        else:
+            await aiofiles.os.makedirs(os.path.dirname(final_path), exist_ok=True)
+            await aiofiles.os.replace(tmp_path, final_path)
+
+        return {
+            "digest": digest,
+            "path": final_path,
+            "size": size,
+            "duplicate": duplicate,
+        }
+    except BaseException:
+        if await aiofiles.os.path.exists(tmp_path):
+            await aiofiles.os.remove(tmp_path)
+        raise
+
+
+def _decode_image(src_path: str, draft_size: Optional[int] = None):
+    """이미지 디코딩 -> (투명도 유지 RGBA 또는 None, 흰 배경 RGB)
+
+    draft_size를 주면 JPEG는 그 크기 근처로 축소 디코딩 (축소 변형 전용)
+    """
+    from PIL import Image
+
+    with Image.open(src_path) as img:
+        if draft_size:
+            img.draft("RGB", (draft_size, draft_size))
+        img.load()
+        if img.mode in ("RGBA", "LA", "P"):
+            rgba = img.convert("RGBA")
+            flattened = Image.new("RGB", rgba.size, (255, 255, 255))
+            flattened.paste(rgba, mask=rgba.split()[-1])
+            return rgba, flattened
+        return None, img.convert("RGB")
+
+
+def _generate_variants(src_path: str, targets: Dict[str, str], thumbnail_size: int, medium_size: int) -> Dict[str, str]:
+    """썸네일/중간/WebP 변형 이미지 생성 (프로세스 풀에서 실행)"""
+    from PIL import Image
+
+    sizes = {"thumbnail": thumbnail_size, "medium": medium_size}
+
+    # 축소 변형은 축소 디코딩으로 속도 향상, WebP(원본 대체본)는 원본 해상도로 디코딩
+    resized_source = _decode_image(src_path, medium_size)[1] if sizes.keys() & targets.keys() else None
+    full_source = None
+    for variant, target in targets.items():
+        tmp_target = f"{target}.{os.getpid()}.tmp"
+        _, fmt = VARIANTS[variant]
+        if variant in sizes:
+            resized = resized_source.copy()
+            resized.thumbnail((sizes[variant], sizes[variant]), Image.LANCZOS)
+            resized.save(tmp_target, fmt, quality=85, optimize=True)
+        else:
+            if full_source is None:
+                rgba, flattened = _decode_image(src_path)
+                full_source = rgba or flattened
+            full_source.save(tmp_target, fmt, quality=80, method=4)
+        os.replace(tmp_target, target)
+
+    return targets
+
+
+def _on_variants_done(digest: str, future: Future):
+    """변형 작업 완료 콜백"""
+    with _pending_lock:
+        _pending.pop(digest, None)
+    error = future.exception() if not future.cancelled() else None
+    if error:
+        print(f"❌ Image variant generation failed ({digest}): {error}")
+
+
+def schedule_variants(digest: str, src_path: str) -> Optional[Future]:
+    """변형 이미지 생성을 프로세스 풀에 등록 (요청 처리와 분리)"""
+    targets = {
+        variant: variant_path(digest, variant)
+        for variant in VARIANTS
+        if not os.path.exists(variant_path(digest, variant))
+    }
+    if not targets:
+        return None
+
+    with _pending_lock:
+        if digest in _pending:
+            return _pending[digest]
+        future = _get_executor().submit(
+            _generate_variants,
+            src_path,
+            targets,
+            settings.IMAGE_THUMBNAIL_SIZE,
+            settings.IMAGE_MEDIUM_SIZE,
+        )
+        _pending[digest] = future
+
+    future.add_done_callback(lambda f: _on_variants_done(digest, f))
+    return future
@@ -0,0 +1,77 @@
+# app/utils/hangul.py
+import re
+import unicodedata
+from typing import List, Set
+
+# 한글 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+             "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+# 입력 중에는 겹모음/겹받침이 나눠서 들어오므로 (고 -> 과, 달 -> 닭) 자모 단위로 분리
+_SPLIT_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+# 한글/영문/숫자/호환 자모 이외 문자는 구분자로 취급
+_SEPARATOR = re.compile(r"[^0-9a-z가-힣ㄱ-ㅣ]+")
+
+
+def normalize(text: str) -> str:
+    """검색용 정규화 (NFC, 소문자, 기호 -> 공백)"""
+    # NFKC는 호환 자모(ㄱ)를 조합형 자모로 바꾸므로 NFC 사용
+    text = unicodedata.normalize("NFC", text or "").lower()
+    return _SEPARATOR.sub(" ", text).strip()
+
+
+def words(text: str) -> List[str]:
+    return normalize(text).split()
+
+
+def choseong(word: str) -> str:
+    """초성 추출 (제주감귤 -> ㅈㅈㄱㄱ, 한글이 아닌 문자는 그대로)"""
+    result = []
+    for char in word:
+        code = ord(char)
+        if _SYLLABLE_BASE <= code <= _SYLLABLE_LAST:
+            result.append(CHOSEONG[(code - _SYLLABLE_BASE) // 588])
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def is_choseong_only(word: str) -> bool:
+    return bool(word) and all(char in CHOSEONG for char in word)
+
+
+def decompose(word: str) -> str:
+    """자모 단위 분해 (감귤 -> ㄱㅏㅁㄱㅠㄹ, 입력 중인 '감ㄱ'도 접두어로 비교 가능)"""
+    result = []
+    for char in word:
+        code = ord(char)
+        if _SYLLABLE_BASE <= code <= _SYLLABLE_LAST:
+            index = code - _SYLLABLE_BASE
+            jamo = CHOSEONG[index // 588] + JUNGSEONG[(index % 588) // 28] + JONGSEONG[index % 28]
+        else:
+            jamo = char
+        for part in jamo:
+            result.append(_SPLIT_JAMO.get(part, part))
+    return "".join(result)
+
+
+def ngrams(word: str) -> Set[str]:
+    """검색어 토큰 (2글자 이상이면 bigram, 1글자면 그대로)"""
+    if len(word) < 2:
+        return {word} if word else set()
+    return {word[i:i + 2] for i in range(len(word) - 1)}
+
+
+def index_tokens(word: str) -> Set[str]:
+    """색인 토큰 (unigram + bigram, 한 글자 검색어(귤, 쌀)도 찾을 수 있도록)"""
+    return set(word) | ngrams(word)
@@ -0,0 +1,164 @@
+# app/utils/smtp_sink.py
+# 로컬 개발/테스트용 SMTP 수신 서버 (메일을 보내지 않고 메모리에 보관)
+import socket
+import socketserver
+import sys
+import threading
+import time
+from typing import Iterable, List, Optional
+
+
+class _SinkHandler(socketserver.StreamRequestHandler):
+    """SMTP 세션 1개 처리 (EHLO, AUTH PLAIN/LOGIN, PIPELINING 지원)"""
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def reply(self, line: str):
+        self.wfile.write((line + "\r\n").encode("utf-8"))
+
+    def handle(self):
+        sink: "SMTPSinkServer" = self.server.sink
+        sink.connections += 1
+        self.reply("220 faank-sink ESMTP")
+        sender, recipients, attempted = None, [], 0
+
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            line = raw.decode("utf-8", "replace").rstrip("\r\n")
+            command = line[:4].upper()
+
+            if command in ("EHLO", "HELO"):
+                if command == "EHLO":
+                    self.reply("250-faank-sink")
+                    self.reply("250-PIPELINING")
+                    self.reply("250-8BITMIME")
+                    self.reply("250 AUTH PLAIN LOGIN")
+                else:
+                    self.reply("250 faank-sink")
+            elif command == "AUTH":
+                if line.upper().startswith("AUTH LOGIN"):
+                    self.reply("334 VXNlcm5hbWU6")
+                    self.rfile.readline()
+                    self.reply("334 UGFzc3dvcmQ6")
+                    self.rfile.readline()
+                sink.logins += 1
+                self.reply("235 2.7.0 Authentication successful")
+            elif command == "MAIL":
+                sender, recipients, attempted = line[10:].strip(" <>"), [], 0
+                self.reply("250 OK")
+            elif command == "RCPT":
+                recipient = line[8:].strip(" <>")
+                attempted += 1
+                if recipient in sink.refuse:
+                    self.reply("550 5.1.1 No such user")
+                    continue
+                recipients.append(recipient)
+                self.reply("250 OK")
+            elif command == "DATA":
+                if not attempted:
+                    self.reply("503 No valid recipients")
+                    continue
+                # PIPELINING 서버처럼 RCPT가 모두 거부돼도 DATA는 받은 뒤 554로 거절
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                while True:
+                    data_line = self.rfile.readline()
+                    if not data_line or data_line in (b".\r\n", b".\n"):
+                        break
+                    if data_line.startswith(b".."):
+                        data_line = data_line[1:]
+                    lines.append(data_line)
+                if not recipients:
+                    self.reply("554 5.5.1 No valid recipients")
+                elif sink.take_failure():
+                    self.reply("451 4.3.0 Temporary failure (sink)")
+                else:
+                    sink.store(sender, recipients, b"".join(lines))
+                    self.reply("250 OK queued")
+                sender, recipients, attempted = None, [], 0
+            elif command == "RSET":
+                sender, recipients, attempted = None, [], 0
+                self.reply("250 OK")
+            elif command == "NOOP":
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+class _ThreadingServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class SMTPSinkServer:
+    """메일을 메모리에 저장하는 로컬 SMTP 서버 (port=0이면 임의 포트, refuse 주소는 RCPT 거부)"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, fail_first: int = 0,
+                 refuse: Iterable[str] = ()):
+        self.messages: List[dict] = []
+        self.refuse = set(refuse)
+        self.connections = 0
+        self.logins = 0
+        self._fail_remaining = fail_first
+        self._lock = threading.Lock()
+        self._server = _ThreadingServer((host, port), _SinkHandler)
+        self._server.sink = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self):
+        return self._server.server_address
+
+    def take_failure(self) -> bool:
+        """fail_first 개수만큼 일시 오류 응답"""
+        with self._lock:
+            if self._fail_remaining > 0:
+                self._fail_remaining -= 1
+                return True
+            return False
+
+    def store(self, sender: str, recipients: List[str], data: bytes):
+        with self._lock:
+            self.messages.append({"from": sender, "to": recipients, "data": data})
+
+    def wait_for(self, count: int, timeout: float = 5.0) -> bool:
+        """count개 이상 도착할 때까지 대기"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if len(self.messages) >= count:
+                return True
+            time.sleep(0.01)
+        return len(self.messages) >= count
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+if __name__ == "__main__":
+    # 사용법: python -m app.utils.smtp_sink [포트]
+    sink_port = int(sys.argv[1]) if len(sys.argv) > 1 else 1025
+    sink = SMTPSinkServer(port=sink_port).start()
+    print(f"📮 SMTP sink listening on {sink.address[0]}:{sink.address[1]}")
+    try:
+        printed = 0
+        while True:
+            time.sleep(1)
+            received = sink.messages[printed:]
+            printed += len(received)
+            for message in received:
+                print(f"✉️  {message['from']} -> {', '.join(message['to'])} ({len(message['data'])} bytes)")
+    except KeyboardInterrupt:
+        sink.stop()
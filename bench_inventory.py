@@ -0,0 +1,150 @@
+# bench_inventory.py
+# 한정 수량 재고 선점 경합 벤치마크 (동시 구매자 수별 선점/초)
+# 사용법: python bench_inventory.py [선점 횟수] [동시성 목록, 예: 1,4,16,64]
+# - memory 저장소는 항상 실행 (샤드 1개 vs INVENTORY_SHARDS)
+# - REDIS_URL에 연결되면 redis 저장소 실행
+# - DATABASE_URL이 PostgreSQL이면 조건부 UPDATE와 SELECT ... FOR UPDATE 비교 실행
+
+import os
+import sys
+import threading
+import time
+
+from app.config import settings
+from app.services.inventory_service import (
+    DatabaseInventoryBackend, InMemoryInventoryBackend, RedisInventoryBackend
+)
+
+PRODUCT_ID = 1
+
+def run_threads(n_threads: int, n_ops: int, reserve_once) -> tuple:
+    """n_threads개 스레드가 합쳐서 n_ops번 선점 -> (성공 수, 경과 시간)"""
+    remaining = [n_ops]
+    succeeded = [0]
+    counter_lock = threading.Lock()
+    start_barrier = threading.Barrier(n_threads + 1)
+
+    def worker(user_id: int):
+        start_barrier.wait()
+        local_ok = 0
+        while True:
+            with counter_lock:
+                if remaining[0] == 0:
+                    break
+                remaining[0] -= 1
+            if reserve_once(user_id):
+                local_ok += 1
+        with counter_lock:
+            succeeded[0] += local_ok
+
+    threads = [threading.Thread(target=worker, args=(i + 1,)) for i in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    start_barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return succeeded[0], time.perf_counter() - started
+
+def report(label: str, n_threads: int, ok: int, elapsed: float, stock: int):
+    print(f"   {label:<28} threads={n_threads:<4} reserved={ok:<7} "
+          f"{ok / elapsed:>10,.0f} reservations/sec  (oversold: {'YES' if ok > stock else 'no'})")
+
+def bench_counter_backend(label: str, make_backend, concurrency, n_ops: int):
+    stock = n_ops * 9 // 10 # 마지막 10%는 매진 이후 거절 경로
+    for n_threads in concurrency:
+        backend = make_backend() # 실행마다 선점 기록 초기화
+        backend.load(None, PRODUCT_ID, stock)
+        ok, elapsed = run_threads(
+            n_threads, n_ops,
+            lambda user_id: backend.reserve(None, PRODUCT_ID, user_id, 1, 600) is not None
+        )
+        report(label, n_threads, ok, elapsed, stock)
+
+def bench_database(concurrency, n_ops: int):
+    from sqlalchemy import select, text, update
+
+    from app.database import SessionLocal
+    from app.models import Product, User
+
+    db = SessionLocal()
+    seller = db.query(User).first()
+    if seller is None:
+        print("   (users 테이블이 비어 있어 DB 벤치마크 생략)")
+        return
+    product = Product(seller_id=seller.user_id, name="bench drop", price=1000, stock=0)
+    db.add(product)
+    db.commit()
+    product_id = product.product_id
+    backend = DatabaseInventoryBackend()
+    sessions = threading.local()
+
+    def session():
+        if not hasattr(sessions, "db"):
+            sessions.db = SessionLocal()
+        return sessions.db
+
+    def conditional_update(user_id: int) -> bool:
+        # 저장소는 flush까지만 하므로 커밋은 호출하는 쪽에서
+        s = session()
+        if backend.reserve(s, product_id, seller.user_id, 1, 600) is None:
+            s.rollback()
+            return False
+        s.commit()
+        return True
+
+    def select_for_update(user_id: int) -> bool:
+        # 비교 기준: 행을 잠그고 읽은 뒤 차감 (왕복 2번 동안 잠금 유지)
+        s = session()
+        stock = s.execute(select(Product.stock).where(Product.product_id == product_id).with_for_update()).scalar()
+        if stock < 1:
+            s.rollback()
+            return False
+        s.execute(update(Product).where(Product.product_id == product_id).values(stock=stock - 1))
+        s.commit()
+        return True
+
+    stock = n_ops * 9 // 10
+    try:
+        for label, reserve_once in (("db conditional UPDATE", conditional_update), ("db SELECT FOR UPDATE", select_for_update)):
+            for n_threads in concurrency:
+                db.execute(update(Product).where(Product.product_id == product_id).values(stock=stock))
+                db.commit()
+                sessions = threading.local()
+                ok, elapsed = run_threads(n_threads, n_ops, reserve_once)
+                report(label, n_threads, ok, elapsed, stock)
+    finally:
+        db.execute(text("DELETE FROM inventory_reservations WHERE product_id = :p"), {"p": product_id})
+        db.execute(text("DELETE FROM products WHERE product_id = :p"), {"p": product_id})
+        db.commit()
+        db.close()
+
+def main():
+    n_ops = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    concurrency = [int(x) for x in sys.argv[2].split(",")] if len(sys.argv) > 2 else [1, 4, 16, 64]
+
+    print(f"📦 inventory contention benchmark: {n_ops} attempts, stock {n_ops * 9 // 10}")
+    bench_counter_backend("memory (1 shard)", lambda: InMemoryInventoryBackend(shards=1), concurrency, n_ops)
+    bench_counter_backend(f"memory ({settings.INVENTORY_SHARDS} shards)",
+                          lambda: InMemoryInventoryBackend(shards=settings.INVENTORY_SHARDS), concurrency, n_ops)
+
+    def make_redis_backend():
+        backend = RedisInventoryBackend(prefix="inv-bench")
+        backend._redis.delete(*backend._keys(PRODUCT_ID), "inv-bench:products", "inv-bench:reservations")
+        return backend
+
+    try:
+        make_redis_backend()
+    except Exception as e:
+        print(f"   (redis 연결 실패로 생략: {e})")
+    else:
+        bench_counter_backend("redis (Lua)", make_redis_backend, concurrency, n_ops)
+        make_redis_backend()
+
+    if (os.getenv("DATABASE_URL") or "").startswith("postgresql"):
+        bench_database(concurrency, min(n_ops, 5000))
+    else:
+        print("   (DATABASE_URL이 PostgreSQL이 아니어서 DB 벤치마크 생략)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# bench_payout.py
+# 토큰 분배 지급 벤치마크 (가상 보유자 N명 배분 계산 + 청크 일괄 기록 + 중단 후 재개)
+# 사용법: python bench_payout.py [보유자 수, 기본 5000000] [기록할 보유자 수, 기본 전체]
+# - DATABASE_URL의 DB에 distribution_payouts/notifications 행을 기록 (빈 테스트 DB 권장)
+
+import resource
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from app.config import settings
+from app.database import Base, SessionLocal, engine
+from app.models import Distribution, DistributionPayout
+from app.services.payout_service import PayoutEngine, allocate_pro_rata
+
+TOTAL_AMOUNT = 1_234_567_890_123 # 분배 총액 (원)
+
+
+def make_holdings(n_holders: int, rng: np.random.Generator) -> tuple:
+    # 소수 대량 보유 + 다수 소량 보유 (파레토 분포)
+    accounts = np.arange(1, n_holders + 1, dtype=np.int64) * 3 + rng.integers(0, 3, n_holders)
+    holdings = np.maximum(1, (rng.pareto(1.2, n_holders) * 1000).astype(np.int64))
+    return accounts, holdings
+
+
+def main():
+    n_holders = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    n_write = int(sys.argv[2]) if len(sys.argv) > 2 else n_holders
+    engine.echo = False
+    rng = np.random.default_rng(42)
+
+    print(f"🧮 Allocating {TOTAL_AMOUNT:,}원 to {n_holders:,} holders")
+    accounts, holdings = make_holdings(n_holders, rng)
+    timings = []
+    for _ in range(5):
+        started = time.perf_counter()
+        amounts = allocate_pro_rata(TOTAL_AMOUNT, holdings)
+        timings.append(time.perf_counter() - started)
+    exact = int(amounts.sum()) == TOTAL_AMOUNT
+    # 각 보유자 지급액은 정확한 비례값과 1원 미만 차이
+    ideal = holdings.astype(np.float64) * (TOTAL_AMOUNT / float(holdings.sum()))
+    print(f"   best={min(timings) * 1000:.0f}ms  sum exact={exact}  max error={np.abs(amounts - ideal).max():.3f}원  "
+          f"zero payouts={int((amounts == 0).sum()):,}")
+
+    print(f"\n💾 Writing {n_write:,} payouts + notifications (chunk={settings.PAYOUT_CHUNK_SIZE:,})")
+    Base.metadata.create_all(engine, tables=[Distribution.__table__, DistributionPayout.__table__,
+                                             Base.metadata.tables["notifications"]])
+    db = SessionLocal()
+    distribution = Distribution(token_id="BENCH", total_amount=int(amounts[:n_write].sum()),
+                                record_date=datetime.now(timezone.utc), status="pending",
+                                chunk_size=settings.PAYOUT_CHUNK_SIZE, next_chunk=0, paid_holders=0, paid_amount=0)
+    db.add(distribution)
+    db.commit()
+    distribution_id = distribution.distribution_id
+    db.close()
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        payout_engine = PayoutEngine(snapshot_dir=snapshot_dir)
+        # 기록할 범위만 명부로 저장
+        payout_engine.save_snapshot(distribution_id, accounts[:n_write], holdings[:n_write])
+        chunks = -(-n_write // settings.PAYOUT_CHUNK_SIZE)
+
+        # 절반 기록 후 중단 -> 점유 만료 없이 바로 재개 (중단시 점유 해제)
+        started = time.perf_counter()
+        payout_engine.run(distribution_id, max_chunks=chunks // 2)
+        first = time.perf_counter() - started
+        started = time.perf_counter()
+        result = payout_engine.run(distribution_id)
+        second = time.perf_counter() - started
+
+    elapsed = first + second
+    print(f"   {elapsed:.1f}s ({result['paid_holders'] / elapsed:,.0f} holders/sec), "
+          f"interrupted after {chunks // 2}/{chunks} chunks ({first:.1f}s), resumed ({second:.1f}s)")
+    print(f"   status={result['status']}  paid={result['paid_amount']:,}원 / {result['total_amount']:,}원  "
+          f"holders={result['paid_holders']:,}  max RSS={resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:,.0f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# bench_search.py
+# 상품 검색 색인 벤치마크 (가상 상품 N개 색인 후 검색/자동완성 지연 측정)
+# 사용법: python bench_search.py [상품 수, 기본 1000000]
+# - DB 없이 memory 저장소만 사용 (상품 변경 반영과 같은 apply 경로로 적재)
+
+import random
+import resource
+import statistics
+import sys
+import time
+
+from app.services.search_service import InMemorySearchBackend
+
+REGIONS = ["제주", "서귀포", "성주", "영주", "청송", "해남", "완도", "횡성", "나주", "상주", "고창", "의성",
+           "남해", "통영", "여수", "강릉", "평창", "안동", "논산", "이천", "철원", "보성", "무안", "영덕"]
+ITEMS = ["감귤", "한라봉", "천혜향", "레드향", "사과", "배", "참외", "수박", "딸기", "토마토", "방울토마토",
+         "블루베리", "복숭아", "포도", "샤인머스캣", "고구마", "감자", "양파", "마늘", "쌀", "현미", "찹쌀",
+         "한우 등심", "한우 안심", "한우 채끝", "한돈 삼겹살", "한돈 목살", "닭가슴살", "유정란",
+         "전복", "굴", "김", "미역", "멸치", "고등어", "갈치", "대게", "홍게", "꽃게", "새우"]
+GRADES = ["", "", "유기농", "무농약", "특품", "상품", "가정용", "선물용", "못난이", "햇", "산지직송"]
+UNITS = ["500g", "1kg", "2kg", "3kg", "5kg", "10kg", "1박스", "2박스", "10입", "20미"]
+CATEGORIES = ["농산물", "축산물", "수산물"]
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주"
+
+QUERIES = ["제주 감귤", "한우 등심", "감귤", "귤", "성주 참외 5kg", "유기농 고구마", "전복",
+           "완도 전복 1kg", "샤인머스캣 선물용", "못난이 사과", "횡성 한우 채끝", "해남 고구마 10kg"]
+PREFIXES = ["ㅎㅇ", "ㅈㅈ ㄱㄱ", "감", "감ㄱ", "한", "제주 감", "성주 ㅊ", "샤인", "ㅅㅇ", "완도 전"]
+
+
+def make_name(rng: random.Random) -> tuple:
+    item = rng.choice(ITEMS)
+    # 판매자 브랜드명 (단어 사전을 실제처럼 넓게)
+    brand = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))) + rng.choice(["농원", "농장", "수산", "상회", ""])
+    parts = [rng.choice(REGIONS), rng.choice(GRADES), item, rng.choice(UNITS), brand]
+    category = "수산물" if item in ITEMS[-11:] else "축산물" if item in ITEMS[22:29] else "농산물"
+    return " ".join(part for part in parts if part), category
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct))]
+
+
+def measure(label: str, fn, inputs, repeat: int = 20):
+    timings = []
+    for _ in range(repeat):
+        for value in inputs:
+            started = time.perf_counter()
+            fn(value)
+            timings.append((time.perf_counter() - started) * 1000)
+    print(f"   {label:<24} p50={statistics.median(timings):6.2f}ms  p99={percentile(timings, 0.99):6.2f}ms  "
+          f"max={max(timings):6.2f}ms  ({len(timings)} calls)")
+
+
+def main():
+    n_products = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(42)
+    backend = InMemorySearchBackend()
+
+    print(f"📦 Indexing {n_products:,} products")
+    started = time.perf_counter()
+    batch = {}
+    for product_id in range(1, n_products + 1):
+        name, category = make_name(rng)
+        batch[product_id] = (name, category, True)
+        if len(batch) == 10000:
+            backend.apply(batch)
+            batch = {}
+    if batch:
+        backend.apply(batch)
+    backend.ready = True
+    elapsed = time.perf_counter() - started
+    status = backend.status()
+    print(f"   {elapsed:.1f}s ({n_products / elapsed:,.0f} products/sec), terms={status['terms']:,}, "
+          f"tokens={status['tokens']:,}, max RSS={resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:,.0f}MB")
+
+    print("\n🔎 Search (top 20)")
+    for query in QUERIES[:4]:
+        total, hits = backend.search(None, query, None, 20, 0)
+        print(f"   {query!r}: {total:,} matches, top={backend._data.texts[hits[0][0]] if hits else None!r}")
+    measure("search", lambda q: backend.search(None, q, None, 20, 0), QUERIES)
+    measure("search + category", lambda q: backend.search(None, q, "농산물", 20, 0), QUERIES)
+
+    print("\n⌨️  Suggest (top 10)")
+    for prefix in PREFIXES[:6]:
+        print(f"   {prefix!r}: {[s['text'] for s in backend.suggest(None, prefix, 5)]}")
+    measure("suggest", lambda p: backend.suggest(None, p, 10), PREFIXES)
+
+    print("\n✏️  Incremental updates")
+    started = time.perf_counter()
+    n_updates = 10000
+    for _ in range(n_updates // 100):
+        backend.apply({rng.randint(1, n_products): (make_name(rng)[0], "농산물", True) for _ in range(100)})
+    elapsed = time.perf_counter() - started
+    print(f"   {n_updates:,} renames in {elapsed:.2f}s ({n_updates / elapsed:,.0f}/sec), "
+          f"compactions={backend.stats['compactions']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# bench_ws_fanout.py
+# 실시간 피드 팬아웃 벤치마크 (가짜 WebSocket 10k개, 인메모리 버스)
+
+import asyncio
+import sys
+import time
+
+from app.core.pubsub import InMemoryBus
+from app.services.feed_service import FeedClient, FeedHub
+
+class FakeWebSocket:
+    """send_text만 흉내내는 WebSocket"""
+
+    def __init__(self):
+        self.received = 0
+        self.last = None
+
+    async def send_text(self, payload: str):
+        self.received += 1
+        self.last = payload
+
+async def run(n_clients: int, n_updates: int, rate_hz: float):
+    hub = FeedHub(bus=InMemoryBus())
+    await hub.start()
+
+    sockets = [FakeWebSocket() for _ in range(n_clients)]
+    clients = [FeedClient(ws, max_rate_hz=rate_hz) for ws in sockets]
+    writers = [asyncio.create_task(client.run_writer()) for client in clients]
+    for client in clients:
+        hub.subscribe(client, ["price:TKN1"])
+
+    started = time.perf_counter()
+    for i in range(n_updates):
+        await hub.publish("price:TKN1", {"price": 10000 + i})
+        await asyncio.sleep(0)
+    publish_elapsed = time.perf_counter() - started
+
+    # 모든 클라이언트가 마지막 업데이트를 받을 때까지 대기
+    last_marker = f'"price":{10000 + n_updates - 1}'
+    while not all(ws.last and last_marker in ws.last for ws in sockets):
+        await asyncio.sleep(0.001)
+    total_elapsed = time.perf_counter() - started
+
+    delivered = sum(ws.received for ws in sockets)
+    coalesced = sum(client.coalesced for client in clients)
+    shared = len({id(ws.last) for ws in sockets})
+
+    for client in clients:
+        hub.remove(client)
+    await asyncio.gather(*writers, return_exceptions=True)
+    await hub.stop()
+
+    print(f"👥 clients: {n_clients}, 📨 updates: {n_updates}, ⏱️ max rate: {rate_hz}Hz")
+    print(f"   publish loop: {publish_elapsed * 1000:.1f} ms")
+    print(f"   all clients up to date: {total_elapsed * 1000:.1f} ms")
+    print(f"   delivered: {delivered} ({delivered / total_elapsed:,.0f} msgs/sec)")
+    print(f"   coalesced: {coalesced}")
+    print(f"   distinct payload objects for last update: {shared}")
+
+def main():
+    n_clients = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    n_updates = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    rate_hz = float(sys.argv[3]) if len(sys.argv) > 3 else 10.0
+
+    print("🚀 WebSocket fan-out benchmark")
+    print("=" * 50)
+    asyncio.run(run(n_clients, n_updates, rate_hz))
+
+if __name__ == "__main__":
+    main()
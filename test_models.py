@@ -4,6 +4,7 @@
 from app.database import SessionLocal, engine
 from app.models import User, SMSVerification, UserSession
 from app.schemas import UserRegisterRequest
+from app.services.encryption_service import get_encryptor
 from sqlalchemy import text
 import bcrypt
 
@@ -34,7 +35,7 @@ def test_user_model():
         print(f"   User dict: {test_user.to_dict()}")
         
         # 사용자 조회
-        found_user = db.query(User).filter(User.phone_number == "01012345678").first()
+        found_user = db.query(User).filter(User.phone_hash == get_encryptor().blind_index("01012345678")).first()
         if found_user:
             print(f"✅ User found: {found_user.user_name}")
         
@@ -0,0 +1,132 @@
+# tests/conftest.py
+import os
+import sys
+import tempfile
+
+# 설정은 import 시점에 읽으므로 앱 모듈보다 먼저 지정 (임시 sqlite, 백그라운드 작업 끔)
+TEST_DIR = tempfile.mkdtemp(prefix="faank-test-")
+os.environ.update({
+    "ENVIRONMENT": "development",
+    "DATABASE_URL": f"sqlite:///{TEST_DIR}/test.db",
+    "LEDGER_ENABLED": "false",
+    "AUDIT_ENABLED": "false",
+    "KYC_WORKER_ENABLED": "false",
+    "PAYOUT_ENABLED": "false",
+    "CART_BACKEND": "memory",
+    "FEED_BUS_BACKEND": "memory",
+    "SMTP_SERVER": "",
+    "PII_MASTER_KEY_PATH": f"{TEST_DIR}/pii_master.key",
+    "AUDIT_SPILL_PATH": f"{TEST_DIR}/audit_spill.jsonl",
+    "PAYOUT_SNAPSHOT_DIR": f"{TEST_DIR}/distributions",
+    "SERVER_METRICS_DIR": f"{TEST_DIR}/metrics",
+})
+
+import pytest
+
+from app.database import Base, SessionLocal, engine
+import app.models # noqa: F401 (테이블 등록)
+
+engine.echo = False
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables():
+    Base.metadata.create_all(engine)
+    yield
+    engine.dispose()
+
+
+@pytest.fixture
+def db():
+    """테스트용 DB 세션 (테스트가 끝나면 모든 테이블 비움)"""
+    session = SessionLocal()
+    yield session
+    session.rollback()
+    for table in reversed(Base.metadata.sorted_tables):
+        session.execute(table.delete())
+    session.commit()
+    session.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_singletons():
+    """테스트 간 프로세스별 싱글톤/캐시 초기화"""
+    yield
+    from app.core.server import PER_PROCESS_SINGLETONS
+    for module_name, attribute in PER_PROCESS_SINGLETONS:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            setattr(module, attribute, None)
+
+
+@pytest.fixture
+def make_user(db):
+    """사용자 생성 (핸드폰 번호는 순서대로 부여)"""
+    from app.models import User
+    counter = iter(range(10**7))
+
+    def factory(phone_number=None, user_type="customer", user_name="테스트 사용자", password_hash="x", **fields):
+        user = User(password_hash=password_hash, user_type=user_type, kyc_status="pending", is_active=True, **fields)
+        user.phone_number = phone_number or f"0109{next(counter):07d}"
+        user.user_name = user_name
+        db.add(user)
+        db.commit()
+        return user
+
+    return factory
+
+
+@pytest.fixture
+def make_product(db, make_user):
+    """판매 중인 상품 생성"""
+    from app.models import Product
+    seller = []
+
+    def factory(name="한우 등심", price=10000, stock=10, **fields):
+        if not seller:
+            seller.append(make_user(user_type="seller"))
+        product = Product(seller_id=seller[0].user_id, name=name, price=price, stock=stock, is_active=True, **fields)
+        db.add(product)
+        db.commit()
+        return product
+
+    return factory
+
+
+class SharedBroker:
+    """워커 여러 개가 구독하는 메시지 브로커 (Redis pub/sub 대신)"""
+
+    def __init__(self):
+        self.handlers = []
+
+    def connect(self):
+        broker = self
+
+        class Bus:
+            async def start(self, handler):
+                broker.handlers.append(handler)
+
+            async def stop(self):
+                pass
+
+            async def publish(self, topic, payload):
+                for handler in list(broker.handlers):
+                    handler(topic, payload)
+
+        return Bus()
+
+
+@pytest.fixture
+def broker():
+    return SharedBroker()
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """redis.Redis.from_url이 같은 fakeredis 서버에 연결되도록 교체"""
+    fakeredis = pytest.importorskip("fakeredis")
+    import redis
+
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(redis.Redis, "from_url", classmethod(lambda cls, url, **kwargs: fakeredis.FakeRedis(server=server)))
+    return fakeredis.FakeRedis(server=server)
@@ -0,0 +1,50 @@
+# tests/test_admission.py
+import asyncio
+
+from app.core.admission import AdaptiveLimiter
+
+
+def make_limiter(**fields) -> AdaptiveLimiter:
+    options = {"initial": 2, "target_latency": 0.05, "min_limit": 1, "max_limit": 4,
+               "queue_factor": 1.0, "queue_timeout": 0.2}
+    options.update(fields)
+    return AdaptiveLimiter("test", **options)
+
+
+async def test_full_queue_is_rejected_and_waiter_takes_released_slot():
+    limiter = make_limiter()
+    assert await limiter.acquire() and await limiter.acquire()
+
+    waiters = [asyncio.ensure_future(limiter.acquire()) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert not await limiter.acquire() # 대기열(한도 x 1.0) 가득 참
+    assert limiter.stats["rejected"] == 1
+
+    limiter.release()
+    assert await waiters[0] is True
+    assert limiter.inflight == 2 # 자리를 그대로 넘김
+    limiter.release()
+    limiter.release()
+    assert await waiters[1] is True
+
+
+async def test_waiter_times_out():
+    # 예상 대기(0.01초)는 기한 안이라 대기열에 들어가지만 자리가 나지 않음
+    limiter = make_limiter(initial=1, target_latency=0.01, queue_timeout=0.02)
+    assert await limiter.acquire()
+    assert await limiter.acquire() is False
+    assert limiter.stats["timed_out"] == 1
+    limiter.release()
+    assert limiter.inflight == 0
+
+
+async def test_limit_shrinks_when_slow_and_grows_when_saturated():
+    limiter = make_limiter(initial=4, max_limit=8)
+    assert await limiter.acquire()
+    limiter.release(latency=1.0)
+    assert limiter.limit == 3.6 and limiter.stats["decreased"] == 1
+
+    for _ in range(3):
+        await limiter.acquire()
+    limiter.release(latency=0.001)
+    assert limiter.limit > 3.6 and limiter.stats["increased"] == 1
@@ -0,0 +1,108 @@
+# tests/test_audit.py
+import os
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.database import SessionLocal
+from app.models import AuditEvent
+from app.services.audit_service import LOGIN_FAILURE, AuditLog
+
+
+class FlakyDatabase:
+    """down이면 연결 오류를 내는 세션 팩토리"""
+
+    def __init__(self):
+        self.down = False
+
+    def __call__(self):
+        if self.down:
+            raise OperationalError("INSERT INTO audit_events", {}, ConnectionError("connection refused"))
+        return SessionLocal()
+
+
+@pytest.fixture
+def database():
+    return FlakyDatabase()
+
+
+@pytest.fixture
+def audit_log(tmp_path, database):
+    return AuditLog(batch_size=4, spill_path=str(tmp_path / "audit_spill.jsonl"), session_factory=database)
+
+
+def stored_events(db):
+    return db.query(AuditEvent).order_by(AuditEvent.id).all()
+
+
+def test_long_fields_are_truncated(db, audit_log):
+    audit_log.record(LOGIN_FAILURE, target="GET /" + "a" * 500, ip_address="1" * 300, success=False)
+    assert audit_log.flush() == 1
+
+    event, = stored_events(db)
+    assert len(event.target) == 200
+    assert len(event.ip_address) == 45
+
+
+def test_outage_spills_and_replays(db, audit_log, database):
+    database.down = True
+    for index in range(10):
+        audit_log.record(LOGIN_FAILURE, target=f"user{index}")
+    assert audit_log.flush() == 0
+    assert audit_log.stats["spilled"] == 10
+
+    database.down = False
+    audit_log._db_retry_at = 0.0
+    audit_log.record(LOGIN_FAILURE, target="after recovery")
+    assert audit_log.flush() == 1
+
+    assert audit_log.stats["replayed"] == 10
+    assert not audit_log.status()["spill_pending"]
+    assert len(stored_events(db)) == 11
+
+
+def test_replay_keeps_only_unwritten_rows_on_outage(db, audit_log, database, monkeypatch):
+    database.down = True
+    for index in range(10):
+        audit_log.record(LOGIN_FAILURE, target=f"user{index}")
+    audit_log.flush()
+
+    # 재기록 도중 DB가 다시 끊긴 상황 (첫 배치만 기록됨)
+    database.down = False
+    audit_log._db_retry_at = 0.0
+    original_insert = audit_log._insert
+
+    def insert_then_fail(rows):
+        original_insert(rows)
+        database.down = True
+
+    monkeypatch.setattr(audit_log, "_insert", insert_then_fail)
+    audit_log.flush()
+    assert audit_log.stats["replayed"] == 4
+
+    monkeypatch.setattr(audit_log, "_insert", original_insert)
+    database.down = False
+    audit_log._db_retry_at = 0.0
+    audit_log.flush()
+    assert audit_log.stats["replayed"] == 10
+    assert len(stored_events(db)) == 10
+
+
+def test_rejected_row_is_quarantined_without_blocking(db, audit_log, database):
+    database.down = True
+    for index in range(6):
+        audit_log.record(LOGIN_FAILURE, target=f"user{index}")
+    # 같은 기본키 행 -> IntegrityError (DB 장애가 아님)
+    audit_log._buffer.append(audit_log._buffer[0])
+    audit_log.flush()
+
+    database.down = False
+    audit_log._db_retry_at = 0.0
+    audit_log.record(LOGIN_FAILURE, target="later")
+    assert audit_log.flush() == 1
+
+    assert audit_log.stats["quarantined"] == 1
+    assert audit_log.stats["replayed"] == 6
+    assert not audit_log.status()["spill_pending"]
+    assert os.path.exists(audit_log.quarantine_path)
+    assert len(stored_events(db)) == 7
@@ -0,0 +1,87 @@
+# tests/test_cart.py
+import pytest
+from fastapi import HTTPException
+
+from app.config import settings
+from app.services.cart_service import CartService, InMemoryCartBackend, ProductCache, RedisCartBackend
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cart(request, db):
+    if request.param == "redis":
+        request.getfixturevalue("fake_redis")
+        backend = RedisCartBackend()
+    else:
+        backend = InMemoryCartBackend()
+    return CartService(db, backend=backend, product_cache=ProductCache())
+
+
+def quantities(cart_view: dict) -> dict:
+    return {item["product_id"]: item["quantity"] for item in cart_view["items"]}
+
+
+def test_add_and_set_quantity(cart, make_user, make_product):
+    user = make_user()
+    product = make_product(price=2500)
+    cart.add_item(user.user_id, product.product_id, 2)
+    view = cart.add_item(user.user_id, product.product_id, 3)
+    assert quantities(view) == {product.product_id: 5}
+    assert view["total_amount"] == 12500
+
+    assert quantities(cart.set_quantity(user.user_id, product.product_id, 1)) == {product.product_id: 1}
+    assert cart.remove_item(user.user_id, product.product_id)["items"] == []
+
+
+def test_limits(cart, make_user, make_product, monkeypatch):
+    monkeypatch.setattr(settings, "CART_MAX_ITEMS", 2)
+    user = make_user()
+    first, second, third = make_product(), make_product(), make_product()
+    cart.add_item(user.user_id, first.product_id, settings.CART_MAX_QUANTITY)
+    with pytest.raises(HTTPException):
+        cart.add_item(user.user_id, first.product_id, 1)
+    cart.add_item(user.user_id, second.product_id, 1)
+    with pytest.raises(HTTPException):
+        cart.add_item(user.user_id, third.product_id, 1)
+
+
+def test_set_quantity_requires_active_product(cart, db, make_user, make_product):
+    user = make_user()
+    product = make_product()
+    cart.add_item(user.user_id, product.product_id, 1)
+    product.is_active = False
+    db.commit()
+    cart.product_cache.invalidate([product.product_id])
+
+    with pytest.raises(HTTPException) as error:
+        cart.set_quantity(user.user_id, product.product_id, 3)
+    assert error.value.status_code == 404
+    with pytest.raises(HTTPException):
+        cart.set_quantity(user.user_id, 999999, 1)
+    # 판매 중지된 상품도 빼는 것은 가능
+    assert cart.remove_item(user.user_id, product.product_id)["items"] == []
+
+
+def test_failed_checkout_restores_within_limits(cart, make_user, make_product, monkeypatch):
+    monkeypatch.setattr(settings, "CART_MAX_ITEMS", 2)
+    user = make_user()
+    scarce, plenty, other = make_product(stock=1), make_product(stock=100), make_product(stock=100)
+    cart.add_item(user.user_id, scarce.product_id, 5)
+    cart.add_item(user.user_id, plenty.product_id, 60)
+
+    # 주문 처리 도중 같은 사용자가 장바구니를 다시 채운 상황
+    original_take = cart.backend.take
+
+    def take_then_refill(key):
+        items = original_take(key)
+        cart.add_item(user.user_id, plenty.product_id, 60)
+        cart.add_item(user.user_id, other.product_id, 1)
+        return items
+
+    monkeypatch.setattr(cart.backend, "take", take_then_refill)
+    with pytest.raises(HTTPException) as error:
+        cart.checkout(user)
+    assert error.value.status_code == 409
+
+    restored = quantities(cart.get_cart(user.user_id))
+    assert restored == {plenty.product_id: settings.CART_MAX_QUANTITY, other.product_id: 1}
+    assert scarce.stock == 1
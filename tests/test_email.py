@@ -0,0 +1,169 @@
+# tests/test_email.py
+import asyncio
+import time
+from email import message_from_bytes, policy
+
+import pytest
+
+from app.config import settings
+from app.utils.email import EmailSender, get_email_sender, render_email
+from app.utils.smtp_sink import SMTPSinkServer
+
+
+@pytest.fixture
+def make_sink():
+    sinks = []
+
+    def factory(**options):
+        sink = SMTPSinkServer(**options).start()
+        sinks.append(sink)
+        return sink
+
+    yield factory
+    for sink in sinks:
+        sink.stop()
+
+
+@pytest.fixture
+def mail_sink(make_sink, monkeypatch):
+    """앱 설정의 SMTP 서버를 싱크로 지정하고 발송기 실행"""
+    sink = make_sink()
+    host, port = sink.address
+    for name, value in (("SMTP_SERVER", host), ("SMTP_PORT", port), ("SMTP_USERNAME", ""),
+                        ("SMTP_USE_TLS", False), ("EMAIL_RETRY_BASE_DELAY", 0.01)):
+        monkeypatch.setattr(settings, name, value)
+    get_email_sender().start()
+    yield sink
+    get_email_sender().stop()
+
+
+def make_sender(sink, **options) -> EmailSender:
+    host, port = sink.address
+    options = {"pool_size": 1, "batch_size": 10, "max_retries": 3, "retry_base_delay": 0.01, **options}
+    return EmailSender(host=host, port=port, username="", password="", use_tls=False, **options)
+
+
+def order_email(index: int, sender: str = None):
+    context = {"user_name": f"고객{index}", "order_id": index, "amount": "10,000"}
+    return render_email("order_confirmation", f"고객{index} <user{index}@example.com>", context, sender=sender)
+
+
+def plain_body(received: dict) -> str:
+    return message_from_bytes(received["data"], policy=policy.default).get_body(("plain",)).get_content()
+
+
+def wait_until(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_batch_is_sent_over_one_connection(make_sink):
+    sink = make_sink()
+    sender = make_sender(sink)
+    for index in range(25):
+        sender.enqueue(order_email(index, sender="Faank <no-reply@faank.com>"))
+    sender.start()
+    try:
+        assert sink.wait_for(25)
+    finally:
+        sender.stop()
+
+    assert sender.stats == {"sent": 25, "retried": 0, "failed": 0, "refused": 0}
+    assert sink.connections == 1
+    # 봉투 주소에는 표시 이름이 들어가지 않음
+    assert {message["from"] for message in sink.messages} == {"no-reply@faank.com"}
+    assert sorted(message["to"][0] for message in sink.messages)[:2] == ["user0@example.com", "user10@example.com"]
+
+
+def test_temporary_failure_is_retried(make_sink):
+    sink = make_sink(fail_first=2)
+    sender = make_sender(sink)
+    for index in range(3):
+        sender.enqueue(order_email(index))
+    sender.start()
+    try:
+        assert sink.wait_for(3)
+    finally:
+        sender.stop()
+
+    assert sender.stats == {"sent": 3, "retried": 2, "failed": 0, "refused": 0}
+
+
+def test_gives_up_after_max_retries(make_sink):
+    sink = make_sink(fail_first=10)
+    sender = make_sender(sink, max_retries=2)
+    sender.enqueue(order_email(1))
+    sender.start()
+    try:
+        assert wait_until(lambda: sender.stats["failed"] == 1)
+    finally:
+        sender.stop()
+
+    assert sender.stats == {"sent": 0, "retried": 2, "failed": 1, "refused": 0}
+    assert sink.messages == []
+
+
+def test_refused_recipients_are_counted_and_connection_stays_usable(make_sink):
+    sink = make_sink(refuse={"user1@example.com", "user2@example.com"})
+    sender = make_sender(sink)
+    context = {"user_name": "고객", "order_id": 1, "amount": "10,000"}
+    sender.enqueue(render_email("order_confirmation", "user0@example.com, user1@example.com", context))
+    # 전원 거부 (DATA 354 이후 본문 종료까지 보내야 같은 연결을 계속 사용)
+    sender.enqueue(render_email("order_confirmation", "user2@example.com", context))
+    sender.enqueue(order_email(3))
+    sender.start()
+    try:
+        assert sink.wait_for(2)
+        assert wait_until(lambda: sender.stats["failed"] == 1)
+    finally:
+        sender.stop()
+
+    assert sender.stats == {"sent": 2, "retried": 0, "failed": 1, "refused": 1}
+    assert [message["to"] for message in sink.messages] == [["user0@example.com"], ["user3@example.com"]]
+    assert sink.connections == 1
+
+
+def test_checkout_sends_order_confirmation(db, mail_sink, make_user, make_product):
+    from app.services.cart_service import CartService, InMemoryCartBackend, ProductCache
+
+    cart = CartService(db, backend=InMemoryCartBackend(), product_cache=ProductCache())
+    user = make_user(user_name="김고객", email="buyer@example.com")
+    no_email = make_user()
+    product = make_product(price=12000)
+    orders = []
+    for customer in (user, no_email):
+        cart.add_item(customer.user_id, product.product_id, 2)
+        orders.append(cart.checkout(customer))
+
+    assert mail_sink.wait_for(1)
+    get_email_sender().stop()
+    assert len(mail_sink.messages) == 1
+    message = mail_sink.messages[0]
+    assert message["to"] == ["buyer@example.com"]
+    assert f"주문번호: {orders[0]['order_id']}" in plain_body(message)
+    assert "결제금액: 24,000원" in plain_body(message)
+
+
+async def test_kyc_submission_and_result_send_notices(db, mail_sink, make_user, monkeypatch):
+    from app.services.kyc_service import FakeKycVerifier, KycService, KycWorkerPool
+
+    monkeypatch.setattr(settings, "KYC_POLL_INTERVAL", 0.01)
+    user = make_user(email="kyc@example.com")
+    KycService(db).submit(user, "홍길동", "19900101")
+    assert mail_sink.wait_for(1)
+
+    pool = KycWorkerPool(verifier=FakeKycVerifier(latency=0), flush_interval=0.01)
+    await pool.start()
+    try:
+        deadline = time.monotonic() + 5
+        while pool.stats["batches"] < 1 and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+    finally:
+        await pool.stop()
+
+    assert mail_sink.wait_for(2)
+    assert [message["to"] for message in mail_sink.messages] == [["kyc@example.com"]] * 2
+    assert "'심사 중'" in plain_body(mail_sink.messages[0])
+    assert "'인증 완료'" in plain_body(mail_sink.messages[1])
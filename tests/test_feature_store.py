@@ -0,0 +1,99 @@
+# tests/test_feature_store.py
+from datetime import date, timedelta
+
+import httpx
+import numpy as np
+
+from app.services.feature_store import FEATURE_COLUMNS, FeatureStore, FixtureWeatherSource, KmaWeatherSource
+
+START = date(2024, 1, 1)
+
+
+def prices(first: int, last: int):
+    return [(START + timedelta(days=day), 1000.0 + 10 * day + (day % 5)) for day in range(first, last)]
+
+
+def make_store(path) -> FeatureStore:
+    store = FeatureStore(directory=str(path), weather_source=FixtureWeatherSource(path=""))
+    store.register_item("cabbage", "제주")
+    return store
+
+
+def test_incremental_materialize_matches_full_recompute(tmp_path):
+    incremental = make_store(tmp_path / "incremental")
+    incremental.ingest_prices("cabbage", prices(0, 90))
+    incremental.refresh_weather("cabbage", START, START + timedelta(days=119))
+    incremental.materialize()
+    incremental.ingest_prices("cabbage", prices(90, 120))
+    assert incremental.materialize()["cabbage"] < 120 # 변경된 구간만 계산
+
+    full = make_store(tmp_path / "full")
+    full.ingest_prices("cabbage", prices(0, 120))
+    full.refresh_weather("cabbage", START, START + timedelta(days=119))
+    full.materialize()
+
+    x_incremental, days, _ = incremental.get_training_data(["cabbage"], START, START + timedelta(days=119))
+    x_full, _, _ = full.get_training_data(["cabbage"], START, START + timedelta(days=119))
+    assert x_incremental.shape == (120, len(FEATURE_COLUMNS)) and len(days) == 120
+    np.testing.assert_allclose(x_incremental, x_full, equal_nan=True)
+
+
+def test_features_survive_restart(tmp_path):
+    store = make_store(tmp_path)
+    store.ingest_prices("cabbage", prices(0, 60))
+    store.materialize()
+    expected = store.get_online_features("cabbage", START + timedelta(days=59))
+
+    reopened = FeatureStore(directory=str(tmp_path), weather_source=FixtureWeatherSource(path=""))
+    loaded = reopened.get_online_features("cabbage", START + timedelta(days=59))
+    np.testing.assert_array_equal(loaded, expected, strict=True)
+    assert loaded[FEATURE_COLUMNS.index("price_lag_7")] == prices(52, 53)[0][1]
+    assert reopened.get_online_features("cabbage", START + timedelta(days=60)) is None
+
+
+def test_incremental_materialize_after_long_gap(tmp_path):
+    # 마지막 관측 이후 결측 구간이 계산 창(MAX_LOOKBACK x 2)보다 길어도 전체 계산과 같아야 함
+    observed = prices(0, 10) + prices(99, 100)
+    incremental = make_store(tmp_path / "incremental")
+    incremental.ingest_prices("cabbage", observed)
+    incremental.materialize()
+    incremental.ingest_prices("cabbage", prices(100, 110))
+    incremental.materialize()
+
+    full = make_store(tmp_path / "full")
+    full.ingest_prices("cabbage", observed + prices(100, 110))
+    full.materialize()
+
+    end = START + timedelta(days=109)
+    x_incremental, _, _ = incremental.get_training_data(["cabbage"], START, end)
+    x_full, _, _ = full.get_training_data(["cabbage"], START, end)
+    np.testing.assert_allclose(x_incremental, x_full, equal_nan=True)
+    assert not np.isnan(x_incremental[100, FEATURE_COLUMNS.index("price_lag_7")])
+
+
+def kma_transport(total: int, page_size: int):
+    """기상청 API 흉내 (totalCount 기준 페이지 나눔, 자료가 없으면 items = "")"""
+    pages = []
+
+    def handler(request):
+        page = int(request.url.params["pageNo"])
+        pages.append(page)
+        days = range((page - 1) * page_size, min(page * page_size, total))
+        items = {"item": [
+            {"tm": (START + timedelta(days=day)).isoformat(), "avgTa": "1.5", "sumRn": "", "avgRhm": "60"}
+            for day in days
+        ]} if days else ""
+        return httpx.Response(200, json={"response": {"body": {"items": items, "totalCount": total}}})
+
+    return httpx.MockTransport(handler), pages
+
+
+def test_kma_source_follows_total_count_across_pages(monkeypatch):
+    monkeypatch.setattr(KmaWeatherSource, "PAGE_SIZE", 10)
+    transport, pages = kma_transport(total=25, page_size=10)
+    rows = KmaWeatherSource(api_key="key", transport=transport).fetch("제주", START, START + timedelta(days=24))
+    assert pages == [1, 2, 3] and len(rows) == 25
+    assert rows[-1]["date"] == START + timedelta(days=24) and rows[0]["precipitation"] == 0.0
+
+    transport, pages = kma_transport(total=0, page_size=10)
+    assert KmaWeatherSource(api_key="key", transport=transport).fetch("제주", START, START) == []
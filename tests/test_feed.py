@@ -0,0 +1,54 @@
+# tests/test_feed.py
+import asyncio
+import json
+
+import pytest
+
+from app.core.pubsub import InMemoryBus
+from app.services.feed_service import FeedClient, FeedHub, SlowConsumerError
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent = []
+
+    async def send_text(self, payload: str):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(payload))
+
+
+async def test_updates_are_coalesced_per_topic():
+    hub = FeedHub(bus=InMemoryBus())
+    await hub.start()
+    websocket = FakeWebSocket()
+    client = FeedClient(websocket, max_rate_hz=20)
+    assert hub.subscribe(client, ["price:HANWOO", "bad topic"]) == {"price:HANWOO"}
+
+    writer = asyncio.create_task(client.run_writer())
+    for price in range(1, 51):
+        await hub.publish("price:HANWOO", {"price": price})
+    await hub.publish("price:OTHER", {"price": 1}) # 구독하지 않은 토픽
+    await asyncio.sleep(0.2)
+    hub.remove(client)
+    await writer
+
+    prices = [message["data"]["price"] for message in websocket.sent]
+    assert prices[-1] == 50 # 최신 값은 항상 전달
+    assert len(prices) < 50 and client.coalesced > 0
+    assert all(message["topic"] == "price:HANWOO" for message in websocket.sent)
+    assert hub.stats()["subscriptions"] == 0
+    await hub.stop()
+
+
+async def test_slow_consumer_is_disconnected():
+    hub = FeedHub(bus=InMemoryBus())
+    await hub.start()
+    client = FeedClient(FakeWebSocket(delay=1.0), send_timeout=0.05)
+    hub.subscribe(client, ["orderbook:HANWOO"])
+    writer = asyncio.create_task(client.run_writer())
+    await hub.publish("orderbook:HANWOO", {"bids": []})
+    with pytest.raises(SlowConsumerError):
+        await asyncio.wait_for(writer, 1.0)
+    await hub.stop()
@@ -0,0 +1,32 @@
+# tests/test_file_handler.py
+from PIL import Image
+
+from app.utils.file_handler import _generate_variants
+
+
+def test_webp_keeps_original_resolution(tmp_path):
+    src = tmp_path / "original.jpg"
+    Image.new("RGB", (2400, 1600), (200, 120, 40)).save(src, "JPEG", quality=90)
+    targets = {variant: str(tmp_path / f"out_{variant}") for variant in ("thumbnail", "medium", "webp")}
+
+    _generate_variants(str(src), targets, thumbnail_size=200, medium_size=800)
+
+    with Image.open(targets["webp"]) as webp:
+        assert webp.format == "WEBP" and webp.size == (2400, 1600)
+    with Image.open(targets["medium"]) as medium:
+        assert max(medium.size) == 800
+    with Image.open(targets["thumbnail"]) as thumbnail:
+        assert max(thumbnail.size) == 200
+
+
+def test_transparent_png_webp_keeps_alpha(tmp_path):
+    src = tmp_path / "original.png"
+    Image.new("RGBA", (300, 300), (0, 0, 0, 0)).save(src, "PNG")
+    targets = {"webp": str(tmp_path / "out.webp"), "thumbnail": str(tmp_path / "out_thumb.jpg")}
+
+    _generate_variants(str(src), targets, thumbnail_size=100, medium_size=200)
+
+    with Image.open(targets["webp"]) as webp:
+        assert webp.mode == "RGBA" and webp.size == (300, 300)
+    with Image.open(targets["thumbnail"]) as thumbnail:
+        assert thumbnail.getpixel((0, 0)) == (255, 255, 255) # 흰 배경으로 합성
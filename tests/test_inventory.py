@@ -0,0 +1,131 @@
+# tests/test_inventory.py
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException
+
+from app.models import InventoryReservation, Notification, Product
+from app.services.cart_service import CartService, InMemoryCartBackend, ProductCache
+from app.services.inventory_service import (
+    DatabaseInventoryBackend, InMemoryInventoryBackend, InventoryService, RedisInventoryBackend,
+)
+
+
+@pytest.fixture(params=["memory", "redis", "database"])
+def backend(request):
+    if request.param == "redis":
+        request.getfixturevalue("fake_redis")
+        return RedisInventoryBackend()
+    if request.param == "memory":
+        return InMemoryInventoryBackend(shards=4)
+    return DatabaseInventoryBackend()
+
+
+def db_stock(db, product_id: int) -> int:
+    return db.query(Product.stock).filter(Product.product_id == product_id).scalar()
+
+
+def test_concurrent_reserve_then_confirm_never_oversells(db, backend, make_user, make_product):
+    product = make_product(stock=20)
+    buyers = [make_user() for _ in range(8)]
+    service = InventoryService(db, backend=backend)
+    service.load_stock(product.product_id)
+
+    if isinstance(backend, DatabaseInventoryBackend):
+        # DB 저장소는 세션을 공유할 수 없으므로 순서대로
+        attempts = [(buyer, 1) for buyer in buyers for _ in range(5)]
+        holds = []
+        for buyer, quantity in attempts:
+            try:
+                holds.append((buyer, service.reserve(buyer.user_id, product.product_id, quantity)))
+            except HTTPException:
+                pass
+    else:
+        def attempt(buyer):
+            hold = backend.reserve(None, product.product_id, buyer.user_id, 1, 600)
+            return buyer, hold
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(attempt, [buyer for buyer in buyers for _ in range(5)]))
+        holds = [(buyer, hold) for buyer, hold in results if hold is not None]
+
+    assert len(holds) == 20
+    assert service.available(product.product_id) == 0
+
+    for buyer, hold in holds:
+        service.confirm(buyer, hold["reservation_id"])
+    assert db_stock(db, product.product_id) == 0
+
+
+def test_cart_checkout_shares_stock_with_reservations(db, backend, make_user, make_product):
+    product = make_product(stock=3)
+    buyer, shopper = make_user(), make_user()
+    service = InventoryService(db, backend=backend)
+    hold = service.reserve(buyer.user_id, product.product_id, 2)
+
+    cart = CartService(db, backend=InMemoryCartBackend(), product_cache=ProductCache(), inventory=service)
+    cart.add_item(shopper.user_id, product.product_id, 2)
+    with pytest.raises(HTTPException) as error:
+        cart.checkout(shopper)
+    assert error.value.status_code == 409
+    assert service.available(product.product_id) == 1
+
+    cart.set_quantity(shopper.user_id, product.product_id, 1)
+    cart.checkout(shopper)
+    service.confirm(buyer, hold["reservation_id"])
+    assert service.available(product.product_id) == 0
+    assert db_stock(db, product.product_id) == 0
+
+
+def test_confirm_fails_instead_of_negative_db_stock(db, make_user, make_product):
+    product = make_product(stock=5)
+    buyer = make_user()
+    service = InventoryService(db, backend=InMemoryInventoryBackend(shards=2))
+    hold = service.reserve(buyer.user_id, product.product_id, 3)
+
+    # 카운터 적재 후 관리자가 DB 재고를 줄인 상황
+    product.stock = 1
+    db.commit()
+    with pytest.raises(HTTPException) as error:
+        service.confirm(buyer, hold["reservation_id"])
+    assert error.value.status_code == 409
+    assert db_stock(db, product.product_id) == 1
+
+
+def test_redis_reservation_index_is_written_by_script(db, fake_redis, make_user, make_product):
+    product = make_product(stock=5)
+    buyer = make_user()
+    backend = RedisInventoryBackend()
+    service = InventoryService(db, backend=backend)
+    hold = service.reserve(buyer.user_id, product.product_id, 2)
+    assert fake_redis.hget("inv:reservations", hold["reservation_id"]) == str(product.product_id).encode()
+
+    # 인덱스가 없어져도 만료 정리는 상품별 만료 zset으로 선점을 찾아 재고를 반환
+    fake_redis.hdel("inv:reservations", hold["reservation_id"])
+    assert backend.expire(db, time.time() + 3600, 100) == 1
+    assert service.available(product.product_id) == 5
+
+
+def test_database_backend_leaves_transaction_to_caller(db, make_user, make_product):
+    product = make_product(stock=1)
+    buyer = make_user()
+    backend = DatabaseInventoryBackend()
+
+    # 호출한 쪽이 같은 세션에 모아 둔 변경은 선점 실패로 버려지지 않음
+    db.add(Notification(user_id=buyer.user_id, kind="drop", title="선점 시작", body="..."))
+    db.flush()
+    assert backend.reserve(db, product.product_id, buyer.user_id, 2, 600) is None
+    assert db.query(Notification).count() == 1
+
+    # 성공해도 커밋하지 않음 (롤백하면 선점과 함께 사라짐)
+    assert backend.reserve(db, product.product_id, buyer.user_id, 1, 600) is not None
+    db.rollback()
+    assert db_stock(db, product.product_id) == 1
+    assert db.query(InventoryReservation).count() == 0 and db.query(Notification).count() == 0
+
+    # InventoryService가 트랜잭션을 마무리
+    hold = InventoryService(db, backend=backend).reserve(buyer.user_id, product.product_id, 1)
+    db.rollback()
+    assert db_stock(db, product.product_id) == 0
+    assert db.get(InventoryReservation, hold["reservation_id"]).status == "held"
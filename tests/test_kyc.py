@@ -0,0 +1,105 @@
+# tests/test_kyc.py
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from app.config import settings
+from app.models import KycJob, User
+from app.services.kyc_service import (
+    FakeKycVerifier, KycService, KycWorkerPool, TransientKycError, _utcnow, create_kyc_verifier,
+)
+
+
+class FlakyVerifier(FakeKycVerifier):
+    """사용자별로 지정한 횟수만큼 일시 오류를 낸 뒤 가짜 검증"""
+
+    def __init__(self, failures: dict):
+        super().__init__(latency=0)
+        self.failures = failures
+        self.calls = 0
+
+    async def verify(self, user_id: int, payload: dict):
+        self.calls += 1
+        if self.failures.get(user_id, 0) > 0:
+            self.failures[user_id] -= 1
+            raise TransientKycError("기관 응답 지연")
+        return await super().verify(user_id, payload)
+
+
+@pytest.fixture(autouse=True)
+def fast_kyc(monkeypatch):
+    monkeypatch.setattr(settings, "KYC_POLL_INTERVAL", 0.01)
+    monkeypatch.setattr(settings, "KYC_RETRY_BASE_DELAY", 0.0)
+
+
+def submit(db, user, birth_date="19900101"):
+    return KycService(db).submit(user, "홍길동", birth_date)
+
+
+async def run_until(pool: KycWorkerPool, condition, timeout: float = 5.0):
+    await pool.start()
+    try:
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not condition() and asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(0.01)
+    finally:
+        await pool.stop()
+
+
+def kyc_statuses(db, users):
+    db.expire_all()
+    return [db.get(User, user.user_id).kyc_status for user in users]
+
+
+async def test_jobs_are_claimed_and_applied_in_one_batch(db, make_user):
+    adult, minor, other = make_user(), make_user(), make_user()
+    submit(db, adult)
+    submit(db, minor, birth_date=(_utcnow() - timedelta(days=365 * 10)).strftime("%Y%m%d"))
+    submit(db, other)
+
+    pool = KycWorkerPool(verifier=FakeKycVerifier(latency=0), batch_size=3, flush_interval=30)
+    await run_until(pool, lambda: pool.stats["batches"] >= 1)
+
+    assert pool.stats["claimed"] == 3
+    assert pool.stats["batches"] == 1
+    assert kyc_statuses(db, [adult, minor, other]) == ["verified", "rejected", "verified"]
+    assert {job.status for job in db.query(KycJob).all()} == {"verified", "rejected"}
+
+
+async def test_transient_errors_are_retried_then_failed(db, make_user):
+    recovers, gives_up = make_user(), make_user()
+    submit(db, recovers)
+    submit(db, gives_up)
+    verifier = FlakyVerifier({recovers.user_id: 1, gives_up.user_id: 10})
+
+    pool = KycWorkerPool(verifier=verifier, max_attempts=3, flush_interval=0.01)
+    await run_until(pool, lambda: pool.stats["verified"] + pool.stats["failed"] == 2)
+
+    jobs = {job.user_id: job for job in db.query(KycJob).all()}
+    assert (jobs[recovers.user_id].status, jobs[recovers.user_id].attempts) == ("verified", 2)
+    assert (jobs[gives_up.user_id].status, jobs[gives_up.user_id].attempts) == ("failed", 3)
+    assert pool.stats["retried"] == 3
+    # 검증 실패는 사용자 상태를 바꾸지 않음
+    assert kyc_statuses(db, [recovers, gives_up]) == ["verified", "pending"]
+
+
+def test_stale_processing_job_is_reclaimed(db, make_user):
+    user = make_user()
+    submit(db, user)
+    pool = KycWorkerPool(verifier=FakeKycVerifier(latency=0))
+    assert len(pool._claim(10)) == 1
+    assert pool._claim(10) == []
+
+    # 워커가 죽어 claim이 만료된 작업
+    job = db.query(KycJob).one()
+    job.claimed_at = _utcnow() - timedelta(seconds=settings.KYC_CLAIM_TIMEOUT + 1)
+    db.commit()
+    reclaimed, = pool._claim(10)
+    assert reclaimed.user_id == user.user_id
+
+
+def test_fake_verifier_is_refused_in_production(monkeypatch):
+    monkeypatch.setattr(settings, "ENVIRONMENT", "production")
+    with pytest.raises(ValueError):
+        create_kyc_verifier("fake")
@@ -0,0 +1,123 @@
+# tests/test_ledger.py
+import asyncio
+import json
+import time
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.ledger import TokenTransferRequest
+from app.services.ledger_service import (
+    FileLedgerStore, LedgerError, LedgerIntegrityError, LedgerVerifier, TokenLedger,
+)
+
+
+def any_account(account: int) -> bool:
+    return True
+
+
+async def make_ledger(path) -> TokenLedger:
+    ledger = TokenLedger(store=FileLedgerStore(str(path)), max_wait_ms=1, account_exists=any_account)
+    await ledger.start()
+    return ledger
+
+
+async def test_group_commit_and_recovery(tmp_path):
+    path = tmp_path / "ledger.wal"
+    ledger = await make_ledger(path)
+    await ledger.issue("HANWOO", 1, 1000)
+    results = await asyncio.gather(
+        *(ledger.transfer("HANWOO", 1, 2, 10) for _ in range(50)),
+        ledger.transfer("HANWOO", 2, 3, 10**6), # 잔액 부족
+        return_exceptions=True,
+    )
+    assert isinstance(results[-1], LedgerError)
+    assert ledger.balance("HANWOO", 1) == 500 and ledger.balance("HANWOO", 2) == 500
+    assert ledger.batches < 51 # 동시 요청은 묶어서 기록
+    await ledger.stop()
+
+    recovered = TokenLedger(store=FileLedgerStore(str(path)))
+    recovered.recover()
+    assert recovered.accounts == ledger.accounts
+    assert recovered.last_hash == ledger.last_hash and recovered.next_seq == 51
+    recovered.store.close()
+
+
+async def test_tampered_entry_breaks_chain(tmp_path):
+    path = tmp_path / "ledger.wal"
+    ledger = await make_ledger(path)
+    await ledger.issue("HANWOO", 1, 100)
+    await ledger.transfer("HANWOO", 1, 2, 40)
+    await ledger.transfer("HANWOO", 2, 3, 10)
+    await ledger.stop()
+
+    verifier = LedgerVerifier(FileLedgerStore(str(path)))
+    assert verifier.verify_once() == 3
+
+    lines = path.read_text().splitlines()
+    entry = json.loads(lines[1])
+    entry["amount"] = 99 # 해시는 그대로 두고 수량만 변경
+    lines[1] = json.dumps(entry, separators=(",", ":"))
+    path.write_text("\n".join(lines) + "\n")
+
+    with pytest.raises(LedgerIntegrityError):
+        LedgerVerifier(FileLedgerStore(str(path))).verify_once()
+    with pytest.raises(LedgerIntegrityError):
+        TokenLedger(store=FileLedgerStore(str(path))).recover()
+
+
+async def test_oversize_token_id_is_rejected_before_batching(tmp_path):
+    with pytest.raises(ValidationError):
+        TokenTransferRequest(token_id="X" * 65, to_user_id=2, amount=1)
+    with pytest.raises(ValidationError):
+        TokenTransferRequest(token_id="HAN WOO", to_user_id=2, amount=1)
+
+    ledger = await make_ledger(tmp_path / "ledger.wal")
+    await ledger.issue("HANWOO", 1, 10)
+    with pytest.raises(LedgerError):
+        await ledger.issue("X" * 65, 1, 10)
+    await ledger.stop()
+
+
+class SlowStore(FileLedgerStore):
+    def append(self, entries):
+        time.sleep(0.2)
+        super().append(entries)
+
+
+async def test_stop_fails_requests_it_could_not_write(tmp_path):
+    ledger = TokenLedger(store=SlowStore(str(tmp_path / "ledger.wal")), max_batch=1, max_wait_ms=0,
+                         account_exists=any_account)
+    await ledger.start()
+    futures = [asyncio.ensure_future(ledger.issue("HANWOO", 1, 1)) for _ in range(20)]
+    await asyncio.sleep(0.05)
+    await ledger.stop(timeout=0.3)
+
+    done, pending = await asyncio.wait(futures, timeout=1.0)
+    assert not pending # 응답 없이 남는 요청 없음
+    failed = [future for future in done if future.exception() is not None]
+    assert failed and all(isinstance(future.exception(), LedgerError) for future in failed)
+    # 기록 중이던 배치는 끝까지 기록되어 성공으로 응답하고 WAL도 온전함
+    written = len(done) - len(failed)
+    assert written >= 1
+    recovered = TokenLedger(store=FileLedgerStore(str(tmp_path / "ledger.wal")))
+    recovered.recover()
+    assert recovered.next_seq == written and recovered.balance("HANWOO", 1) == written
+    recovered.store.close()
+    with pytest.raises(LedgerError):
+        await ledger.issue("HANWOO", 1, 1)
+
+
+async def test_tokens_cannot_be_sent_to_missing_accounts(tmp_path, make_user):
+    user = make_user()
+    ledger = TokenLedger(store=FileLedgerStore(str(tmp_path / "ledger.wal")), max_wait_ms=1)
+    await ledger.start()
+    try:
+        await ledger.issue("HANWOO", user.user_id, 10)
+        with pytest.raises(LedgerError):
+            await ledger.issue("HANWOO", user.user_id + 1000, 10)
+        with pytest.raises(LedgerError):
+            await ledger.transfer("HANWOO", user.user_id, user.user_id + 1000, 5)
+        assert ledger.balance("HANWOO", user.user_id) == 10 and ledger.next_seq == 1
+    finally:
+        await ledger.stop()
@@ -0,0 +1,83 @@
+# tests/test_payout.py
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from app.models import Distribution, DistributionPayout, Notification
+from app.services.payout_service import PayoutEngine, PayoutError, allocate_pro_rata
+
+
+def test_allocation_sums_to_total_exactly():
+    rng = np.random.default_rng(7)
+    holdings = np.maximum(1, (rng.pareto(1.2, 10000) * 1000).astype(np.int64))
+    for total in (1, 999, 1_234_567_890_123):
+        amounts = allocate_pro_rata(total, holdings)
+        assert int(amounts.sum()) == total
+        # 정확한 비례값과 최소 단위 1 미만 차이
+        ideal = holdings.astype(object) * total / int(holdings.sum())
+        assert all(abs(int(amount) - value) < 1 for amount, value in zip(amounts, ideal))
+
+
+def test_allocation_leftover_goes_to_largest_remainder_then_lowest_account():
+    # 10 / 3 = 3.33... -> 나머지 1은 앞쪽 보유자에게
+    assert allocate_pro_rata(10, np.array([1, 1, 1])).tolist() == [4, 3, 3]
+    assert allocate_pro_rata(7, np.array([1, 2, 4])).tolist() == [1, 2, 4]
+    assert allocate_pro_rata(5, np.array([3, 1])).tolist() == [4, 1]
+
+
+def test_allocation_with_huge_holdings_stays_exact():
+    # 나머지 x 보유량이 int64를 넘는 경우 (파이썬 정수 경로)
+    holdings = np.array([2 ** 61, 2 ** 61 - 1, 3], dtype=np.int64)
+    total = 2 ** 62 - 12345
+    assert int(allocate_pro_rata(total, holdings).sum()) == total
+
+    with pytest.raises(PayoutError):
+        allocate_pro_rata(total, np.array([2 ** 62, 2 ** 62], dtype=np.int64)) # 총 보유량이 int64 초과
+
+
+@pytest.fixture
+def distribution(db, tmp_path):
+    """보유자 25명, 청크 10명 단위 분배 (스냅샷 저장까지)"""
+    row = Distribution(token_id="HANWOO", total_amount=1_000_003, status="pending",
+                       record_date=datetime.now(timezone.utc) - timedelta(days=1),
+                       chunk_size=10, next_chunk=0, paid_holders=0, paid_amount=0)
+    db.add(row)
+    db.commit()
+    engine = PayoutEngine(snapshot_dir=str(tmp_path))
+    engine.save_snapshot(row.distribution_id, np.arange(1, 26) * 2, np.arange(1, 26) * 7)
+    return engine, row.distribution_id
+
+
+def test_resume_from_checkpoint_pays_each_holder_once(db, distribution):
+    engine, distribution_id = distribution
+    assert engine.run(distribution_id, max_chunks=1) is None # 중단
+
+    db.expire_all()
+    stopped = db.get(Distribution, distribution_id)
+    assert stopped.next_chunk == 1 and stopped.paid_holders == 10 and stopped.lease_until is None
+
+    result = PayoutEngine(snapshot_dir=engine.snapshot_dir).run(distribution_id)
+    assert result["status"] == "completed" and result["next_chunk"] == 3
+    payouts = db.query(DistributionPayout).filter(DistributionPayout.distribution_id == distribution_id).all()
+    assert len(payouts) == 25 and sum(payout.amount for payout in payouts) == 1_000_003
+    assert db.query(Notification).filter(Notification.reference_id == distribution_id).count() == 25
+
+
+def test_notification_uses_configured_currency(db, distribution, monkeypatch):
+    from app.config import settings
+    monkeypatch.setattr(settings, "PAYOUT_CURRENCY_UNIT", "USD")
+    engine, distribution_id = distribution
+    engine.run(distribution_id)
+    notification = db.query(Notification).filter(Notification.reference_id == distribution_id).first()
+    assert " USD (기준일 " in notification.body and "원" not in notification.body
+
+
+def test_changed_snapshot_fails_distribution(db, distribution):
+    engine, distribution_id = distribution
+    with open(engine.snapshot_path(distribution_id), "ab") as f:
+        f.write(b"tampered")
+    with pytest.raises(PayoutError):
+        engine.run(distribution_id)
+    db.expire_all()
+    assert db.get(Distribution, distribution_id).status == "failed"
@@ -0,0 +1,90 @@
+# tests/test_pii.py
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from app.models import User
+from app.schemas import UserLoginRequest
+from app.services import encryption_service
+from app.services.auth_service import AuthService
+from app.services.encryption_service import PiiEncryptor, get_encryptor, is_encrypted
+from app.services.pii_migration import migrate_user_pii
+from app.services.user_lookup_service import UserLookupService
+from app.utils.auth import hash_password
+
+
+def login(db, phone_number: str, password: str = "123456") -> dict:
+    return AuthService(db).login_user(UserLoginRequest(phone_number=phone_number, password=password))
+
+
+def test_phone_is_encrypted_and_found_by_blind_index(db, make_user):
+    user = make_user(phone_number="01055556666", user_name="김투자", password_hash=hash_password("123456"))
+    db.expire_all()
+    row = db.execute(text("SELECT phone_number, user_name, phone_hash FROM users")).one()
+
+    assert is_encrypted(row.phone_number) and "01055556666" not in row.phone_number
+    assert is_encrypted(row.user_name)
+    assert row.phone_hash == get_encryptor().blind_index("010-5555-6666")
+
+    result = login(db, "010-5555-6666")
+    assert result["user"]["user_id"] == user.user_id
+    assert result["user"]["phone_number"] == "01055556666"
+    with pytest.raises(HTTPException) as error:
+        login(db, "01055556666", "654321")
+    assert error.value.status_code == 401
+
+
+@pytest.fixture
+def legacy_db(tmp_path, monkeypatch):
+    """암호화 도입 전 스키마 (phone_number VARCHAR(11) 평문, phone_hash 없음)"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as connection:
+        connection.execute(text("""
+            CREATE TABLE users (
+                user_id INTEGER PRIMARY KEY, phone_number VARCHAR(11) NOT NULL UNIQUE,
+                password_hash VARCHAR(255) NOT NULL, user_name VARCHAR(100), user_type VARCHAR(20),
+                kyc_status VARCHAR(20), is_active BOOLEAN, created_at DATETIME, updated_at DATETIME
+            )
+        """))
+        for phone_number, user_name, user_type in (("01011112222", "관리자", "admin"), ("01033334444", "고객", "customer")):
+            connection.execute(text(
+                "INSERT INTO users (phone_number, password_hash, user_name, user_type, kyc_status, is_active) "
+                "VALUES (:phone, :password, :name, :type, 'pending', 1)"
+            ), {"phone": phone_number, "password": hash_password("123456"), "name": user_name, "type": user_type})
+    session_factory = sessionmaker(bind=engine)
+    # 데이터 키도 전환 대상 DB에 저장
+    monkeypatch.setattr(encryption_service, "_encryptor", PiiEncryptor(session_factory=session_factory))
+    db = session_factory()
+    yield db
+    db.close()
+    engine.dispose()
+
+
+def test_legacy_rows_log_in_before_and_after_migration(legacy_db):
+    # 배포 직후 컬럼만 추가된 상태 -> phone_hash가 NULL인 행은 평문으로 조회
+    legacy_db.execute(text("ALTER TABLE users ADD COLUMN phone_hash VARCHAR(64)"))
+    legacy_db.execute(text("ALTER TABLE users ADD COLUMN email TEXT"))
+    legacy_db.commit()
+    assert login(legacy_db, "010-1111-2222")["user"]["user_type"] == "admin"
+    assert UserLookupService(legacy_db).resolve_phones(["01033334444"]) == {"01033334444": 2}
+
+    result = migrate_user_pii(legacy_db)
+    assert result["reencrypted"] == 2
+
+    rows = legacy_db.execute(text("SELECT phone_number, user_name, phone_hash FROM users ORDER BY user_id")).all()
+    assert all(is_encrypted(row.phone_number) and is_encrypted(row.user_name) and row.phone_hash for row in rows)
+    indexes = {index["name"]: index for index in inspect(legacy_db.get_bind()).get_indexes("users")}
+    assert indexes["ix_users_phone_hash"]["unique"]
+
+    legacy_db.expire_all()
+    result = login(legacy_db, "01033334444")
+    assert result["user"]["user_name"] == "고객"
+    # 다시 실행해도 바뀌는 행 없음
+    assert migrate_user_pii(legacy_db)["reencrypted"] == 0
+
+
+def test_migration_adds_missing_column(legacy_db):
+    result = migrate_user_pii(legacy_db)
+    assert result["added_phone_hash"] is True and result["added_email"] is True
+    assert legacy_db.query(User).filter(User.phone_hash.is_(None)).count() == 0
@@ -0,0 +1,71 @@
+# tests/test_profiling.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.config import settings
+from app.core.profiling import RequestProfile, _current, span
+from app.core.server import check_multi_worker_settings
+
+
+@pytest.fixture
+def profile():
+    profile = RequestProfile(1, "GET", "/api/products")
+    token = _current.set(profile)
+    yield profile
+    _current.reset(token)
+
+
+def run_in_thread(function):
+    """컨텍스트를 넘겨 스레드풀에서 실행한 뒤 그 스레드 ID 반환 (starlette run_in_threadpool과 같은 방식)"""
+    import contextvars
+
+    context = contextvars.copy_context()
+
+    def call():
+        context.run(function)
+        return threading.get_ident()
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(call).result()
+
+
+def test_threadpool_thread_is_released_after_span(profile):
+    seen = []
+
+    def work():
+        with span("hash"):
+            seen.append(dict(profile.threads))
+
+    worker = run_in_thread(work)
+    assert worker in seen[0]
+    assert worker not in profile.threads
+    assert threading.get_ident() in profile.threads
+    assert "hash" in profile.spans
+
+
+def test_nested_spans_keep_thread_until_outermost_exits(profile):
+    with span("outer"):
+        with span("inner"):
+            pass
+        assert profile.threads[threading.get_ident()] == 2
+    assert profile.threads[threading.get_ident()] == 1
+
+
+def test_db_thread_is_released_after_failed_query(db, profile):
+    def work():
+        with pytest.raises(OperationalError):
+            db.execute(text("SELECT * FROM no_such_table"))
+
+    worker = run_in_thread(work)
+    db.rollback()
+    assert worker not in profile.threads
+    assert "db" in profile.spans
+
+
+def test_profiling_is_rejected_for_multi_worker(monkeypatch):
+    monkeypatch.setattr(settings, "PROFILING_ENABLED", True)
+    assert any(problem.startswith("PROFILING_ENABLED") for problem in check_multi_worker_settings())
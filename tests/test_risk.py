@@ -0,0 +1,90 @@
+# tests/test_risk.py
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.config import settings
+from app.models import SMSVerification
+from app.routers import auth as auth_router
+from app.services.cart_service import CartService, InMemoryCartBackend, ProductCache
+from app.services.auth_service import AuthService
+from app.services.risk_service import (
+    LOGIN_FAILURE, ORDER, SMS_FAILURE, SMS_SENT, RiskEngine, check_order_risk, get_risk_engine, user_risk_key,
+)
+
+
+def test_login_and_order_events_share_user_key(db, make_user):
+    user = make_user(phone_number="01012345678")
+    engine = get_risk_engine()
+    # 로그인 실패는 입력한 번호(형식 무관)로, 주문은 로그인한 사용자로 기록
+    for _ in range(5):
+        engine.record(LOGIN_FAILURE, user_risk_key("010-1234-5678"), "10.0.0.1")
+    assessment = engine.check_order(user_risk_key(user.phone_number), "10.0.0.2", 10000)
+    assert "order_after_login_failures" in assessment.reasons
+
+
+def test_order_burst_is_blocked(db, make_user, monkeypatch):
+    user = make_user()
+    engine = RiskEngine(rules=[rule for rule in get_risk_engine().rules if rule[0] == "order_burst"])
+    monkeypatch.setattr("app.services.risk_service._engine", engine)
+    monkeypatch.setattr(settings, "RISK_BLOCK_SCORE", 50)
+    for _ in range(10):
+        engine.record(ORDER, user_risk_key(user.phone_number), amount=1000)
+    with pytest.raises(HTTPException) as error:
+        check_order_risk(user, "10.0.0.1", 1000)
+    assert error.value.status_code == 429
+
+
+def test_cart_checkout_records_order_event(db, make_user, make_product):
+    user = make_user()
+    product = make_product(price=3000, stock=5)
+    service = CartService(db, backend=InMemoryCartBackend(), product_cache=ProductCache())
+    service.add_item(user.user_id, product.product_id, 2)
+    order = service.checkout(user, "10.0.0.9")
+    assert order["total_amount"] == 6000
+
+    stats = get_risk_engine().snapshot(user_risk_key(user.phone_number), "10.0.0.9")
+    assert stats["user"]["per_minute"][ORDER] == 1
+    assert stats["ip"]["per_minute"][ORDER] == 1
+
+
+def make_request(peer: str, forwarded: str = None) -> Request:
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return Request({"type": "http", "client": (peer, 1234), "headers": headers})
+
+
+def test_forwarded_for_is_ignored_from_untrusted_peer(monkeypatch):
+    monkeypatch.setattr(auth_router, "TRUSTED_PROXY_NETWORKS", [])
+    assert auth_router.get_client_ip(make_request("203.0.113.5", "1.2.3.4")) == "203.0.113.5"
+
+
+def test_forwarded_for_skips_trusted_proxies(monkeypatch):
+    import ipaddress
+    monkeypatch.setattr(auth_router, "TRUSTED_PROXY_NETWORKS", [ipaddress.ip_network("10.0.0.0/8")])
+    # 클라이언트가 앞에 임의 값을 넣어도 마지막 신뢰 프록시가 본 주소를 사용
+    request = make_request("10.0.0.2", "6.6.6.6, 198.51.100.7, 10.0.0.3")
+    assert auth_router.get_client_ip(request) == "198.51.100.7"
+    assert auth_router.get_client_ip(make_request("10.0.0.2", "x" * 300)) == "10.0.0.2"
+
+
+def test_resent_codes_can_still_be_verified(db):
+    phone_number = "01055556666"
+    engine = get_risk_engine()
+    for _ in range(12):
+        engine.record(SMS_SENT, user_risk_key(phone_number), "10.0.0.1")
+    assert engine.check("sms", user_risk_key(phone_number), "10.0.0.1").blocked
+
+    db.add(SMSVerification(phone_number=phone_number, verification_code="123456",
+                           expires_at=datetime.now() + timedelta(minutes=5)))
+    db.commit()
+    assert AuthService(db).verify_sms_code(phone_number, "123456", "10.0.0.1")["success"]
+
+
+def test_repeated_verify_failures_are_blocked():
+    engine = get_risk_engine()
+    for _ in range(10):
+        engine.record(SMS_FAILURE, "user-key", "10.0.0.1")
+    assert engine.check("sms_verify", "user-key").blocked
+    assert not engine.check("login", "user-key").blocked
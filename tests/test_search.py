@@ -0,0 +1,57 @@
+# tests/test_search.py
+import asyncio
+
+from app.services import search_service
+from app.services.search_service import InMemorySearchBackend, SearchIndexSync
+
+
+def product_ids(backend, query):
+    _, hits = backend.search(None, query, None, 10, 0)
+    return [product_id for product_id, _ in hits]
+
+
+async def test_committed_changes_reach_other_workers(db, make_product, broker, monkeypatch):
+    local, remote = InMemorySearchBackend(), InMemorySearchBackend()
+    local.rebuild(db)
+    remote.rebuild(db)
+    local_sync = SearchIndexSync(bus=broker.connect(), backend=local, rebuild_interval=0)
+    remote_sync = SearchIndexSync(bus=broker.connect(), backend=remote, rebuild_interval=0)
+    await local_sync.start()
+    await remote_sync.start()
+    # 이 프로세스가 커밋한 변경은 local 색인과 local 동기화로
+    monkeypatch.setattr(search_service, "_backend", local)
+    monkeypatch.setattr(search_service, "_sync", local_sync)
+    try:
+        product = make_product(name="제주 감귤 5kg")
+        await asyncio.sleep(0.01)
+        assert product_ids(remote, "감귤") == [product.product_id]
+
+        product.is_active = False
+        db.commit()
+        await asyncio.sleep(0.01)
+        assert product_ids(remote, "감귤") == []
+        assert local_sync.stats["published"] == 2
+        assert remote_sync.stats["received"] == 2
+        # 자기 메시지는 다시 적용하지 않음
+        assert local_sync.stats["received"] == 0
+    finally:
+        await local_sync.stop()
+        await remote_sync.stop()
+
+
+async def test_periodic_rebuild_recovers_missed_changes(db, make_product, broker):
+    backend = InMemorySearchBackend()
+    backend.rebuild(db)
+    make_product(name="한우 등심")
+    assert product_ids(backend, "등심") == []
+
+    sync = SearchIndexSync(bus=broker.connect(), backend=backend, rebuild_interval=0.01)
+    await sync.start()
+    try:
+        for _ in range(100):
+            if product_ids(backend, "등심"):
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await sync.stop()
+    assert len(product_ids(backend, "등심")) == 1
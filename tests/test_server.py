@@ -0,0 +1,86 @@
+# tests/test_server.py
+import asyncio
+
+from app.config import MULTI_WORKER_DEFAULTS, Settings, apply_multi_worker_defaults, settings
+from app.core.server import check_multi_worker_settings
+from app.services import cart_service
+from app.services.cart_service import ProductCache
+from app.services.risk_service import LOGIN_FAILURE, RiskEngine
+from app.services.user_cache import UserCache
+
+
+async def start_workers(broker, *components):
+    """같은 브로커에 연결된 워커별 객체 시작"""
+    for component in components:
+        component.broadcaster.bus = broker.connect()
+        await component.broadcaster.start()
+
+
+async def stop_workers(*components):
+    for component in components:
+        await component.broadcaster.stop()
+
+
+def test_memory_bus_is_rejected_for_multiple_workers(monkeypatch):
+    monkeypatch.setattr(settings, "FEED_BUS_BACKEND", "memory")
+    assert any(problem.startswith("FEED_BUS_BACKEND=memory") for problem in check_multi_worker_settings())
+    monkeypatch.setattr(settings, "FEED_BUS_BACKEND", "redis")
+    assert not any(problem.startswith("FEED_BUS_BACKEND") for problem in check_multi_worker_settings())
+
+
+def test_production_defaults_pass_multi_worker_check(monkeypatch):
+    for name in (*MULTI_WORKER_DEFAULTS, "CART_BACKEND", "INVENTORY_BACKEND"):
+        monkeypatch.delenv(name, raising=False)
+    config = apply_multi_worker_defaults(Settings(ENVIRONMENT="production"))
+    for name in (*MULTI_WORKER_DEFAULTS, "CART_BACKEND", "INVENTORY_BACKEND"):
+        monkeypatch.setattr(settings, name, getattr(config, name))
+    assert check_multi_worker_settings() == []
+
+    # 직접 지정한 값은 그대로 (원장 전용 단일 워커 프로세스)
+    ledger_process = apply_multi_worker_defaults(Settings(LEDGER_ENABLED=True, FEED_BUS_BACKEND="memory"))
+    assert ledger_process.LEDGER_ENABLED is True and ledger_process.FEED_BUS_BACKEND == "memory"
+    assert ledger_process.PROFILING_ENABLED is False
+
+
+async def test_risk_events_count_across_workers(broker):
+    first, second = RiskEngine(), RiskEngine()
+    await start_workers(broker, first, second)
+    try:
+        # 로그인 실패가 워커 둘에 나뉘어 들어와도 합계로 판단
+        for engine in (first, second, first, second, first):
+            engine.record(LOGIN_FAILURE, "user-key", "10.0.0.1")
+        await asyncio.sleep(0.01)
+        assert first.check("login", "user-key").blocked
+        assert second.check("login", "user-key").blocked
+        assert first.broadcaster.stats["received"] == 2 and second.broadcaster.stats["received"] == 3
+    finally:
+        await stop_workers(first, second)
+
+
+async def test_user_cache_invalidation_reaches_other_workers(broker):
+    first, second = UserCache(), UserCache()
+    await start_workers(broker, first, second)
+    try:
+        for cache in (first, second):
+            cache.put_many([{"user_id": 1, "kyc_status": "pending"}, {"user_id": 2, "kyc_status": "pending"}])
+        first.invalidate([1])
+        await asyncio.sleep(0.01)
+        assert second.get(1) is None and second.get(2) is not None
+    finally:
+        await stop_workers(first, second)
+
+
+async def test_product_update_evicts_cached_price_in_other_workers(db, make_product, broker, monkeypatch):
+    local, remote = ProductCache(), ProductCache()
+    await start_workers(broker, local, remote)
+    monkeypatch.setattr(cart_service, "_product_cache", local)
+    try:
+        product = make_product(price=10000)
+        assert remote.get_many(db, [product.product_id])[product.product_id]["price"] == 10000
+
+        product.price = 12000
+        db.commit()
+        await asyncio.sleep(0.01)
+        assert remote.get_many(db, [product.product_id])[product.product_id]["price"] == 12000
+    finally:
+        await stop_workers(local, remote)
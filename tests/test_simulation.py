@@ -0,0 +1,58 @@
+# tests/test_simulation.py
+import numpy as np
+import pytest
+
+from app.schemas.simulation import SimulationRequest
+from app.services.simulation_service import SimulationService, shutdown_executor
+
+
+def make_request(**overrides) -> SimulationRequest:
+    data = {
+        "initial_amount": 1_000_000,
+        "horizon_months": 24,
+        "n_paths": 2000,
+        "seed": 7,
+        "assets": [
+            {"name": "한우 STO", "weight": 0.6, "expected_return": 0.08, "volatility": 0.25},
+            {"name": "감귤 STO", "weight": 0.4, "expected_return": 0.04, "volatility": 0.1},
+        ],
+        "correlation": [[1.0, 0.3], [0.3, 1.0]],
+    }
+    data.update(overrides)
+    return SimulationRequest(**data)
+
+
+def test_parallel_and_serial_runs_match():
+    """청크별 시드를 쓰므로 프로세스 풀 사용 여부와 무관하게 결과 동일"""
+    request = make_request(seed=11)
+    params = SimulationService()._build_params(request)
+    serial = SimulationService(chunk_paths=500, parallel_threshold=10**9)._simulate(params, request.n_paths, request.seed)
+    parallel = SimulationService(chunk_paths=500, parallel_threshold=1)._simulate(params, request.n_paths, request.seed)
+    shutdown_executor()
+    np.testing.assert_array_equal(serial[0], parallel[0])
+    np.testing.assert_array_equal(serial[1], parallel[1])
+
+
+def test_bands_are_ordered_and_cached():
+    service = SimulationService(chunk_paths=500, parallel_threshold=10**9)
+    request = make_request(seed=12)
+    result = service.run(request)
+    assert result["cached"] is False
+    bands = [np.array(result["bands"][f"p{p}"]) for p in result["percentiles"]]
+    for lower, upper in zip(bands, bands[1:]):
+        assert (lower <= upper + 1e-6).all()
+    assert bands[0][0] == pytest.approx(request.initial_amount)
+    assert 0 <= result["drawdown"]["median"] <= result["drawdown"]["p95"] <= result["drawdown"]["worst"] <= 1
+
+    assert service.run(request)["cached"] is True
+    # 청크 크기가 다르면 난수열이 달라지므로 캐시를 쓰지 않음
+    assert SimulationService(chunk_paths=250, parallel_threshold=10**9).run(request)["cached"] is False
+
+
+def test_bootstrap_requires_equal_length_history():
+    request = make_request(method="bootstrap", assets=[
+        {"name": "A", "weight": 1, "historical_returns": [0.01, 0.02]},
+        {"name": "B", "weight": 1, "historical_returns": [0.01]},
+    ])
+    with pytest.raises(ValueError):
+        SimulationService().run(request)
@@ -0,0 +1,98 @@
+# tests/test_static_files.py
+import gzip
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from app.config import settings
+from app.core.static_files import OptimizedStaticFiles, asset_url, file_fingerprint
+
+CSS = b"body { color: #333; }\n" * 200
+
+
+@pytest.fixture
+def static_dir(tmp_path, monkeypatch):
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "app.css").write_bytes(CSS)
+    (tmp_path / "css" / "app.css.gz").write_bytes(gzip.compress(CSS))
+    (tmp_path / "css" / "app.css.br").write_bytes(b"brotli-bytes")
+    (tmp_path / "img").mkdir()
+    (tmp_path / "img" / "cow.jpg").write_bytes(b"jpeg-bytes")
+    (tmp_path / "img" / "cow.webp").write_bytes(b"webp")
+    (tmp_path / "data.bin").write_bytes(bytes(range(100)))
+    monkeypatch.setattr(settings, "STATIC_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def client(static_dir):
+    app = Starlette(routes=[Mount("/static", OptimizedStaticFiles(directory=str(static_dir)))])
+    return TestClient(app)
+
+
+def test_precompressed_variant_is_negotiated(client):
+    response = client.get("/static/css/app.css", headers={"Accept-Encoding": "gzip, br"})
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["vary"] == "Accept-Encoding"
+
+    response = client.get("/static/css/app.css", headers={"Accept-Encoding": "gzip, br;q=0"})
+    assert response.headers["content-encoding"] == "gzip" and response.content == CSS
+
+    response = client.get("/static/css/app.css", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers and response.content == CSS
+
+
+def test_webp_is_served_when_accepted(client):
+    response = client.get("/static/img/cow.jpg", headers={"Accept": "image/webp,*/*"})
+    assert response.content == b"webp" and response.headers["content-type"] == "image/webp"
+    assert response.headers["vary"] == "Accept"
+
+    response = client.get("/static/img/cow.jpg", headers={"Accept": "image/jpeg"})
+    assert response.content == b"jpeg-bytes" and response.headers["vary"] == "Accept"
+
+
+def test_fingerprinted_url_is_immutable(client, static_dir):
+    url = asset_url("css/app.css")
+    assert url == f"/static/css/app.{file_fingerprint(str(static_dir / 'css' / 'app.css'))}.css"
+
+    response = client.get(url, headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200 and response.content == CSS
+    assert "immutable" in response.headers["cache-control"]
+
+    # 내용이 바뀐 뒤의 옛 지문은 짧은 캐시로만 제공
+    stale = client.get("/static/css/app.000000000000.css", headers={"Accept-Encoding": "identity"})
+    assert stale.status_code == 200 and "immutable" not in stale.headers["cache-control"]
+    assert "immutable" not in client.get("/static/data.bin").headers["cache-control"]
+
+
+def test_etag_revalidation_returns_304(client):
+    etag = client.get("/static/data.bin").headers["etag"]
+    response = client.get("/static/data.bin", headers={"If-None-Match": etag})
+    assert response.status_code == 304 and response.content == b""
+
+
+def test_range_requests(client):
+    response = client.get("/static/data.bin", headers={"Range": "bytes=10-19"})
+    assert response.status_code == 206 and response.content == bytes(range(10, 20))
+    assert response.headers["content-range"] == "bytes 10-19/100"
+
+    response = client.get("/static/data.bin", headers={"Range": "bytes=-5"})
+    assert response.status_code == 206 and response.content == bytes(range(95, 100))
+
+    response = client.get("/static/data.bin", headers={"Range": "bytes=100-"})
+    assert response.status_code == 416 and response.headers["content-range"] == "bytes */100"
+
+    # 끝이 시작보다 앞인 범위는 무시하고 전체 전송
+    response = client.get("/static/data.bin", headers={"Range": "bytes=5-2"})
+    assert response.status_code == 200 and response.content == bytes(range(100))
+
+
+def test_if_range_mismatch_sends_full_file(client):
+    etag = client.get("/static/data.bin").headers["etag"]
+    response = client.get("/static/data.bin", headers={"Range": "bytes=0-9", "If-Range": etag})
+    assert response.status_code == 206 and len(response.content) == 10
+
+    response = client.get("/static/data.bin", headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+    assert response.status_code == 200 and len(response.content) == 100
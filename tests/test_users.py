@@ -0,0 +1,69 @@
+# tests/test_users.py
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import event
+
+from app.core.admission import DB_READ, DB_WRITE, classify
+from app.database import engine
+from app.models import AuditEvent
+from app.routers.audit import list_audit_events
+from app.services.user_lookup_service import UserLoader
+
+
+@pytest.fixture
+def user_queries():
+    """users 테이블 SELECT 횟수"""
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM users" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count)
+    yield statements
+    event.remove(engine, "before_cursor_execute", count)
+
+
+async def test_loads_in_same_tick_share_one_query(db, make_user, user_queries):
+    users = [make_user(user_name=f"사용자{i}") for i in range(5)]
+    user_ids = [user.user_id for user in users]
+    user_queries.clear()
+    loader = UserLoader(db)
+
+    results = await asyncio.gather(*(loader.load(user_id) for user_id in [*user_ids, user_ids[0], 10**6]))
+    assert [result["user_name"] for result in results[:5]] == [f"사용자{i}" for i in range(5)]
+    assert results[5] == results[0] and results[6] is None
+    assert loader.batches == 1 and len(user_queries) == 1
+
+    # 요청 안에서 이미 조회한 사용자는 다시 조회하지 않음
+    assert (await loader.load(user_ids[1]))["user_id"] == user_ids[1]
+    assert loader.batches == 1 and len(user_queries) == 1
+
+
+async def test_audit_events_resolve_actors_with_one_query(db, make_user, user_queries):
+    admin = make_user(user_type="admin")
+    actors = [make_user(user_name=f"행위자{i}") for i in range(3)]
+    now = datetime.now(timezone.utc)
+    for i in range(9):
+        db.add(AuditEvent(id=i + 1, occurred_at=now, event_type="login_success",
+                          actor_id=actors[i % 3].user_id, success=True))
+    db.add(AuditEvent(id=10, occurred_at=now, event_type="login_failure", actor_id=None, success=False))
+    db.commit()
+    user_queries.clear()
+
+    loader = UserLoader(db)
+    response = await list_audit_events(event_type=None, actor_id=None, before_id=None, limit=100,
+                                       current_user=admin, db=db, users=loader)
+    events = response.data["events"]
+    assert [event["id"] for event in events] == list(range(10, 0, -1))
+    assert events[0]["actor"] is None
+    assert events[1]["actor"] == {"user_id": actors[2].user_id, "user_name": "행위자2", "user_type": "customer"}
+    assert loader.batches == 1 and len(user_queries) == 1
+
+
+def test_user_lookup_is_classified_as_read():
+    assert classify("POST", "/api/internal/users/lookup") == DB_READ
+    assert classify("POST", "/api/internal/users/lookup/") == DB_READ
+    assert classify("POST", "/api/cart/checkout") == DB_WRITE